@@ -21,40 +21,15 @@ from prodsys.simulation import request
 class ProductionControlEnv(sequencing_control_env.AbstractSequencingControlEnv):
     def get_observation(self) -> np.ndarray:
         """
-        Function that utilizes the ResourceObserver of the environment class to get an array of observations of processes performed by the resource and in the queue of the resource. The observatino has a dimension CxP, where c is the capacity of resource and queue and P the number of processes.
+        Function that utilizes the ResourceArrayObserver of the environment class to get an array of observations of processes performed by the resource and in the queue of the resource. The observation has a dimension CxP, where C is the capacity of resource and queue and P the number of processes.
 
         Returns:
             np.ndarray: The observation.
         """
-        processes_observation = self.observer.observe_processes()
-        encoded_processes = []
-        processes = self.resource.data.process_ids
-
-        for process_observation in processes_observation:
-            encoded_process = [0 for _ in range(len(processes))]
-            encoded_process[processes.index(process_observation.process)] = 1
-            encoded_processes.append(encoded_process)
-
-        encoded_process = [0 for _ in range(len(processes))]
-        encoded_processes += [encoded_process] * (
-            self.resource.data.capacity - len(processes_observation)
-        )
-
-        queue_observations = self.observer.observe_input_queue()
-        for queue_observation in queue_observations:
-            encoded_process = [0 for _ in range(len(processes))]
-            encoded_process[processes.index(queue_observation.process)] = 1
-            encoded_processes.append(encoded_process)
-
-        encoded_process = [0 for _ in range(len(processes))]
-        # v1 resources expose unified `ports` (queues); in this example we treat the first port as input.
-        queue_capacity = self.resource.ports[0].capacity
-
-        encoded_processes += [encoded_process] * (
-            queue_capacity - len(queue_observations)
-        )
-
-        return np.array(encoded_processes)
+        self.array_observer.observe()
+        return np.concatenate(
+            (self.array_observer.process_one_hot, self.array_observer.queue_one_hot)
+        ).astype(int)
 
     def get_info(self) -> dict:
         return {"info": 0}
@@ -116,6 +91,8 @@ if __name__ == "__main__":
         observation_space=observation_space,
         action_space=action_space,
         render_mode="human",
+        use_array_observer=True,
+        max_queue_length=int(queue.capacity),
     )
 
     tmp_path = os.path.join(
@@ -0,0 +1,107 @@
+"""
+Micro-benchmark for the event logging of the simulation.
+
+Measures how many events per second can be logged through the observed state infos of a production system and how
+many events per second the full simulation of the link transport example produces including logging.
+"""
+
+import time
+
+import prodsys
+from prodsys import express as psx
+from prodsys.simulation import sim, state
+
+sim.VERBOSE = 0
+
+
+def create_link_transport_system() -> prodsys.ProductionSystemData:
+    time_model_agv = psx.DistanceTimeModel(speed=360, reaction_time=0, ID="time_model_x")
+    time_model_machine1 = psx.FunctionTimeModel("constant", 3, ID="time_model_ap01")
+    time_model_machine2 = psx.FunctionTimeModel("constant", 3, ID="time_model_ap02")
+    time_model_machine3 = psx.FunctionTimeModel("constant", 6, ID="time_model_ap03")
+    interarrival_time1 = psx.FunctionTimeModel("constant", 6, ID="time_model_source01")
+    interarrival_time2 = psx.FunctionTimeModel("constant", 6, ID="time_model_source02")
+
+    node1 = psx.Node(location=[10, 0], ID="node1")
+    node2 = psx.Node(location=[0, 15], ID="node2")
+    node3 = psx.Node(location=[20, 20], ID="node3")
+    node4 = psx.Node(location=[0, 20], ID="node4")
+
+    ltp01 = psx.LinkTransportProcess(time_model=time_model_agv, ID="ltp01")
+    pp01 = psx.ProductionProcess(time_model=time_model_machine1, ID="pp01")
+    pp02 = psx.ProductionProcess(time_model=time_model_machine2, ID="pp02")
+    pp03 = psx.ProductionProcess(time_model=time_model_machine3, ID="pp03")
+
+    machine01 = psx.Resource(ID="resource01", processes=[pp01], location=[10, 10])
+    machine02 = psx.Resource(ID="resource02", processes=[pp02], location=[20, 10])
+    machine03 = psx.Resource(ID="resource03", processes=[pp03], location=[10, 20])
+    agv01 = psx.Resource(location=[0, 0], ID="agv01", processes=[ltp01])
+
+    product01 = psx.Product(process=[pp01, pp02, pp03], transport_process=ltp01, ID="product01")
+    product02 = psx.Product(process=[pp03, pp02, pp01], transport_process=ltp01, ID="product02")
+
+    source01 = psx.Source(product=product01, ID="source01", time_model=interarrival_time1, location=[0, 0])
+    source02 = psx.Source(product=product02, ID="source02", time_model=interarrival_time2, location=[0, 0])
+    sink01 = psx.Sink(product=product01, ID="sink01", location=[20, 25])
+    sink02 = psx.Sink(product=product02, ID="sink02", location=[20, 25])
+
+    ltp01.set_links(
+        [
+            [source01, node1],
+            [source02, node1],
+            [source01, node2],
+            [source02, node2],
+            [node1, machine01],
+            [node2, machine01],
+            [node2, node4],
+            [machine02, machine03],
+            [machine03, machine01],
+            [machine01, machine02],
+            [machine03, node3],
+            [machine02, node3],
+            [node4, machine03],
+            [node3, sink01],
+            [node3, sink02],
+        ]
+    )
+    production_system = psx.ProductionSystem(
+        resources=[agv01, machine01, machine02, machine03],
+        sources=[source01, source02],
+        sinks=[sink01, sink02],
+        ID="productionsystem01",
+    )
+    return production_system.to_model()
+
+
+def benchmark_state_logging(number_of_events: int = 500_000) -> float:
+    """
+    Logs events directly through an observed state info and returns the events per second.
+    """
+    runner = prodsys.runner.Runner(production_system_data=create_link_transport_system())
+    runner.initialize_simulation()
+    state_info = runner.resource_factory.all_resources["resource01"].production_states[0].state_info
+    log_start_state = state_info.log_start_state
+    production = state.StateTypeEnum.production
+    start = time.perf_counter()
+    for i in range(number_of_events):
+        log_start_state(i, i + 1, production)
+    duration = time.perf_counter() - start
+    assert len(runner.event_logger.event_data) == number_of_events
+    return number_of_events / duration
+
+
+def benchmark_simulation(run_length: float = 50_000) -> float:
+    """
+    Simulates the link transport example and returns the logged events per second of wall time.
+    """
+    runner = prodsys.runner.Runner(production_system_data=create_link_transport_system())
+    runner.initialize_simulation()
+    start = time.perf_counter()
+    runner.run(run_length)
+    duration = time.perf_counter() - start
+    return len(runner.event_logger.event_data) / duration
+
+
+if __name__ == "__main__":
+    print(f"State logging: {benchmark_state_logging():,.0f} events/s")
+    print(f"Simulation:    {benchmark_simulation():,.0f} events/s")
@@ -0,0 +1,110 @@
+"""
+Benchmark for resetting a simulation between short runs, e.g. the episodes of the reinforcement learning control
+environments.
+
+Resets the most trivial example with ``Runner.initialize_simulation`` and with ``Runner.reset_simulation``. Each reset
+is followed by a short run, like an episode of the control environments. The wall time of the resets and of the runs
+is measured separately, so the resets per second only contain the reset itself. The target of ``reset_simulation`` is
+``TARGET_RESETS_PER_SECOND`` for this system.
+"""
+
+import gc
+import sys
+import time
+from typing import Tuple
+
+import prodsys
+from prodsys import express as psx
+from prodsys.simulation import sim
+
+sim.VERBOSE = 0
+prodsys.set_logging("CRITICAL")
+
+TARGET_RESETS_PER_SECOND = 100
+EPISODE_LENGTH = 20
+
+
+def create_most_trivial_system() -> prodsys.ProductionSystemData:
+    t1 = psx.FunctionTimeModel("normal", 1, 0.1, "t1")
+    t2 = psx.FunctionTimeModel("normal", 2, 0.2, "t2")
+
+    p1 = psx.ProductionProcess(t1, "p1")
+    p2 = psx.ProductionProcess(t2, "p2")
+
+    t3 = psx.DistanceTimeModel(speed=180, reaction_time=0.1, ID="t3")
+    tp = psx.TransportProcess(t3, "tp")
+
+    s1 = psx.FunctionTimeModel("exponential", 0.5, ID="s1")
+    setup_state_1 = psx.SetupState(s1, p1, p2, "S1")
+    setup_state_2 = psx.SetupState(s1, p2, p1, "S2")
+
+    machine = psx.Resource(
+        [p1, p2], [5, 0], 2, states=[setup_state_1, setup_state_2], ID="machine"
+    )
+    machine2 = psx.Resource(
+        [p1, p2], [7, 0], 2, states=[setup_state_1, setup_state_2], ID="machine2"
+    )
+    transport = psx.Resource([tp], [2, 0], 1, ID="transport")
+
+    product1 = psx.Product(process=[p1, p2], transport_process=tp, ID="product1")
+    product2 = psx.Product(process=[p2, p1], transport_process=tp, ID="product2")
+
+    sink1 = psx.Sink(product1, [10, 0], "sink1")
+    sink2 = psx.Sink(product2, [10, 0], "sink2")
+
+    arrival_model_1 = psx.FunctionTimeModel("exponential", 1, ID="arrival_model_1")
+    arrival_model_2 = psx.FunctionTimeModel("exponential", 2, ID="arrival_model_2")
+    source1 = psx.Source(product1, arrival_model_1, [0, 0], ID="source_1")
+    source2 = psx.Source(product2, arrival_model_2, [0, 0], ID="source_2")
+
+    system = psx.ProductionSystem(
+        [machine, machine2, transport], [source1, source2], [sink1, sink2]
+    )
+    return system.to_model()
+
+
+def benchmark_resets(fast_reset: bool, number_of_resets: int) -> Tuple[float, float]:
+    """
+    Resets and runs the most trivial example repeatedly and returns the resets per second and the episodes (reset
+    and run) per second of wall time.
+    """
+    runner = prodsys.runner.Runner(production_system_data=create_most_trivial_system())
+    runner.initialize_simulation()
+    reset_duration = 0.0
+    run_duration = 0.0
+    for _ in range(number_of_resets):
+        # The garbage of the previous episode is collected before the reset, so that garbage collections triggered
+        # by the objects of the episode are not measured as part of the reset.
+        gc.collect()
+        start = time.perf_counter()
+        if fast_reset:
+            runner.reset_simulation()
+        else:
+            runner.initialize_simulation()
+        reset_duration += time.perf_counter() - start
+        start = time.perf_counter()
+        runner.run(EPISODE_LENGTH)
+        run_duration += time.perf_counter() - start
+    return (
+        number_of_resets / reset_duration,
+        number_of_resets / (reset_duration + run_duration),
+    )
+
+
+if __name__ == "__main__":
+    number_of_resets = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    initialize, initialize_episodes = benchmark_resets(False, number_of_resets)
+    reset, reset_episodes = benchmark_resets(True, number_of_resets)
+    print(f"Resets:                {number_of_resets:,}")
+    print(
+        f"initialize_simulation: {initialize:,.1f} resets/s, "
+        f"{initialize_episodes:,.1f} episodes/s"
+    )
+    print(
+        f"reset_simulation:      {reset:,.1f} resets/s ({reset / initialize:.1f}x), "
+        f"{reset_episodes:,.1f} episodes/s ({reset_episodes / initialize_episodes:.1f}x)"
+    )
+    print(
+        f"Target:                {TARGET_RESETS_PER_SECOND:,} resets/s "
+        f"({'reached' if reset >= TARGET_RESETS_PER_SECOND else 'not reached'})"
+    )
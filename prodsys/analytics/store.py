@@ -7,7 +7,7 @@ directly from the interval representation.
 
 from __future__ import annotations
 
-from typing import Optional, Set
+from typing import Iterable, Optional, Set
 
 import pandas as pd
 import numpy as np
@@ -156,6 +156,7 @@ class AnalyticsStore:
         self._interval_chunks: list[pd.DataFrame] = []
         self._t_max: float = 0.0
         self._time_range = time_range
+        self._start_time: float = 0.0
         self._exclude_resources: Set[str] = exclude_resources or set()
         # Excludes derived from observed events (source/sink resources) are
         # tracked separately so metadata-only updates (F3) can recompute the
@@ -225,6 +226,16 @@ class AnalyticsStore:
 
         self._accumulate_wip_transfer_events(df_raw)
 
+    def ingest_event_chunks(self, chunks: Iterable[pd.DataFrame]) -> None:
+        """Ingest raw events batch by batch, e.g. the lazily read chunks of a
+        streamed event log, so only one batch is materialised at a time.
+
+        Chunks must be in time order and must not split events of the same
+        time stamp, as written by ``StreamingEventLog``.
+        """
+        for df_raw in chunks:
+            self.ingest_events(df_raw)
+
     def _accumulate_wip_transfer_events(self, df_raw: pd.DataFrame) -> None:
         """Accumulate per-resource WIP increment rows from raw events (per ingest batch)."""
         if df_raw is None or len(df_raw) == 0:
@@ -283,6 +294,15 @@ class AnalyticsStore:
         self._ri_cache = None
         self._ri_cache_key = None
 
+    def set_time_range(self, time_range: Optional[float], start_time: float = 0.0) -> None:
+        """Set the nominal analysis window, e.g. once a live-ingested
+        simulation run has finished. ``start_time`` moves the start of the
+        window, e.g. to skip the warm-up before a forked scenario."""
+        self._time_range = time_range
+        self._start_time = start_time
+        self._ri_cache = None
+        self._ri_cache_key = None
+
     def append_events(self, df_raw: pd.DataFrame) -> None:
         """Alias for ingest_events, for incremental append."""
         self.ingest_events(df_raw)
@@ -329,6 +349,11 @@ class AnalyticsStore:
             return self._time_range
         return self._t_max
 
+    @property
+    def simulation_start_time(self) -> float:
+        """Start of the analysis window for KPI queries without ``t_from``."""
+        return self._start_time
+
     def _compact_intervals(self) -> None:
         """Merge buffered ingest batches into the canonical interval frame (A8)."""
         if not self._interval_chunks:
@@ -357,11 +382,13 @@ class AnalyticsStore:
 
     def resource_intervals(
         self,
-        t_from: float = 0.0,
+        t_from: Optional[float] = None,
         t_to: Optional[float] = None,
         resource: Optional[str] = None,
     ) -> pd.DataFrame:
         """Resource intervals, optionally filtered by time range and resource."""
+        if t_from is None:
+            t_from = self.simulation_start_time
         if t_to is None:
             t_to = self.simulation_end_time
         cache_key = (t_from, t_to)
@@ -391,12 +418,14 @@ class AnalyticsStore:
 
     def product_intervals(
         self,
-        t_from: float = 0.0,
+        t_from: Optional[float] = None,
         t_to: Optional[float] = None,
     ) -> pd.DataFrame:
         """Product lifecycle intervals."""
         df = self.intervals
         df = df[df["entity_kind"] == "product"]
+        if t_from is None:
+            t_from = self.simulation_start_time
         if t_to is None:
             t_to = self.simulation_end_time
         df = df[(df["t_end"] >= t_from) & (df["t_start"] <= t_to)]
@@ -406,7 +435,7 @@ class AnalyticsStore:
 
     def throughput(
         self,
-        t_from: float = 0.0,
+        t_from: Optional[float] = None,
         t_to: Optional[float] = None,
     ) -> pd.DataFrame:
         """
@@ -440,7 +469,7 @@ class AnalyticsStore:
 
     def aggregated_throughput_time(
         self,
-        t_from: float = 0.0,
+        t_from: Optional[float] = None,
         t_to: Optional[float] = None,
     ) -> pd.Series:
         """Mean throughput time per product type."""
@@ -451,7 +480,7 @@ class AnalyticsStore:
 
     def aggregated_output_and_throughput(
         self,
-        t_from: float = 0.0,
+        t_from: Optional[float] = None,
         t_to: Optional[float] = None,
     ) -> pd.DataFrame:
         """Output count and throughput rate per product type."""
@@ -470,7 +499,7 @@ class AnalyticsStore:
 
     def aggregated_output(
         self,
-        t_from: float = 0.0,
+        t_from: Optional[float] = None,
         t_to: Optional[float] = None,
     ) -> pd.Series:
         """Total output per product type."""
@@ -483,7 +512,7 @@ class AnalyticsStore:
 
     def resource_states(
         self,
-        t_from: float = 0.0,
+        t_from: Optional[float] = None,
         t_to: Optional[float] = None,
         exclude_resources: Optional[Set[str]] = None,
     ) -> pd.DataFrame:
@@ -493,6 +522,8 @@ class AnalyticsStore:
         Returns DataFrame with columns:
             Resource, Time_type, time_increment, resource_time, percentage
         """
+        if t_from is None:
+            t_from = self.simulation_start_time
         if t_to is None:
             t_to = self.simulation_end_time
 
@@ -612,7 +643,7 @@ class AnalyticsStore:
     def resource_states_by_interval(
         self,
         interval_minutes: float,
-        t_from: float = 0.0,
+        t_from: Optional[float] = None,
         t_to: Optional[float] = None,
         exclude_resources: Optional[Set[str]] = None,
     ) -> pd.DataFrame:
@@ -623,6 +654,8 @@ class AnalyticsStore:
             Resource, Interval_start, Interval_end, Time_type,
             time_increment, interval_time, percentage
         """
+        if t_from is None:
+            t_from = self.simulation_start_time
         if t_to is None:
             t_to = self.simulation_end_time
 
@@ -689,7 +722,7 @@ class AnalyticsStore:
 
     def scrap_per_product_type(
         self,
-        t_from: float = 0.0,
+        t_from: Optional[float] = None,
         t_to: Optional[float] = None,
         primitive_types: Optional[Set[str]] = None,
     ) -> pd.DataFrame:
@@ -728,7 +761,7 @@ class AnalyticsStore:
 
     def scrap_per_resource(
         self,
-        t_from: float = 0.0,
+        t_from: Optional[float] = None,
         t_to: Optional[float] = None,
     ) -> pd.DataFrame:
         """
@@ -766,7 +799,7 @@ class AnalyticsStore:
 
     def production_flow_ratio(
         self,
-        t_from: float = 0.0,
+        t_from: Optional[float] = None,
         t_to: Optional[float] = None,
     ) -> pd.DataFrame:
         """
@@ -848,7 +881,7 @@ class AnalyticsStore:
 
     def wip(
         self,
-        t_from: float = 0.0,
+        t_from: Optional[float] = None,
         t_to: Optional[float] = None,
     ) -> pd.DataFrame:
         """
@@ -856,7 +889,10 @@ class AnalyticsStore:
 
         Returns DataFrame with columns: Time, WIP, WIP_Increment, Product_type
         """
-        df = self.product_intervals(t_from, t_to)
+        if t_from is None:
+            t_from = self.simulation_start_time
+        # Products created before the window still count towards its WIP.
+        df = self.product_intervals(0.0, t_to)
 
         created = df[df["state_type"] == "created_product"][["product_id", "product_type", "t_start"]].copy()
         created.columns = ["Product", "Product_type", "Time"]
@@ -873,6 +909,7 @@ class AnalyticsStore:
             return pd.DataFrame(columns=["Time", "WIP", "WIP_Increment", "Product_type"])
 
         events["WIP"] = events["WIP_Increment"].cumsum().clip(lower=0).astype(float)
+        events = events[events["Time"] >= t_from]
         return events[["Time", "WIP", "WIP_Increment", "Product_type", "Product"]].reset_index(drop=True)
 
     def _wip_sink_queues(self, sink_resources: Set[str]) -> Set[str]:
@@ -901,7 +938,7 @@ class AnalyticsStore:
 
     def wip_per_resource(
         self,
-        t_from: float = 0.0,
+        t_from: Optional[float] = None,
         t_to: Optional[float] = None,
     ) -> pd.DataFrame:
         """
@@ -910,6 +947,8 @@ class AnalyticsStore:
         Returns DataFrame with columns: Time, WIP, WIP_resource, WIP_Increment
         """
         empty = pd.DataFrame(columns=["Time", "WIP", "WIP_resource", "WIP_Increment"])
+        if t_from is None:
+            t_from = self.simulation_start_time
         if t_to is None:
             t_to = self.simulation_end_time
 
@@ -943,20 +982,24 @@ class AnalyticsStore:
 
     def aggregated_wip(
         self,
-        t_from: float = 0.0,
+        t_from: Optional[float] = None,
         t_to: Optional[float] = None,
     ) -> pd.Series:
         """Mean WIP per product type (plus Total)."""
-        df = self.wip(t_from, t_to)
+        if t_from is None:
+            t_from = self.simulation_start_time
+        # Per product type WIP is accumulated from the start of the run.
+        df_all = self.wip(0.0, t_to)
+        df = df_all[df_all["Time"] >= t_from]
         if len(df) == 0:
             return pd.Series(dtype=float, name="WIP")
 
         # Per product type
         results = {}
         for pt in df["Product_type"].dropna().unique():
-            pt_df = df[df["Product_type"] == pt].copy()
+            pt_df = df_all[df_all["Product_type"] == pt].copy()
             pt_df["WIP_pt"] = pt_df["WIP_Increment"].cumsum().clip(lower=0).astype(float)
-            results[pt] = pt_df["WIP_pt"].mean()
+            results[pt] = pt_df.loc[pt_df["Time"] >= t_from, "WIP_pt"].mean()
 
         # Total
         results["Total"] = df["WIP"].mean()
@@ -1163,7 +1206,7 @@ class AnalyticsStore:
 
     def oee_per_resource(
         self,
-        t_from: float = 0.0,
+        t_from: Optional[float] = None,
         t_to: Optional[float] = None,
     ) -> pd.DataFrame:
         """
@@ -1240,7 +1283,7 @@ class AnalyticsStore:
 
     def oee_production_system(
         self,
-        t_from: float = 0.0,
+        t_from: Optional[float] = None,
         t_to: Optional[float] = None,
     ) -> pd.DataFrame:
         """
@@ -1378,7 +1421,7 @@ class AnalyticsStore:
     def oee_per_resource_by_interval(
         self,
         interval_minutes: float,
-        t_from: float = 0.0,
+        t_from: Optional[float] = None,
         t_to: Optional[float] = None,
     ) -> pd.DataFrame:
         """
@@ -1388,6 +1431,8 @@ class AnalyticsStore:
             Resource, Interval_start, Interval_end, Availability,
             Performance, Quality, OEE
         """
+        if t_from is None:
+            t_from = self.simulation_start_time
         rs = self.resource_states_by_interval(interval_minutes, t_from, t_to)
         if len(rs) == 0:
             return pd.DataFrame(columns=[
@@ -1533,7 +1578,7 @@ class AnalyticsStore:
     def _compute_performance(
         self,
         resource: str,
-        t_from: float,
+        t_from: Optional[float],
         t_to: Optional[float],
         pr_time: float,
         process_ideal_times: dict,
@@ -119,7 +119,7 @@ class AbstractRoutingControlEnv(gym.Env, ABC):
         """
         super().reset(seed=seed)
 
-        self.runner.initialize_simulation()
+        self.runner.reset_simulation()
         self.interrupt_simulation_event = events.Event(self.runner.env)
         self.chose_resource_event = events.Event(self.runner.env)
         # v1 runner creates and starts routers via RouterFactory.
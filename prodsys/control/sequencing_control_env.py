@@ -30,6 +30,10 @@ class AbstractSequencingControlEnv(gym.Env, ABC):
         observation_space (Optional[spaces.Space], optional): The observation space of the environment.
         action_space (Optional[spaces.Space], optional): The action space of the environment.
         render_mode (Optional[str], optional): The render mode of the environment. Defaults to None.
+        use_array_observer (bool, optional): Whether to additionally observe the resource with an incrementally updated
+            `observer.ResourceArrayObserver`. Defaults to False.
+        max_queue_length (Optional[int], optional): Number of queue slots of the array observer. Defaults to None, which
+            uses the capacity of the ports of the resource with limited capacity.
 
     Attributes:
         adapter (adapters.ProductionSystemAdapter): The adapter.
@@ -42,6 +46,7 @@ class AbstractSequencingControlEnv(gym.Env, ABC):
         resource_controller (control.Controller): The controller of the resource.
         resource (resources.Resource): The resource to control.
         observer (observer.ResourceObserver): The observer of the resource.
+        array_observer (Optional[observer.ResourceArrayObserver]): The array observer of the resource, if `use_array_observer` is True.
         step_count (int): The number of steps taken in the environment.
         reward (float): The reward of the environment.
     """
@@ -53,12 +58,16 @@ class AbstractSequencingControlEnv(gym.Env, ABC):
         observation_space: Optional[spaces.Space] = None,
         action_space: Optional[spaces.Space] = None,
         render_mode: Optional[str] = None,
+        use_array_observer: bool = False,
+        max_queue_length: Optional[int] = None,
     ):
         self.adapter = adapter
         self.resource_id = resource_id
         self.observation_space = observation_space
         self.action_space = action_space
         self.render_mode = render_mode
+        self.use_array_observer = use_array_observer
+        self.max_queue_length = max_queue_length
 
         self.runner = runner.Runner(production_system_data=self.adapter)
 
@@ -66,6 +75,7 @@ class AbstractSequencingControlEnv(gym.Env, ABC):
         self.resource_controller: control.Controller = None
         self.resource: resources.Resource = None
         self.observer: observer.ResourceObserver = None
+        self.array_observer: Optional[observer.ResourceArrayObserver] = None
         self.step_count: int = 0
         self.reward = 0
 
@@ -125,7 +135,7 @@ class AbstractSequencingControlEnv(gym.Env, ABC):
         """
         super().reset(seed=seed)
 
-        self.runner.initialize_simulation()
+        self.runner.reset_simulation()
         self.interrupt_simulation_event = events.Event(self.runner.env)
         self.resource_controller = self.runner.resource_factory.get_resource(
             self.resource_id
@@ -138,6 +148,10 @@ class AbstractSequencingControlEnv(gym.Env, ABC):
             product_factory=self.runner.product_factory,
             resource=self.resource,
         )
+        if self.use_array_observer:
+            self.array_observer = observer.ResourceArrayObserver(
+                self.resource, self.runner.product_factory, self.max_queue_length
+            )
 
         self.runner.env.run_until(until=self.interrupt_simulation_event)
         self.interrupt_simulation_event = events.Event(self.runner.env)
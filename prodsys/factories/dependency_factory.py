@@ -142,7 +142,8 @@ class DependencyFactory:
             if not hasattr(process.data, "dependency_ids"):
                 process.dependencies = []
                 continue
-            dependencies = process.data.dependency_ids
-            for dependency_id in dependencies:
-                dependency = self.get_dependency(dependency_id)
-                process.dependencies.append(dependency)
+            # Processes are reused by Runner.reset_simulation, so their dependencies are replaced instead of extended.
+            process.dependencies = [
+                self.get_dependency(dependency_id)
+                for dependency_id in process.data.dependency_ids
+            ]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Dict, List, Literal, Optional, TYPE_CHECKING
 
 from prodsys.factories import time_model_factory
 from prodsys.models import processes_data
@@ -29,17 +29,28 @@ class ProcessFactory:
 
     Args:
         time_model_factory (time_model_factory.TimeModelFactory): Factory that creates time model objects.
+        route_finder_backend (Literal["dijkstra", "csgraph"], optional): Backend of the route finder for the created link transport processes. Defaults to "dijkstra".
+        transport_route_mode (Literal["hops", "macro"], optional): How routes with multiple links of the created link transport processes are simulated. Defaults to "hops".
         processes (List[process.PROCESS_UNION], optional): List of process objects. Defaults to [] and is filled by the `create_processes` method.
     """
 
-    def __init__(self, time_model_factory: time_model_factory.TimeModelFactory):
+    def __init__(
+        self,
+        time_model_factory: time_model_factory.TimeModelFactory,
+        route_finder_backend: Literal["dijkstra", "csgraph"] = "dijkstra",
+        transport_route_mode: Literal["hops", "macro"] = "hops",
+    ):
         """
         Initializes the ProcessFactory with the given time model factory.
 
         Args:
             time_model_factory (time_model_factory.TimeModelFactory): Factory that creates time model objects.
+            route_finder_backend (Literal["dijkstra", "csgraph"], optional): Backend of the route finder for the created link transport processes. Defaults to "dijkstra".
+            transport_route_mode (Literal["hops", "macro"], optional): How routes with multiple links of the created link transport processes are simulated. Defaults to "hops".
         """
         self.time_model_factory = time_model_factory
+        self.route_finder_backend = route_finder_backend
+        self.transport_route_mode = transport_route_mode
         self.processes: Dict[str, process.PROCESS_UNION] = {}
 
     def create_processes(self, adapter: production_system_data.ProductionSystemData):
@@ -140,7 +151,13 @@ class ProcessFactory:
             ]
             values.update({"contained_processes_data": contained_processes_data})
         if isinstance(process_data, processes_data.LinkTransportProcessData):
-            values.update({"links": [[]]})
+            values.update(
+                {
+                    "links": [[]],
+                    "route_finder_backend": self.route_finder_backend,
+                    "route_mode": self.transport_route_mode,
+                }
+            )
         if isinstance(process_data, processes_data.ReworkProcessData):
             # TODO: think about getting here the processes and not only ids...
             values.update({"reworked_process_ids": process_data.reworked_process_ids})
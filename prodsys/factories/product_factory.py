@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Dict, Optional, Callable
+import copy
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, List, Dict, Optional, Callable, Deque, Union
 
 from prodsys.models.product_data import ProductData
 from prodsys.models.source_data import RoutingHeuristic
@@ -19,6 +22,42 @@ if TYPE_CHECKING:
     from prodsys.simulation import logger
     from prodsys.factories.dependency_factory import DependencyFactory
     from prodsys.simulation.schedule_completion import ScheduleCompletionTracker
+    from prodsys.simulation.dependency import Dependency
+
+
+@dataclass
+class ProductTemplate:
+    """
+    Precompiled parts of all products of one product type. Products are stamped from the template instead of
+    building and registering a process model and resolving the transport process and dependencies per product.
+
+    Args:
+        process_model (process.ProcessModelProcess): Process model of the product type.
+        transport_process (process.PROCESS_UNION): Transport process of the product type.
+        dependencies (Optional[List[Dependency]], optional): Dependencies of the product type. Defaults to None.
+        dependencies_resolved (bool, optional): Whether the dependencies were already resolved. Defaults to False.
+    """
+
+    process_model: process.ProcessModelProcess
+    transport_process: process.PROCESS_UNION
+    dependencies: Optional[List[Dependency]] = None
+    dependencies_resolved: bool = False
+
+    def create_process_model(self, product_id: str) -> process.ProcessModelProcess:
+        """
+        Creates the process model of a single product, which shares the processes of the template but has an
+        independent precedence graph.
+
+        Args:
+            product_id (str): ID of the product.
+
+        Returns:
+            process.ProcessModelProcess: The process model of the product.
+        """
+        process_model = copy.copy(self.process_model)
+        process_model.data = self.process_model.data.model_copy(update={"ID": product_id})
+        process_model.precedence_graph = self.process_model.precedence_graph.create_instance()
+        return process_model
 
 
 class ProductFactory:
@@ -28,16 +67,36 @@ class ProductFactory:
     Args:
         env (sim.Environment): prodsys simulation environment.
         process_factory (process_factory.ProcessFactory): Factory that creates process objects.
+        adapter (production_system_data.ProductionSystemData): Production system the products belong to.
+        finished_product_retention (Optional[int], optional): How many finished product objects are kept in
+            `finished_products`. None keeps all finished products. An integer N only keeps the last N finished
+            products and releases the process model of every finished product, so the memory stays bounded in
+            long runs. 0 only keeps the counters `finished_product_count` and `finished_product_counts`. Defaults to None.
     """
 
     def __init__(
-        self, env: sim.Environment, process_factory: process_factory.ProcessFactory, adapter: production_system_data.ProductionSystemData
+        self,
+        env: sim.Environment,
+        process_factory: process_factory.ProcessFactory,
+        adapter: production_system_data.ProductionSystemData,
+        finished_product_retention: Optional[int] = None,
     ):
         self.env = env
         self.process_factory = process_factory
         self.adapter: production_system_data.ProductionSystemData = adapter
         self.products: Dict[str, product.Product] = {}
-        self.finished_products = []
+        if finished_product_retention is not None and finished_product_retention < 0:
+            raise ValueError(
+                f"finished_product_retention must be None or a non-negative integer, got {finished_product_retention}."
+            )
+        self.finished_product_retention = finished_product_retention
+        self.finished_products: Union[List[product.Product], Deque[product.Product]] = (
+            []
+            if finished_product_retention is None
+            else deque(maxlen=finished_product_retention)
+        )
+        self.finished_product_count = 0
+        self.finished_product_counts: Dict[str, int] = {}
         self.event_logger: logger.EventLogger = None
         self.product_counter = 0
         self.router: router_module.Router = None
@@ -46,6 +105,7 @@ class ProductFactory:
         self.routing_heuristic_override: Optional[Callable] = None
         self.dependency_factory: DependencyFactory = None
         self.products_init: Dict[str, product.Product] = {}
+        self.product_templates: Dict[str, ProductTemplate] = {}
         # Set by :class:`prodsys.simulation.runner.Runner` when the model
         # ships with a schedule.  Sinks consult this on every finished
         # product so the runner can terminate as soon as the scheduled
@@ -87,18 +147,13 @@ class ProductFactory:
             for product_data in adapter.product_data:
             
             
+                product_template = self.get_product_template(product_data)
                 product_data = product_data.model_copy()
                 product_data.ID = (
                     str(product_data.type) 
                 )
-                process_model = self.create_process_model(product_data)
-                transport_processes = self.process_factory.get_process(
-                    product_data.transport_process
-                )
-                if not transport_processes or isinstance(
-                    transport_processes, process.ProductionProcess
-                ):
-                    raise ValueError("Transport process not found.")
+                process_model = product_template.process_model
+                transport_processes = product_template.transport_process
                 
                 routing_heuristic_callable = router_module.ROUTING_HEURISTIC.get("FIFO")
                 
@@ -162,6 +217,7 @@ class ProductFactory:
         Returns:
             product.Product: Created product object.
         """
+        product_template = self.get_product_template(product_data)
         product_data = product_data.model_copy()
         if not product_id:
             product_id = (
@@ -169,14 +225,8 @@ class ProductFactory:
             )
         self.product_counter += 1
         product_data.ID = product_id
-        process_model = self.create_process_model(product_data)
-        transport_processes = self.process_factory.get_process(
-            product_data.transport_process
-        )
-        if not transport_processes or isinstance(
-            transport_processes, process.ProductionProcess
-        ):
-            raise ValueError("Transport process not found.")
+        process_model = product_template.create_process_model(product_id)
+        transport_processes = product_template.transport_process
         if self.routing_heuristic_override is not None:
             routing_heuristic_callable = self.routing_heuristic_override
         else:
@@ -186,11 +236,15 @@ class ProductFactory:
             if routing_heuristic_callable is None:
                 raise ValueError(f"Routing heuristic {routing_heuristic} not found.")
         
-        if product_data.dependency_ids:
-            dependencies = []
-            for dependency_id in product_data.dependency_ids:
-                dependency = self.dependency_factory.get_dependency(dependency_id)
-                dependencies.append(dependency)
+        if not product_template.dependencies_resolved:
+            if product_data.dependency_ids:
+                product_template.dependencies = [
+                    self.dependency_factory.get_dependency(dependency_id)
+                    for dependency_id in product_data.dependency_ids
+                ]
+            product_template.dependencies_resolved = True
+        if product_template.dependencies is not None:
+            dependencies = list(product_template.dependencies)
         else:
             dependencies = None
 
@@ -213,6 +267,40 @@ class ProductFactory:
         self.products[product_data.ID] = product_object
         return product_object
 
+    def get_product_template(self, product_data: ProductData) -> ProductTemplate:
+        """
+        Returns the template of the product type of the given product data and compiles it on first use. The
+        process model of the template is registered at the process factory with the product type as ID.
+
+        Args:
+            product_data (ProductData): Product data of the product type.
+
+        Raises:
+            ValueError: If the transport process is not found.
+
+        Returns:
+            ProductTemplate: The template of the product type.
+        """
+        product_type = str(product_data.type)
+        product_template = self.product_templates.get(product_type)
+        if product_template is not None:
+            return product_template
+        template_data = product_data.model_copy()
+        template_data.ID = product_type
+        process_model = self.create_process_model(template_data)
+        transport_process = self.process_factory.get_process(
+            product_data.transport_process
+        )
+        if not transport_process or isinstance(
+            transport_process, process.ProductionProcess
+        ):
+            raise ValueError("Transport process not found.")
+        product_template = ProductTemplate(
+            process_model=process_model, transport_process=transport_process
+        )
+        self.product_templates[product_type] = product_template
+        return product_template
+
     def get_precendece_graph_from_id_adjacency_matrix(
         self, id_adjacency_matrix: Dict[str, List[str]]
     ) -> process_models.PrecedenceGraphProcessModel:
@@ -294,7 +382,19 @@ class ProductFactory:
         Args:
             product (product.Product): Product object that is registered as a finished product object.
         """
-        self.finished_products.append(product)
+        self.finished_product_count += 1
+        product_type = str(product.data.type)
+        self.finished_product_counts[product_type] = (
+            self.finished_product_counts.get(product_type, 0) + 1
+        )
+        if self.finished_product_retention is not None:
+            if not product.data.becomes_consumable:
+                # The per-instance process model is not needed after the product is finished.
+                product.process_model = None
+            if self.finished_product_retention > 0:
+                self.finished_products.append(product)
+        else:
+            self.finished_products.append(product)
         self.remove_product(product)
 
 
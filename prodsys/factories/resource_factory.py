@@ -18,6 +18,7 @@ from prodsys.models.resource_data import (
     TransportControlPolicy,
 )
 from prodsys.models import performance_data, processes_data
+from prodsys.models.schedule_data import ColumnarScheduleEvents
 from prodsys.factories import port_factory, process_factory, state_factory
 
 from prodsys.simulation import control, resources
@@ -66,7 +67,11 @@ def get_scheduled_control_policy(
         if process_id and product_id and event.state_type in ("Production", "Transport", "Setup"):
             schedule_matches_by_key[(product_id, process_id)].append(index)
 
-    dependency_attendance_matches = build_dependency_attendance_schedule_index(schedule)
+    # Lists instead of deques, so that the policy can bisect the sorted schedule indices.
+    dependency_attendance_matches = {
+        key: list(indices)
+        for key, indices in build_dependency_attendance_schedule_index(schedule).items()
+    }
 
     return partial(
         control.scheduled_control_policy,
@@ -74,16 +79,35 @@ def get_scheduled_control_policy(
         dependency_attendance_matches,
         list(schedule),
         fallback_policy,
+        schedule_cursor=control.ScheduleCursor(),
     )
 
 
+def copy_state_for_resource(actual_state: state.STATE_UNION, _env: sim.Environment) -> state.STATE_UNION:
+    """
+    Copies a state of the state factory for a resource. The state data is static and shared with the copy and the copy
+    is bound to the given environment instead of a copy of the environment of the original state.
+
+    Args:
+        actual_state (state.STATE_UNION): State of the state factory.
+        _env (sim.Environment): Environment of the copy.
+
+    Returns:
+        state.STATE_UNION: Copy of the state.
+    """
+    memo = {id(actual_state.data): actual_state.data}
+    if actual_state.env is not None:
+        memo[id(actual_state.env)] = _env
+    return copy.deepcopy(actual_state, memo)
+
+
 def register_states(
     resource: resources.Resource,
     states: List[state.STATE_UNION],
     _env: sim.Environment,
 ):
     for actual_state in states:
-        copy_state = copy.deepcopy(actual_state)
+        copy_state = copy_state_for_resource(actual_state, _env)
         copy_state.env = _env
         resource.add_state(copy_state)
 
@@ -98,7 +122,7 @@ def register_production_states(
             actual_state.env = None
             active_before = actual_state.active
             actual_state.active = None
-            copy_state = copy.deepcopy(actual_state)
+            copy_state = copy_state_for_resource(actual_state, _env)
             actual_state.env = _env
             copy_state.active = active_before
             copy_state.env = _env
@@ -204,6 +228,12 @@ def adjust_process_breakdown_states(
         process_breakdown_state.set_production_states(production_states)
 
 
+SCHEDULED_STATE_TYPES = ("Production", "Transport", "Dependency", "Setup")
+"""
+State types of the schedule events that are followed by the scheduled control policies of the resources.
+"""
+
+
 class ResourceFactory:
     """
     Factory class that creates and stores `prodsys.simulation` resource objects from `prodsys.models` resource objects.
@@ -230,6 +260,19 @@ class ResourceFactory:
         self.state_factory = state_factory
         self.queue_factory = queue_factory
         self.schedule = schedule
+        self.schedule_by_resource: Dict[str, List[performance_data.Event]] = {}
+        if isinstance(schedule, ColumnarScheduleEvents):
+            # Group on the columns, so that events are only created for the scheduled states of the resources.
+            data = schedule.columnar_schedule.data
+            self.schedule_by_resource = schedule.columnar_schedule.group_events(
+                "Resource",
+                (data["Activity"] == "start state")
+                & data["State Type"].isin(SCHEDULED_STATE_TYPES),
+            )
+        elif schedule is not None:
+            for event in schedule:
+                if event.activity == "start state" and event.state_type in SCHEDULED_STATE_TYPES:
+                    self.schedule_by_resource.setdefault(event.resource, []).append(event)
         self.strict_schedule_timing = strict_schedule_timing
         self.global_system_resource: resources.SystemResource = None
         self.all_resources: Dict[str, resources.Resource] = {}
@@ -362,12 +405,7 @@ class ResourceFactory:
         resource_schedule = []
         if self.schedule is not None:
             # Filter schedule events for this specific resource
-            resource_schedule = [
-                event for event in self.schedule
-                if event.resource == resource_data.ID
-                and event.activity == "start state"
-                and event.state_type in ("Production", "Transport", "Dependency", "Setup")
-            ]
+            resource_schedule = self.schedule_by_resource.get(resource_data.ID, [])
             
             if resource_schedule:
                 # Get fallback policy
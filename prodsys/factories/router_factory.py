@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Dict, Literal, Optional
 
 from prodsys.simulation import sim
 from prodsys.simulation import router as router_module
@@ -30,6 +30,9 @@ class RouterFactory:
         primitive_factory: primitive_factory.PrimitiveFactory,
         dependency_factory: dependency_factory.DependencyFactory,
         production_system_data: production_system_data.ProductionSystemData,
+        compatibility_cache_directory: Optional[str] = None,
+        transport_compatibility_mode: Literal["eager", "lazy"] = "eager",
+        compatibility_tables: Optional[Dict[str, Any]] = None,
     ):
         self.env = env
         self.resource_factory = resource_factory
@@ -51,9 +54,19 @@ class RouterFactory:
             self.source_factory,
             self.primitive_factory,
             self.dependency_factory,
+            production_system_data=self.production_system_data,
+            cache_directory=compatibility_cache_directory,
+            transport_compatibility_mode=transport_compatibility_mode,
+            compatibility_tables=compatibility_tables,
         )
 
     def create_routers(self):
+        # The routing maps of the schedule are built once and shared by all routers.
+        schedule_routing_maps = None
+        if self.production_system_data is not None and self.production_system_data.schedule:
+            schedule_routing_maps = router_module.ScheduleRoutingMaps(
+                self.production_system_data.schedule
+            )
         for system_sources in self.resource_factory.system_resources.values():
             router = router_module.Router(
                 env=self.env,
@@ -65,6 +78,7 @@ class RouterFactory:
                 production_system_data=self.production_system_data,
                 resources=system_sources.subresources,
                 process_matcher=self.process_matcher,
+                schedule_routing_maps=schedule_routing_maps,
             )
             system_sources.router = router
             self.system_routers[system_sources.data.ID] = router
@@ -80,6 +94,7 @@ class RouterFactory:
             production_system_data=self.production_system_data,
             resources=self.resource_factory.global_system_resource.subresources,
             process_matcher=self.process_matcher,
+            schedule_routing_maps=schedule_routing_maps,
         )
         self.global_system_router = global_system_router
         self.resource_factory.global_system_resource.set_router(global_system_router)
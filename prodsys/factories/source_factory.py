@@ -10,6 +10,7 @@ from prodsys.simulation import router as router_module
 from prodsys.models.product_data import ProductData
 from prodsys.models.source_data import SourceData, OrderSourceData
 from prodsys.models import performance_data, order_data
+from prodsys.models.schedule_data import ColumnarScheduleEvents
 
 logger = logging.getLogger(__name__)
 
@@ -62,7 +63,10 @@ class SourceFactory:
         # access the attribute right after construction (mostly tests) keep
         # working with the simple ``Type_index`` ID convention.
         self._raw_schedule = schedule
-        self.schedule_per_product = self._schedule_per_product(schedule, valid_types=None)
+        self.schedule_per_product: Dict[str, List[performance_data.Event]] = {}
+        if not isinstance(schedule, ColumnarScheduleEvents):
+            # Columnar schedules are only partitioned once, when the product types are known.
+            self.schedule_per_product = self._schedule_per_product(schedule, valid_types=None)
 
         self.sources: Dict[str, source.Source] = {}
 
@@ -108,6 +112,20 @@ class SourceFactory:
         if not schedule:
             return schedule_per_product
 
+        if isinstance(schedule, ColumnarScheduleEvents):
+            # Sources release every product once at its first scheduled event, so only the events of the first rows
+            # of the products are created, grouped by the product types of their product IDs.
+            products = schedule.columnar_schedule.data["Product"]
+            product_types = products.map(
+                {
+                    product_id: self._get_product_type(str(product_id), valid_types=valid_types)
+                    for product_id in products.dropna().unique()
+                }
+            )
+            return schedule.columnar_schedule.group_events(
+                product_types, products.notna() & (products != "") & ~products.duplicated()
+            )
+
         for event in schedule:
             product_type = self._get_product_type(event.product, valid_types=valid_types)
             if product_type not in schedule_per_product:
@@ -23,6 +23,9 @@ STATE_MAP = {
     state_data.StateTypeEnum.NonScheduled: state.NonScheduledState,
 }
 
+# Building the type adapter of the state data union is expensive, so it is only built once.
+STATE_DATA_ADAPTER = TypeAdapter(state_data.STATE_DATA_UNION)
+
 
 class StateFactory:
     """
@@ -48,7 +51,7 @@ class StateFactory:
             for values in items.values():
                 values.update({"type": cls_name})
                 self.state_data.append(
-                    TypeAdapter(state_data.STATE_DATA_UNION).validate_python(values)
+                    STATE_DATA_ADAPTER.validate_python(values)
                 )
                 self.add_state(self.state_data[-1])
 
@@ -23,6 +23,32 @@ TIME_MODEL_MAP = {
 }
 
 
+def get_static_locations(
+    adapter: production_system_data.ProductionSystemData,
+) -> List[List[float]]:
+    """
+    Returns the locations of all resources, sources, sinks, nodes and ports with a location of a production system.
+
+    Args:
+        adapter (production_system_data.ProductionSystemData): Production system that contains the locations.
+
+    Returns:
+        List[List[float]]: The locations.
+    """
+    locations = []
+    for locatable_data in (
+        adapter.resource_data
+        + adapter.source_data
+        + adapter.sink_data
+        + adapter.node_data
+    ):
+        locations.append(locatable_data.location)
+    for port in adapter.port_data:
+        if getattr(port, "location", None) is not None:
+            locations.append(port.location)
+    return locations
+
+
 class TimeModelFactory:
     """
     Factory class that creates and stores `prodsys.simulation` time model objects based on the given time model data according to `prodsys.models.time_model_data.TIME_MODEL_DATA`.
@@ -68,8 +94,19 @@ class TimeModelFactory:
             time_model_class = self.get_class(time_model_data)
 
             time_model = time_model_class(time_model_data)
+            time_model.set_seed(adapter.seed)
             self.time_models[time_model_data.ID] = time_model
 
+        distance_time_models = [
+            time_model
+            for time_model in self.time_models.values()
+            if isinstance(time_model, DistanceTimeModel)
+        ]
+        if distance_time_models:
+            locations = get_static_locations(adapter)
+            for time_model in distance_time_models:
+                time_model.precompute_travel_times(locations)
+
     def get_time_models(self, IDs: List[str]) -> List[TimeModel]:
         """
         Returns a list of time model objects with the given IDs.
@@ -48,10 +48,7 @@ class ProcessDependencyData(DependencyData):
         Returns:
             str: Hash of the process dependency.
         """
-        process_hash = ""
-        for process in adapter.process_data:
-            if process.ID == self.required_process:
-                process_hash = process.hash(adapter)
+        process_hash = adapter.get_hash_by_ID("process_data", self.required_process) or ""
         return md5(
             "".join([self.dependency_type, process_hash]).encode("utf-8")
         ).hexdigest()
@@ -71,10 +68,7 @@ class ResourceDependencyData(DependencyData):
         Returns:
             str: Hash of the resource dependency.
         """
-        resource_hash = ""
-        for resource in adapter.resource_data:
-            if resource.ID == self.required_resource:
-                resource_hash = resource.hash(adapter)
+        resource_hash = adapter.get_hash_by_ID("resource_data", self.required_resource) or ""
         return md5(
             "".join([self.dependency_type, resource_hash]).encode("utf-8")
         ).hexdigest()
@@ -106,10 +100,11 @@ class ToolDependencyData(DependencyData):
         Returns:
             str: Hash of the primitive dependency.
         """
-        entity_hash = ""
-        for entity in adapter.primitive_data + adapter.product_data:
-            if entity.ID == self.required_entity:
-                entity_hash = entity.hash(adapter)
+        entity_hash = (
+            adapter.get_hash_by_ID("product_data", self.required_entity)
+            or adapter.get_hash_by_ID("primitive_data", self.required_entity)
+            or ""
+        )
         return md5(
             "".join([self.dependency_type, entity_hash]).encode("utf-8")
         ).hexdigest()
@@ -127,10 +122,11 @@ class AssemblyDependencyData(DependencyData):
         Returns:
             str: Hash of the assembly dependency.
         """
-        entity_hash = ""
-        for entity in adapter.primitive_data + adapter.product_data:
-            if entity.ID == self.required_entity:
-                entity_hash = entity.hash(adapter)
+        entity_hash = (
+            adapter.get_hash_by_ID("product_data", self.required_entity)
+            or adapter.get_hash_by_ID("primitive_data", self.required_entity)
+            or ""
+        )
         return md5(
             "".join([self.dependency_type, entity_hash]).encode("utf-8")
         ).hexdigest()
@@ -147,10 +143,11 @@ class DisassemblyDependencyData(DependencyData):
         Returns:
             str: Hash of the disassembly dependency.
         """
-        entity_hash = ""
-        for entity in adapter.primitive_data + adapter.product_data:
-            if entity.ID == self.required_entity:
-                entity_hash = entity.hash(adapter)
+        entity_hash = (
+            adapter.get_hash_by_ID("product_data", self.required_entity)
+            or adapter.get_hash_by_ID("primitive_data", self.required_entity)
+            or ""
+        )
         return md5(
             "".join([self.dependency_type, entity_hash]).encode("utf-8")
         ).hexdigest()
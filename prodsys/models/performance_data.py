@@ -134,3 +134,56 @@ class Performance(BaseModel):
         self, context: Tuple[KPILevelEnum, ...], name: KPIEnum
     ) -> List[KPI_UNION]:
         return [kpi for kpi in self.kpis if context == kpi.context and name == kpi.name]
+
+
+class KPISummary(BaseModel):
+    """
+    Class that represents the summary of a KPI over independent replications of a simulation.
+
+    Args:
+        name (KPIEnum): Name of the KPI.
+        context (Optional[Tuple[KPILevelEnum, ...]], optional): Context of the KPI. Defaults to None.
+        resource (Optional[str], optional): Resource of the KPI. Defaults to None.
+        product_type (Optional[str], optional): Product type of the KPI. Defaults to None.
+        values (List[float]): Values of the KPI in the replications.
+        mean (float): Mean of the values.
+        std (float): Sample standard deviation of the values. 0 for a single replication.
+        confidence_interval (Tuple[float, float]): Student-t confidence interval of the mean.
+        confidence_level (float): Confidence level of the confidence interval.
+    """
+
+    name: KPIEnum
+    context: Optional[Tuple[KPILevelEnum, ...]] = None
+    resource: Optional[str] = None
+    product_type: Optional[str] = None
+    values: List[float]
+    mean: float
+    std: float
+    confidence_interval: Tuple[float, float]
+    confidence_level: float
+
+
+class ReplicationPerformance(BaseModel):
+    """
+    Class that represents the performance of independent replications of a simulation.
+
+    Args:
+        seeds (List[int]): Seeds of the replications.
+        kpis (List[KPISummary]): Summaries of the KPIs over the replications.
+        event_log_directories (Optional[List[str]], optional): Directories with the Parquet event log chunks of the replications, in the order of the seeds. Defaults to None.
+    """
+
+    seeds: List[int]
+    kpis: List[KPISummary]
+    event_log_directories: Optional[List[str]] = None
+
+    def get_kpi_for_context(self, context: Tuple[KPILevelEnum, ...]) -> List[KPISummary]:
+        return [kpi for kpi in self.kpis if context == kpi.context]
+
+    def get_kpi_for_name(self, name: KPIEnum) -> List[KPISummary]:
+        return [kpi for kpi in self.kpis if name == kpi.name]
+
+    def get_kpi_for_context_and_name(
+        self, context: Tuple[KPILevelEnum, ...], name: KPIEnum
+    ) -> List[KPISummary]:
+        return [kpi for kpi in self.kpis if context == kpi.context and name == kpi.name]
@@ -77,11 +77,8 @@ class ProcessData(CoreAsset):
         Returns:
             str: hash of the process data.
         """
-        for time_model in adapter.time_model_data:
-            if time_model.ID == self.time_model_id:
-                time_model_hash = time_model.hash()
-                break
-        else:
+        time_model_hash = adapter.get_hash_by_ID("time_model_data", self.time_model_id)
+        if time_model_hash is None:
             raise ValueError(
                 f"Time model with ID {self.time_model_id} not found for process {self.ID}."
             )
@@ -265,16 +262,14 @@ class TransportProcessData(ProcessData):
         unloading_time_model_hash = ""
 
         if self.loading_time_model_id:
-            for time_model in adapter.time_model_data:
-                if time_model.ID == self.loading_time_model_id:
-                    loading_time_model_hash = time_model.hash()
-                    break
+            loading_time_model_hash = (
+                adapter.get_hash_by_ID("time_model_data", self.loading_time_model_id) or ""
+            )
 
         if self.unloading_time_model_id:
-            for time_model in adapter.time_model_data:
-                if time_model.ID == self.unloading_time_model_id:
-                    unloading_time_model_hash = time_model.hash()
-                    break
+            unloading_time_model_hash = (
+                adapter.get_hash_by_ID("time_model_data", self.unloading_time_model_id) or ""
+            )
         input_data = (
             base_class_hash + loading_time_model_hash + unloading_time_model_hash
         )
@@ -380,14 +375,12 @@ class CompoundProcessData(CoreAsset):
         """
         process_hashes = []
         for process_id in self.process_ids:
-            for process in adapter.process_data:
-                if process.ID == process_id:
-                    process_hashes.append(process.hash(adapter))
-                    break
-            else:
+            process_hash = adapter.get_hash_by_ID("process_data", process_id)
+            if process_hash is None:
                 raise ValueError(
                     f"Process with ID {process_id} not found for compound process {self.ID}."
                 )
+            process_hashes.append(process_hash)
         return md5("".join([*sorted(process_hashes)]).encode("utf-8")).hexdigest()
 
 
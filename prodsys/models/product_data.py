@@ -118,20 +118,17 @@ class ProductData(PrimitiveData):
         # Hash all unique processes in the adjacency matrix
         unique_process_ids = sorted(set(self.processes.keys()))
         for process_id in unique_process_ids:
-            process = next((process for process in adapter.process_data if process.ID == process_id), None)
-            if process is None:
+            process_hash = adapter.get_hash_by_ID("process_data", process_id)
+            if process_hash is None:
                 raise ValueError(
                     f"Process with ID {process_id} not found for product {self.ID}."
                 )
-            processes_hashes.append(process.hash(adapter))
+            processes_hashes.append(process_hash)
 
         # TODO: add hashing for dependencies!
 
-        for transport_process in adapter.process_data:
-            if transport_process.ID == self.transport_process:
-                transport_process_hash = transport_process.hash(adapter)
-                break
-        else:
+        transport_process_hash = adapter.get_hash_by_ID("process_data", self.transport_process)
+        if transport_process_hash is None:
             raise ValueError(
                 f"Transport process with ID {self.transport_process} not found for product {self.ID}."
             )
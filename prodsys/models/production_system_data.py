@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+from copy import deepcopy
 from hashlib import md5
 import datetime
 import json
-from typing import List, Any, Set, Optional, Tuple, Union, Literal
+from typing import Callable, Dict, Iterable, List, Any, Set, Optional, Tuple, Union, Literal
 from pydantic import (
     BaseModel,
     ConfigDict,
+    PrivateAttr,
+    SerializerFunctionWrapHandler,
     TypeAdapter,
+    field_serializer,
     model_validator,
 )
 
@@ -38,6 +42,7 @@ from prodsys.models import scenario_data as scenario_data_module
 from prodsys.models import dependency_data as dependency_data_module
 from prodsys.models import primitives_data as primitives_data_module
 from prodsys.models.layout_data import LayoutData
+from prodsys.models.schedule_data import ColumnarSchedule, ColumnarScheduleEvents
 from prodsys.util import util
 from prodsys.models.processes_data import LinkTransportProcessData
 from prodsys.models.source_data import OrderSourceData
@@ -364,6 +369,29 @@ def load_json(file_path: str) -> dict:
     return data
 
 
+DATA_FIELDS = (
+    "time_model_data",
+    "state_data",
+    "process_data",
+    "port_data",
+    "node_data",
+    "resource_data",
+    "product_data",
+    "sink_data",
+    "source_data",
+    "scenario_data",
+    "dependency_data",
+    "primitive_data",
+    "schedule",
+    "order_data",
+    "layout_data",
+)
+"""
+Fields of a production system that contain its entities. Copies made with `ProductionSystemData.trusted_copy` share
+these fields until they are copied on write.
+"""
+
+
 class ProductionSystemData(BaseModel):
     """
     A ProductionSystemAdapter serves as a n abstract base class of a data container to represent a production system. It is based on the `prodsys.models` module, but is also compatible with the `prodsys.express` API.
@@ -422,6 +450,14 @@ class ProductionSystemData(BaseModel):
     valid_configuration: bool = True
     reconfiguration_cost: float = 0
 
+    # ID indices and memoised entity hashes, only set during a call of `hash`.
+    _hash_indices: Optional[Dict[Tuple[str, str], Dict[str, Any]]] = PrivateAttr(default=None)
+    _hash_memo: Optional[Dict[Tuple[str, str, str], str]] = PrivateAttr(default=None)
+    # Data fields that a trusted copy still shares with the production system it was copied from.
+    _shared_data_fields: Set[str] = PrivateAttr(default_factory=set)
+    # Checks that passed on a trusted copy by name, with the data fields they depend on. None for other instances.
+    _passed_checks: Optional[Dict[str, Tuple[str, ...]]] = PrivateAttr(default=None)
+
     model_config = ConfigDict(
         validate_assignment=True,
         revalidate_instances='always',
@@ -830,6 +866,43 @@ class ProductionSystemData(BaseModel):
         with open(filepath, "w", encoding="utf-8") as json_file:
             json_file.write(self.model_dump_json(indent=4))
 
+    def set_columnar_schedule(self, schedule: ColumnarSchedule):
+        """
+        Sets the schedule from a columnar schedule. The IDs of the schedule are validated with vectorised checks on the
+        unique IDs of its columns instead of event by event. `schedule` is then a view on the columns that creates
+        the events without validation when they are accessed, see `ColumnarScheduleEvents`. Only the events that start
+        a state are kept, like for a schedule of events.
+
+        Args:
+            schedule (ColumnarSchedule): The columnar schedule.
+
+        Raises:
+            ValueError: If the schedule references resources, processes, setup states or products that are not part
+                of the production system.
+        """
+        data = schedule.data
+        is_setup = data["State Type"] == "Setup"
+        self._validate_schedule_ids(
+            event_resources_ids=schedule.get_unique_ids("Resource"),
+            event_process_ids_set=schedule.get_unique_ids("process", ~is_setup),
+            event_setup_state_ids=schedule.get_unique_ids("process", is_setup),
+            event_product_instance_ids=schedule.get_unique_ids("Product"),
+        )
+        object.__setattr__(self, "schedule", schedule.get_start_events().events)
+
+    def read_schedule(self, filepath: str):
+        """
+        Reads the schedule from a Parquet or CSV file with the columns of the event log and sets it as columnar schedule.
+
+        Args:
+            filepath (str): Path of the Parquet file, directory of Parquet files or CSV file.
+        """
+        if filepath.endswith(".csv"):
+            schedule = ColumnarSchedule.from_csv(filepath)
+        else:
+            schedule = ColumnarSchedule.from_parquet(filepath)
+        self.set_columnar_schedule(schedule)
+
     def revalidate(self) -> 'ProductionSystemData':
         """
         Explicitly revalidates the entire ProductionSystemData model.
@@ -857,41 +930,219 @@ class ProductionSystemData(BaseModel):
             setattr(self, key, value)
         return self
 
+    def get_data_by_ID(self, field_name: str, ID: str, attribute: str = "ID") -> Optional[Any]:
+        """
+        Returns the entity of a data field of the adapter with the given ID. During `hash`, the entities are looked up
+        in an index by ID instead of scanning the data field.
+
+        Args:
+            field_name (str): Name of the data field, e.g. "time_model_data".
+            ID (str): ID of the entity.
+            attribute (str, optional): Attribute of the entities that is compared to the ID. Defaults to "ID".
+
+        Returns:
+            Optional[Any]: The entity or None, if no entity with the ID exists.
+        """
+        hash_indices = getattr(self, "_hash_indices", None)
+        if hash_indices is None:
+            return next(
+                (
+                    entity
+                    for entity in getattr(self, field_name) or []
+                    if getattr(entity, attribute) == ID
+                ),
+                None,
+            )
+        index = hash_indices.get((field_name, attribute))
+        if index is None:
+            index = {}
+            for entity in getattr(self, field_name) or []:
+                index.setdefault(getattr(entity, attribute), entity)
+            hash_indices[(field_name, attribute)] = index
+        return index.get(ID)
+
+    def get_hash_by_ID(self, field_name: str, ID: str, attribute: str = "ID") -> Optional[str]:
+        """
+        Returns the hash of the entity of a data field of the adapter with the given ID. During `hash`, the hash of
+        every entity is only computed once and reused by all entities referencing it.
+
+        Args:
+            field_name (str): Name of the data field, e.g. "time_model_data".
+            ID (str): ID of the entity.
+            attribute (str, optional): Attribute of the entities that is compared to the ID. Defaults to "ID".
+
+        Returns:
+            Optional[str]: Hash of the entity or None, if no entity with the ID exists.
+        """
+        hash_memo = getattr(self, "_hash_memo", None)
+        key = (field_name, attribute, ID)
+        if hash_memo is not None and key in hash_memo:
+            return hash_memo[key]
+        entity = self.get_data_by_ID(field_name, ID, attribute)
+        if entity is None:
+            return None
+        entity_hash = self._hash_entity(field_name, entity)
+        if hash_memo is not None:
+            hash_memo[key] = entity_hash
+        return entity_hash
+
+    def _hash_entity(self, field_name: str, entity: Any) -> str:
+        if field_name in ("time_model_data", "port_data", "node_data"):
+            return entity.hash()
+        return entity.hash(self)
+
+    def trusted_copy(
+        self,
+        update: Optional[Dict[str, Any]] = None,
+        copied_fields: Iterable[str] = (),
+    ) -> ProductionSystemData:
+        """
+        Creates a copy of the production system without validation, e.g. for the offsprings of an optimization. Only
+        use this path for production systems that were validated before.
+
+        The copy shares the data fields with this production system, except the `copied_fields`, which are deep
+        copied. Shared fields must not be mutated in place by either of them: call `copy_on_write` with the fields
+        before mutating them.
+        Assignments to fields of the copy are not validated, but are tracked like a copy on write.
+
+        Only the delta of the copy is validated: checks run with `run_check`, e.g. by `validate_configuration`, are
+        skipped if they passed on the copy or the production system it was copied from and none of their data fields
+        was written since.
+
+        Args:
+            update (Optional[Dict[str, Any]], optional): Values of fields that are set in the copy without validation
+                instead of being copied. Defaults to None.
+            copied_fields (Iterable[str], optional): Data fields that are deep copied instead of shared, because they
+                are mutated in place. Defaults to ().
+
+        Returns:
+            ProductionSystemData: The copy of the production system.
+        """
+        update = dict(update or {})
+        for field_name in copied_fields:
+            if field_name not in update:
+                update[field_name] = deepcopy(getattr(self, field_name))
+        copy = self.model_copy(update=update)
+        copy._shared_data_fields = {
+            field_name for field_name in DATA_FIELDS if field_name not in update
+        }
+        self._shared_data_fields |= copy._shared_data_fields
+        copy._passed_checks = dict(self._passed_checks or {})
+        copy._invalidate_checks(update)
+        return copy
+
+    def copy_on_write(self, *field_names: str) -> None:
+        """
+        Prepares data fields for an in-place mutation: fields that are still shared with a trusted copy or with the
+        production system a trusted copy was made from are deep copied and the checks depending on the fields have to
+        pass again.
+
+        Args:
+            *field_names (str): Names of the data fields that are mutated.
+        """
+        for field_name in field_names:
+            if field_name in self._shared_data_fields:
+                self.__dict__[field_name] = deepcopy(self.__dict__[field_name])
+                self._shared_data_fields.discard(field_name)
+        self._invalidate_checks(field_names)
+
+    def run_check(
+        self,
+        check: Callable[[ProductionSystemData], Any],
+        data_fields: Optional[Tuple[str, ...]] = None,
+    ) -> None:
+        """
+        Runs a check of the production system that raises a ValueError if the production system is not valid. For
+        trusted copies, the check is skipped if it already passed and none of its data fields was written since.
+
+        Args:
+            check (Callable[[ProductionSystemData], Any]): The check.
+            data_fields (Optional[Tuple[str, ...]], optional): Data fields that the result of the check depends on.
+                Defaults to None, which uses the data fields of the check in CONFIGURATION_CHECKS.
+        """
+        if self._passed_checks is not None and check.__name__ in self._passed_checks:
+            return
+        if data_fields is None:
+            data_fields = dict(CONFIGURATION_CHECKS)[check]
+        check(self)
+        if self._passed_checks is not None:
+            self._passed_checks[check.__name__] = data_fields
+
+    def _invalidate_checks(self, field_names: Iterable[str]) -> None:
+        if not self._passed_checks:
+            return
+        field_names = set(field_names)
+        self._passed_checks = {
+            check_name: data_fields
+            for check_name, data_fields in self._passed_checks.items()
+            if field_names.isdisjoint(data_fields)
+        }
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        private_attributes = getattr(self, "__pydantic_private__", None)
+        if (
+            private_attributes
+            and private_attributes.get("_passed_checks") is not None
+            and name in type(self).model_fields
+        ):
+            # Assignments to trusted copies are not validated, only the checks of the field have to pass again.
+            self.__dict__[name] = value
+            self.__pydantic_fields_set__.add(name)
+            self._shared_data_fields.discard(name)
+            self._invalidate_checks((name,))
+            return
+        super().__setattr__(name, value)
+
     def hash(self) -> str:
         """
         Generates a hash of the adapter based on the hash of all contained entities. Only information describing the physical structure and functionality of the production system is considered. Can be used to compare two production systems of adapters for functional equality.
 
+        Referenced entities are looked up by ID and the hash of every entity is only computed once, so that the runtime
+        is linear in the size of the production system.
+
         Returns:
             str: Hash of the adapter
         """
-        return md5(
-            (
-                "".join(
-                    [
-                        *sorted(
-                            [time_model.hash() for time_model in self.time_model_data]
-                        ),
-                        *sorted([state.hash(self) for state in self.state_data]),
-                        *sorted([process.hash(self) for process in self.process_data]),
-                        *sorted([res.hash(self) for res in self.resource_data]),
-                        *sorted([queue.hash() for queue in self.port_data]),
-                        *sorted([node.hash() for node in self.node_data]),
-                        *sorted([product.hash(self) for product in self.product_data]),
-                        *sorted([sink.hash(self) for sink in self.sink_data]),
-                        *sorted([source.hash(self) for source in self.source_data]),
-                        *sorted(
-                            [
-                                dependency.hash(self)
-                                for dependency in self.dependency_data
-                            ]
-                        ),
-                        *sorted(
-                            [primitive.hash(self) for primitive in self.primitive_data]
-                        ),
-                    ]
+        self._hash_indices = {}
+        self._hash_memo = {}
+        try:
+            entity_hashes = []
+            for field_name in (
+                "time_model_data",
+                "state_data",
+                "process_data",
+                "resource_data",
+                "port_data",
+                "node_data",
+                "product_data",
+                "sink_data",
+                "source_data",
+                "dependency_data",
+                "primitive_data",
+            ):
+                entity_hashes.extend(
+                    sorted(
+                        self.get_hash_by_ID(field_name, entity.ID)
+                        if self.get_data_by_ID(field_name, entity.ID) is entity
+                        else self._hash_entity(field_name, entity)
+                        for entity in getattr(self, field_name) or []
+                    )
                 )
-            ).encode("utf-8")
-        ).hexdigest()
+        finally:
+            self._hash_indices = None
+            self._hash_memo = None
+        return md5(("".join(entity_hashes)).encode("utf-8")).hexdigest()
+
+    @field_serializer("schedule", mode="wrap")
+    def serialize_schedule(
+        self, schedule: Optional[List[performance_data.Event]], handler: SerializerFunctionWrapHandler
+    ) -> Any:
+        """
+        Serializes the events of a columnar schedule like a list of events.
+        """
+        if isinstance(schedule, ColumnarScheduleEvents):
+            schedule = list(schedule)
+        return handler(schedule)
 
     @model_validator(mode='after')
     def check_no_duplicate_ids(self) -> 'ProductionSystemData':
@@ -1164,28 +1415,10 @@ class ProductionSystemData(BaseModel):
                 )
 
         # Check schedule and replace with filtered "start state" events
-        if self.schedule is not None:
-            resources_ids = get_set_of_IDs(self.resource_data)
-            processes_ids_set = get_set_of_IDs(self.process_data)
-            products_ids = get_set_of_IDs(self.product_data)
-            products_ids_by_length = sorted(products_ids, key=len, reverse=True)
-
-            def _product_type_from_instance(product_inst_id: str) -> str:
-                """Map a product instance ID back to a registered product type.
-
-                Two ID conventions are accepted:
-                    * ``ProductType_index`` (legacy / examples)
-                    * ``ProductType_{order_id}_{index}`` (prodsys_scheduler
-                      / SICK xFx, where multiple orders produce the same
-                      product type).
-                We do a longest-prefix match against the registered product
-                types and fall back to the legacy ``rsplit('_', 1)`` heuristic.
-                """
-                for type_id in products_ids_by_length:
-                    if product_inst_id == type_id or product_inst_id.startswith(type_id + "_"):
-                        return type_id
-                return "_".join(product_inst_id.split("_")[:-1])
-
+        if isinstance(self.schedule, ColumnarScheduleEvents):
+            # Only set by set_columnar_schedule, which already validated the schedule.
+            pass
+        elif self.schedule is not None:
             event_resources_ids = set()
             event_process_ids_set = set()
             event_setup_state_ids = set()
@@ -1198,7 +1431,7 @@ class ProductionSystemData(BaseModel):
                     )
                 event_resources_ids.add(event.resource)
                 if event.product is not None:
-                    event_product_ids.add(_product_type_from_instance(event.product))
+                    event_product_ids.add(event.product)
                 if event.process:
                     if event.state_type == "Setup":
                         event_setup_state_ids.add(event.process)
@@ -1208,34 +1441,86 @@ class ProductionSystemData(BaseModel):
                     continue
                 schedule_to_consider.append(event)
 
-            setup_state_ids = {
-                str(getattr(st, "ID"))
-                for st in (self.state_data or [])
-                if getattr(st, "ID", None) is not None
-                and getattr(st, "type", None) == "SetupState"
-            }
-
-            if event_resources_ids - resources_ids != set():
-                raise ValueError(
-                    f"The resources {event_resources_ids - resources_ids} of the schedule are not valid resources of {resources_ids}."
-                )
-            if event_process_ids_set - processes_ids_set != set():
-                raise ValueError(
-                    f"The processes {event_process_ids_set - processes_ids_set} of the schedule are not valid processes of {processes_ids_set}."
-                )
-            if event_setup_state_ids - setup_state_ids != set():
-                raise ValueError(
-                    f"The setup states {event_setup_state_ids - setup_state_ids} of the schedule "
-                    f"are not valid SetupStates of {setup_state_ids}."
-                )
-            if event_product_ids - products_ids != set():
-                raise ValueError(
-                    f"The products {event_product_ids - products_ids} of the schedule are not valid products of {products_ids}."
-                )
+            self._validate_schedule_ids(
+                event_resources_ids,
+                event_process_ids_set,
+                event_setup_state_ids,
+                event_product_ids,
+            )
             object.__setattr__(self, 'schedule', schedule_to_consider)
 
         return self
 
+    def _validate_schedule_ids(
+        self,
+        event_resources_ids: Set[str],
+        event_process_ids_set: Set[str],
+        event_setup_state_ids: Set[str],
+        event_product_instance_ids: Set[str],
+    ):
+        """
+        Checks that the IDs referenced by the schedule are part of the production system.
+
+        Args:
+            event_resources_ids (Set[str]): IDs of the resources of the schedule.
+            event_process_ids_set (Set[str]): IDs of the processes of the schedule.
+            event_setup_state_ids (Set[str]): IDs of the setup states of the schedule.
+            event_product_instance_ids (Set[str]): IDs of the product instances of the schedule.
+
+        Raises:
+            ValueError: If an ID is not part of the production system.
+        """
+        resources_ids = get_set_of_IDs(self.resource_data)
+        processes_ids_set = get_set_of_IDs(self.process_data)
+        products_ids = get_set_of_IDs(self.product_data)
+        products_ids_by_length = sorted(products_ids, key=len, reverse=True)
+
+        def _product_type_from_instance(product_inst_id: str) -> str:
+            """Map a product instance ID back to a registered product type.
+
+            Two ID conventions are accepted:
+                * ``ProductType_index`` (legacy / examples)
+                * ``ProductType_{order_id}_{index}`` (prodsys_scheduler
+                  / SICK xFx, where multiple orders produce the same
+                  product type).
+            We do a longest-prefix match against the registered product
+            types and fall back to the legacy ``rsplit('_', 1)`` heuristic.
+            """
+            for type_id in products_ids_by_length:
+                if product_inst_id == type_id or product_inst_id.startswith(type_id + "_"):
+                    return type_id
+            return "_".join(product_inst_id.split("_")[:-1])
+
+        event_product_ids = {
+            _product_type_from_instance(product_inst_id)
+            for product_inst_id in event_product_instance_ids
+        }
+
+        setup_state_ids = {
+            str(getattr(st, "ID"))
+            for st in (self.state_data or [])
+            if getattr(st, "ID", None) is not None
+            and getattr(st, "type", None) == "SetupState"
+        }
+
+        if event_resources_ids - resources_ids != set():
+            raise ValueError(
+                f"The resources {event_resources_ids - resources_ids} of the schedule are not valid resources of {resources_ids}."
+            )
+        if event_process_ids_set - processes_ids_set != set():
+            raise ValueError(
+                f"The processes {event_process_ids_set - processes_ids_set} of the schedule are not valid processes of {processes_ids_set}."
+            )
+        if event_setup_state_ids - setup_state_ids != set():
+            raise ValueError(
+                f"The setup states {event_setup_state_ids - setup_state_ids} of the schedule "
+                f"are not valid SetupStates of {setup_state_ids}."
+            )
+        if event_product_ids - products_ids != set():
+            raise ValueError(
+                f"The products {event_product_ids - products_ids} of the schedule are not valid products of {products_ids}."
+            )
+
     def read_scenario(self, scenario_file_path: str):
         scenario_data = json.load(open(scenario_file_path))
         self.scenario_data = scenario_data_module.ScenarioData.model_validate(scenario_data)
@@ -1256,6 +1541,7 @@ class ProductionSystemData(BaseModel):
     def validate_configuration(self):
         """
         Checks if the configuration is physically valid, i.e. if all resources are positioned at different locations and if all required processes are available.
+        For trusted copies, only the checks depending on data fields written since they last passed are run again.
 
         Raises:
             ValueError: If multiple objects are positioned at the same location.
@@ -1263,10 +1549,8 @@ class ProductionSystemData(BaseModel):
             ValueError: If not all links are available for LinkTransportProcesses.
             ValueError: If ports are missing locations (needed for transport routing).
         """
-        assert_no_redundant_locations(self)
-        assert_required_processes_in_resources_available(self)
-        assert_all_links_available(self)
-        assert_ports_have_locations(self)
+        for check, data_fields in CONFIGURATION_CHECKS:
+            self.run_check(check, data_fields)
 
 
 def remove_duplicate_locations(input_list: List[List[float]]) -> List[List[float]]:
@@ -2240,3 +2524,23 @@ def assert_required_processes_in_resources_available(
     assert_capability_processes_available(
         available_capability_processes, required_capability_processes
     )
+
+
+CONFIGURATION_CHECKS: Tuple[Tuple[Callable[[ProductionSystemData], None], Tuple[str, ...]], ...] = (
+    (
+        assert_no_redundant_locations,
+        ("resource_data", "process_data", "port_data", "source_data", "sink_data"),
+    ),
+    (
+        assert_required_processes_in_resources_available,
+        ("resource_data", "process_data", "product_data", "state_data"),
+    ),
+    (
+        assert_all_links_available,
+        ("process_data", "node_data", "resource_data", "source_data", "sink_data", "port_data"),
+    ),
+    (assert_ports_have_locations, ("resource_data", "port_data")),
+)
+"""
+Checks of `ProductionSystemData.validate_configuration` with the data fields that their results depend on.
+"""
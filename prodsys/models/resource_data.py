@@ -179,36 +179,30 @@ class ResourceData(CoreAsset, Locatable):
         base_class_hash = Locatable.hash(self)
 
         for state_id in self.state_ids:
-            for state in production_system.state_data:
-                if state.ID == state_id:
-                    state_hashes.append(state.hash(production_system))
-                    break
-            else:
+            state_hash = production_system.get_hash_by_ID("state_data", state_id)
+            if state_hash is None:
                 raise ValueError(
                     f"State with ID {state_id} not found for resource {self.ID}."
                 )
+            state_hashes.append(state_hash)
 
         for process_id in self.process_ids:
-            for process in production_system.process_data:
-                if process.ID == process_id:
-                    process_hashes.append(process.hash(production_system))
-                    break
-            else:
+            process_hash = production_system.get_hash_by_ID("process_data", process_id)
+            if process_hash is None:
                 raise ValueError(
                     f"Process with ID {process_id} not found for resource {self.ID}."
                 )
+            process_hashes.append(process_hash)
 
         # For production resources, include queues in the hash
         if self.ports:
             for port_id in self.ports:
-                for port in production_system.port_data:
-                    if port.ID == port_id:
-                        port_hashes.append(port.hash())
-                        break
-                else:
+                port_hash = production_system.get_hash_by_ID("port_data", port_id)
+                if port_hash is None:
                     raise ValueError(
                         f"Port with ID {port_id} not found for resource {self.ID}."
                     )
+                port_hashes.append(port_hash)
 
         components = [
             base_class_hash,
@@ -324,27 +318,23 @@ class SystemResourceData(ResourceData):
         # Add subresource hashes
         subresource_hashes = []
         for subresource_id in self.subresource_ids:
-            for resource in production_system.resource_data:
-                if resource.ID == subresource_id:
-                    subresource_hashes.append(resource.hash(production_system))
-                    break
-            else:
+            resource_hash = production_system.get_hash_by_ID("resource_data", subresource_id)
+            if resource_hash is None:
                 raise ValueError(
                     f"Subresource with ID {subresource_id} not found for system resource {self.ID}."
                 )
+            subresource_hashes.append(resource_hash)
         
         # Add system port hashes
         system_port_hashes = []
         if self.system_ports:
             for port_id in self.system_ports:
-                for port in production_system.port_data:
-                    if port.ID == port_id:
-                        system_port_hashes.append(port.hash())
-                        break
-                else:
+                port_hash = production_system.get_hash_by_ID("port_data", port_id)
+                if port_hash is None:
                     raise ValueError(
                         f"System port with ID {port_id} not found for system resource {self.ID}."
                     )
+                system_port_hashes.append(port_hash)
         
         # Add internal routing matrix hash
         routing_hash = ""
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Dict, Iterator, List, Optional, Set, Union
+
+import numpy as np
+import pandas as pd
+
+from prodsys.models.performance_data import Event
+
+EVENT_COLUMNS: Dict[str, str] = {
+    name: field.alias or name for name, field in Event.model_fields.items()
+}
+"""
+Column names of the schedule per field of :class:`Event`. The columns are named like the columns of the event log.
+"""
+
+REQUIRED_COLUMNS = ("Time", "Resource", "State Type", "Activity")
+
+ID_COLUMNS = (
+    "Resource",
+    "State",
+    "State Type",
+    "Activity",
+    "Product",
+    "Origin location",
+    "Target location",
+    "Requesting Item",
+    "Dependency",
+    "process",
+    "Order ID",
+)
+"""
+Columns with IDs, which are stored as categoricals so that every ID is only stored once.
+"""
+
+EVENT_CHUNK_SIZE = 10_000
+"""
+Number of rows that are converted to events at once when iterating over the events of a schedule.
+"""
+
+
+def get_events_of_data(data: pd.DataFrame) -> List[Event]:
+    """
+    Creates the events of the rows of a schedule without validation, because the columns are already typed.
+
+    Args:
+        data (pd.DataFrame): Rows of a schedule.
+
+    Returns:
+        List[Event]: The events of the rows.
+    """
+    data = data.astype(object).where(data.notna(), None)
+    columns = list(data.columns)
+    return [
+        Event.model_construct(**dict(zip(columns, row)))
+        for row in data.itertuples(index=False, name=None)
+    ]
+
+
+class ColumnarSchedule:
+    """
+    Schedule of a production system that is stored column-wise in a pandas DataFrame instead of a list of
+    :class:`Event` objects. The columns are named like the columns of the event log, so schedules can be loaded
+    directly from event logs or plans that were stored as Parquet or CSV files. ID columns are stored as categoricals,
+    which interns the IDs and allows to check them with vectorised set-membership checks.
+
+    The schedule only holds the columns. Its events are a :class:`ColumnarScheduleEvents` view that creates the events
+    without validation when they are accessed and does not keep them, so consumers that can work on the columns, like
+    the grouping of the schedule by resource, never create events.
+
+    Args:
+        data (pd.DataFrame): The schedule with one row per event. Columns can be named by the aliases or the field
+            names of :class:`Event`.
+
+    Raises:
+        ValueError: If a required column is missing.
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        data = data.rename(
+            columns={name: alias for name, alias in EVENT_COLUMNS.items() if name != alias}
+        )
+        missing_columns = [column for column in REQUIRED_COLUMNS if column not in data.columns]
+        if missing_columns:
+            raise ValueError(f"The schedule is missing the columns {missing_columns}.")
+        data = data[[column for column in EVENT_COLUMNS.values() if column in data.columns]]
+        data = data.reset_index(drop=True)
+        data["Time"] = data["Time"].astype(np.float64)
+        for column in ID_COLUMNS:
+            if column in data.columns and not isinstance(
+                data[column].dtype, pd.CategoricalDtype
+            ):
+                data[column] = data[column].astype("category")
+        self.data = data
+        self.events = ColumnarScheduleEvents(self)
+
+    @classmethod
+    def from_parquet(cls, filepath: str) -> ColumnarSchedule:
+        """
+        Loads a schedule from a Parquet file or a directory of Parquet files. Requires a Parquet engine of pandas,
+        i.e. pyarrow or fastparquet.
+
+        Args:
+            filepath (str): Path of the Parquet file or directory.
+
+        Returns:
+            ColumnarSchedule: The loaded schedule.
+        """
+        return cls(pd.read_parquet(filepath))
+
+    @classmethod
+    def from_csv(cls, filepath: str) -> ColumnarSchedule:
+        """
+        Loads a schedule from a CSV file.
+
+        Args:
+            filepath (str): Path of the CSV file.
+
+        Returns:
+            ColumnarSchedule: The loaded schedule.
+        """
+        return cls(pd.read_csv(filepath, dtype={column: "category" for column in ID_COLUMNS}))
+
+    @classmethod
+    def from_events(cls, events: List[Event]) -> ColumnarSchedule:
+        """
+        Creates a columnar schedule from a list of events.
+
+        Args:
+            events (List[Event]): The events of the schedule.
+
+        Returns:
+            ColumnarSchedule: The columnar schedule.
+        """
+        return cls(
+            pd.DataFrame(
+                [event.model_dump(by_alias=True) for event in events],
+                columns=list(EVENT_COLUMNS.values()),
+            )
+        )
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def get_start_events(self) -> ColumnarSchedule:
+        """
+        Returns the schedule of the events that start a state, which are the events considered by the simulation.
+
+        Returns:
+            ColumnarSchedule: The schedule of the start events.
+        """
+        return ColumnarSchedule(self.data[self.data["Activity"] == "start state"])
+
+    def get_unique_ids(self, column: str, mask: Optional[pd.Series] = None) -> Set[str]:
+        """
+        Returns the set of non-empty IDs in a column of the schedule.
+
+        Args:
+            column (str): The column.
+            mask (Optional[pd.Series], optional): Boolean mask of the considered events. Defaults to None, which
+                considers all events.
+
+        Returns:
+            Set[str]: The IDs in the column.
+        """
+        if column not in self.data.columns:
+            return set()
+        values = self.data[column]
+        if mask is not None:
+            values = values[mask]
+        return {str(value) for value in values.dropna().unique() if value != ""}
+
+    def get_events(self, mask: Optional[pd.Series] = None) -> List[Event]:
+        """
+        Creates the events of the schedule. The events are created without validation and are not kept by the
+        schedule.
+
+        Args:
+            mask (Optional[pd.Series], optional): Boolean mask of the considered events. Defaults to None, which
+                considers all events.
+
+        Returns:
+            List[Event]: The events of the schedule.
+        """
+        data = self.data if mask is None else self.data[mask]
+        return get_events_of_data(data)
+
+    def group_events(
+        self, column: Union[str, pd.Series], mask: Optional[pd.Series] = None
+    ) -> Dict[str, List[Event]]:
+        """
+        Groups the events of the schedule by the IDs of a column. Events are only created for the considered rows.
+
+        Args:
+            column (Union[str, pd.Series]): The column to group by or the group IDs of the rows, e.g. derived from
+                a column.
+            mask (Optional[pd.Series], optional): Boolean mask of the considered events. Defaults to None, which
+                considers all events.
+
+        Returns:
+            Dict[str, List[Event]]: The events per ID in the column, in the order of the schedule.
+        """
+        data = self.data if mask is None else self.data[mask]
+        return {
+            str(group_id): get_events_of_data(group_data)
+            for group_id, group_data in data.groupby(column, observed=True, sort=False)
+        }
+
+
+class ColumnarScheduleEvents(Sequence):
+    """
+    Read-only sequence of the events of a :class:`ColumnarSchedule`, which is used as `ProductionSystemData.schedule`
+    of a columnar schedule. The events are created from the columns when they are accessed and are not stored, so the
+    schedule is only held once in memory. Iterating creates the events in chunks of :data:`EVENT_CHUNK_SIZE` rows.
+
+    Args:
+        columnar_schedule (ColumnarSchedule): The columnar schedule.
+    """
+
+    def __init__(self, columnar_schedule: ColumnarSchedule):
+        self.columnar_schedule = columnar_schedule
+
+    def __len__(self) -> int:
+        return len(self.columnar_schedule)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Event, List[Event]]:
+        data = self.columnar_schedule.data
+        if isinstance(index, slice):
+            return get_events_of_data(data.iloc[index])
+        if index < -len(data) or index >= len(data):
+            raise IndexError("schedule index out of range")
+        return get_events_of_data(data.iloc[[index]])[0]
+
+    def __iter__(self) -> Iterator[Event]:
+        data = self.columnar_schedule.data
+        for start in range(0, len(data), EVENT_CHUNK_SIZE):
+            yield from get_events_of_data(data.iloc[start : start + EVENT_CHUNK_SIZE])
+
+    def __repr__(self) -> str:
+        return f"ColumnarScheduleEvents({len(self)} events)"
@@ -65,11 +65,8 @@ class SinkData(CoreAsset, Locatable):
             str: Hash of the sink.
         """
         base_class_hash = Locatable.hash(self)
-        for product in adapter.product_data:
-            if product.type == self.product_type:
-                product_hash = product.hash(adapter)
-                break
-        else:
+        product_hash = adapter.get_hash_by_ID("product_data", self.product_type, attribute="type")
+        if product_hash is None:
             raise ValueError(
                 f"Product with ID {self.product_type} not found for sink {self.ID}."
             )
@@ -77,14 +74,12 @@ class SinkData(CoreAsset, Locatable):
         port_hashes = []
         if self.ports:
             for port_id in self.ports:
-                for port in adapter.port_data:
-                    if port.ID == port_id:
-                        port_hashes.append(port.hash())
-                        break
-                else:
+                port_hash = adapter.get_hash_by_ID("port_data", port_id)
+                if port_hash is None:
                     raise ValueError(
                         f"Queue with ID {port_id} not found for sink {self.ID}."
                     )
+                port_hashes.append(port_hash)
 
         return md5(
             "".join([base_class_hash, product_hash, *sorted(port_hashes)]).encode(
@@ -69,20 +69,14 @@ class SourceData(CoreAsset, Locatable):
             str: Hash of the source.
         """
         locatable_hash = Locatable.hash(self)
-        for product in adapter.product_data:
-            if product.type == self.product_type:
-                product_hash = product.hash(adapter)
-                break
-        else:
+        product_hash = adapter.get_hash_by_ID("product_data", self.product_type, attribute="type")
+        if product_hash is None:
             raise ValueError(
                 f"Product with ID {self.product_type} not found for source {self.ID}."
             )
 
-        for time_model in adapter.time_model_data:
-            if time_model.ID == self.time_model_id:
-                time_model_hash = time_model.hash()
-                break
-        else:
+        time_model_hash = adapter.get_hash_by_ID("time_model_data", self.time_model_id)
+        if time_model_hash is None:
             raise ValueError(
                 f"Time model with ID {self.time_model_id} not found for source {self.ID}."
             )
@@ -90,14 +84,12 @@ class SourceData(CoreAsset, Locatable):
         output_queue_hashes = []
         if self.ports:
             for output_queue in self.ports:
-                for queue in adapter.port_data:
-                    if queue.ID == output_queue:
-                        output_queue_hashes.append(queue.hash())
-                        break
-                else:
+                queue_hash = adapter.get_hash_by_ID("port_data", output_queue)
+                if queue_hash is None:
                     raise ValueError(
                         f"Queue with ID {output_queue} not found for source {self.ID}."
                     )
+                output_queue_hashes.append(queue_hash)
 
         return md5(
             (
@@ -179,28 +171,24 @@ class OrderSourceData(CoreAsset, Locatable):
         order_hashes = []
         if adapter.order_data:
             for order_id in self.order_ids:
-                for order in adapter.order_data:
-                    if order.ID == order_id:
-                        # Create a simple hash from order ID and release time
-                        order_hash = md5(f"{order.ID}_{order.release_time or order.order_time}".encode("utf-8")).hexdigest()
-                        order_hashes.append(order_hash)
-                        break
-                else:
+                order = adapter.get_data_by_ID("order_data", order_id)
+                if order is None:
                     raise ValueError(
                         f"Order with ID {order_id} not found for order source {self.ID}."
                     )
+                # Create a simple hash from order ID and release time
+                order_hash = md5(f"{order.ID}_{order.release_time or order.order_time}".encode("utf-8")).hexdigest()
+                order_hashes.append(order_hash)
 
         output_queue_hashes = []
         if self.ports:
             for output_queue in self.ports:
-                for queue in adapter.port_data:
-                    if queue.ID == output_queue:
-                        output_queue_hashes.append(queue.hash())
-                        break
-                else:
+                queue_hash = adapter.get_hash_by_ID("port_data", output_queue)
+                if queue_hash is None:
                     raise ValueError(
                         f"Queue with ID {output_queue} not found for order source {self.ID}."
                     )
+                output_queue_hashes.append(queue_hash)
 
         return md5(
             (
@@ -83,11 +83,8 @@ class StateData(CoreAsset):
             str: hash of the state.
         """
         time_model_hash = ""
-        for time_model in adapter.time_model_data:
-            if time_model.ID == self.time_model_id:
-                time_model_hash = time_model.hash()
-                break
-        else:
+        time_model_hash = adapter.get_hash_by_ID("time_model_data", self.time_model_id)
+        if time_model_hash is None:
             raise ValueError(
                 f"Time model with ID {self.time_model_id} not found for state {self.ID}."
             )
@@ -150,11 +147,8 @@ class BreakDownStateData(StateData):
         base_class_hash = super().hash(adapter)
         repair_time_model_hash = ""
 
-        for repair_time_model in adapter.time_model_data:
-            if repair_time_model.ID == self.repair_time_model_id:
-                repair_time_model_hash = repair_time_model.hash()
-                break
-        else:
+        repair_time_model_hash = adapter.get_hash_by_ID("time_model_data", self.repair_time_model_id)
+        if repair_time_model_hash is None:
             raise ValueError(
                 f"Repair time model with ID {self.repair_time_model_id} not found for state {self.ID}."
             )
@@ -222,11 +216,8 @@ class MaintenanceStateData(StateData):
         base_class_hash = super().hash(adapter)
         repair_time_model_hash = ""
 
-        for repair_time_model in adapter.time_model_data:
-            if repair_time_model.ID == self.repair_time_model_id:
-                repair_time_model_hash = repair_time_model.hash()
-                break
-        else:
+        repair_time_model_hash = adapter.get_hash_by_ID("time_model_data", self.repair_time_model_id)
+        if repair_time_model_hash is None:
             raise ValueError(
                 f"Maintenance duration time model with ID {self.repair_time_model_id} not found for state {self.ID}."
             )
@@ -297,20 +288,14 @@ class ProcessBreakDownStateData(StateData):
         process_hash = ""
         repair_time_model_hash = ""
 
-        for process in adapter.process_data:
-            if process.ID == self.process_id:
-                process_hash = process.hash(adapter)
-                break
-        else:
+        process_hash = adapter.get_hash_by_ID("process_data", self.process_id)
+        if process_hash is None:
             raise ValueError(
                 f"Process with ID {self.process_id} not found for process breakdown state {self.ID}."
             )
 
-        for repair_time_model in adapter.time_model_data:
-            if repair_time_model.ID == self.repair_time_model_id:
-                repair_time_model_hash = repair_time_model.hash()
-                break
-        else:
+        repair_time_model_hash = adapter.get_hash_by_ID("time_model_data", self.repair_time_model_id)
+        if repair_time_model_hash is None:
             raise ValueError(
                 f"Repair time model with ID {self.repair_time_model_id} not found for process breakdown state {self.ID}."
             )
@@ -516,11 +501,8 @@ class ChargingStateData(StateData):
         base_class_hash = super().hash(adapter)
         charging_time_model_hash = ""
 
-        for charging_time_model in adapter.time_model_data:
-            if charging_time_model.ID == self.battery_time_model_id:
-                charging_time_model_hash = charging_time_model.hash()
-                break
-        else:
+        charging_time_model_hash = adapter.get_hash_by_ID("time_model_data", self.battery_time_model_id)
+        if charging_time_model_hash is None:
             raise ValueError(
                 f"Battery time model with ID {self.battery_time_model_id} not found for state {self.ID}."
             )
@@ -589,11 +571,8 @@ class NonScheduledStateData(StateData):
         base_class_hash = super().hash(adapter)
         non_scheduled_time_model_hash = ""
 
-        for non_scheduled_time_model in adapter.time_model_data:
-            if non_scheduled_time_model.ID == self.non_scheduled_time_model_id:
-                non_scheduled_time_model_hash = non_scheduled_time_model.hash()
-                break
-        else:
+        non_scheduled_time_model_hash = adapter.get_hash_by_ID("time_model_data", self.non_scheduled_time_model_id)
+        if non_scheduled_time_model_hash is None:
             raise ValueError(
                 f"Non-scheduled time model with ID {self.non_scheduled_time_model_id} not found for state {self.ID}."
             )
@@ -10,6 +10,7 @@ import networkx as nx
 import pandas as pd
 from prodsys import adapters
 from prodsys.models.production_system_data import (
+    DATA_FIELDS,
     add_default_queues_to_resources,
     get_possible_production_processes_IDs,
     get_possible_transport_processes_IDs,
@@ -315,6 +316,8 @@ def crossover(ind1, ind2):
     crossover_type = random.choice(["machine", "partial_machine", "transport_resource"])
     adapter1: adapters.ProductionSystemData = ind1[0]
     adapter2: adapters.ProductionSystemData = ind2[0]
+    adapter1.copy_on_write(*CROSSOVER_DATA_FIELDS)
+    adapter2.copy_on_write(*CROSSOVER_DATA_FIELDS)
     machines_1 = adapters.get_production_resources(adapter1)
     machines_2 = adapters.get_production_resources(adapter2)
     # Remove queues from resources and clean up orphaned queues before swapping
@@ -981,9 +984,27 @@ def get_mutation_operations(
     return mutations_operations
 
 
+def get_mutated_data_fields(
+    operation: Callable[[adapters.ProductionSystemData], bool],
+) -> Tuple[str, ...]:
+    """
+    Returns the data fields of a production system that a mutation operation and the repair steps after it mutate.
+
+    Args:
+        operation (Callable[[adapters.ProductionSystemData], bool]): The mutation operation.
+
+    Returns:
+        Tuple[str, ...]: Names of the mutated data fields. All data fields for operations with unknown fields.
+    """
+    if operation not in MUTATED_DATA_FIELDS:
+        return DATA_FIELDS
+    return MUTATED_DATA_FIELDS[operation] + REPAIR_DATA_FIELDS
+
+
 def mutation(individual):
     mutation_operation = random.choice(get_mutation_operations(individual[0]))
     adapter_object = individual[0]
+    adapter_object.copy_on_write(*get_mutated_data_fields(mutation_operation))
     if mutation_operation(adapter_object):
         replace_optimization_configuration_id(adapter_object)
     add_default_queues_to_resources(adapter_object, reset=False)
@@ -994,6 +1015,7 @@ def mutation(individual):
     # Regenerate network for conveyor processes to ensure old links are cleared
     if any(isinstance(process, LinkTransportProcessData) and not process.can_move 
            for process in adapter_object.process_data):
+        adapter_object.copy_on_write(*NETWORK_DATA_FIELDS)
         node_link_generation.generate_and_apply_network(adapter_object, simple_connection=True)
 
     adapter_object.schedule = None
@@ -1185,7 +1207,7 @@ def random_configuration(
         If valid the list is empty; if invalid the adapter is None.
     """
     transformations = baseline.scenario_data.options.transformations
-    adapter_object = baseline.model_copy(deep=True)
+    adapter_object = baseline.trusted_copy(copied_fields=CONFIGURATION_DATA_FIELDS)
     replace_optimization_configuration_id(adapter_object)
     adapter_object.schedule = None
     if scenario_data.ReconfigurationEnum.PRODUCTION_CAPACITY in transformations:
@@ -1285,8 +1307,8 @@ def random_configuration_with_initial_solution(
                 continue
             return adapter_object
 
-        # Otherwise, start with a deep copy of the baseline and apply random manipulations.
-        adapter_object = baseline.model_copy(deep=True)
+        # Otherwise, start with a copy of the baseline and apply random manipulations.
+        adapter_object = baseline.trusted_copy()
         adapter_object.schedule = None
         num_manipulations = random.randint(0, max_manipulations)
 
@@ -1294,6 +1316,7 @@ def random_configuration_with_initial_solution(
         successful_mutations = 0
         for _ in range(num_manipulations):
             mutation_op = random.choice(mutation_ops)
+            adapter_object.copy_on_write(*get_mutated_data_fields(mutation_op))
             # Apply the chosen mutation operation.
             if not mutation_op(adapter_object):
                 break
@@ -1345,7 +1368,7 @@ def configuration_capacity_based(
         adapters.ProductionSystemData: Capacity-optimized configuration
     """
     # Create a copy of the baseline configuration
-    adapter_object = baseline.model_copy(deep=True)
+    adapter_object = baseline.trusted_copy(copied_fields=CONFIGURATION_DATA_FIELDS)
     replace_optimization_configuration_id(adapter_object)
     adapter_object.schedule = None
 
@@ -1932,15 +1955,53 @@ TRANSFORMATIONS = {
     scenario_data.ReconfigurationEnum.ROUTING_LOGIC: [change_routing_policy],
 }
 
+# Data fields that are written by the network generation for link transport processes.
+NETWORK_DATA_FIELDS = ("process_data", "node_data")
+
+MUTATED_DATA_FIELDS = {
+    add_machine: ("resource_data", "port_data") + NETWORK_DATA_FIELDS,
+    add_transport_resource: ("resource_data", "port_data", "process_data") + NETWORK_DATA_FIELDS,
+    add_process_module: ("resource_data",),
+    remove_machine: ("resource_data",),
+    remove_transport_resource: ("resource_data",) + NETWORK_DATA_FIELDS,
+    remove_process_module: ("resource_data",),
+    move_process_module: ("resource_data",),
+    move_machine: ("resource_data",) + NETWORK_DATA_FIELDS,
+    add_primitive: ("primitive_data",),
+    remove_primitive: ("primitive_data",),
+    change_control_policy: ("resource_data",),
+    change_routing_policy: ("source_data",),
+}
+"""
+Data fields of a production system that the mutation operations mutate in place and that are copied on write before
+the operation is applied to a trusted copy.
+"""
+
+# Data fields that are mutated by the repair steps after each mutation.
+REPAIR_DATA_FIELDS = ("resource_data", "port_data", "dependency_data")
+
+CROSSOVER_DATA_FIELDS = ("resource_data", "port_data", "dependency_data") + NETWORK_DATA_FIELDS
+
+# Data fields that are mutated in place when a random configuration is created from a baseline.
+CONFIGURATION_DATA_FIELDS = (
+    "resource_data",
+    "port_data",
+    "dependency_data",
+    "primitive_data",
+    "source_data",
+) + NETWORK_DATA_FIELDS
+
 # Save initial state for cleanup
 _INITIAL_TRANSFORMATIONS = {
     key: value.copy() for key, value in TRANSFORMATIONS.items()
 }
+_INITIAL_MUTATED_DATA_FIELDS = MUTATED_DATA_FIELDS.copy()
 
 
 def add_transformation_operation(
     transformation: scenario_data.ReconfigurationEnum,
     operation: Callable[[adapters.ProductionSystemData], bool],
+    data_fields: Optional[Tuple[str, ...]] = None,
 ) -> None:
     """
     Function that adds a transformation operation to the transformation dictionary.
@@ -1948,9 +2009,13 @@ def add_transformation_operation(
     Args:
         transformation (scenario_data.ReconfigurationEnum): Transformation to add the operation to.
         operation (Callable[[adapters.ProductionSystemAdapter], bool]): Operation to add to the transformation.
+        data_fields (Optional[Tuple[str, ...]], optional): Data fields of the production system that the operation
+            mutates in place. Defaults to None, which copies all data fields before the operation is applied.
     """
     if transformation in TRANSFORMATIONS:
         TRANSFORMATIONS[transformation].append(operation)
+        if data_fields is not None:
+            MUTATED_DATA_FIELDS[operation] = tuple(data_fields)
 
 
 def reset_transformations() -> None:
@@ -1958,7 +2023,8 @@ def reset_transformations() -> None:
     Reset TRANSFORMATIONS to its initial state, removing any operations added via add_transformation_operation.
     This is useful for test cleanup to avoid test pollution.
     """
-    global TRANSFORMATIONS
+    global TRANSFORMATIONS, MUTATED_DATA_FIELDS
     TRANSFORMATIONS = {
         key: value.copy() for key, value in _INITIAL_TRANSFORMATIONS.items()
     }
+    MUTATED_DATA_FIELDS = _INITIAL_MUTATED_DATA_FIELDS.copy()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from copy import deepcopy
 import json
 import time
 from typing import TYPE_CHECKING, Annotated
@@ -25,6 +26,7 @@ from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
 
 from prodsys.simulation import sim
 from prodsys import adapters
+from prodsys.models.production_system_data import DATA_FIELDS
 from prodsys.optimization.util import (
     get_weights,
     check_breakdown_states_available,
@@ -103,6 +105,23 @@ class EvolutionaryAlgorithmHyperparameters(BaseModel):
     )
 
 
+def clone_individual(individual):
+    """
+    Clones an individual of the evolutionary algorithm. Instead of a deep copy of the whole individual, the production
+    systems are copied with `ProductionSystemData.trusted_copy`, which shares the data that is not mutated by the
+    optimization and skips the validation.
+
+    Args:
+        individual (creator.Individual): The individual to clone.
+
+    Returns:
+        creator.Individual: The cloned individual.
+    """
+    clone = type(individual)(configuration.trusted_copy() for configuration in individual)
+    clone.fitness = deepcopy(individual.fitness)
+    return clone
+
+
 def register_functions_in_toolbox(
     base_configuration: prodsys.models.production_system_data.ProductionSystemData,
     solutions_dict: dict,
@@ -151,6 +170,7 @@ def register_functions_in_toolbox(
         hyper_parameters.number_of_seeds,
         full_save,
     )
+    toolbox.register("clone", clone_individual)
     toolbox.register("mate", crossover)
     toolbox.register("mutate", mutation)
 
@@ -171,9 +191,7 @@ def evolutionary_algorithm_optimization(
     Args:
         optimizer (Optimizer): The optimizer that contains the adapter, hyperparameters, and initial solutions.
     """
-    adapters.ProductionSystemData.model_config["validate_assignment"] = False
-
-    base_configuration = optimizer.adapter.model_copy(deep=True)
+    base_configuration = optimizer.adapter.trusted_copy(copied_fields=DATA_FIELDS)
     if not adapters.check_for_clean_compound_processes(base_configuration):
         logger.warning(
             "Both compound processes and normal processes are used. This may lead to unexpected results."
@@ -18,6 +18,7 @@ logger = logging.getLogger(__name__)
 
 from pydantic import BaseModel, ConfigDict
 from prodsys import adapters
+from prodsys.models.production_system_data import DATA_FIELDS
 from prodsys.models import (
     resource_data,
     processes_data,
@@ -473,7 +474,7 @@ class MathOptimizer(BaseModel):
         performances["0"] = {}
 
         for result_counter in range(nSolutions):
-            new_adapter = self.adapter.model_copy(deep=True)
+            new_adapter = self.adapter.trusted_copy(copied_fields=DATA_FIELDS)
             replace_optimization_configuration_id(new_adapter)
             new_adapter.resource_data = [
                 resource
@@ -582,9 +583,7 @@ def mathematical_optimization(
         save_folder (str, optional): Folder to save the results in. Defaults to "results".
         full_save (bool, optional): Indicates if the full results are saved. Defaults to False.
     """
-    adapters.ProductionSystemData.model_config["validate_assignment"] = False
-
-    base_configuration = optimizer.adapter.model_copy(deep=True)
+    base_configuration = optimizer.adapter.trusted_copy(copied_fields=DATA_FIELDS)
     if not adapters.check_for_clean_compound_processes(base_configuration):
         raise ValueError(
             "Compound processes are not supported in the current configuration."
@@ -417,7 +417,7 @@ def check_valid_configuration(
         reasons.append(f"Required primitives not available: {e}")
 
     try:
-        assert_required_processes_in_resources_available(configuration)
+        configuration.run_check(assert_required_processes_in_resources_available)
     except ValueError as e:
         reasons.append(f"Required processes not in resources: {e}")
 
@@ -1,12 +1,46 @@
 import pandas as pd
-from typing import List
+from typing import List, Union
 import json
 import plotly
 import plotly.graph_objects as go
 import numpy as np
 from copy import copy
 
+from pydantic import TypeAdapter
+
 from prodsys.optimization.optimization_data import OptimizationResults
+from prodsys.optimization.result_store import OptimizationResultStore
+
+
+def read_optimization_results(filepath: str) -> OptimizationResults:
+    """
+    Reads the results of an optimization run from the result store (`optimization_results.jsonl`) or from a json file
+    of older versions (`optimization_results.json`).
+
+    Args:
+        filepath (str): Filepath to the result file.
+
+    Returns:
+        OptimizationResults: The optimization results.
+    """
+    if filepath.endswith(".jsonl"):
+        return OptimizationResultStore(filepath).read()
+    with open(filepath, "r") as json_file:
+        return TypeAdapter(OptimizationResults).validate_python(json.load(json_file))
+
+
+def read_optimization_results_file_to_df(filepath: str, label: str) -> pd.DataFrame:
+    """
+    Function reads the results of an optimization run from a result file and returns a pandas dataframe.
+
+    Args:
+        filepath (str): Filepath to the result file.
+        label (str): Label to specify the utilized optimizer.
+
+    Returns:
+        pd.DataFrame: Dataframe containing the optimization results.
+    """
+    return transform_optimization_results_to_df(read_optimization_results(filepath), label)
 
 
 def transform_optimization_results_to_df(data: OptimizationResults, label: str) -> pd.DataFrame:
@@ -95,17 +129,20 @@ def is_pareto_efficient(costs):
 
 
 def get_pareto_solutions_from_result_files(
-    optimization_results: OptimizationResults
+    optimization_results: Union[OptimizationResults, str]
 ) -> List[str]:
     """
-    Analyses an optimization result file and returns the IDs of the pareto efficient solutions.
+    Analyses optimization results and returns the IDs of the pareto efficient solutions.
 
     Args:
-        file_path (str): Filepath of the json file containing the optimization results.
+        optimization_results (Union[OptimizationResults, str]): The optimization results or the filepath of the
+            result file containing them.
 
     Returns:
         List[str]: List of IDs of the pareto efficient solutions.
     """
+    if isinstance(optimization_results, str):
+        optimization_results = read_optimization_results(optimization_results)
     df = transform_optimization_results_to_df(optimization_results, label="optimizer")
     relevant_cols = ["agg_fitness", "cost", "throughput", "wip", "optimizer"]
     relevant_cols = [col for col in relevant_cols if col in df.columns]
@@ -17,7 +17,8 @@ from prodsys.optimization.optimization_data import (
     SolutionMetadata,
     get_empty_optimization_results,
 )
-from prodsys.optimization.util import get_weights
+from prodsys.optimization.result_store import OptimizationResultStore
+from prodsys.optimization.util import get_weights, reserve_optimization_configuration_ids
 from prodsys.util import util
 
 if util.run_from_ipython():
@@ -110,6 +111,7 @@ class Optimizer(ABC):
         self.performances_cache: OptimizationResults = get_empty_optimization_results()
         self.progress = OptimizationProgress()
         self.start_time = None
+        self.generation_offset = 0
 
     def get_algorithm_and_steps(self) -> tuple[Callable, int]:
         if isinstance(self.hyperparameters, EvolutionaryAlgorithmHyperparameters):
@@ -153,6 +155,8 @@ class Optimizer(ABC):
         self.progress = OptimizationProgress()
         self.optimization_cache_first_found_hashes = OptimizationSolutions()
         self.performances_cache = get_empty_optimization_results()
+        self.generation_offset = 0
+        self.load_previous_results()
         self.start_time = time.perf_counter()
 
         algorithm, steps = self.get_algorithm_and_steps()
@@ -162,6 +166,27 @@ class Optimizer(ABC):
         algorithm(self)
         self.pbar.close()
 
+    def load_previous_results(self) -> None:
+        """
+        Prepares the persistence for a new optimization run. Concrete subclasses can load the results of a previous,
+        interrupted run here, so that already evaluated configurations are not simulated again. Loaded results need to
+        reserve their configuration IDs and set `generation_offset`, so that the new results do not overwrite them.
+        """
+        pass
+
+    def get_current_generation(self) -> str:
+        """
+        Returns the generation under which the current optimization step is saved. Numbered generations of the
+        algorithm are shifted by `generation_offset` to continue after the generations of loaded results.
+
+        Returns:
+            str: The generation of the current optimization step.
+        """
+        current_generation = self.optimization_cache_first_found_hashes.current_generation
+        if self.generation_offset and current_generation.isdigit():
+            return str(int(current_generation) + self.generation_offset)
+        return current_generation
+
     def save_optimization_step(
         self,
         fitness_values: Optional[list[float]],
@@ -178,11 +203,9 @@ class Optimizer(ABC):
         )
         # Cache the configuration separately (only in subclasses that override cache_configuration)
         self.save_configuration(configuration)
-        current_generation = (
-            self.optimization_cache_first_found_hashes.current_generation
-        )
+        current_generation = self.get_current_generation()
         self.cache_fitness_data(fitness_data, current_generation, configuration)
-        self.save_fitness_data(fitness_data, current_generation)
+        self.save_fitness_data(fitness_data, current_generation, configuration.ID)
         return fitness_data.fitness, fitness_data.event_log_dict
 
     def get_fitness_data_entry(
@@ -261,7 +284,9 @@ class Optimizer(ABC):
         ...
 
     @abstractmethod
-    def save_fitness_data(self, fitness_data: FitnessData, generation: str) -> None:
+    def save_fitness_data(
+        self, fitness_data: FitnessData, generation: str, adapter_id: str
+    ) -> None:
         """
         Persists the fitness data. Must be implemented by concrete subclasses.
         """
@@ -405,7 +430,9 @@ class InMemoryOptimizer(Optimizer):
         configuration_hash = configuration.hash()
         self.configuration_cache[configuration_hash] = configuration
 
-    def save_fitness_data(self, fitness_data: FitnessData, generation: str) -> None:
+    def save_fitness_data(
+        self, fitness_data: FitnessData, generation: str, adapter_id: str
+    ) -> None:
         # Here also add the configuration to the cached fitness data
         configuration = self.configuration_cache.get(fitness_data.hash)
         if configuration is None:
@@ -446,6 +473,13 @@ class FileSystemSaveOptimizer(Optimizer):
         save_folder (str): The folder where data will be saved.
         initial_solutions (Optional[list[ProductionSystemAdapter]], optional): Initial solutions to start the optimization. Defaults to None.
         full_save (bool, optional): Whether to save full event log data. Defaults to False.
+        resume (bool, optional): Whether to resume from the results of a previous, interrupted optimization in the
+            save folder. Configurations that were already evaluated are then not simulated again and the new results
+            continue after the stored generations and configuration IDs. Defaults to False, which starts with empty
+            results.
+
+    The fitness data of all evaluated configurations is appended to `optimization_results.jsonl` in the save folder.
+    Results of older versions in `optimization_results.json` can still be read.
     """
 
     def __init__(
@@ -457,11 +491,51 @@ class FileSystemSaveOptimizer(Optimizer):
         smart_initial_solutions: Optional[bool] = False,
         full_save: bool = False,
         base_validation: BaseValidationMode = "strict",
+        resume: bool = False,
     ) -> None:
         super().__init__(adapter, hyperparameters, initial_solutions, smart_initial_solutions, full_save, base_validation)
         self.save_folder = save_folder
+        self.resume = resume
         self.configuration_cache: dict[str, ProductionSystemData] = {}
         util.prepare_save_folder(self.save_folder + "/")
+        self.result_store = OptimizationResultStore(
+            os.path.join(self.save_folder, "optimization_results.jsonl")
+        )
+
+    def load_previous_results(self) -> None:
+        """
+        Loads the results of a previous optimization from the result store if the optimizer resumes, otherwise
+        removes them so that the results of different runs are not mixed.
+        """
+        if not self.resume:
+            self.result_store.clear()
+            return
+        optimization_results = self.result_store.read()
+        self.performances_cache = optimization_results
+        self.optimization_cache_first_found_hashes.hashes = (
+            self.result_store.get_first_found_hashes(optimization_results)
+        )
+        # IDs and generations restart in a new process, so continue after the stored ones to not overwrite results.
+        reserve_optimization_configuration_ids(
+            adapter_id
+            for fitness_entry in optimization_results.values()
+            for adapter_id in fitness_entry
+        )
+        numbered_generations = [
+            int(generation) for generation in optimization_results if generation.isdigit()
+        ]
+        if numbered_generations:
+            self.generation_offset = max(numbered_generations) + 1
+
+    def _read_optimization_results(self) -> OptimizationResults:
+        if not self.result_store.exists():
+            legacy_path = os.path.join(self.save_folder, "optimization_results.json")
+            if os.path.exists(legacy_path):
+                with open(legacy_path, "r") as json_file:
+                    return TypeAdapter(OptimizationResults).validate_python(
+                        json.load(json_file)
+                    )
+        return self.result_store.read()
 
     def save_configuration(self, configuration: ProductionSystemData) -> None:
         configuration_hash = configuration.hash()
@@ -469,7 +543,9 @@ class FileSystemSaveOptimizer(Optimizer):
             f"{self.save_folder}/hash_{configuration_hash}.json"
         )
 
-    def save_fitness_data(self, fitness_data: FitnessData, generation: str) -> None:
+    def save_fitness_data(
+        self, fitness_data: FitnessData, generation: str, adapter_id: str
+    ) -> None:
         """
         Saves the fitness data to disk.
         If full_save is True, event log data is also persisted.
@@ -481,17 +557,8 @@ class FileSystemSaveOptimizer(Optimizer):
             )
             df.to_json(event_log_path, indent=4)
             fitness_data.event_log_dict = None  # Free up memory
-        # Update the aggregated optimization results on disk.
-        optimization_results = {}
-        for gen in self.performances_cache:
-            if gen not in optimization_results:
-                optimization_results[gen] = {}
-            for adapter_id, fitness_data_entry in self.performances_cache[gen].items():
-                optimization_results[gen][adapter_id] = fitness_data_entry.model_dump(
-                    exclude={"production_system", "event_log_dict"}
-                )
-        with open(f"{self.save_folder}/optimization_results.json", "w") as json_file:
-            json.dump(optimization_results, json_file, indent=4)
+        # Append the result of the evaluated configuration instead of rewriting all results.
+        self.result_store.append(generation, adapter_id, fitness_data)
 
     def get_configuration_by_hash(
         self, configuration_hash: str
@@ -511,10 +578,7 @@ class FileSystemSaveOptimizer(Optimizer):
         """
         Loads the fitness data for a given generation and adapter_id from disk.
         """
-        with open(f"{self.save_folder}/optimization_results.json", "r") as json_file:
-            optimization_results = json.load(json_file)
-        fitness_data_dict = optimization_results[generation][adapter_id]
-        fitness_data = FitnessData.model_validate(fitness_data_dict)
+        fitness_data = self._read_optimization_results()[generation][adapter_id]
         # In this design, the configuration is loaded separately.
         fitness_data.production_system = None
         if self.full_save:
@@ -537,11 +601,7 @@ class FileSystemSaveOptimizer(Optimizer):
         Loads the entire optimization results from disk.
         The flags determine if full configuration data and/or event log data are included.
         """
-        with open(f"{self.save_folder}/optimization_results.json", "r") as json_file:
-            optimization_results_data = json.load(json_file)
-        optimization_results: OptimizationResults = TypeAdapter(
-            OptimizationResults
-        ).validate_python(optimization_results_data)
+        optimization_results = self._read_optimization_results()
         if configuration_data:
             for generation in optimization_results:
                 for adapter_id, fitness_data in optimization_results[
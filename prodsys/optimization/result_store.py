@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+from typing import Optional
+
+from prodsys.optimization.optimization_data import (
+    FitnessData,
+    OptimizationResults,
+    OptimizationSolutionDict,
+    SolutionMetadata,
+    get_empty_optimization_results,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class OptimizationResultStore:
+    """
+    Append-only store of optimization results in a JSON Lines file. Every evaluated individual is appended as one line
+    with its generation, ID and fitness data, so saving a result does not rewrite the previous results and an
+    interrupted write can at most lose the last line. The results are indexed by generation and by configuration hash
+    when the store is read, which allows to resume an interrupted optimization.
+
+    Args:
+        file_path (str): Path of the JSON Lines file.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._line_terminated = False
+
+    def exists(self) -> bool:
+        """
+        Returns whether the store contains results.
+
+        Returns:
+            bool: True if the file of the store exists, False otherwise.
+        """
+        return os.path.exists(self.file_path)
+
+    def clear(self) -> None:
+        """
+        Removes all results of the store.
+        """
+        if self.exists():
+            os.remove(self.file_path)
+        self._line_terminated = False
+
+    def append(self, generation: str, adapter_id: str, fitness_data: FitnessData) -> None:
+        """
+        Appends the fitness data of an individual to the store. The configuration and the event log are not stored.
+
+        Args:
+            generation (str): Generation of the individual.
+            adapter_id (str): ID of the individual.
+            fitness_data (FitnessData): Fitness data of the individual.
+        """
+        record = {
+            "generation": generation,
+            "ID": adapter_id,
+            "fitness_data": fitness_data.model_dump(
+                exclude={"production_system", "event_log_dict"}
+            ),
+        }
+        if not self._line_terminated:
+            self._terminate_incomplete_line()
+        with open(self.file_path, "a", encoding="utf-8") as jsonl_file:
+            jsonl_file.write(json.dumps(record) + "\n")
+            jsonl_file.flush()
+
+    def _terminate_incomplete_line(self) -> None:
+        # An interrupted write leaves the last line without a line break, so new results start on a new line.
+        if self.exists() and os.path.getsize(self.file_path) > 0:
+            with open(self.file_path, "rb+") as jsonl_file:
+                jsonl_file.seek(-1, os.SEEK_END)
+                if jsonl_file.read(1) != b"\n":
+                    jsonl_file.write(b"\n")
+        self._line_terminated = True
+
+    def read(self) -> OptimizationResults:
+        """
+        Reads all results of the store, indexed by generation and ID. Lines that cannot be parsed, e.g. because the
+        optimization was interrupted while writing them, are skipped.
+
+        Returns:
+            OptimizationResults: The optimization results.
+        """
+        optimization_results = get_empty_optimization_results()
+        if not self.exists():
+            return optimization_results
+        with open(self.file_path, "r", encoding="utf-8") as jsonl_file:
+            for line_number, line in enumerate(jsonl_file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(
+                        f"Skipping incomplete line {line_number} of optimization results {self.file_path}."
+                    )
+                    continue
+                generation = record["generation"]
+                if generation not in optimization_results:
+                    optimization_results[generation] = {}
+                optimization_results[generation][record["ID"]] = FitnessData.model_validate(
+                    record["fitness_data"]
+                )
+        return optimization_results
+
+    def get_first_found_hashes(
+        self, optimization_results: Optional[OptimizationResults] = None
+    ) -> OptimizationSolutionDict:
+        """
+        Returns the index of the results by configuration hash, pointing to the generation and ID where each
+        configuration was evaluated first.
+
+        Args:
+            optimization_results (Optional[OptimizationResults], optional): Results of the store, if they were
+                already read. Defaults to None, which reads the store.
+
+        Returns:
+            OptimizationSolutionDict: Mapping of configuration hash to the generation and ID of its first evaluation.
+        """
+        if optimization_results is None:
+            optimization_results = self.read()
+        hashes: OptimizationSolutionDict = {}
+        for generation, fitness_entry in optimization_results.items():
+            for adapter_id, fitness_data in fitness_entry.items():
+                if fitness_data.hash not in hashes:
+                    hashes[fitness_data.hash] = SolutionMetadata(
+                        generation=generation, ID=adapter_id
+                    )
+        return hashes
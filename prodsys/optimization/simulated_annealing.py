@@ -1,5 +1,4 @@
 import time
-from copy import deepcopy
 from typing import TYPE_CHECKING
 from pydantic import BaseModel, ConfigDict
 import logging
@@ -14,6 +13,7 @@ from prodsys.optimization.optimization import check_valid_configuration
 from simanneal import Annealer
 
 from prodsys import adapters
+from prodsys.models.production_system_data import DATA_FIELDS
 from prodsys.optimization.util import (
     check_breakdown_states_available,
     create_default_breakdown_states,
@@ -73,7 +73,7 @@ class ProductionSystemOptimization(ThreadSafeAnnealer):
 
     def move(self):
         while True:
-            configuration = mutation(individual=[deepcopy(self.state)])[0][0]
+            configuration = mutation(individual=[self.state.trusted_copy()])[0][0]
             is_valid, _reasons = check_valid_configuration(
                 configuration=configuration,
                 base_configuration=self.base_configuration,
@@ -150,8 +150,7 @@ def simulated_annealing_optimization(optimizer: "Optimizer"):
         save_folder (str): Folder to save the results in. Defaults to "results".
         initial_solution (adapters.ProductionSystemAdapter, optional): Initial solution for optimization. Defaults to None.
     """
-    adapters.ProductionSystemData.model_config["validate_assignment"] = False
-    base_configuration = optimizer.adapter.model_copy(deep=True)
+    base_configuration = optimizer.adapter.trusted_copy(copied_fields=DATA_FIELDS)
 
     if not adapters.check_for_clean_compound_processes(base_configuration):
         logger.warning(
@@ -160,7 +159,7 @@ def simulated_annealing_optimization(optimizer: "Optimizer"):
     if not check_breakdown_states_available(base_configuration):
         create_default_breakdown_states(base_configuration)
     if not optimizer.initial_solutions:
-        optimizer.initial_solutions = base_configuration.model_copy(deep=True)
+        optimizer.initial_solutions = base_configuration.trusted_copy(copied_fields=DATA_FIELDS)
 
     hyper_parameters: SimulatedAnnealingHyperparameters = optimizer.hyperparameters
 
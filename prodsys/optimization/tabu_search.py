@@ -20,6 +20,7 @@ from prodsys.optimization.optimization import check_valid_configuration
 from pydantic import BaseModel, ConfigDict
 
 from prodsys import adapters
+from prodsys.models.production_system_data import DATA_FIELDS
 from prodsys.optimization.util import (
     check_breakdown_states_available,
     create_default_breakdown_states,
@@ -172,9 +173,7 @@ def tabu_search_optimization(
     Args:
         optimizer (Optimizer): The optimizer that contains the adapter, hyperparameters for tabu search, and initial solution (Defaults to None).
     """
-    adapters.ProductionSystemData.model_config["validate_assignment"] = False
-
-    base_configuration = optimizer.adapter.model_copy(deep=True)
+    base_configuration = optimizer.adapter.trusted_copy(copied_fields=DATA_FIELDS)
     if not adapters.check_for_clean_compound_processes(base_configuration):
         logger.warning(
             "Both compound processes and normal processes are used. This may lead to unexpected results."
@@ -229,7 +228,7 @@ def tabu_search_optimization(
             neighboarhood = []
             for _ in range(self.neighborhood_size):
                 while True:
-                    configuration = mutation(individual=[deepcopy(self.current)])[0][0]
+                    configuration = mutation(individual=[self.current.trusted_copy()])[0][0]
                     is_valid, _reasons = check_valid_configuration(
                         configuration=configuration,
                         base_configuration=base_configuration,
@@ -4,7 +4,7 @@ Module containts utility functions for the optimization module. These functions
 
 from __future__ import annotations
 
-from typing import Dict, List, Union, Tuple, Literal
+from typing import Dict, Iterable, List, Union, Tuple, Literal
 from enum import Enum
 import logging
 
@@ -95,6 +95,17 @@ def replace_optimization_configuration_id(
     _assigned_optimization_system_ids.add(new_id)
 
 
+def reserve_optimization_configuration_ids(configuration_ids: Iterable[str]) -> None:
+    """
+    Reserves configuration ids that were already assigned, e.g. by a previous optimization run that is resumed, so
+    that `replace_optimization_configuration_id` does not assign them again.
+
+    Args:
+        configuration_ids (Iterable[str]): The already assigned configuration ids.
+    """
+    _assigned_optimization_system_ids.update(configuration_ids)
+
+
 def get_breakdown_state_ids_of_machine_with_processes(
     processes: List[str], adapter_object: adapters.ProductionSystemData
 ) -> List[str]:
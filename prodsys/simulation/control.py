@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from bisect import bisect_left
+from collections.abc import Callable, Collection
 from typing import List, Generator, TYPE_CHECKING, Literal, Optional, Union
 
 from simpy import events
@@ -26,11 +27,13 @@ from prodsys.simulation.process_handlers.system_process_model_process_handler im
 from prodsys.simulation.process_handlers.resource_process_model_process_handler import ResourceProcessModelHandler
 from prodsys.models.resource_data import ResourceType
 from prodsys.simulation import request as request_module
+from prodsys.simulation.time_model import DistanceTimeModel
 
 if TYPE_CHECKING:
     from prodsys.simulation import (
         process,
         resources,
+        router,
     )
     from prodsys.simulation import request as request_module
     from prodsys.control import sequencing_control_env
@@ -57,6 +60,7 @@ class Controller:
         process_finished (events.Event): The event that is triggered when a process is finished.
         num_running_processes (int): The number of processes that are currently running.
         reserved_requests_count (int): The number of requests that are reserved for processing.
+        routers (List[router.Router]): The routers that route requests to the resource and track if the controller is busy.
     """
 
     def __init__(
@@ -81,6 +85,7 @@ class Controller:
         self.resource: resources.Resource = None
         self.num_running_processes = 0
         self.reserved_requests_count = 0
+        self.routers: List[router.Router] = []
         # Resource-local schedule (Production/Transport/Dependency/Setup start events).
         # Set by resource_factory when a scheduled control policy is used.
         self.resource_schedule: list = []
@@ -106,6 +111,28 @@ class Controller:
         if not self.state_changed.triggered:
             self.state_changed.succeed()
 
+    @property
+    def idle(self) -> bool:
+        """
+        Returns if the controller is idle, i.e. it has no pending requests, no reserved or running processes and its resource is neither bound, in setup, broken down nor scheduled or charging.
+
+        Waking up an idle controller cannot start any work, because all these conditions only change with a new request or with a state change of the controller's own resource, which wakes up the controller itself.
+
+        Returns:
+            bool: True if the controller is idle, False otherwise.
+        """
+        resource = self.resource
+        return not (
+            self.requests
+            or self.num_running_processes
+            or self.reserved_requests_count
+            or self.resource_schedule
+            or resource.bound
+            or resource.in_setup
+            or resource.charging_states
+            or not resource.active.triggered
+        )
+
     def _current_setup_process_id(self) -> str | None:
         if self.resource is None:
             return None
@@ -581,6 +608,9 @@ class Controller:
             yield self.state_changed
             self.state_changed = events.Event(self.env)
             self.resource.update_idle_logging()
+            if not self.idle:
+                for router in self.routers:
+                    router.mark_resource_not_free(self.resource)
             if (
                 self.resource.full
                 or self.resource.in_setup
@@ -1031,10 +1061,13 @@ def get_requets_handler(
     ):
         return ProductionProcessHandler(request.requesting_item.env)
     elif request.request_type == request_module.RequestType.TRANSPORT:
+        route_mode = "hops"
+        if isinstance(request.get_process(), process.LinkTransportProcess):
+            route_mode = request.get_process().route_mode
         if request.get_resource().can_move:
-            return TransportProcessHandler(request.requesting_item.env)
+            return TransportProcessHandler(request.requesting_item.env, route_mode=route_mode)
         else:
-            return ConveyorTransportProcessHandler(request.requesting_item.env)
+            return ConveyorTransportProcessHandler(request.requesting_item.env, route_mode=route_mode)
     elif (
         request.request_type == request_module.RequestType.PROCESS_DEPENDENCY
         or request.request_type == request_module.RequestType.RESOURCE_DEPENDENCY
@@ -1088,6 +1121,55 @@ def get_location(locatable: Locatable) -> List[float]:
     return locatable.get_location()
 
 
+def get_expected_transport_times(
+    requests: List[request_module.Request],
+    get_origin: Callable[[request_module.Request], Locatable],
+    get_target: Callable[[request_module.Request], Locatable],
+) -> List[float]:
+    """
+    Returns the expected transport times of requests. Requests whose processes share a DistanceTimeModel are scored
+    in one vectorised call of the time model.
+
+    Args:
+        requests (List[request.Request]): The list of requests.
+        get_origin (Callable[[request.Request], Locatable]): Returns the origin of the transport of a request.
+        get_target (Callable[[request.Request], Locatable]): Returns the target of the transport of a request.
+
+    Returns:
+        List[float]: The expected transport times in the order of the requests.
+    """
+    expected_times = [0.0] * len(requests)
+    batches = {}
+    for index, request in enumerate(requests):
+        time_model = getattr(request.process, "time_model", None)
+        if isinstance(time_model, DistanceTimeModel):
+            batches.setdefault(id(time_model), (time_model, []))[1].append(index)
+        else:
+            expected_times[index] = request.process.get_expected_process_time(
+                get_location(get_origin(request)), get_location(get_target(request))
+            )
+    for time_model, indices in batches.values():
+        batch_times = time_model.get_expected_times(
+            [get_location(get_origin(requests[index])) for index in indices],
+            [get_location(get_target(requests[index])) for index in indices],
+        )
+        for index, expected_time in zip(indices, batch_times.tolist()):
+            expected_times[index] = expected_time
+    return expected_times
+
+
+def sort_requests(requests: List[request_module.Request], keys: List) -> None:
+    """
+    Sorts the requests in place by precomputed keys. Like list.sort, the sorting is stable.
+
+    Args:
+        requests (List[request.Request]): The list of requests.
+        keys (List): The sort keys in the order of the requests.
+    """
+    order = sorted(range(len(requests)), key=keys.__getitem__)
+    requests[:] = [requests[index] for index in order]
+
+
 def SPT_transport_control_policy(
     requests: List[request_module.Request],
 ) -> None:
@@ -1097,20 +1179,28 @@ def SPT_transport_control_policy(
     Args:
         requests (List[request.Request]): The list of requests.
     """
-    # for request in requests:
-    #     if request.origin_queue is None or request.target_queue is None:
-    #         raise ValueError(f"Origin queue or target queue is None for request {request.completed}")
-
-    def get_expected_time(request: request_module.Request) -> float:
-        if request.request_type in (request_module.RequestType.PROCESS_DEPENDENCY, request_module.RequestType.RESOURCE_DEPENDENCY):
-            #  TODO: calculate time based on dependency process time
-            return 0.1
-        return request.process.get_expected_process_time(
-            get_location(request.origin_queue), get_location(request.target_queue)
+    dependency_request_types = (
+        request_module.RequestType.PROCESS_DEPENDENCY,
+        request_module.RequestType.RESOURCE_DEPENDENCY,
+    )
+    transport_requests = [
+        request
+        for request in requests
+        if request.request_type not in dependency_request_types
+    ]
+    transport_times = iter(
+        get_expected_transport_times(
+            transport_requests,
+            lambda request: request.origin_queue,
+            lambda request: request.target_queue,
         )
-    requests.sort(
-        key=get_expected_time
     )
+    #  TODO: calculate time of dependency requests based on dependency process time
+    keys = [
+        0.1 if request.request_type in dependency_request_types else next(transport_times)
+        for request in requests
+    ]
+    sort_requests(requests, keys)
 
 
 def nearest_origin_and_longest_target_queues_transport_control_policy(
@@ -1122,14 +1212,14 @@ def nearest_origin_and_longest_target_queues_transport_control_policy(
     Args:
         requests (List[request.Request]): The list of requests.
     """
-    requests.sort(
-        key=lambda x: (
-            x.process.get_expected_process_time(
-                get_location(x.resource), get_location(x.origin_queue)
-            ),
-            -x.target_queue.free_space(),
-        )
+    origin_times = get_expected_transport_times(
+        requests, lambda request: request.resource, lambda request: request.origin_queue
     )
+    keys = [
+        (origin_time, -request.target_queue.free_space())
+        for origin_time, request in zip(origin_times, requests)
+    ]
+    sort_requests(requests, keys)
 
 
 def nearest_origin_and_shortest_target_input_queues_transport_control_policy(
@@ -1142,14 +1232,14 @@ def nearest_origin_and_shortest_target_input_queues_transport_control_policy(
     Args:
         requests (List[request.Request]): The list of requests.
     """
-    requests.sort(
-        key=lambda x: (
-            x.process.get_expected_process_time(
-                get_location(x.resource), get_location(x.origin_queue)
-            ),
-            x.target_queue.free_space(),
-        )
+    origin_times = get_expected_transport_times(
+        requests, lambda request: request.resource, lambda request: request.origin_queue
     )
+    keys = [
+        (origin_time, request.target_queue.free_space())
+        for origin_time, request in zip(origin_times, requests)
+    ]
+    sort_requests(requests, keys)
 
 
 def agent_control_policy(
@@ -1165,12 +1255,48 @@ def agent_control_policy(
     """
     gym_env.interrupt_simulation_event.succeed()
 
+class ScheduleCursor:
+    """
+    Persistent cursor of a scheduled control policy into its schedule. For every schedule key, e.g. a product and
+    process, it stores the position of the first schedule index in the sorted index list of the key that was not
+    started yet. The positions only move forward, so skipping started schedule indices costs O(1) amortized per call
+    of the policy instead of a scan over all started indices.
+
+    Attributes:
+        positions (dict[tuple, int]): Position of the first open schedule index per schedule key.
+    """
+
+    def __init__(self) -> None:
+        self.positions: dict[tuple, int] = {}
+
+    def first_open_position(
+        self, key: tuple, indices: List[int], completed: Collection[int]
+    ) -> int:
+        """
+        Advances the cursor of a schedule key past all started schedule indices and returns its position.
+
+        Args:
+            key (tuple): The schedule key.
+            indices (List[int]): The sorted schedule indices of the key.
+            completed (Collection[int]): The schedule indices that were already started.
+
+        Returns:
+            int: Position of the first schedule index of the key that was not started yet.
+        """
+        position = self.positions.get(key, 0)
+        while position < len(indices) and indices[position] in completed:
+            position += 1
+        self.positions[key] = position
+        return position
+
+
 def scheduled_control_policy(
     schedule_matches_by_key: dict[tuple[str, str], list[int]],
     dependency_attendance_matches_by_key: dict,
     schedule_events: list,
     fallback_policy: Callable,
     requests: List[request_module.Request],
+    schedule_cursor: Optional[ScheduleCursor] = None,
 ) -> None:
     """
     A control policy that sequences products based on their scheduled index in the sequence. 
@@ -1188,6 +1314,8 @@ def scheduled_control_policy(
             schedule indices where that pair appears on this resource.
         fallback_policy (Callable): fallback control policy
         requests (List[request_module.Request]): list of requests to sequence
+        schedule_cursor (Optional[ScheduleCursor]): Cursor that persists the first open schedule
+            index per key between calls. Defaults to None, which starts from the beginning of the schedule.
     """
 
     matched_schedule_indices = set()
@@ -1195,18 +1323,40 @@ def scheduled_control_policy(
     non_scheduled_requests = []
     product_next_expected_index = {}
     dependency_next_expected_index: dict[tuple[str, str, str | None], int] = {}
+    cursor = schedule_cursor if schedule_cursor is not None else ScheduleCursor()
 
     from prodsys.simulation.schedule_dependency import (
         dependency_attendance_lookup_keys,
         preceding_dependency_move_start_time,
     )
 
-    def _completed_indices_for(request_instance: request_module.Request) -> set[int]:
+    def _completed_indices_for(request_instance: request_module.Request) -> Collection[int]:
         resource = getattr(request_instance, "resource", None)
         controller = getattr(resource, "controller", None) if resource is not None else None
         if controller is None:
-            return set()
-        return set(getattr(controller, "completed_schedule_indices", ()) or ())
+            return ()
+        return getattr(controller, "completed_schedule_indices", None) or ()
+
+    def _first_open_index(
+        key: tuple,
+        indices: List[int],
+        next_expected: int,
+        completed: Collection[int],
+        is_candidate: Callable[[int], bool] | None = None,
+    ) -> int | None:
+        # Indices before the cursor are started and indices before next_expected are
+        # behind the plan of the product, so the search starts at the later of both.
+        position = max(
+            cursor.first_open_position(key, indices, completed),
+            bisect_left(indices, next_expected),
+        )
+        for position in range(position, len(indices)):
+            sched_index = indices[position]
+            if sched_index in matched_schedule_indices or sched_index in completed:
+                continue
+            if is_candidate is None or is_candidate(sched_index):
+                return sched_index
+        return None
 
     request_matches = {}
     dependency_request_matches = {}
@@ -1217,10 +1367,11 @@ def scheduled_control_policy(
             request_module.RequestType.RESOURCE_DEPENDENCY,
         ):
             lookup_keys = dependency_attendance_lookup_keys(request_instance)
-            possible: list[tuple[int, tuple[str, str, str | None]]] = []
+            possible: list[tuple[tuple[str, str, str | None], List[int]]] = []
             for key in lookup_keys:
-                for sched_index in dependency_attendance_matches_by_key.get(key, ()):
-                    possible.append((sched_index, key))
+                indices = dependency_attendance_matches_by_key.get(key)
+                if indices:
+                    possible.append((key, indices))
             if possible:
                 dependency_request_matches[request_instance] = possible
             else:
@@ -1233,11 +1384,10 @@ def scheduled_control_policy(
             if not product_id or not setup_state_id:
                 non_scheduled_requests.append(request_instance)
                 continue
-            indices = schedule_matches_by_key.get((product_id, setup_state_id), ())
+            key = (product_id, setup_state_id)
+            indices = schedule_matches_by_key.get(key)
             if indices:
-                request_matches[request_instance] = [
-                    (sched_index, product_id, setup_state_id) for sched_index in indices
-                ]
+                request_matches[request_instance] = (key, indices)
             else:
                 non_scheduled_requests.append(request_instance)
             continue
@@ -1249,11 +1399,10 @@ def scheduled_control_policy(
             non_scheduled_requests.append(request_instance)
             continue
         
-        indices = schedule_matches_by_key.get((product_id, process_id), ())
+        key = (product_id, process_id)
+        indices = schedule_matches_by_key.get(key)
         if indices:
-            request_matches[request_instance] = [
-                (sched_index, product_id, process_id) for sched_index in indices
-            ]
+            request_matches[request_instance] = (key, indices)
         else:
             non_scheduled_requests.append(request_instance)
     
@@ -1261,34 +1410,33 @@ def scheduled_control_policy(
     # Strategy: Process schedule entries in order, and match requests as we go
     # This ensures that earlier schedule entries are matched first, maintaining correct order
     
-    # Create a list of (request, possible_matches) sorted by earliest possible schedule index
-    request_match_list = []
-    for request_instance, possible_matches in request_matches.items():
-        if possible_matches:
-            earliest_index = min(m[0] for m in possible_matches)
-            request_match_list.append((earliest_index, request_instance, possible_matches))
+    # Create a list of (request, possible_matches) sorted by earliest possible schedule index.
+    # The index lists are sorted, so the earliest possible index is the first one.
+    request_match_list = [
+        (indices[0], request_instance, key, indices)
+        for request_instance, (key, indices) in request_matches.items()
+    ]
     
     # Sort by earliest possible schedule index
     request_match_list.sort(key=lambda x: x[0])
 
-    dependency_match_list = []
-    for request_instance, possible_matches in dependency_request_matches.items():
-        earliest_index = min(m[0] for m in possible_matches)
-        dependency_match_list.append(
-            (earliest_index, request_instance, possible_matches)
-        )
+    dependency_match_list = [
+        (min(indices[0] for _, indices in possible), request_instance, possible)
+        for request_instance, possible in dependency_request_matches.items()
+    ]
     dependency_match_list.sort(key=lambda x: x[0])
 
-    for earliest_index, request_instance, possible_matches in dependency_match_list:
+    for earliest_index, request_instance, possible in dependency_match_list:
         completed = _completed_indices_for(request_instance)
         best_match = None
-        for sched_index, key in possible_matches:
-            if sched_index in matched_schedule_indices or sched_index in completed:
-                continue
-            next_expected = dependency_next_expected_index.get(key, 0)
-            if sched_index >= next_expected:
-                if best_match is None or sched_index < best_match[0]:
-                    best_match = (sched_index, key)
+        for key, indices in possible:
+            sched_index = _first_open_index(
+                key, indices, dependency_next_expected_index.get(key, 0), completed
+            )
+            if sched_index is not None and (
+                best_match is None or sched_index < best_match[0]
+            ):
+                best_match = (sched_index, key)
         if best_match:
             sched_index, key = best_match
             request_to_priority[request_instance] = sched_index
@@ -1312,9 +1460,8 @@ def scheduled_control_policy(
             non_scheduled_requests.append(request_instance)
     
     # Now match requests in order of their earliest possible schedule index
-    for earliest_index, request_instance, possible_matches in request_match_list:
+    for earliest_index, request_instance, key, indices in request_match_list:
         product_id = request_instance.entity.data.ID
-        process_id = request_instance.process.data.ID
         completed = _completed_indices_for(request_instance)
         
         # Get the next expected index for this product
@@ -1349,48 +1496,39 @@ def scheduled_control_policy(
             tq = getattr(request_instance, "target_queue", None)
             req_target_id = getattr(getattr(tq, "data", None), "ID", None)
 
-        candidates = []
-        for sched_index, sched_product_id, sched_process_id in possible_matches:
-            if (
-                sched_index >= next_expected
-                and sched_index not in matched_schedule_indices
-                and sched_index not in completed
-            ):
-                candidates.append((sched_index, sched_product_id, sched_process_id))
+        def _locations_match(sched_index: int) -> bool:
+            if sched_index >= len(schedule_events):
+                return False
+            ev = schedule_events[sched_index]
+            ev_origin = getattr(ev, "origin_location", None)
+            ev_target = getattr(ev, "target_location", None)
+            origin_ok = (
+                req_origin_id is None
+                or ev_origin is None
+                or ev_origin == req_origin_id
+            )
+            target_ok = (
+                req_target_id is None
+                or ev_target is None
+                or ev_target == req_target_id
+            )
+            # Prefer events that actually bind at least one location and match.
+            return (ev_origin is not None or ev_target is not None) and origin_ok and target_ok
 
         best_match = None
-        if candidates and (
+        if (
             getattr(request_instance, "request_type", None)
             == request_module.RequestType.TRANSPORT
             and (req_origin_id or req_target_id)
         ):
-            loc_matched = []
-            for sched_index, sched_product_id, sched_process_id in candidates:
-                if sched_index >= len(schedule_events):
-                    continue
-                ev = schedule_events[sched_index]
-                ev_origin = getattr(ev, "origin_location", None)
-                ev_target = getattr(ev, "target_location", None)
-                origin_ok = (
-                    req_origin_id is None
-                    or ev_origin is None
-                    or ev_origin == req_origin_id
-                )
-                target_ok = (
-                    req_target_id is None
-                    or ev_target is None
-                    or ev_target == req_target_id
-                )
-                # Prefer events that actually bind at least one location and match.
-                if (ev_origin is not None or ev_target is not None) and origin_ok and target_ok:
-                    loc_matched.append((sched_index, sched_product_id, sched_process_id))
-            if loc_matched:
-                best_match = min(loc_matched, key=lambda m: m[0])
-        if best_match is None and candidates:
-            best_match = min(candidates, key=lambda m: m[0])
+            best_match = _first_open_index(
+                key, indices, next_expected, completed, _locations_match
+            )
+        if best_match is None:
+            best_match = _first_open_index(key, indices, next_expected, completed)
         
-        if best_match:
-            sched_index, _, _ = best_match
+        if best_match is not None:
+            sched_index = best_match
             request_to_priority[request_instance] = sched_index
             matched_schedule_indices.add(sched_index)
             request_instance.scheduled_control_index = sched_index
@@ -43,7 +43,7 @@ class DependedEntity(Protocol):
         # called by the dependant
 
 
-class DependencyInfo:
+class DependencyInfo(state.ObservableInfo):
     """
     Class that represents information of the current state of a resource.
 
@@ -97,6 +97,8 @@ class DependencyInfo:
         self.product_ID = product_id
         self.order_ID = order_id
         self.process_ID = process_id
+        for observer in self.observers:
+            observer(self)
 
     def log_end_dependency(
         self,
@@ -122,6 +124,8 @@ class DependencyInfo:
         self.product_ID = product_id
         self.order_ID = order_id
         self.process_ID = process_id
+        for observer in self.observers:
+            observer(self)
 
 
 class Dependency:
@@ -79,6 +79,8 @@ class Product(Entity):
         self.dependency_info = DependencyInfo(primitive_id=self.data.ID)
         self.bound = False
         self.last_process_failed: Optional[bool] = None  # Track if the last executed process failed
+        # Precedence graph instance of the process model handler that currently executes the product's process model.
+        self.active_process_model: Optional[process_models.PrecedenceGraphProcessModel] = None
 
     @property
     def type(self) -> EntityType:
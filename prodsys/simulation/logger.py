@@ -1,20 +1,25 @@
 from __future__ import annotations
 
 import functools
+import glob
+import importlib.util
+import os
 import warnings
 from enum import Enum
 from abc import ABC, abstractmethod
 
 
 from functools import partial, wraps
-from typing import Callable, List, Union, TYPE_CHECKING, Dict, Any, Optional
+from typing import Callable, Iterator, List, Union, TYPE_CHECKING, Dict, Any, Optional
 
+import numpy as np
 import pandas as pd
 
 from prodsys.simulation import state
 from prodsys.simulation.entities import primitive, product
 
 if TYPE_CHECKING:
+    from prodsys.analytics.store import AnalyticsStore
     from prodsys.simulation import product
     from prodsys.factories import resource_factory
     from prodsys.simulation.dependency import DependencyInfo
@@ -27,7 +32,7 @@ class Logger(ABC):
     """
 
     def __init__(self):
-        pass
+        self._observer_lists: Dict[tuple, List[Callable]] = {}
 
     @abstractmethod
     def get_data_as_dataframe(self) -> pd.DataFrame:
@@ -92,6 +97,28 @@ class Logger(ABC):
             post = partial(post, data)
         self.patch_state(object, attr, pre, post)
 
+    def register_observer(
+        self,
+        data: Any,
+        info: state.ObservableInfo,
+        post: Callable[[Any, state.ObservableInfo], None],
+    ):
+        """
+        Register an observer for the info object of a state, product or dependency. In contrast to :meth:`register_patch`, no
+        wrapper is created per object: all info objects observed with the same data and post function share one observer list.
+
+        Args:
+            data (Any): Data to log to used for preloading the post function.
+            info (state.ObservableInfo): The info object to observe.
+            post (Callable[[Any, state.ObservableInfo], None]): The function to call after each logged event of the info object.
+        """
+        key = (id(data), post)
+        observers = self._observer_lists.get(key)
+        if observers is None:
+            observers = [partial(post, data)]
+            self._observer_lists[key] = observers
+        info.add_observers(observers)
+
     def log_data_to_csv(self, filepath: str):
         """
         Log the data to a csv file.
@@ -191,6 +218,24 @@ def post_monitor_primitive_movement(data: List[dict], primitive_info: product.Pr
     }
     data.append(item)
 
+
+_PRIMITIVE_MOVEMENT_STATE_TYPES = frozenset(
+    {state.StateTypeEnum.loading, state.StateTypeEnum.unloading}
+)
+
+
+def post_monitor_primitive_loading(data: List[dict], primitive_info: product.ProductInfo):
+    """
+    Post function for monitoring primitive movement that only logs the loading and unloading events of primitives.
+
+    Args:
+        data (List[dict]): The data to log to.
+        primitive_info (product.ProductInfo): The product info object of the primitive.
+    """
+    if primitive_info.state_type in _PRIMITIVE_MOVEMENT_STATE_TYPES:
+        post_monitor_primitive_movement(data, primitive_info)
+
+
 def post_monitor_primitive_dependency(
     data: List[dict], dependency_info: DependencyInfo
 ):
@@ -251,6 +296,340 @@ def post_monitor_resource_dependency(
     data.append(item)
 
 
+def _normalize_activity_column(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Converts the activity column of a raw event data frame to the string representation of the StateEnum values.
+
+    Args:
+        df (pd.DataFrame): The raw event data frame.
+
+    Returns:
+        pd.DataFrame: The data frame with the normalized activity column.
+    """
+    df["Activity"] = pd.Categorical(
+        df["Activity"],
+        categories=[v.value for v in list(state.StateEnum)],
+        ordered=True,
+    )
+    df["Activity"] = df["Activity"].astype("string")
+    return df
+
+
+class ColumnarEventLog:
+    """
+    Growable, preallocated column store for raw simulation events.
+
+    Every logged item is written row-wise into one typed numpy array per column instead of being kept as a dictionary.
+    Numeric columns are stored as float arrays, all other columns are interned: each distinct value is stored once and
+    the rows only hold an integer code. Columns that are missing in a logged item are filled with NaN, matching the
+    behaviour of a data frame created from a list of dictionaries.
+
+    The class implements ``append`` so it can be used as a drop-in target for the ``post_monitor_*`` functions.
+
+    Args:
+        initial_capacity (int, optional): Number of rows to preallocate. The capacity is doubled when exceeded. Defaults to 4096.
+    """
+
+    FLOAT_COLUMNS = frozenset({"Time", "Expected End Time"})
+    MISSING_CODE = 0
+
+    def __init__(self, initial_capacity: int = 4096):
+        self._capacity = max(1, initial_capacity)
+        self._size = 0
+        self._columns: Dict[str, np.ndarray] = {}
+        self._codes: Dict[str, Dict[Any, int]] = {}
+        self._values: Dict[str, List[Any]] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def columns(self) -> List[str]:
+        """
+        Returns:
+            List[str]: The column names in order of their first appearance.
+        """
+        return list(self._columns)
+
+    def _allocate(self, column_name: str, capacity: int) -> np.ndarray:
+        if column_name in self.FLOAT_COLUMNS:
+            return np.full(capacity, np.nan, dtype=np.float64)
+        return np.full(capacity, self.MISSING_CODE, dtype=np.int32)
+
+    def _add_column(self, column_name: str) -> np.ndarray:
+        column = self._allocate(column_name, self._capacity)
+        self._columns[column_name] = column
+        if column_name not in self.FLOAT_COLUMNS:
+            self._codes[column_name] = {}
+            self._values[column_name] = [np.nan]
+        return column
+
+    def _grow(self):
+        new_capacity = self._capacity * 2
+        for column_name, column in self._columns.items():
+            new_column = self._allocate(column_name, new_capacity)
+            new_column[: self._size] = column[: self._size]
+            self._columns[column_name] = new_column
+        self._capacity = new_capacity
+
+    def append(self, item: Dict[str, Any]):
+        """
+        Appends one event to the column store.
+
+        Args:
+            item (Dict[str, Any]): The event as mapping from column name to value.
+        """
+        if self._size == self._capacity:
+            self._grow()
+        row = self._size
+        for column_name, value in item.items():
+            column = self._columns.get(column_name)
+            if column is None:
+                column = self._add_column(column_name)
+            if column_name in self.FLOAT_COLUMNS:
+                column[row] = np.nan if value is None else value
+                continue
+            codes = self._codes[column_name]
+            code = codes.get(value)
+            if code is None:
+                values = self._values[column_name]
+                code = len(values)
+                codes[value] = code
+                values.append(value)
+            column[row] = code
+        self._size += 1
+
+    def clear(self):
+        """
+        Removes all events and interned values while keeping the allocated arrays for reuse.
+        """
+        for column_name, column in self._columns.items():
+            column[: self._size] = np.nan if column_name in self.FLOAT_COLUMNS else self.MISSING_CODE
+            if column_name not in self.FLOAT_COLUMNS:
+                self._codes[column_name] = {}
+                self._values[column_name] = [np.nan]
+        self._size = 0
+
+    def get_column(self, column_name: str) -> np.ndarray:
+        """
+        Returns the decoded values of a column. Float columns are returned as views on the underlying storage without copying.
+
+        Args:
+            column_name (str): The name of the column.
+
+        Returns:
+            np.ndarray: The values of the column.
+        """
+        column = self._columns[column_name][: self._size]
+        if column_name in self.FLOAT_COLUMNS:
+            return column
+        values = self._values[column_name]
+        lookup = np.empty(len(values), dtype=object)
+        lookup[:] = values
+        return lookup.take(column)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Converts the column store to a data frame with the same layout as a data frame created from a list of event dictionaries.
+
+        Returns:
+            pd.DataFrame: The events as a data frame.
+        """
+        df = pd.DataFrame(
+            {column_name: self.get_column(column_name) for column_name in self._columns},
+            copy=False,
+        )
+        # Decoded columns are object arrays; infer their dtypes like pandas does for records.
+        return df.infer_objects()
+
+
+EVENT_LOG_CHUNK_PATTERN = "events_*.parquet"
+
+PARQUET_ENGINES = ("pyarrow", "fastparquet")
+"""
+Parquet engines of pandas, one of which is required to stream event logs to disk.
+"""
+
+
+def is_parquet_engine_available() -> bool:
+    """
+    Returns if one of the Parquet engines of pandas is installed.
+
+    Returns:
+        bool: True if pyarrow or fastparquet is installed, False otherwise.
+    """
+    return any(importlib.util.find_spec(engine) is not None for engine in PARQUET_ENGINES)
+
+
+def check_parquet_engine_available():
+    """
+    Checks that a Parquet engine is installed before events are streamed to disk, so that a missing engine does not
+    fail the simulation when the first chunk is written.
+
+    Raises:
+        ImportError: If neither pyarrow nor fastparquet is installed.
+    """
+    if not is_parquet_engine_available():
+        raise ImportError(
+            "Streaming event logs requires a Parquet engine of pandas. Install pyarrow or fastparquet, e.g. with "
+            "`pip install prodsys[parquet]`."
+        )
+
+
+def get_event_log_chunk_files(directory: str) -> List[str]:
+    """
+    Returns the chunk files of an event log that was streamed to a directory, ordered by their creation.
+
+    Args:
+        directory (str): The directory of the streamed event log.
+
+    Returns:
+        List[str]: The paths to the chunk files.
+    """
+    return sorted(glob.glob(os.path.join(directory, EVENT_LOG_CHUNK_PATTERN)))
+
+
+def iter_event_log_chunks(directory: str) -> Iterator[pd.DataFrame]:
+    """
+    Lazily reads the chunks of an event log that was streamed to a directory. Only one chunk is held in memory at a time.
+
+    Args:
+        directory (str): The directory of the streamed event log.
+
+    Yields:
+        pd.DataFrame: The events of one chunk.
+    """
+    for chunk_file in get_event_log_chunk_files(directory):
+        yield pd.read_parquet(chunk_file)
+
+
+class ChunkedEventLog(ColumnarEventLog):
+    """
+    Column store that hands its buffered events as a data frame to the registered chunk handlers and clears the
+    buffer whenever ``chunk_size`` events are reached or the buffered events span more than ``chunk_interval``
+    simulated time units. Only a bounded window of events is therefore kept in memory while simulating.
+
+    Chunks are only cut between events with different time stamps. All events of one point in time therefore end up
+    in the same chunk, which allows to ingest the chunks one after another into an AnalyticsStore.
+
+    Args:
+        chunk_size (int, optional): Maximum number of events per chunk. Defaults to 100000.
+        chunk_interval (Optional[float], optional): Maximum simulated time span of the events of one chunk. Defaults to None.
+    """
+
+    def __init__(self, chunk_size: int = 100_000, chunk_interval: Optional[float] = None):
+        super().__init__(initial_capacity=chunk_size)
+        self.chunk_size = chunk_size
+        self.chunk_interval = chunk_interval
+        self.chunk_handlers: List[Callable[[pd.DataFrame], None]] = []
+        self._flushed_columns: Dict[str, None] = {}
+        self._chunk_start_time: Optional[float] = None
+        self._last_time: Optional[float] = None
+
+    @property
+    def columns(self) -> List[str]:
+        """
+        Returns:
+            List[str]: The column names of all flushed and buffered events in order of their first appearance.
+        """
+        return list(dict.fromkeys([*self._flushed_columns, *self._columns]))
+
+    def _is_chunk_complete(self, event_time: Optional[float]) -> bool:
+        if not self._size or event_time == self._last_time:
+            return False
+        if self._size >= self.chunk_size:
+            return True
+        return (
+            self.chunk_interval is not None
+            and event_time is not None
+            and event_time - self._chunk_start_time >= self.chunk_interval
+        )
+
+    def append(self, item: Dict[str, Any]):
+        """
+        Appends one event and flushes the buffered events if the chunk is complete.
+
+        Args:
+            item (Dict[str, Any]): The event as mapping from column name to value.
+        """
+        event_time = item.get("Time")
+        if self._is_chunk_complete(event_time):
+            self.flush()
+        if not self._size:
+            self._chunk_start_time = event_time
+        super().append(item)
+        self._last_time = event_time
+
+    def buffer_to_dataframe(self) -> pd.DataFrame:
+        """
+        Returns the events that are currently buffered in memory.
+
+        Returns:
+            pd.DataFrame: The buffered events.
+        """
+        return _normalize_activity_column(self.to_dataframe())
+
+    def flush(self):
+        """
+        Passes the buffered events to all chunk handlers and clears the buffer.
+        """
+        if not self._size:
+            return
+        df = self.buffer_to_dataframe()
+        for chunk_handler in self.chunk_handlers:
+            chunk_handler(df)
+        self._flushed_columns.update(dict.fromkeys(self._columns))
+        self.clear()
+
+
+class StreamingEventLog(ChunkedEventLog):
+    """
+    Chunked column store that spills every chunk as Parquet file to a directory.
+
+    Writing the chunks requires a parquet engine for pandas, e.g. pyarrow.
+
+    Args:
+        directory (str): The directory to write the chunks to. Is created if it does not exist.
+        chunk_size (int, optional): Maximum number of events per chunk. Defaults to 100000.
+        chunk_interval (Optional[float], optional): Maximum simulated time span of the events of one chunk. Defaults to None.
+
+    Raises:
+        ImportError: If no Parquet engine is installed.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        chunk_size: int = 100_000,
+        chunk_interval: Optional[float] = None,
+    ):
+        check_parquet_engine_available()
+        super().__init__(chunk_size=chunk_size, chunk_interval=chunk_interval)
+        self.directory = directory
+        self.chunk_files: List[str] = []
+        self.chunk_handlers.append(self._write_chunk)
+        os.makedirs(directory, exist_ok=True)
+
+    def _write_chunk(self, df: pd.DataFrame):
+        chunk_file = os.path.join(
+            self.directory, f"events_{len(self.chunk_files):06d}.parquet"
+        )
+        df.to_parquet(chunk_file, index=False)
+        self.chunk_files.append(chunk_file)
+
+    def iter_dataframes(self) -> Iterator[pd.DataFrame]:
+        """
+        Lazily yields the flushed chunks followed by the buffered events.
+
+        Yields:
+            pd.DataFrame: The events of one chunk.
+        """
+        for chunk_file in self.chunk_files:
+            yield pd.read_parquet(chunk_file)
+        if self._size:
+            yield self.buffer_to_dataframe()
+
+
 class EventLogger(Logger):
     """
     Logger for logging events.
@@ -271,19 +650,24 @@ class EventLogger(Logger):
             pd.DataFrame: The data as a pandas DataFrame.
         """
         df = pd.DataFrame(self.event_data)
-        df["Activity"] = pd.Categorical(
-            df["Activity"],
-            categories=[v.value for v in list(state.StateEnum)],
-            ordered=True,
+        return _normalize_activity_column(df)
+
+    def observe_resource_state(self, __state: state.State):
+        """
+        Observe the state changes of a single resource state.
+
+        Args:
+            __state (state.State): The state.
+        """
+        self.register_observer(
+            self.event_data, __state.state_info, post=post_monitor_resource_states
         )
-        df["Activity"] = df["Activity"].astype("string")
-        return df
 
     def observe_resource_states(
         self, resource_factory: resource_factory.ResourceFactory
     ):
         """
-        Create patch to observe the resource states.
+        Observe the resource states.
 
         Args:
             resource_factory (resource_factory.ResourceFactory): The resource factory.
@@ -296,81 +680,225 @@ class EventLogger(Logger):
                 + r.charging_states
             )
             for __state in all_states:
-                self.register_patch(
-                    self.event_data,
-                    __state.state_info,
-                    attr=[
-                        "log_start_state",
-                        "log_start_interrupt_state",
-                        "log_end_interrupt_state",
-                        "log_end_state",
-                    ],
-                    post=post_monitor_resource_states,
-                )
+                self.observe_resource_state(__state)
             for state_info in r.standby_states.all_state_infos():
-                self.register_patch(
-                    self.event_data,
-                    state_info,
-                    attr=[
-                        "log_start_state",
-                        "log_start_interrupt_state",
-                        "log_end_interrupt_state",
-                        "log_end_state",
-                    ],
-                    post=post_monitor_resource_states,
+                self.register_observer(
+                    self.event_data, state_info, post=post_monitor_resource_states
                 )
 
     def observe_terminal_product_states(self, product: product.Product):
         """
-        Create path to observe the terminal product states.
+        Observe the terminal product states.
 
         Args:
             product (product.Product): The product.
         """
-        self.register_patch(
-            self.event_data,
-            product.info,
-            attr=["log_create_product", "log_finish_product", "log_start_loading", "log_end_loading", "log_start_unloading", "log_end_unloading", "log_consumption"],
-            post=post_monitor_product_info,
+        self.register_observer(
+            self.event_data, product.info, post=post_monitor_product_info
         )
 
     def observe_terminal_primitive_states(self, primitive: primitive.Primitive):
         """
-        Create path to observe the terminal primitive states.
+        Observe the terminal primitive states.
 
         Args:
             primitive (primitive.Primitive): The primitive.
         """
-        self.register_patch(
+        self.register_observer(
             self.event_data,
             primitive.dependency_info,
-            attr=["log_start_dependency", "log_end_dependency"],
             post=post_monitor_primitive_dependency,
         )
 
     def observe_primitive_movement(self, primitive: primitive.Primitive):
         """
-        Create path to observe the primitive movement.
+        Observe the loading and unloading of a primitive.
         """
-        self.register_patch(
-            self.event_data,
-            primitive.info,
-            attr=["log_start_loading", "log_end_loading", "log_start_unloading", "log_end_unloading"],
-            post=post_monitor_primitive_movement,
+        self.register_observer(
+            self.event_data, primitive.info, post=post_monitor_primitive_loading
         )
 
     def observe_resource_dependency_states(
         self, resource_factory: resource_factory.ResourceFactory
     ):
         """
-        Create path to observe the resource dependency states.
+        Observe the resource dependency states.
         Args:
             resource_factory (resource_factory.ResourceFactory): The resource factory.
         """
         for r in resource_factory.all_resources.values():
-            self.register_patch(
+            self.register_observer(
                 self.event_data,
                 r.dependency_info,
-                attr=["log_start_dependency", "log_end_dependency"],
                 post=post_monitor_resource_dependency,
             )
+
+
+class ColumnarEventLogger(EventLogger):
+    """
+    Event logger that stores the events in a :class:`ColumnarEventLog` instead of a list of dictionaries.
+
+    This reduces the memory footprint of long simulation runs considerably, since repeated strings like resource,
+    state and product IDs are only stored once and every event only occupies a few bytes per column.
+
+    Args:
+        initial_capacity (int, optional): Number of events to preallocate. Defaults to 4096.
+    """
+
+    def __init__(self, initial_capacity: int = 4096):
+        """
+        Initialize the ColumnarEventLogger.
+        """
+        super().__init__()
+        self.event_data: ColumnarEventLog = ColumnarEventLog(initial_capacity)
+
+    def get_data_as_dataframe(self) -> pd.DataFrame:
+        """
+        Get the data as a pandas DataFrame.
+
+        Returns:
+            pd.DataFrame: The data as a pandas DataFrame.
+        """
+        df = self.event_data.to_dataframe()
+        return _normalize_activity_column(df)
+
+
+class StreamingEventLogger(ColumnarEventLogger):
+    """
+    Event logger that streams the events in fixed-size Parquet chunks to a directory while simulating, keeping only
+    the latest chunk in memory. Use :meth:`iter_dataframes` or :func:`iter_event_log_chunks` to read the events back
+    chunk by chunk. Requires pyarrow or fastparquet, see :func:`check_parquet_engine_available`.
+
+    Args:
+        directory (str): The directory to write the event log chunks to.
+        chunk_size (int, optional): Number of events per chunk. Defaults to 100000.
+    """
+
+    def __init__(self, directory: str, chunk_size: int = 100_000):
+        """
+        Initialize the StreamingEventLogger.
+        """
+        Logger.__init__(self)
+        self.event_data: StreamingEventLog = StreamingEventLog(directory, chunk_size)
+
+    @property
+    def directory(self) -> str:
+        """
+        Returns:
+            str: The directory the event log chunks are written to.
+        """
+        return self.event_data.directory
+
+    def flush(self):
+        """
+        Writes all buffered events to disk.
+        """
+        self.event_data.flush()
+
+    def iter_dataframes(self) -> Iterator[pd.DataFrame]:
+        """
+        Lazily yields the logged events chunk by chunk.
+
+        Yields:
+            pd.DataFrame: The events of one chunk.
+        """
+        yield from self.event_data.iter_dataframes()
+
+    def get_data_as_dataframe(self) -> pd.DataFrame:
+        """
+        Get the data as a pandas DataFrame. Note that this reads all chunks into memory.
+
+        Returns:
+            pd.DataFrame: The data as a pandas DataFrame.
+        """
+        chunks = list(self.iter_dataframes())
+        if not chunks:
+            return pd.DataFrame(columns=self.event_data.columns)
+        df = pd.concat(chunks, ignore_index=True)
+        return df.reindex(columns=self.event_data.columns)
+
+    def log_data_to_csv(self, filepath: str):
+        """
+        Log the data chunk by chunk to a csv file.
+
+        Args:
+            filepath (str): The path to the csv file.
+        """
+        columns = self.event_data.columns
+        offset = 0
+        with open(filepath, "w", newline="") as csv_file:
+            for df in self.iter_dataframes():
+                df = df.reindex(columns=columns)
+                df.index = pd.RangeIndex(offset, offset + len(df))
+                df.to_csv(csv_file, header=offset == 0)
+                offset += len(df)
+            if offset == 0:
+                pd.DataFrame(columns=columns).to_csv(csv_file)
+
+    def log_data_to_json(self, filepath: str):
+        """
+        Log the data chunk by chunk to a json file.
+
+        Args:
+            filepath (str): The path to the json file.
+        """
+        first_chunk = True
+        with open(filepath, "w") as json_file:
+            json_file.write("[")
+            for df in self.iter_dataframes():
+                records = df.to_json(orient="records")[1:-1]
+                if not records:
+                    continue
+                if not first_chunk:
+                    json_file.write(",")
+                json_file.write(records)
+                first_chunk = False
+            json_file.write("]")
+
+
+class LiveAnalyticsEventLogger(ColumnarEventLogger):
+    """
+    Event logger that folds the events batch-wise into an AnalyticsStore while simulating, so that KPIs like
+    throughput, WIP or OEE can be queried from :attr:`store` during the run. The raw events are dropped once they are
+    ingested, which keeps the memory consumption flat for long simulation runs.
+
+    A batch is ingested when ``batch_size`` events are buffered or the buffered events span more than
+    ``batch_interval`` simulated time units. Call :meth:`flush` to ingest the remaining events before querying.
+
+    Args:
+        store (AnalyticsStore): The store to ingest the events into.
+        batch_size (int, optional): Maximum number of events per batch. Defaults to 10000.
+        batch_interval (Optional[float], optional): Maximum simulated time span of one batch. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        store: AnalyticsStore,
+        batch_size: int = 10_000,
+        batch_interval: Optional[float] = None,
+    ):
+        """
+        Initialize the LiveAnalyticsEventLogger.
+        """
+        Logger.__init__(self)
+        self.store = store
+        self.event_data: ChunkedEventLog = ChunkedEventLog(batch_size, batch_interval)
+        self.event_data.chunk_handlers.append(store.ingest_events)
+
+    def flush(self):
+        """
+        Ingests all buffered events into the store.
+        """
+        self.event_data.flush()
+
+    def get_data_as_dataframe(self) -> pd.DataFrame:
+        """
+        Raw events are not retained by this logger.
+
+        Raises:
+            ValueError: Always, since the events are dropped after being ingested into the store.
+        """
+        raise ValueError(
+            "The live analytics event logger drops raw events after ingesting them into the analytics store. "
+            "Use the 'columnar' or 'streaming' event log backend to keep the raw events."
+        )
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
-from typing import List, TYPE_CHECKING
+from typing import Dict, List, Optional, TYPE_CHECKING
 
+import numpy as np
 from pydantic import BaseModel, ConfigDict
 
 
 if TYPE_CHECKING:
     from prodsys.simulation import resources, state
     from prodsys.factories import resource_factory
+    from prodsys.simulation import port
+    from prodsys.simulation.entities import product as product_module
 
 
 class ProcessObservation(BaseModel):
@@ -39,6 +42,23 @@ def observe_processes(resource: resources.Resource) -> List[ProcessObservation]:
     return process_observations
 
 
+def get_next_process_id(product: product_module.Product) -> str:
+    """
+    Returns the ID of the next process of a product according to the marking of the process model handler that
+    currently executes the product's process model.
+
+    Args:
+        product (product_module.Product): The product.
+
+    Returns:
+        str: ID of the first next possible process, or an empty string if the product has no next process.
+    """
+    if product.active_process_model is None:
+        return ""
+    next_possible = product.active_process_model.get_next_possible_processes()
+    return next_possible[0].data.ID if next_possible else ""
+
+
 def observe_input_queue(
     resource: resources.Resource, product_factory: product_factory.ProductFactory
 ) -> List[QueueObservation]:
@@ -47,13 +67,11 @@ def observe_input_queue(
         # `queue.items` is a dict keyed by item.ID (v1); iterate over stored objects.
         for product_data in queue.items.values():
             product = product_factory.get_product(product_data.ID)
-            next_possible = product.process_model.precedence_graph.get_next_possible_processes() or []
-            next_process_id = next_possible[0].data.ID if next_possible else ""
 
             production_process_info = QueueObservation(
                 product=product_data.ID,
                 activity="waiting",
-                process=next_process_id,
+                process=get_next_process_id(product),
                 next_resource=product.current_locatable.data.ID,
                 waiting_since=product.info.event_time,
             )
@@ -70,13 +88,11 @@ def observe_output_queue(
         # `queue.items` is a dict keyed by item.ID (v1); iterate over stored objects.
         for product_data in queue.items.values():
             product = product_factory.get_product(product_data.ID)
-            next_possible = product.process_model.precedence_graph.get_next_possible_processes() or []
-            next_process_id = next_possible[0].data.ID if next_possible else ""
 
             production_process_info = QueueObservation(
                 product=product_data.ID,
                 activity="waiting",
-                process=next_process_id,
+                process=get_next_process_id(product),
                 next_resource=product.current_locatable.data.ID,
                 waiting_since=product.info.event_time,
             )
@@ -115,5 +131,157 @@ class ResourceObserver(BaseModel):
         return observe_resource_available(self.resource)
 
 
+class ResourceArrayObserver:
+    """
+    Observer of a resource that keeps its observation in preallocated NumPy arrays instead of creating observation
+    objects for every step. The arrays are updated incrementally: the running processes are only encoded again after
+    an event of a production state of the resource and the queued products only after an item was put into or removed
+    from a port of the resource. Only the waiting times and the availability are updated on every observation.
+
+    All arrays are views of the flat array `observation`, which is returned by :meth:`observe` and overwritten by the
+    next observation.
+
+    Args:
+        resource (resources.Resource): The resource to observe.
+        product_factory (product_factory.ProductFactory): The product factory to look up the queued products.
+        max_queue_length (Optional[int], optional): Number of observed queue slots. Products beyond the slots are only
+            counted in `queue_lengths`. Defaults to None, which uses the summed capacity of the ports of the resource with
+            limited capacity.
+
+    Attributes:
+        process_ids (List[str]): The processes of the resource in the order of the one-hot columns.
+        process_one_hot (np.ndarray): One-hot encoding of the running processes per capacity slot of the resource.
+        queue_one_hot (np.ndarray): One-hot encoding of the next process per queue slot, read from the marking of the
+            process model handler that executes the product.
+        waiting_times (np.ndarray): Time since the product entered the port per queue slot.
+        queue_lengths (np.ndarray): Number of items per port of the resource.
+        available (np.ndarray): 1 if the resource is available, else 0.
+        observation (np.ndarray): Flat array of all observations.
+    """
+
+    def __init__(
+        self,
+        resource: resources.Resource,
+        product_factory: product_factory.ProductFactory,
+        max_queue_length: Optional[int] = None,
+    ):
+        self.resource = resource
+        self.product_factory = product_factory
+        if max_queue_length is None:
+            finite_capacities = [
+                queue.capacity for queue in resource.ports if queue.capacity != float("inf")
+            ]
+            if not finite_capacities:
+                raise ValueError(
+                    f"Resource {resource.data.ID} only has ports with unlimited capacity, max_queue_length needs to be specified."
+                )
+            max_queue_length = sum(finite_capacities)
+        self.max_queue_length = int(max_queue_length)
+        self.process_ids: List[str] = list(resource.data.process_ids)
+        self.process_indices: Dict[str, int] = {
+            process_id: index for index, process_id in enumerate(self.process_ids)
+        }
+
+        number_of_processes = len(self.process_ids)
+        capacity = resource.data.capacity
+        sizes = [
+            capacity * number_of_processes,
+            self.max_queue_length * number_of_processes,
+            self.max_queue_length,
+            len(resource.ports),
+            1,
+        ]
+        self.observation = np.zeros(sum(sizes), dtype=np.float64)
+        (
+            process_one_hot,
+            queue_one_hot,
+            self.waiting_times,
+            self.queue_lengths,
+            self.available,
+        ) = np.split(self.observation, np.cumsum(sizes)[:-1])
+        self.process_one_hot = process_one_hot.reshape(capacity, number_of_processes)
+        self.queue_one_hot = queue_one_hot.reshape(
+            self.max_queue_length, number_of_processes
+        )
+        self._waiting_since = np.zeros(self.max_queue_length, dtype=np.float64)
+        self._number_of_queued_products = 0
+        self._entry_times: Dict[str, float] = {}
+
+        self._processes_changed = True
+        self._queues_changed = True
+        state_observers = [self._on_state_event]
+        for production_state in resource.production_states:
+            production_state.state_info.add_observers(state_observers)
+        for queue in resource.ports:
+            queue.observers.append(self._on_queue_event)
+
+    def _on_state_event(self, state_info: state.StateInfo) -> None:
+        self._processes_changed = True
+
+    def _on_queue_event(self, queue: port.Queue) -> None:
+        self._queues_changed = True
+        now = self.resource.env.now
+        for item_ID in queue.items:
+            if item_ID not in self._entry_times:
+                self._entry_times[item_ID] = now
+
+    def _update_processes(self) -> None:
+        self.process_one_hot.fill(0)
+        slot = 0
+        for production_state in self.resource.production_states:
+            if not production_state.process:
+                continue
+            if slot == len(self.process_one_hot):
+                break
+            process_index = self.process_indices.get(production_state.state_info.ID)
+            if process_index is not None:
+                self.process_one_hot[slot, process_index] = 1
+            slot += 1
+        self._processes_changed = False
+
+    def _update_queues(self) -> None:
+        self.queue_one_hot.fill(0)
+        slot = 0
+        entry_times = {}
+        for queue_index, queue in enumerate(self.resource.ports):
+            self.queue_lengths[queue_index] = len(queue.items)
+            for item_ID in queue.items:
+                entry_times[item_ID] = self._entry_times.get(item_ID, 0.0)
+                if slot == self.max_queue_length:
+                    continue
+                product = self.product_factory.products.get(item_ID)
+                if product is None:
+                    continue
+                process_index = self.process_indices.get(get_next_process_id(product))
+                if process_index is not None:
+                    self.queue_one_hot[slot, process_index] = 1
+                self._waiting_since[slot] = entry_times[item_ID]
+                slot += 1
+        self._entry_times = entry_times
+        self._number_of_queued_products = slot
+        self._queues_changed = False
+
+    def observe(self) -> np.ndarray:
+        """
+        Updates the changed parts of the observation and returns it.
+
+        Returns:
+            np.ndarray: The flat observation array. It is overwritten by the next observation.
+        """
+        if self._processes_changed:
+            self._update_processes()
+        if self._queues_changed:
+            self._update_queues()
+        number_of_queued_products = self._number_of_queued_products
+        np.subtract(
+            self.resource.env.now,
+            self._waiting_since[:number_of_queued_products],
+            out=self.waiting_times[:number_of_queued_products],
+        )
+        self.waiting_times[number_of_queued_products:] = 0
+        self.available[0] = self.resource.active.triggered
+        return self.observation
+
+
 from prodsys.factories import resource_factory, product_factory
-from prodsys.simulation import resources, state
+from prodsys.simulation import port, resources, state
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Any, Generator, List, Literal, Union
+from typing import Any, Callable, Generator, List, Literal, Union
 
 
 from simpy.resources import store
@@ -41,6 +41,8 @@ class Queue:
         # Separate condition events
         self.on_item: events.Event = self.env.event()
         self.on_space: events.Event = self.env.event()
+        # Called with the queue after an item was put or removed, e.g. by observers of the queue contents.
+        self.observers: List[Callable[[Queue], None]] = []
 
     # ---- helpers ------------------------------------------------------------
     def _is_full(self) -> bool:
@@ -56,6 +58,10 @@ class Queue:
             ev.succeed()
         setattr(self, which, self.env.event())
 
+    def _notify_observers(self) -> None:
+        for observer in self.observers:
+            observer(self)
+
     # ---- API ----------------------------------------------------------------
 
     def free_space(self) -> int:
@@ -88,6 +94,8 @@ class Queue:
 
         # Insert item
         self.items[item.ID] = item
+        if self.observers:
+            self._notify_observers()
 
         # Notify getters that an item is available
         self._notify("on_item")
@@ -103,6 +111,8 @@ class Queue:
             yield ev
 
         item = self.items.pop(item_id)
+        if self.observers:
+            self._notify_observers()
 
         # Space has freed up (unless unbounded)
         if self.capacity != float("inf"):
@@ -135,6 +145,8 @@ class Queue:
         
         # Remove item (frees space)
         item = self.items.pop(item_id)
+        if self.observers:
+            self._notify_observers()
         
         # CRITICAL: Reserve BEFORE notifying on_space to minimize race window
         # After removing item, space is available. Reserve it immediately.
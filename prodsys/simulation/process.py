@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Union, List, Optional, Dict
+from typing import TYPE_CHECKING, Literal, Union, List, Optional, Dict
 import typing
 
 from prodsys.models.processes_data import ProcessTypeEnum
@@ -452,6 +452,8 @@ class LinkTransportProcess(TransportProcess):
 
     data: processes_data.LinkTransportProcessData
     links: Optional[List[List[Union[Node, Source, Sink, Resource]]]]
+    route_finder_backend: Literal["dijkstra", "csgraph"]
+    route_mode: Literal["hops", "macro"]
 
     def __init__(
         self,
@@ -463,6 +465,8 @@ class LinkTransportProcess(TransportProcess):
             typing.List[Dependency]
         ] = None,
         links: Optional[List[List[Union[Node, Source, Sink, Resource]]]] = None,
+        route_finder_backend: Literal["dijkstra", "csgraph"] = "dijkstra",
+        route_mode: Literal["hops", "macro"] = "hops",
     ):
         """
         Initializes the link transport process with the given process data and time model.
@@ -470,6 +474,10 @@ class LinkTransportProcess(TransportProcess):
         Args:
             data (processes_data.LinkTransportProcessData): The process data.
             time_model (Optional[time_model.TimeModel], optional): The time model. Defaults to None.
+            route_finder_backend (Literal["dijkstra", "csgraph"], optional): Backend of the route finder for routes
+                of this process between static locations. Defaults to "dijkstra".
+            route_mode (Literal["hops", "macro"], optional): How transport handlers simulate routes of this process
+                with multiple links, see TransportProcessHandler. Defaults to "hops".
         """
         super().__init__(
             data,
@@ -479,6 +487,8 @@ class LinkTransportProcess(TransportProcess):
             dependencies,
         )
         self.links = links if links else []
+        self.route_finder_backend = route_finder_backend
+        self.route_mode = route_mode
 
     def matches_request(
         self,
@@ -74,6 +74,8 @@ class ProcessModelHandler:
         self.process_model = proc.precedence_graph.create_instance()
         
         entity = process_request.get_entity()
+        super_process_model = entity.active_process_model
+        entity.active_process_model = self.process_model
         target_queue = process_request.target_queue
 
         super_system_router = process_request.entity.router
@@ -106,6 +108,7 @@ class ProcessModelHandler:
         # This ensures that when control returns to a parent handler, it sees the ProcessModelProcess as completed,
         # not the last internal process that was executed
         entity.current_process = proc
+        entity.active_process_model = super_process_model
         
         arrived_at_queue = system_router.request_transport(entity, target_queue)
         yield arrived_at_queue
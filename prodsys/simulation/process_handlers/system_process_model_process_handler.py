@@ -107,6 +107,8 @@ class SystemProcessModelHandler:
         self.process_model = proc.precedence_graph.create_instance()
         
         entity = process_request.get_entity()
+        super_process_model = entity.active_process_model
+        entity.active_process_model = self.process_model
         target_queue = process_request.target_queue
 
         super_system_router = process_request.entity.router
@@ -145,6 +147,7 @@ class SystemProcessModelHandler:
         # This ensures that when control returns to a parent handler, it sees the ProcessModelProcess as completed,
         # not the last internal process that was executed
         entity.current_process = proc
+        entity.active_process_model = super_process_model
         
         if(entity.no_transport_to_sink):
             entity.router.route_disassembled_product_to_sink(entity)
@@ -1,6 +1,6 @@
 
 from __future__ import annotations
-from typing import List, Generator, TYPE_CHECKING, Union
+from typing import List, Generator, Literal, Optional, TYPE_CHECKING, Union
 
 import logging
 
@@ -31,10 +31,18 @@ logger = logging.getLogger(__name__)
 class TransportProcessHandler:
     """
     Controller for transport resources.
+
+    Args:
+        env (sim.Environment): The simulation environment.
+        route_mode (Literal["hops", "macro"], optional): How routes with multiple links are simulated. "hops" runs
+            and logs a transport step per link. "macro" sums up the times of all links up front and runs the route as
+            a single transport step that is logged as one interval from the origin to the target of the route.
+            Congestion at the nodes of the route is then not considered. Defaults to "hops".
     """
 
-    def __init__(self, env: sim.Environment) -> None:
+    def __init__(self, env: sim.Environment, route_mode: Literal["hops", "macro"] = "hops") -> None:
         self.env = env
+        self.route_mode = route_mode
         self.resource = None
         self.blocked_capacity = 0
 
@@ -246,6 +254,11 @@ class TransportProcessHandler:
         Yields:
             Generator: The generator yields when the transport is over.
         """
+        if self.route_mode == "macro" and len(route) > 2:
+            yield from self.run_macro_transport(
+                transport_state, item, route, empty_transport
+            )
+            return
         for link_index, (location, next_location) in enumerate(zip(route, route[1:])):
             if link_index == 0:
                 initial_transport_step = True
@@ -268,6 +281,58 @@ class TransportProcessHandler:
             transport_state.reserved = False
             yield transport_state.process
 
+    def run_macro_transport(
+        self,
+        transport_state: state.TransportState,
+        item: Union[product.Product, primitive.Primitive],
+        route: List[locatable.Locatable],
+        empty_transport: bool,
+    ) -> Generator:
+        """
+        Run all transport steps of a route as a single transport step. The time of the step is the sum of the times
+        of the single links, so the route takes the same time as in the "hops" route mode.
+
+        Args:
+            transport_state (state.TransportState): The transport state of the process.
+            item (Union[product.Product, primitive.Primitive]): The product that is transported.
+            route (List[locatable.Locatable]): The route of the transport with locatable objects.
+            empty_transport (bool): If the transport is empty.
+
+        Yields:
+            Generator: The generator yields when the transport is over.
+        """
+        origin_location = self.resource.get_location()
+        route_time = 0.0
+        last_link_index = len(route) - 2
+        for link_index, next_location in enumerate(route[1:]):
+            target_location = self.get_target_location(
+                next_location,
+                empty_transport,
+                last_transport_step=link_index == last_link_index,
+            )
+            route_time += transport_state.get_transport_time(
+                origin_location,
+                target_location,
+                empty_transport,
+                initial_transport_step=link_index == 0,
+                last_transport_step=link_index == last_link_index,
+            )
+            if self.resource.can_move:
+                origin_location = target_location
+        transport_state.process = self.env.process(
+            self.run_process(
+                transport_state,
+                item,
+                target=route[-1],
+                empty_transport=empty_transport,
+                initial_transport_step=True,
+                last_transport_step=True,
+                time=route_time,
+            )
+        )
+        transport_state.reserved = False
+        yield transport_state.process
+
     def get_target_location(
         self,
         target: locatable.Locatable,
@@ -295,6 +360,7 @@ class TransportProcessHandler:
         empty_transport: bool,
         initial_transport_step: bool,
         last_transport_step: bool,
+        time: Optional[float] = None,
     ):
         """
         Run the process of a product. The process is started and the product is logged.
@@ -306,6 +372,8 @@ class TransportProcessHandler:
             empty_transport (bool): If the transport is empty.
             initial_transport_step (bool): If this is the initial transport step.
             last_transport_step (bool): If this is the last transport step.
+            time (Optional[float], optional): The time of the transport. Defaults to None, which calculates the time
+                from the current location to the target.
         """
         if not hasattr(item, "product_info"):
             input_state.state_info.log_primitive(item, state.StateTypeEnum.transport)
@@ -325,7 +393,7 @@ class TransportProcessHandler:
             target, empty_transport, last_transport_step=last_transport_step
         )
         input_state.process = self.env.process(
-            input_state.process_state(target=target_location, empty_transport=empty_transport, initial_transport_step=initial_transport_step, last_transport_step=last_transport_step)  # type: ignore False
+            input_state.process_state(target=target_location, empty_transport=empty_transport, initial_transport_step=initial_transport_step, last_transport_step=last_transport_step, time=time)  # type: ignore False
         )
         yield input_state.process
         if self.resource.can_move:
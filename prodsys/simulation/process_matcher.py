@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Dict, List, Tuple
+from hashlib import md5
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Set, Tuple
 
+import json
 import logging
+import os
 
 from prodsys.factories import primitive_factory
 from prodsys.models.source_data import RoutingHeuristic
@@ -19,14 +22,53 @@ if TYPE_CHECKING:
         source_factory,
         dependency_factory,
     )
-    from prodsys.simulation.entities import product
-    from prodsys.models import product_data
+    from prodsys.simulation.entities import product, primitive
+    from prodsys.models import product_data, production_system_data
     from prodsys.simulation.locatable import Locatable
 
     # from prodsys.factories.source_factory import SourceFactory
 
 logger = logging.getLogger(__name__)
 
+COMPATIBILITY_CACHE_VERSION = 1
+"""Version of the file format of the compatibility cache. Needs to be increased if the format or the precomputation changes."""
+
+COMPATIBILITY_CACHE_FIELDS = {
+    "process_data",
+    "port_data",
+    "node_data",
+    "resource_data",
+    "product_data",
+    "sink_data",
+    "source_data",
+    "dependency_data",
+    "primitive_data",
+}
+"""Fields of the production system data that determine the compatibility tables."""
+
+
+def get_compatibility_cache_key(
+    production_system_data: production_system_data.ProductionSystemData,
+) -> str:
+    """
+    Returns a hash of the parts of the production system data that determine the compatibility tables of the ProcessMatcher.
+
+    In contrast to ProductionSystemData.hash, the IDs of all entities are considered, because the cached tables reference the entities by their IDs. Time models, states, the seed and the schedule are not considered.
+
+    Args:
+        production_system_data (production_system_data.ProductionSystemData): The production system data.
+
+    Returns:
+        str: The hash of the production system data.
+    """
+    structure = production_system_data.model_dump_json(
+        include=COMPATIBILITY_CACHE_FIELDS
+    )
+    return md5(
+        f"{COMPATIBILITY_CACHE_VERSION}:{structure}".encode("utf-8")
+    ).hexdigest()
+
+
 @dataclass(frozen=True)
 class ResourceCompatibilityKey:
     """Key for the resource compatibility lookup table."""
@@ -72,6 +114,10 @@ class ProcessMatcher:
         source_factory: source_factory.SourceFactory,
         primitive_factory: primitive_factory.PrimitiveFactory,
         dependency_factory: dependency_factory.DependencyFactory,
+        production_system_data: Optional[production_system_data.ProductionSystemData] = None,
+        cache_directory: Optional[str] = None,
+        transport_compatibility_mode: Literal["eager", "lazy"] = "eager",
+        compatibility_tables: Optional[dict[str, Any]] = None,
     ):
         """
         Initialize the ProcessMatcher with the necessary factories and routing control environment.
@@ -83,6 +129,10 @@ class ProcessMatcher:
             product_factory (ProductFactory): Factory for creating products.
             source_factory (SourceFactory): Factory for creating sources.
             routing_control_env (RoutingControlEnv): Environment for routing control.
+            production_system_data (Optional[ProductionSystemData]): The production system data the factories were created from. Required for the compatibility cache.
+            cache_directory (Optional[str]): Directory of the compatibility cache. If given together with the production system data, the compatibility tables are loaded from the cache if the production system did not change and stored in it otherwise.
+            transport_compatibility_mode (Literal["eager", "lazy"]): "eager" precomputes the transport compatibility for all pairs of transport locations. "lazy" resolves the transport compatibility of an origin, target and process signature the first time it is requested and memoises the result.
+            compatibility_tables (Optional[dict[str, Any]]): Compatibility tables of a previous run of the same production system as returned by `dump_compatibility_tables`. If given, they are resolved to the simulation objects of this run instead of being precomputed.
         """
         self.resource_factory = resource_factory
         self.sink_factory = sink_factory
@@ -103,9 +153,21 @@ class ProcessMatcher:
         self.rework_compatibility: dict[
             str, list[process.ReworkProcess]
         ] = {}
+        self.transport_compatibility_mode = transport_compatibility_mode
+        # Keys of the transport compatibility table that were resolved in the lazy mode.
+        self.resolved_transport_keys: Set[TransportCompatibilityKey] = set()
 
         # Precompute compatibility tables at initialization time
-        self.precompute_compatibility_tables()
+        if compatibility_tables is not None and self._resolve_compatibility_tables(
+            compatibility_tables
+        ):
+            return
+        if cache_directory and production_system_data is not None:
+            self.load_or_precompute_compatibility_tables(
+                production_system_data, cache_directory
+            )
+        else:
+            self.precompute_compatibility_tables()
 
     def _create_dummy_product(
         self, product_data: product_data.ProductData
@@ -218,7 +280,11 @@ class ProcessMatcher:
 
         # Precompute different types of compatibility
         self._precompute_production_compatibility(dummy_products)
-        self._precompute_transport_compatibility(dummy_products)
+        if self.transport_compatibility_mode == "lazy":
+            # Transport compatibility is resolved on demand in get_transport_compatible.
+            self.resolved_transport_keys.clear()
+        else:
+            self._precompute_transport_compatibility(dummy_products)
         self._precompute_rework_compatibility()
 
         # Precompute compatibility of resource processes
@@ -235,6 +301,172 @@ class ProcessMatcher:
         self._remove_dummy_products(dummy_products)
         self._reset_primitives_in_queues()
 
+    def load_or_precompute_compatibility_tables(
+        self,
+        production_system_data: production_system_data.ProductionSystemData,
+        cache_directory: str,
+    ):
+        """
+        Loads the compatibility tables and cached routes from the compatibility cache. If the cache contains no valid entry for the production system, the tables are precomputed and stored in the cache.
+
+        Args:
+            production_system_data (ProductionSystemData): The production system data the factories were created from.
+            cache_directory (str): Directory of the compatibility cache.
+        """
+        cache_key = get_compatibility_cache_key(production_system_data)
+        cache_path = os.path.join(
+            cache_directory,
+            f"compatibility_{cache_key}_{self.transport_compatibility_mode}.json",
+        )
+        if os.path.exists(cache_path) and self._load_compatibility_tables(cache_path):
+            logger.info(f"Loaded compatibility tables from cache {cache_path}")
+            return
+        self.precompute_compatibility_tables()
+        os.makedirs(cache_directory, exist_ok=True)
+        # Write to a temporary file first, so that concurrent runs never read a partially written cache.
+        temporary_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w") as cache_file:
+            json.dump(self.dump_compatibility_tables(), cache_file)
+        os.replace(temporary_path, cache_path)
+        logger.info(f"Stored compatibility tables in cache {cache_path}")
+
+    def dump_compatibility_tables(self) -> dict[str, Any]:
+        """
+        Returns the compatibility tables and cached routes with all simulation objects replaced by their IDs.
+
+        Returns:
+            dict[str, Any]: The JSON serializable compatibility tables.
+        """
+        return {
+            "production": [
+                [key.process_signature, [[r.data.ID, p.data.ID] for r, p in entries]]
+                for key, entries in self.production_compatibility.items()
+            ],
+            "transport": [
+                [
+                    key.origin_id,
+                    key.target_id,
+                    key.process_signature,
+                    [[r.data.ID, p.data.ID] for r, p in entries],
+                ]
+                for key, entries in self.transport_compatibility.items()
+            ],
+            "rework": {
+                signature: [p.data.ID for p in rework_processes]
+                for signature, rework_processes in self.rework_compatibility.items()
+            },
+            "reachability": [
+                [origin_id, target_id, reachable]
+                for (origin_id, target_id), reachable in self.reachability_cache.items()
+            ],
+            "routes": [
+                [
+                    origin_id,
+                    target_id,
+                    signature,
+                    cached_request.resource.data.ID,
+                    cached_request.process.data.ID,
+                    [location.data.ID for location in cached_request.get_route()],
+                ]
+                for (origin_id, target_id, signature), cached_request in self.route_cache.items()
+            ],
+        }
+
+    def _load_compatibility_tables(self, cache_path: str) -> bool:
+        """
+        Loads the compatibility tables and cached routes from a cache file and resolves the IDs to the simulation objects.
+
+        Args:
+            cache_path (str): Path of the cache file.
+
+        Returns:
+            bool: True if the tables were loaded, False if the cache file is invalid.
+        """
+        try:
+            with open(cache_path) as cache_file:
+                tables = json.load(cache_file)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring invalid compatibility cache {cache_path}: {e}")
+            return False
+        return self._resolve_compatibility_tables(tables)
+
+    def _resolve_compatibility_tables(self, tables: dict[str, Any]) -> bool:
+        """
+        Resolves the IDs of dumped compatibility tables and cached routes to the simulation objects and sets them as the tables of the process matcher.
+
+        Args:
+            tables (dict[str, Any]): The compatibility tables as returned by `dump_compatibility_tables`.
+
+        Returns:
+            bool: True if the tables were resolved, False if they do not match the simulation objects.
+        """
+        locations = {
+            location.data.ID: location
+            for location in [
+                *self._get_all_locations(),
+                *self.get_all_transport_locations(),
+                *self._get_all_queues(),
+                *self.resource_factory.all_resources.values(),
+            ]
+        }
+
+        def get_resource_and_process(
+            resource_id: str, process_id: str
+        ) -> tuple[resources.Resource, process.PROCESS_UNION]:
+            resource = self.resource_factory.all_resources[resource_id]
+            for offered_process in resource.processes:
+                if offered_process.data.ID == process_id:
+                    return resource, offered_process
+            return resource, self.resource_factory.process_factory.get_process(process_id)
+
+        try:
+            production_compatibility = {
+                ResourceCompatibilityKey(process_signature=signature): [
+                    get_resource_and_process(*entry) for entry in entries
+                ]
+                for signature, entries in tables["production"]
+            }
+            transport_compatibility = {
+                TransportCompatibilityKey(
+                    origin_id=origin_id,
+                    target_id=target_id,
+                    process_signature=signature,
+                ): [get_resource_and_process(*entry) for entry in entries]
+                for origin_id, target_id, signature, entries in tables["transport"]
+            }
+            rework_compatibility = {
+                signature: [
+                    self.resource_factory.process_factory.get_process(process_id)
+                    for process_id in process_ids
+                ]
+                for signature, process_ids in tables["rework"].items()
+            }
+            reachability_cache = {
+                (origin_id, target_id): reachable
+                for origin_id, target_id, reachable in tables["reachability"]
+            }
+            route_cache = {}
+            for origin_id, target_id, signature, resource_id, process_id, route_ids in tables["routes"]:
+                resource, cached_process = get_resource_and_process(resource_id, process_id)
+                route_cache[(origin_id, target_id, signature)] = request.Request(
+                    process=cached_process,
+                    resource=resource,
+                    origin=locations[origin_id],
+                    target=locations[target_id],
+                    route=[locations[location_id] for location_id in route_ids],
+                    request_type=request.RequestType.TRANSPORT,
+                )
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring invalid compatibility tables: {e}")
+            return False
+
+        self.production_compatibility = production_compatibility
+        self.transport_compatibility = transport_compatibility
+        self.rework_compatibility = rework_compatibility
+        self.reachability_cache = reachability_cache
+        self.route_cache = route_cache
+        return True
+
     def _get_parent_from_queue(self, locatable: Locatable) -> Locatable:
         """
         Get the parent object from a queue object.
@@ -355,7 +587,11 @@ class ProcessMatcher:
         return compatible_resources
 
     def get_transport_compatible(
-        self, origin: Locatable, target: Locatable, process_signature: str
+        self,
+        origin: Locatable,
+        target: Locatable,
+        process_signature: str,
+        item: Optional[product.Product | primitive.Primitive] = None,
     ) -> List[Tuple[resources.Resource, process.PROCESS_UNION]]:
         """
         Returns a list of compatible transport resources and processes for moving between origin and target.
@@ -364,6 +600,7 @@ class ProcessMatcher:
             origin (Locatable): The origin location.
             target (Locatable): The target location.
             process_signature (str): The transport process signature.
+            item (Optional[product.Product | primitive.Primitive]): The item to transport, located at the origin. Required to resolve the compatibility in the lazy transport compatibility mode.
 
         Returns:
             List[Tuple[resources.Resource, process.PROCESS_UNION]]: List of compatible transport resources and processes.
@@ -373,6 +610,13 @@ class ProcessMatcher:
             target_id=target.data.ID,
             process_signature=process_signature,
         )
+        if (
+            self.transport_compatibility_mode == "lazy"
+            and item is not None
+            and key not in self.resolved_transport_keys
+        ):
+            self._resolve_transport_compatibility(item, origin, target)
+            self.resolved_transport_keys.add(key)
         result = self.transport_compatibility.get(key, [])
         if not result:
             logger.warning(
@@ -716,6 +960,95 @@ class ProcessMatcher:
             transport_process_with_product[primitive.transport_process.data.ID] = (primitive, primitive.transport_process)
         return list(transport_process_with_product.values())
 
+    def _check_transport_compatibility(
+        self,
+        item: product.Product | primitive.Primitive,
+        requested_process: process.PROCESS_UNION,
+        transport_resource: resources.Resource,
+        offered_process: process.PROCESS_UNION,
+        origin: Locatable,
+        target: Locatable,
+    ) -> Optional[bool]:
+        """
+        Checks if an offered transport process can transport an item from origin to target and adds the resource and process to the transport compatibility table if so.
+
+        Args:
+            item: The item to transport, located at the origin.
+            requested_process: The requested transport process of the item.
+            transport_resource: The transport resource.
+            offered_process: The offered transport process.
+            origin: The origin location.
+            target: The target location.
+
+        Returns:
+            Optional[bool]: None if the offered process does not match the request, True if a compatibility entry was created and False if no route was found.
+        """
+        dummy_transport_request = request.Request(
+            process=requested_process,
+            requesting_item=item,
+            resource=transport_resource,
+            origin=origin,
+            target=target,
+            request_type=request.RequestType.TRANSPORT,
+        )
+
+        try:
+            if not offered_process.matches_request(dummy_transport_request):
+                return None
+        except Exception as e:
+            logger.warning(f"      Exception in matches_request for {origin.data.ID} -> {target.data.ID}: {e}")
+            return None
+
+        # Handle different types of transport processes
+        if isinstance(offered_process, process.RequiredCapabilityProcess):
+            logger.debug(f"      Match found: RequiredCapabilityProcess for {origin.data.ID} -> {target.data.ID}")
+            self._handle_required_capability_process(
+                dummy_transport_request, requested_process,
+                transport_resource, offered_process, origin, target
+            )
+            return True
+        elif isinstance(offered_process, process.LinkTransportProcess):
+            logger.debug(f"      Match found: LinkTransportProcess for {origin.data.ID} -> {target.data.ID}")
+            return self._handle_link_transport_process(
+                dummy_transport_request, requested_process,
+                transport_resource, offered_process, origin, target
+            )
+        else:
+            logger.debug(f"      Match found: Regular transport process for {origin.data.ID} -> {target.data.ID}")
+            # Regular transport process
+            key = TransportCompatibilityKey(
+                origin_id=origin.data.ID,
+                target_id=target.data.ID,
+                process_signature=requested_process.get_process_signature(),
+            )
+            self._add_to_transport_compatibility(key, transport_resource, offered_process)
+            self.reachability_cache[(origin.data.ID, target.data.ID)] = True
+
+            # Cache the route
+            self._cache_route(dummy_transport_request, origin, target, offered_process, [])
+            return True
+
+    def _resolve_transport_compatibility(
+        self,
+        item: product.Product | primitive.Primitive,
+        origin: Locatable,
+        target: Locatable,
+    ):
+        """
+        Resolves the transport compatibility of the transport process of an item from origin to target for all transport resources. Used by the lazy transport compatibility mode.
+
+        Args:
+            item: The item to transport, located at the origin.
+            origin: The origin location.
+            target: The target location.
+        """
+        requested_process = item.transport_process
+        for transport_resource in self.resource_factory.get_movable_resources():
+            for offered_process in transport_resource.processes:
+                self._check_transport_compatibility(
+                    item, requested_process, transport_resource, offered_process, origin, target
+                )
+
     def _precompute_transport_compatibility(self, dummy_products: dict[str, product.Product]):
         """
         Precompute transport resource compatibility.
@@ -770,64 +1103,24 @@ class ProcessMatcher:
                     for origin in all_locations:
                         for target in all_locations:
                             item.update_location(origin)
-                            dummy_transport_request = request.Request(
-                                process=requested_process,
-                                requesting_item=item,
-                                resource=transport_resource,
-                                origin=origin,
-                                target=target,
-                                request_type=request.RequestType.TRANSPORT,
+                            compatible = self._check_transport_compatibility(
+                                item, requested_process, transport_resource, offered_process, origin, target
                             )
-                            
-                            try:
-                                matches = offered_process.matches_request(dummy_transport_request)
-                                if not matches:
-                                    match_failures += 1
-                                    continue
-                            except Exception as e:
-                                logger.warning(f"      Exception in matches_request for {origin.data.ID} -> {target.data.ID}: {e}")
+                            if compatible is None:
                                 match_failures += 1
                                 continue
-                            
+
                             matches_found += 1
                             routes_checked += 1
-                            
-                            # Handle different types of transport processes
-                            if isinstance(offered_process, process.RequiredCapabilityProcess):
-                                logger.debug(f"      Match found: RequiredCapabilityProcess for {origin.data.ID} -> {target.data.ID}")
-                                self._handle_required_capability_process(
-                                    dummy_transport_request, requested_process, 
-                                    transport_resource, offered_process, origin, target
-                                )
+                            if compatible:
                                 compatibility_count += 1
-                            elif isinstance(offered_process, process.LinkTransportProcess):
-                                logger.debug(f"      Match found: LinkTransportProcess for {origin.data.ID} -> {target.data.ID}")
-                                if self._handle_link_transport_process(
-                                    dummy_transport_request, requested_process,
-                                    transport_resource, offered_process, origin, target
-                                ):
-                                    compatibility_count += 1
-                                else:
-                                    route_failure_count += 1
-                                    logger.debug(
-                                        f"      Route not found: {origin.data.ID} -> {target.data.ID} "
-                                        f"(requested: {requested_process_id}, "
-                                        f"offered: {offered_process_id}, resource: {transport_resource.data.ID})"
-                                    )
                             else:
-                                logger.debug(f"      Match found: Regular transport process for {origin.data.ID} -> {target.data.ID}")
-                                # Regular transport process
-                                key = TransportCompatibilityKey(
-                                    origin_id=origin.data.ID,
-                                    target_id=target.data.ID,
-                                    process_signature=requested_process.get_process_signature(),
+                                route_failure_count += 1
+                                logger.debug(
+                                    f"      Route not found: {origin.data.ID} -> {target.data.ID} "
+                                    f"(requested: {requested_process_id}, "
+                                    f"offered: {offered_process_id}, resource: {transport_resource.data.ID})"
                                 )
-                                self._add_to_transport_compatibility(key, transport_resource, offered_process)
-                                self.reachability_cache[(origin.data.ID, target.data.ID)] = True
-                                
-                                # Cache the route
-                                self._cache_route(dummy_transport_request, origin, target, offered_process, [])
-                                compatibility_count += 1
                     
                     if matches_found > 0:
                         logger.info(f"    Process {offered_process_id}: {matches_found} matches found, {routes_checked} routes checked")
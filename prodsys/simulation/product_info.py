@@ -11,12 +11,12 @@ def extract_order_id_from_product_id(product_id: str) -> Optional[str]:
     match = _ORDER_ID_IN_PRODUCT_RE.search(product_id)
     return match.group(1) if match else None
 
-from prodsys.simulation.state import StateTypeEnum, StateEnum
+from prodsys.simulation.state import ObservableInfo, StateTypeEnum, StateEnum
 from prodsys.simulation.locatable import Locatable
 
 
 
-class ProductInfo:
+class ProductInfo(ObservableInfo):
     """
     Class that represents information of the current state of a product.
 
@@ -78,6 +78,8 @@ class ProductInfo:
             self.order_ID = order_ID
         elif self.order_ID is None:
             self.order_ID = extract_order_id_from_product_id(_product.data.ID)
+        for observer in self.observers:
+            observer(self)
 
     def log_create_product(
         self,
@@ -101,6 +103,8 @@ class ProductInfo:
         self.activity = StateEnum.created_product
         self.state_type = StateTypeEnum.source
         self.order_ID = order_ID
+        for observer in self.observers:
+            observer(self)
 
     def log_start_loading(
         self,
@@ -119,6 +123,8 @@ class ProductInfo:
         self.state_type = StateTypeEnum.loading
         self.origin_ID = origin.data.ID
         self.target_ID = None
+        for observer in self.observers:
+            observer(self)
 
     def log_end_loading(
         self,
@@ -137,6 +143,8 @@ class ProductInfo:
         self.state_type = StateTypeEnum.loading
         self.origin_ID = origin.data.ID
         self.target_ID = None
+        for observer in self.observers:
+            observer(self)
 
     def log_start_unloading(
         self,
@@ -155,6 +163,8 @@ class ProductInfo:
         self.state_type = StateTypeEnum.unloading
         self.origin_ID = None
         self.target_ID = target.data.ID
+        for observer in self.observers:
+            observer(self)
 
     def log_end_unloading(
         self,
@@ -173,6 +183,8 @@ class ProductInfo:
         self.state_type = StateTypeEnum.unloading
         self.origin_ID = None
         self.target_ID = target.data.ID
+        for observer in self.observers:
+            observer(self)
 
     def log_consumption(
         self,
@@ -190,6 +202,8 @@ class ProductInfo:
         self.state_type = StateTypeEnum.assembly
         self.origin_ID = None
         self.target_ID = None
+        for observer in self.observers:
+            observer(self)
 
     def log_bind(
         self,
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import Deque, List, TYPE_CHECKING, Literal, Optional, Union, Dict, Set
+from typing import Deque, Iterable, Iterator, List, TYPE_CHECKING, Literal, Optional, Union, Dict, Set
 from dataclasses import dataclass, field
 
+import itertools
 import logging
 
 import simpy
@@ -102,6 +103,81 @@ def get_dependency_request_info_key(
     return f"{item_id}:{dependency_id}:{item_id}"
 
 
+@dataclass
+class PendingRequestIndex:
+    """
+    Insertion-ordered collection of pending request keys with an index from lookup keys to the pending entries.
+
+    Every added request key gets a new, increasing entry number, so the same request key can be pending multiple times.
+    The index maps lookup keys (e.g. IDs of the resources that can handle a request or the types of the required
+    primitives) to the entries in insertion order. This allows to find the oldest pending request for a resource
+    without scanning all pending requests.
+
+    Attributes:
+        entries (dict[int, RequestInfoKey]): The pending request keys by their entry number in insertion order.
+        index (dict[str, dict[int, None]]): The entry numbers by lookup key in insertion order.
+    """
+
+    entries: dict[int, RequestInfoKey] = field(default_factory=dict)
+    index: dict[str, dict[int, None]] = field(default_factory=dict)
+    _lookup_keys: dict[int, tuple[str, ...]] = field(default_factory=dict)
+    _entry_counter: Iterator[int] = field(default_factory=itertools.count)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[RequestInfoKey]:
+        return iter(self.entries.values())
+
+    def add(self, request_info_key: RequestInfoKey, lookup_keys: Iterable[str]) -> int:
+        """
+        Adds a pending request key.
+
+        Args:
+            request_info_key (RequestInfoKey): The key of the request info.
+            lookup_keys (Iterable[str]): The lookup keys to index the request under.
+
+        Returns:
+            int: The entry number of the pending request.
+        """
+        entry = next(self._entry_counter)
+        self.entries[entry] = request_info_key
+        lookup_keys = tuple(dict.fromkeys(lookup_keys))
+        self._lookup_keys[entry] = lookup_keys
+        for lookup_key in lookup_keys:
+            self.index.setdefault(lookup_key, {})[entry] = None
+        return entry
+
+    def remove(self, entry: int) -> RequestInfoKey:
+        """
+        Removes a pending entry.
+
+        Args:
+            entry (int): The entry number.
+
+        Returns:
+            RequestInfoKey: The key of the removed request info.
+        """
+        for lookup_key in self._lookup_keys.pop(entry):
+            entries = self.index[lookup_key]
+            del entries[entry]
+            if not entries:
+                del self.index[lookup_key]
+        return self.entries.pop(entry)
+
+    def get_entries(self, lookup_key: str) -> Iterable[int]:
+        """
+        Returns the pending entries of a lookup key in insertion order.
+
+        Args:
+            lookup_key (str): The lookup key.
+
+        Returns:
+            Iterable[int]: The entry numbers.
+        """
+        return self.index.get(lookup_key, ())
+
+
 @dataclass
 class RequestHandler:
     """
@@ -111,8 +187,10 @@ class RequestHandler:
     process_matcher: ProcessMatcher
 
     request_infos: dict[RequestInfoKey, RequestInfo] = field(default_factory=dict)
-    pending_resource_requests: list[RequestInfoKey] = field(default_factory=list)
-    pending_primitive_requests: list[RequestInfoKey] = field(default_factory=list)
+    #: Pending requests indexed by the IDs of the resources that can handle them.
+    pending_resource_requests: PendingRequestIndex = field(default_factory=PendingRequestIndex)
+    #: Pending requests indexed by the type of the required primitive.
+    pending_primitive_requests: PendingRequestIndex = field(default_factory=PendingRequestIndex)
 
     pending_requests: dict[str, RequestInfo] = field(default_factory=dict)
     routed_requests: dict[str, RequestInfo] = field(default_factory=dict)
@@ -149,9 +227,6 @@ class RequestHandler:
             request_state="pending",
             request_completion_event=request_completion_event,
         )
-        # Add to pending requests
-        self.request_infos[request_info_key] = request_info
-        self.pending_requests[request_info_key] = request_info
         processing_request = request.Request(
             requesting_item=entity,
             entity=entity,
@@ -215,7 +290,7 @@ class RequestHandler:
         )
         # Add to pending requests
         self.request_infos[request_info_key] = request_info
-        self.pending_resource_requests.append(request_info_key)
+        self.pending_resource_requests.add(request_info_key, resources)
         return request_info
 
     def add_transport_request(
@@ -248,7 +323,7 @@ class RequestHandler:
         
         possible_resources_and_processes = (
             self.process_matcher.get_transport_compatible(
-                origin, target, transport_process_signature
+                origin, target, transport_process_signature, item
             )
         )
         if not possible_resources_and_processes:
@@ -301,7 +376,7 @@ class RequestHandler:
         )
         # Add to pending requests
         self.request_infos[request_info_key] = request_info
-        self.pending_resource_requests.append(request_info_key)
+        self.pending_resource_requests.add(request_info_key, resources)
         return request_info
 
     def add_dependency_request(
@@ -383,9 +458,11 @@ class RequestHandler:
         request_info.parent_target_queue = parent_target_queue
         self.request_infos[request_info_key] = request_info
         if dependency.data.dependency_type == DependencyType.TOOL or dependency.data.dependency_type == DependencyType.ASSEMBLY:
-            self.pending_primitive_requests.append(request_info_key)
+            self.pending_primitive_requests.add(
+                request_info_key, [dependency.required_entity.data.type]
+            )
         else:
-            self.pending_resource_requests.append(request_info_key)
+            self.pending_resource_requests.add(request_info_key, resource_mappings)
         return request_info
 
     def mark_routing(self, allocated_request: request.Request, setting_current_process: bool = True) -> None:
@@ -435,8 +512,9 @@ class RequestHandler:
                 f"Request info not found for completed request {completed_request.completed}"
             )
         request_info.request_state = "completed"
+        self._remove_request_info(request_info)
 
-                # If this was a lot request, clean up RequestInfo objects for all individual requests
+        # If this was a lot request, clean up RequestInfo objects for all individual requests
         # that were combined into the lot. These were never cleaned up when the lot was formed.
         if completed_request.entity.type == EntityType.LOT:
             lot = completed_request.entity
@@ -451,13 +529,19 @@ class RequestHandler:
                 if individual_request_info:
                     logger.debug(f"{completed_request.resource.env.now}: Cleaning up RequestInfo for individual request {id(completed_event)} from lot {lot.data.ID}")
                     individual_request_info.request_state = "completed"
-
+                    self._remove_request_info(individual_request_info)
                 else:
                     raise ValueError(f"Request info not found for completed event {completed_event} from lot {lot.data.ID}")
                 # If not found, it might have been cleaned up already or never existed
                 # (e.g., if the request was never routed, or was already cleaned up)
 
 
+    def _remove_request_info(self, request_info: RequestInfo) -> None:
+        # Completed request infos are not needed anymore and would keep their items, e.g. finished products, alive.
+        # A newer request of the same item can reuse the key, so only the completed request info is removed.
+        if self.request_infos.get(request_info.key) is request_info:
+            del self.request_infos[request_info.key]
+
     def create_resource_request(
         self,
         request_info: RequestInfo,
@@ -510,48 +594,58 @@ class RequestHandler:
         )
         return request_instance
 
+    @staticmethod
+    def _can_handle(request_info: RequestInfo, resource: resources.Resource) -> bool:
+        # For process dependencies, skip resources that are already bound to another entity
+        # This ensures that resources with ResourceDependency are not used for ProcessDependency
+        return not (
+            request_info.request_type == request.RequestType.PROCESS_DEPENDENCY
+            and getattr(resource, "bound", False)
+        )
+
     def get_next_resource_request_to_route(
         self, free_resources: list[resources.Resource]
     ) -> Optional[List[request.Request]]:
         """
-        Returns a list of all pending requests that can be allocated.
+        Returns the requests of the oldest pending request that can be allocated to one of the free resources.
+
+        Only the pending requests indexed for the free resources are considered, so the costs are proportional to
+        the number of free resources and not to the number of pending requests.
 
         Returns:
-            List[request.Request]: List of free requests ready for allocation.
+            List[request.Request]: List of free requests ready for allocation, one for each free resource and process that can handle the request.
         """
-        free_resources_set = set(
-            (index, resource.data.ID) for index, resource in enumerate(free_resources)
-        )
-        self.current_resource_request_index = 0
-        for request_info_index in range(
-            self.current_resource_request_index, len(self.pending_resource_requests)
-        ):
-            request_info_key = self.pending_resource_requests[request_info_index]
-            request_info = self.request_infos[request_info_key]
-            possible_resources_and_processes = request_info.resource_mappings
-            requests = []
-            for free_resource_index, free_resource_id in free_resources_set:
-                if free_resource_id in possible_resources_and_processes:
-                    free_resource = free_resources[free_resource_index]
-                    # For process dependencies, skip resources that are already bound to another entity
-                    # This ensures that resources with ResourceDependency are not used for ProcessDependency
-                    if (request_info.request_type == request.RequestType.PROCESS_DEPENDENCY 
-                        and hasattr(free_resource, 'bound') and free_resource.bound):
-                        continue
-                    for process_instance in possible_resources_and_processes[
-                        free_resource_id
-                    ]:
-                        new_request = self.create_resource_request(
-                            request_info,
-                            free_resource,
-                            process_instance,
-                        )
-                        requests.append(new_request)
-
-            if requests:
-                self.pending_requests[id(requests[0].completed)] = request_info
-                self.pending_resource_requests.remove(request_info_key)
-                return requests
+        pending = self.pending_resource_requests
+        if not pending:
+            return None
+        next_entry = None
+        for free_resource in free_resources:
+            for entry in pending.get_entries(free_resource.data.ID):
+                if next_entry is not None and entry > next_entry:
+                    break
+                if self._can_handle(self.request_infos[pending.entries[entry]], free_resource):
+                    next_entry = entry
+                    break
+        if next_entry is None:
+            return None
+
+        request_info_key = pending.remove(next_entry)
+        request_info = self.request_infos[request_info_key]
+        possible_resources_and_processes = request_info.resource_mappings
+        requests = []
+        for free_resource in free_resources:
+            processes = possible_resources_and_processes.get(free_resource.data.ID)
+            if not processes or not self._can_handle(request_info, free_resource):
+                continue
+            for process_instance in processes:
+                new_request = self.create_resource_request(
+                    request_info,
+                    free_resource,
+                    process_instance,
+                )
+                requests.append(new_request)
+        self.pending_requests[id(requests[0].completed)] = request_info
+        return requests
 
     def create_primitive_request(
         self,
@@ -582,52 +676,62 @@ class RequestHandler:
         )
         return dependency_request
 
+    @staticmethod
+    def _is_available(possible_primitive: primitive.Primitive) -> bool:
+        # Check if primitive is available (not bound to another entity)
+        if possible_primitive.bound:
+            return False
+        # Check if primitive is in a queue and available for routing
+        # Only route if primitive is in its storage or current locatable queue
+        if possible_primitive._current_locatable is None:
+            return False
+        # Verify the primitive is actually in the queue at its current location
+        if hasattr(possible_primitive._current_locatable, 'items'):
+            if possible_primitive.data.ID not in possible_primitive._current_locatable.items:
+                return False
+        return True
+
     def get_next_primitive_request_to_route(
         self, free_primitives: dict[str, list[primitive.Primitive]]
     ) -> Optional[List[request.Request]]:
         """
-        Returns a list of all pending requests that can be allocated.
+        Returns the requests of the oldest pending request for which a free primitive is available.
+
+        Only the oldest pending request of each required primitive type is considered.
 
         Returns:
-            List[request.Request]: List of free requests ready for allocation.
+            List[request.Request]: List of free requests ready for allocation, one for each available primitive.
         """
-        if not self.pending_primitive_requests:
+        pending = self.pending_primitive_requests
+        if not pending:
             return None
-        self.current_primitive_request_index = 0
-        for request_info_index in range(
-            self.current_primitive_request_index, len(self.pending_primitive_requests)
-        ):
-            request_info_key = self.pending_primitive_requests[request_info_index]
-            request_info = self.request_infos[request_info_key]
-            possible_primitives = free_primitives.get(
-                request_info.dependency.required_entity.data.type, []
-            )
-            possible_primitive_requests = []
-            for possible_primitive in possible_primitives:
-                # Check if primitive is available (not bound to another entity)
-                if possible_primitive.bound:
-                    continue
-                # Check if primitive is in a queue and available for routing
-                # Only route if primitive is in its storage or current locatable queue
-                if possible_primitive._current_locatable is None:
-                    continue
-                # Verify the primitive is actually in the queue at its current location
-                if hasattr(possible_primitive._current_locatable, 'items'):
-                    if possible_primitive.data.ID not in possible_primitive._current_locatable.items:
-                        # Primitive is not in the queue at its current location - skip it
-                        continue
-                new_request = self.create_primitive_request(
-                    request_info,
-                    possible_primitive,
-                )
-                possible_primitive_requests.append(new_request)
-            if possible_primitive_requests:
-                self.pending_primitive_requests.remove(request_info_key)
-                # self.request_infos.pop(request_info_key, None)
-                self.pending_requests[id(possible_primitive_requests[0].completed)] = (
-                    request_info
-                )
-                return possible_primitive_requests
+        next_entry = None
+        next_primitives = None
+        for primitive_type, entries in pending.index.items():
+            entry = next(iter(entries))
+            if next_entry is not None and entry > next_entry:
+                continue
+            available_primitives = [
+                possible_primitive
+                for possible_primitive in free_primitives.get(primitive_type, [])
+                if self._is_available(possible_primitive)
+            ]
+            if available_primitives:
+                next_entry = entry
+                next_primitives = available_primitives
+        if next_entry is None:
+            return None
+
+        request_info_key = pending.remove(next_entry)
+        request_info = self.request_infos[request_info_key]
+        possible_primitive_requests = [
+            self.create_primitive_request(request_info, possible_primitive)
+            for possible_primitive in next_primitives
+        ]
+        self.pending_requests[id(possible_primitive_requests[0].completed)] = (
+            request_info
+        )
+        return possible_primitive_requests
 
     def get_rework_processes(
         self, failed_process: process.PROCESS_UNION
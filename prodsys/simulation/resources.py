@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Generator, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Generator, Optional, Set, Union
 
+import heapq
 import random
 
 import logging
@@ -37,6 +38,71 @@ from prodsys.simulation.state import StateTypeEnum
 logger = logging.getLogger(__name__)
 
 
+class ProcessStatePool:
+    """
+    Pool of the production states of a resource for one process. The states are registered at the pool and notify it
+    when they are reserved or released, so the free states are known without scanning all states. The free states
+    are kept in a heap of their registration indices, so the first free state is returned like a scan would do.
+    """
+
+    def __init__(self):
+        self.states: List[state.State] = []
+        self.indices: Dict[state.State, int] = {}
+        self.free_indices: Set[int] = set()
+        self.free_heap: List[int] = []
+
+    def add(self, input_state: state.State) -> None:
+        """
+        Registers a state at the pool.
+
+        Args:
+            input_state (state.State): The state to register.
+        """
+        self.indices[input_state] = len(self.states)
+        self.states.append(input_state)
+        input_state.slot_pool = self
+        self.update(input_state)
+
+    def update(self, input_state: state.State) -> None:
+        """
+        Updates if a state of the pool is free, i.e. has no running process and is not reserved.
+
+        Args:
+            input_state (state.State): The state that changed.
+        """
+        index = self.indices[input_state]
+        if input_state.process is None and not input_state.reserved:
+            if index not in self.free_indices:
+                self.free_indices.add(index)
+                heapq.heappush(self.free_heap, index)
+        else:
+            self.free_indices.discard(index)
+
+    def get_free_state(self) -> Optional[state.State]:
+        """
+        Returns the free state with the lowest registration index.
+
+        Returns:
+            Optional[state.State]: The free state or None if all states are busy.
+        """
+        free_heap = self.free_heap
+        while free_heap and free_heap[0] not in self.free_indices:
+            heapq.heappop(free_heap)
+        if not free_heap:
+            return None
+        return self.states[free_heap[0]]
+
+    @property
+    def busy_count(self) -> int:
+        """
+        Returns the number of states that are running a process or are reserved.
+
+        Returns:
+            int: The number of busy states.
+        """
+        return len(self.states) - len(self.free_indices)
+
+
 class Resource(resource.Resource):
     """
     Base class for all resources.
@@ -76,6 +142,9 @@ class Resource(resource.Resource):
         self.controller = controller
         self.states = states if states else []
         self.production_states = production_states if production_states else []
+        self.production_state_pools: Dict[str, ProcessStatePool] = {}
+        for production_state in self.production_states:
+            self._add_to_production_state_pool(production_state)
         self.setup_states = setup_states if setup_states else []
         self.charging_states = charging_states if charging_states else []
 
@@ -151,14 +220,8 @@ class Resource(resource.Resource):
         if setup_to_check and isinstance(setup_to_check, ProcessModelProcess):
             return self.capacity
         
-        current_setup_ID = setup_to_check.data.ID
-        length = len(
-            [
-                state
-                for state in self.production_states
-                if state.data.ID == current_setup_ID
-            ]
-        )
+        production_state_pool = self.production_state_pools.get(setup_to_check.data.ID)
+        length = len(production_state_pool.states) if production_state_pool else 0
         # If no production states found for the setup, fall back to base capacity
         # This can happen for process models or other processes without explicit production states
         return length if length > 0 else self.capacity
@@ -311,8 +374,14 @@ class Resource(resource.Resource):
             input_state (state.ProductionState): The production state to add.
         """
         self.production_states.append(input_state)
+        self._add_to_production_state_pool(input_state)
         input_state.set_resource(self)
 
+    def _add_to_production_state_pool(self, input_state: state.State) -> None:
+        if input_state.data.ID not in self.production_state_pools:
+            self.production_state_pools[input_state.data.ID] = ProcessStatePool()
+        self.production_state_pools[input_state.data.ID].add(input_state)
+
     def start_states(self):
         """
         Starts the simpy processes of the states of the resource in simpy.
@@ -377,15 +446,12 @@ class Resource(resource.Resource):
         Returns:
             state.State: The state of the resource for the process.
         """
-        possible_states = [
-            actual_state
-            for actual_state in self.production_states
-            if actual_state.data.ID == process.data.ID
-        ]
-        if not possible_states:
+        production_state_pool = self.production_state_pools.get(process.data.ID)
+        if not production_state_pool:
             raise ValueError(
                 f"Process {process.data.ID} not found in resource {self.data.ID}"
             )
+        possible_states = production_state_pool.states
         return random.choice(possible_states)
 
     def get_processes(self, process: PROCESS_UNION) -> List[state.State]:
@@ -401,16 +467,13 @@ class Resource(resource.Resource):
         Returns:
             List[state.State]: The state of the resource for the process.
         """
-        possible_states = [
-            actual_state
-            for actual_state in self.production_states
-            if actual_state.data.ID == process.data.ID
-        ]
-        if not possible_states:
+        production_state_pool = self.production_state_pools.get(process.data.ID)
+        if not production_state_pool:
             raise ValueError(
                 f"Process {process.data.ID} not found in resource {self.data.ID}"
             )
-        return possible_states
+        possible_states = production_state_pool.states
+        return list(possible_states)
 
     def get_free_process(self, process: PROCESS_UNION) -> Optional[state.State]:
         """
@@ -422,14 +485,10 @@ class Resource(resource.Resource):
         Returns:
             Optional[state.State]: The state of the resource for the process.
         """
-        for actual_state in self.production_states:
-            if (
-                actual_state.data.ID == process.data.ID
-                and actual_state.process is None
-                and not actual_state.reserved
-            ):
-                return actual_state
-        return None
+        production_state_pool = self.production_state_pools.get(process.data.ID)
+        if not production_state_pool:
+            return None
+        return production_state_pool.get_free_state()
 
     def get_free_processes(self, process: PROCESS_UNION) -> Optional[List[state.State]]:
         """
@@ -441,11 +500,13 @@ class Resource(resource.Resource):
         Returns:
             List[state.State]: The state of the resource for the process.
         """
+        production_state_pool = self.production_state_pools.get(process.data.ID)
+        if not production_state_pool:
+            return []
         return [
             actual_state
-            for actual_state in self.production_states
-            if actual_state.data.ID == process.data.ID
-            and (actual_state.process is None or not actual_state.process.is_alive)
+            for actual_state in production_state_pool.states
+            if actual_state.process is None or not actual_state.process.is_alive
         ]
 
     def get_location(
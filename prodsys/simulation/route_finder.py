@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import Dict, List, TYPE_CHECKING, Optional, Tuple
+from typing import Dict, List, Literal, TYPE_CHECKING, Optional, Tuple
 
 import math
 from pathfinding.core.graph import GraphNode
 
 from prodsys.util.dijkstra_all import DijkstraAllPaths
+from prodsys.util.shortest_path_matrix import ShortestPathMatrix
 
 if TYPE_CHECKING:
     from prodsys.simulation import request, process
@@ -31,7 +32,7 @@ def find_route(
     """
     if request.route and not find_route_to_origin:
         return request.route
-    route_finder = RouteFinder()
+    route_finder = RouteFinder(backend=process.route_finder_backend)
     route = route_finder.find_route(
         request=request, process=process, find_route_to_origin=find_route_to_origin
     )
@@ -45,9 +46,18 @@ class RouteFinder:
     """
     Class representing a route finder for transportation requests in a graph.
     Uses efficient Dijkstra exploration to cache all paths from each origin.
+
+    With the "csgraph" backend, the routes between the static locations of a process are instead looked up in a
+    ShortestPathMatrix that is computed in one batch per process. Routes from mobile origins always use the
+    Dijkstra exploration, because their graph depends on the current location of the origin.
+
+    Args:
+        backend (Literal["dijkstra", "csgraph"], optional): Backend for routes between static locations. Defaults to
+            "dijkstra".
     """
-    # Cache: (process_id, origin_id, target_id) -> List[Locatable]
-    _route_cache: Dict[Tuple[str, str, str], List["Locatable"]] = {}
+
+    # Cache: (backend, process_id, origin_id, target_id) -> List[Locatable]
+    _route_cache: Dict[Tuple[str, str, str, str], List["Locatable"]] = {}
 
     # Static graph per process_id: (edges, nodes_dict, locatable_per_id)
     # Only populated for non-mobile origins (the graph is fixed for a given process).
@@ -64,10 +74,18 @@ class RouteFinder:
     # path-cache survives across RouteFinder instantiations.
     _dijkstra_per_process: Dict[str, DijkstraAllPaths] = {}
 
-    def __init__(self):
+    # All-pairs shortest paths per process_id for the "csgraph" backend.
+    _shortest_path_matrix_per_process: Dict[str, ShortestPathMatrix] = {}
+
+    def __init__(self, backend: Literal["dijkstra", "csgraph"] = "dijkstra"):
         """
         Initializes the route finder with empty node dictionary and Dijkstra path finder.
+
+        Args:
+            backend (Literal["dijkstra", "csgraph"], optional): Backend for routes between static locations. Defaults
+                to "dijkstra".
         """
+        self.backend = backend
         self.nodes: Dict[str, GraphNode] = {}
         self.dijkstra_finder = DijkstraAllPaths()
 
@@ -80,6 +98,60 @@ class RouteFinder:
         cls._route_cache.clear()
         cls._static_graph_cache.clear()
         cls._dijkstra_per_process.clear()
+        cls._shortest_path_matrix_per_process.clear()
+
+    @classmethod
+    def rebind_cache(cls, processes: List[process.LinkTransportProcess]):
+        """
+        Keeps the cached routes and graphs of the given processes for a new run of the same production system and
+        replaces their locatables with the locatables of the new run, which are taken from the links of the processes.
+
+        Routes and graphs that contain a mobile locatable or a locatable that is not part of the links of its
+        process depend on locations of the previous run and are cleared, just like the caches of all other processes.
+
+        Args:
+            processes (List[process.LinkTransportProcess]): The link transport processes of the new run with updated
+                links.
+        """
+        locatable_per_id_per_process: Dict[str, Dict[str, Locatable]] = {
+            link_process.data.ID: {
+                locatable.data.ID: locatable
+                for link in link_process.links
+                for locatable in link
+                if not (hasattr(locatable, "can_move") and locatable.can_move)
+            }
+            for link_process in processes
+        }
+
+        static_graph_cache = {}
+        for process_id, (edges, nodes, old_locatable_per_id) in cls._static_graph_cache.items():
+            locatable_per_id = locatable_per_id_per_process.get(process_id, {})
+            if all(locatable_id in locatable_per_id for locatable_id in old_locatable_per_id):
+                static_graph_cache[process_id] = (
+                    edges,
+                    nodes,
+                    {locatable_id: locatable_per_id[locatable_id] for locatable_id in old_locatable_per_id},
+                )
+        cls._static_graph_cache.clear()
+        cls._static_graph_cache.update(static_graph_cache)
+        for process_cache in (cls._dijkstra_per_process, cls._shortest_path_matrix_per_process):
+            for process_id in list(process_cache):
+                if process_id not in static_graph_cache:
+                    del process_cache[process_id]
+
+        route_cache = {}
+        for route_cache_key, route in cls._route_cache.items():
+            _, process_id, origin_id, target_id = route_cache_key
+            locatable_per_id = locatable_per_id_per_process.get(process_id, {})
+            if (
+                process_id in static_graph_cache
+                and origin_id in locatable_per_id
+                and target_id in locatable_per_id
+                and all(locatable.data.ID in locatable_per_id for locatable in route)
+            ):
+                route_cache[route_cache_key] = [locatable_per_id[locatable.data.ID] for locatable in route]
+        cls._route_cache.clear()
+        cls._route_cache.update(route_cache)
 
     def find_route(
         self,
@@ -103,7 +175,7 @@ class RouteFinder:
             request=request, route_to_origin=find_route_to_origin
         )
 
-        route_cache_key = (process.data.ID, origin.data.ID, target.data.ID)
+        route_cache_key = (self.backend, process.data.ID, origin.data.ID, target.data.ID)
         if route_cache_key in self._route_cache:
             return self._route_cache[route_cache_key]
 
@@ -136,6 +208,18 @@ class RouteFinder:
             self._route_cache[route_cache_key] = []
             return []
 
+        if self.backend == "csgraph" and not origin_is_mobile:
+            if process_id not in self._shortest_path_matrix_per_process:
+                self._shortest_path_matrix_per_process[process_id] = ShortestPathMatrix(edges)
+            graph_node_path = self._shortest_path_matrix_per_process[process_id].get_path(
+                origin_node, target_node
+            )
+            route = self.convert_node_path_to_locatable_route(
+                graph_node_path=graph_node_path, locatable_per_id=locatable_per_id
+            )
+            self._route_cache[route_cache_key] = route
+            return route
+
         # Use a persistent DijkstraAllPaths per process for static graphs so its
         # internal path-cache is not discarded between RouteFinder instantiations.
         if not origin_is_mobile:
@@ -164,7 +248,7 @@ class RouteFinder:
             route_target = route[-1]
             if route_target.data.ID == target.data.ID:
                 route_to_return = route
-            self._route_cache[(process_id, origin.data.ID, route_target.data.ID)] = route
+            self._route_cache[(self.backend, process_id, origin.data.ID, route_target.data.ID)] = route
 
         # If the requested target was not reachable, cache [] so the next lookup
         # for this pair returns immediately without rebuilding the graph.
@@ -11,6 +11,7 @@ from typing import (
     Dict,
     Tuple,
     Callable,
+    Sequence,
 )
 
 import logging
@@ -20,7 +21,8 @@ import simpy
 from prodsys.factories import primitive_factory
 from prodsys.models.dependency_data import DependencyType
 from prodsys.simulation.dependency import Dependency
-from prodsys.models import port_data, production_system_data
+from prodsys.models import performance_data, port_data, production_system_data
+from prodsys.models.schedule_data import ColumnarScheduleEvents
 from prodsys.simulation.interaction_handler import InteractionHandler
 from prodsys.simulation.process_matcher import ProcessMatcher
 from prodsys.simulation.request_handler import RequestHandler
@@ -70,6 +72,134 @@ def get_env_from_requests(requests: List[request.Request]) -> simpy.Environment:
         return requests[0].primitive.env
 
 
+class ScheduleRoutingMaps:
+    """
+    Routing maps of the schedule of a production system. They are built once per simulation and shared by all routers,
+    so that every scheduled occurrence is only routed once. Columnar schedules are indexed on their columns, so that
+    events are only created for the dependency moves.
+
+    Args:
+        schedule (Sequence[performance_data.Event]): The schedule of the production system.
+
+    Attributes:
+        schedule_routing_map (Dict[Tuple[str, str], deque[Tuple[float, str]]]): The scheduled resources per
+            (product, process) in chronological order.
+        dependency_move_routing_map (Dict[Tuple[str, str, str | None, str | None], deque[Tuple[float, str]]]): The
+            scheduled worker resources per dependency move in chronological order.
+    """
+
+    def __init__(self, schedule: Sequence[performance_data.Event]):
+        self.schedule = schedule
+        self.schedule_routing_map: Dict[Tuple[str, str], deque[Tuple[float, str]]] = {}
+        self.dependency_move_routing_map: Dict[
+            Tuple[str, str, str | None, str | None], deque[Tuple[float, str]]
+        ] = {}
+        # Targets of the scheduled transports per product ID, indexed on the first sink lookup of a product.
+        self._scheduled_transport_targets: Optional[Dict[str, List[Optional[str]]]] = None
+        self._build_schedule_routing_map()
+        self._build_dependency_move_routing_map()
+
+    def _build_schedule_routing_map(self):
+        """
+        Pre-process the schedule into a per-(product, process) FIFO of
+        scheduled resources.
+
+        A single product traverses the same process id many times when its
+        chain contains multiple transports (e.g. ``ltp_workers_shared`` for
+        every move between stations).  The previous implementation kept a
+        flat ``dict`` keyed on ``(product_id, process_id)`` and overwrote
+        the entry on every iteration, so only the *last* scheduled
+        occurrence survived — every earlier transport request ended up on
+        the fallback heuristic and the simulator's resource choice
+        diverged from the plan, dragging the plan-vs-sim match-rate down.
+
+        We now keep a ``deque[(time, resource)]`` per key, sorted by
+        ``planned_start``.  ``schedule_based_routing_heuristic`` consumes
+        the deque head-first when a request fires, so concurrent
+        occurrences are routed in chronological order.
+        """
+        if isinstance(self.schedule, ColumnarScheduleEvents):
+            self._build_columnar_schedule_routing_map()
+            return
+
+        buckets: Dict[Tuple[str, str], List[Tuple[float, str]]] = defaultdict(list)
+        for event in self.schedule:
+            if event.activity != "start state" or not event.process:
+                continue
+            buckets[(event.product, event.process)].append(
+                (float(event.time or 0.0), event.resource)
+            )
+
+        for key, entries in buckets.items():
+            entries.sort(key=lambda e: e[0])
+            self.schedule_routing_map[key] = deque(entries)
+
+        total_entries = sum(len(v) for v in self.schedule_routing_map.values())
+        logger.debug(
+            "Built schedule routing map with %d unique (product, process) keys "
+            "/ %d total scheduled occurrences",
+            len(self.schedule_routing_map), total_entries,
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            for key, dq in list(self.schedule_routing_map.items())[:5]:
+                logger.debug("  Schedule routing: %s -> %s", key, list(dq))
+
+    def _build_columnar_schedule_routing_map(self) -> None:
+        data = self.schedule.columnar_schedule.data
+        if "process" not in data.columns or "Product" not in data.columns:
+            return
+        mask = (
+            (data["Activity"] == "start state")
+            & data["process"].notna()
+            & (data["process"] != "")
+        )
+        scheduled = data.loc[mask, ["Product", "process", "Time", "Resource"]]
+        scheduled = scheduled.assign(Time=scheduled["Time"].fillna(0.0)).sort_values(
+            "Time", kind="stable"
+        )
+        for (product_id, process_id), entries in scheduled.groupby(
+            ["Product", "process"], observed=True, sort=False
+        ):
+            self.schedule_routing_map[(str(product_id), str(process_id))] = deque(
+                zip(entries["Time"].tolist(), entries["Resource"].astype(str).tolist())
+            )
+
+    def _build_dependency_move_routing_map(self) -> None:
+        _, _, _, routing_by_key = build_dependency_move_schedule_index(self.schedule)
+        for key, entries in routing_by_key.items():
+            sorted_entries = sorted(entries, key=lambda e: e[0])
+            self.dependency_move_routing_map[key] = deque(sorted_entries)
+
+    def get_scheduled_transport_targets(self, product_id: str) -> List[Optional[str]]:
+        """
+        Returns the target locations of the scheduled transports of a product.
+
+        Args:
+            product_id (str): The ID of the product.
+
+        Returns:
+            List[Optional[str]]: The target locations in the order of the schedule.
+        """
+        if self._scheduled_transport_targets is None:
+            # Index the scheduled transport targets once instead of scanning the schedule for every product.
+            self._scheduled_transport_targets = defaultdict(list)
+            if isinstance(self.schedule, ColumnarScheduleEvents):
+                data = self.schedule.columnar_schedule.data
+                if "Target location" in data.columns:
+                    mask = (data["State Type"] == "Transport") & (data["Activity"] == "start state")
+                    target_locations = data.loc[mask, "Target location"].astype(object)
+                    target_locations = target_locations.where(target_locations.notna(), None)
+                    for scheduled_product_id, product_targets in target_locations.groupby(
+                        data.loc[mask, "Product"], observed=True, sort=False
+                    ):
+                        self._scheduled_transport_targets[str(scheduled_product_id)] = product_targets.tolist()
+            else:
+                for event in self.schedule:
+                    if event.state_type == "Transport" and event.activity == "start state":
+                        self._scheduled_transport_targets[event.product].append(event.target_location)
+        return self._scheduled_transport_targets.get(product_id, [])
+
+
 class Router:
     """
     Base class for all routers.
@@ -78,6 +208,7 @@ class Router:
         resource_factory (resource_factory.ResourceFactory): The resource factory of the production system.
         sink_factory (sink_factory.SinkFactory): The sink factory of the production system.
         routing_heuristic (Callable[[List[resources.Resource]], resources.Resource]): The routing heuristic to be used, needs to be a callable that takes a list of resources and returns a resource.
+        schedule_routing_maps (Optional[ScheduleRoutingMaps]): The routing maps of the schedule, shared by all routers of the simulation. Defaults to None, which builds them from the schedule of the production system data.
     """
 
     def __init__(
@@ -91,6 +222,7 @@ class Router:
         production_system_data: Optional[production_system_data.ProductionSystemData] = None,
         resources: Optional[List[resources.Resource]] = None,
         process_matcher: Optional[ProcessMatcher] = None,
+        schedule_routing_maps: Optional[ScheduleRoutingMaps] = None,
     ):
         self.env = env
         self.resource_factory: resource_factory.ResourceFactory = resource_factory
@@ -110,7 +242,19 @@ class Router:
         self.resources = resources
         self.process_matcher: ProcessMatcher = process_matcher
 
+        # Routing candidates. Requests are also queued at busy resources, so this always contains all resources.
         self.free_resources: Dict[str, resources.Resource] = {resource.data.ID: resource for resource in self.resources}
+        # Resources whose controllers may be busy, keyed by their index in resources so that they are woken up in
+        # the order of the resources. Controllers register themselves when they wake up busy, idle controllers are
+        # removed by update_free_resources. All resources start as busy, so that every controller is checked once.
+        self._resource_indices: Dict[str, int] = {
+            resource.data.ID: index for index, resource in enumerate(self.resources)
+        }
+        self.busy_resources: Dict[int, resources.Resource] = dict(enumerate(self.resources))
+        for resource in self.resources:
+            resource.controller.routers.append(self)
+        # Number of controller wakeups skipped by trigger_resources because the controller was idle.
+        self.skipped_resource_wakeups = 0
 
         self.got_requested = events.Event(self.env)
         self.got_primitive_request = events.Event(self.env)
@@ -132,9 +276,13 @@ class Router:
         ] = {}
         self.schedule_routing_heuristic: Optional[Callable] = None
         self.dependency_move_routing_heuristic: Optional[Callable] = None
+        self.schedule_routing_maps: Optional[ScheduleRoutingMaps] = None
         if self.production_system_data and self.production_system_data.schedule:
-            self._build_schedule_routing_map()
-            self._build_dependency_move_routing_map()
+            if schedule_routing_maps is None:
+                schedule_routing_maps = ScheduleRoutingMaps(self.production_system_data.schedule)
+            self.schedule_routing_maps = schedule_routing_maps
+            self.schedule_routing_map = schedule_routing_maps.schedule_routing_map
+            self.dependency_move_routing_map = schedule_routing_maps.dependency_move_routing_map
             if self.schedule_routing_map:
                 self.schedule_routing_heuristic = self._create_schedule_based_routing_heuristic(
                     shortest_queue_routing_heuristic
@@ -175,61 +323,43 @@ class Router:
 
     def mark_resource_free(self, resource: resources.Resource) -> None:
         """
-        Marks a resource as free in the router.
+        Marks a resource as free in the router, i.e. its controller is idle and is not woken up by trigger_resources.
+
+        Args:
+            resource (resources.Resource): The resource to mark as free.
         """
-        pass
-        # if resource.data.ID not in self.free_resources:
-        #     self.free_resources[resource.data.ID] = resource
+        self.busy_resources.pop(self._resource_indices[resource.data.ID], None)
 
     def mark_resource_not_free(self, resource: resources.Resource) -> None:
         """
-        Marks a resource as not free in the router.
+        Marks a resource as not free in the router, i.e. its controller is busy and is woken up by trigger_resources.
+
+        Args:
+            resource (resources.Resource): The resource to mark as not free.
         """
-        pass
-        # if resource.data.ID in self.free_resources:
-        #     self.free_resources.pop(resource.data.ID)
+        self.busy_resources[self._resource_indices[resource.data.ID]] = resource
 
     def update_free_resources(self) -> None:
         """
-        Updates the list of free resources.
-        For INPUT_OUTPUT queues, we need special handling: a resource should be considered
-        free if it has items in INPUT_OUTPUT queues that can be processed (removed and put back).
+        Marks the resources with idle controllers as free. Only the resources that are currently marked as busy are
+        checked, because an idle controller only gets busy again by waking up itself, which marks its resource as
+        not free.
         """
-        pass
-        # for resource in self.resources:
-        #     if resource.full:
-        #         self.mark_resource_not_free(resource)
-        #     else:
-        #         # Check OUTPUT and INPUT_OUTPUT ports
-        #         output_ports = [port for port in resource.ports if port.data.interface_type in [port_data.PortInterfaceType.OUTPUT, port_data.PortInterfaceType.INPUT_OUTPUT]]
-        #         if output_ports:
-        #             # For INPUT_OUTPUT queues: if there are items in the queue, the resource can still process them
-        #             # even if the queue appears full (because items will be removed then put back)
-        #             all_ports_full_with_no_items = True
-        #             for port in output_ports:
-        #                 if port.data.interface_type == port_data.PortInterfaceType.INPUT_OUTPUT:
-        #                     # INPUT_OUTPUT queue: if it has items, resource can process (items will be removed)
-        #                     if len(port.items) > 0:
-        #                         all_ports_full_with_no_items = False
-        #                         break
-        #                 # For OUTPUT or full INPUT_OUTPUT with no items: check if full
-        #                 if not port.is_full:
-        #                     all_ports_full_with_no_items = False
-        #                     break
-                    
-        #             if all_ports_full_with_no_items:
-        #                 self.mark_resource_not_free(resource)
-        #             else:
-        #                 self.mark_resource_free(resource)
-        #         else:
-        #             # No output ports, just check if resource is full
-        #             self.mark_resource_free(resource)
+        for resource in list(self.busy_resources.values()):
+            if resource.controller.idle:
+                self.mark_resource_free(resource)
 
-    
     def trigger_resources(self) -> None:
-        for resource in self.resources:
-            if not resource.controller.state_changed.triggered:
-                resource.controller.state_changed.succeed()
+        """
+        Wakes up the controllers of all busy resources, so that they can recheck their pending requests.
+        Idle controllers are skipped, because they cannot start any work until they get a new request.
+        """
+        self.update_free_resources()
+        self.skipped_resource_wakeups += len(self.resources) - len(self.busy_resources)
+        for index in sorted(self.busy_resources):
+            controller = self.busy_resources[index].controller
+            if not controller.state_changed.triggered:
+                controller.state_changed.succeed()
 
     def resource_routing_loop(self) -> Generator[None, None, None]:
         """
@@ -246,7 +376,6 @@ class Router:
                 self.resource_got_free = events.Event(self.env)
             while True:
                 logger.debug("Resource routing loop")
-                self.update_free_resources()
                 free_requests = self.request_handler.get_next_resource_request_to_route(
                     list(self.free_resources.values())
                 )
@@ -472,9 +601,7 @@ class Router:
                 )
                 # Notify all resources that might be waiting for this primitive type
                 # This allows controllers to recheck feasibility of pending requests
-                for resource in self.resources:
-                    if resource.controller and not resource.controller.state_changed.triggered:
-                        resource.controller.state_changed.succeed()
+                self.trigger_resources()
         if not self.got_primitive_request.triggered:
             self.got_primitive_request.succeed()
 
@@ -535,60 +662,6 @@ class Router:
         return possible_storages[0] if possible_storages else primitive.storage
     
     
-    def _build_schedule_routing_map(self):
-        """
-        Pre-process the schedule into a per-(product, process) FIFO of
-        scheduled resources.
-
-        A single product traverses the same process id many times when its
-        chain contains multiple transports (e.g. ``ltp_workers_shared`` for
-        every move between stations).  The previous implementation kept a
-        flat ``dict`` keyed on ``(product_id, process_id)`` and overwrote
-        the entry on every iteration, so only the *last* scheduled
-        occurrence survived — every earlier transport request ended up on
-        the fallback heuristic and the simulator's resource choice
-        diverged from the plan, dragging the plan-vs-sim match-rate down.
-
-        We now keep a ``deque[(time, resource)]`` per key, sorted by
-        ``planned_start``.  ``schedule_based_routing_heuristic`` consumes
-        the deque head-first when a request fires, so concurrent
-        occurrences are routed in chronological order.
-        """
-        if not self.production_system_data or not self.production_system_data.schedule:
-            return
-
-        buckets: Dict[Tuple[str, str], List[Tuple[float, str]]] = defaultdict(list)
-        for event in self.production_system_data.schedule:
-            if event.activity != "start state" or not event.process:
-                continue
-            buckets[(event.product, event.process)].append(
-                (float(event.time or 0.0), event.resource)
-            )
-
-        for key, entries in buckets.items():
-            entries.sort(key=lambda e: e[0])
-            self.schedule_routing_map[key] = deque(entries)
-
-        total_entries = sum(len(v) for v in self.schedule_routing_map.values())
-        logger.debug(
-            "Built schedule routing map with %d unique (product, process) keys "
-            "/ %d total scheduled occurrences",
-            len(self.schedule_routing_map), total_entries,
-        )
-        if logger.isEnabledFor(logging.DEBUG):
-            for key, dq in list(self.schedule_routing_map.items())[:5]:
-                logger.debug("  Schedule routing: %s -> %s", key, list(dq))
-
-    def _build_dependency_move_routing_map(self) -> None:
-        if not self.production_system_data or not self.production_system_data.schedule:
-            return
-        _, _, _, routing_by_key = build_dependency_move_schedule_index(
-            self.production_system_data.schedule
-        )
-        for key, entries in routing_by_key.items():
-            sorted_entries = sorted(entries, key=lambda e: e[0])
-            self.dependency_move_routing_map[key] = deque(sorted_entries)
-
     def _create_dependency_move_routing_heuristic(
         self, fallback_heuristic: Callable
     ) -> Callable:
@@ -912,12 +985,7 @@ class Router:
         return request_info.request_completion_event
 
     def _scheduled_sink_port_for_product(self, product_instance: product.Product) -> Optional[str]:
-        schedule = (
-            self.production_system_data.schedule
-            if self.production_system_data is not None
-            else None
-        )
-        if not schedule:
+        if self.schedule_routing_maps is None:
             return None
 
         sink_port_ids = {
@@ -931,12 +999,11 @@ class Router:
             return None
 
         matches = [
-            event.target_location
-            for event in schedule
-            if event.product == product_instance.data.ID
-            and event.state_type == "Transport"
-            and event.activity == "start state"
-            and event.target_location in sink_port_ids
+            target_location
+            for target_location in self.schedule_routing_maps.get_scheduled_transport_targets(
+                product_instance.data.ID
+            )
+            if target_location in sink_port_ids
         ]
         return matches[-1] if matches else None
 
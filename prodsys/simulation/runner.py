@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 import contextlib
+import multiprocessing
+import os
 import random
-from typing import List, Literal, Optional
+import tempfile
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 import time
+from scipy import stats
 
 from prodsys.models import production_system_data
-from prodsys.simulation import sim, logger
+from prodsys.simulation import sim, logger, process
 from prodsys.simulation.schedule_completion import ScheduleCompletionTracker
 
 import logging as _logging
@@ -30,7 +34,8 @@ from prodsys.factories import (
 )
 
 
-from prodsys.util.post_processing import PostProcessor
+from prodsys.analytics.store import AnalyticsStore
+from prodsys.util.post_processing import PostProcessor, get_sink_source_queue_names
 
 from prodsys.util import util
 from prodsys.models import performance_data
@@ -76,6 +81,190 @@ def temp_seed(seed: int):
         random.setstate(p_state)
 
 
+def _run_replication(
+    args: Tuple[
+        production_system_data.ProductionSystemData, int, float, Optional[str]
+    ],
+) -> List[performance_data.KPI_UNION]:
+    """
+    Runs one replication of a simulation in a worker. Only the KPIs are returned, the events are either folded
+    batch-wise into the analytics store and dropped, so that the memory of a replication stays bounded, or spilled to
+    disk. No event data needs to be pickled back to the parent process.
+
+    Args:
+        args (Tuple[production_system_data.ProductionSystemData, int, float, Optional[str]]): Production system, seed,
+            run length and event log directory of the replication.
+
+    Returns:
+        List[performance_data.KPI_UNION]: The KPIs of the replication.
+    """
+    adapter_object, seed, run_length, event_log_directory = args
+    sim.VERBOSE = 0
+    replication_data = adapter_object.model_copy(update={"seed": seed})
+    if event_log_directory is None:
+        runner_object = Runner(
+            production_system_data=replication_data, event_log_backend="live"
+        )
+    else:
+        runner_object = Runner(
+            production_system_data=replication_data,
+            event_log_backend="streaming",
+            event_log_directory=event_log_directory,
+        )
+    runner_object.initialize_simulation()
+    runner_object.run(run_length)
+    return runner_object.get_performance_data(event_log=False).kpis
+
+
+def _summarize_kpis(
+    kpis_per_replication: List[List[performance_data.KPI_UNION]],
+    confidence_level: float,
+) -> List[performance_data.KPISummary]:
+    """
+    Aggregates the KPIs of the replications to their mean and a Student-t confidence interval of the mean.
+
+    Args:
+        kpis_per_replication (List[List[performance_data.KPI_UNION]]): KPIs of each replication.
+        confidence_level (float): Confidence level of the confidence intervals.
+
+    Returns:
+        List[performance_data.KPISummary]: Summary per KPI, in order of first occurrence.
+    """
+    values_per_kpi: Dict[tuple, List[float]] = {}
+    for kpis in kpis_per_replication:
+        for kpi in kpis:
+            if kpi.value is None:
+                continue
+            key = (kpi.name, kpi.context, kpi.resource, kpi.product_type)
+            values_per_kpi.setdefault(key, []).append(float(kpi.value))
+
+    summaries = []
+    for (name, context, resource, product_type), values in values_per_kpi.items():
+        mean = float(np.mean(values))
+        if len(values) > 1:
+            std = float(np.std(values, ddof=1))
+            half_width = float(
+                stats.t.ppf((1 + confidence_level) / 2, len(values) - 1)
+                * std
+                / np.sqrt(len(values))
+            )
+        else:
+            std = 0.0
+            half_width = 0.0
+        summaries.append(
+            performance_data.KPISummary(
+                name=name,
+                context=context,
+                resource=resource,
+                product_type=product_type,
+                values=values,
+                mean=mean,
+                std=std,
+                confidence_interval=(mean - half_width, mean + half_width),
+                confidence_level=confidence_level,
+            )
+        )
+    return summaries
+
+
+def run_replications(
+    production_system_data: production_system_data.ProductionSystemData,
+    seeds: Union[int, Iterable[int]],
+    run_length: float,
+    workers: Optional[int] = None,
+    event_log_directory: Optional[str] = None,
+    confidence_level: float = 0.95,
+) -> performance_data.ReplicationPerformance:
+    """
+    Runs independent replications of the simulation with different seeds in a process pool and aggregates the mean
+    and confidence interval per KPI. The workers only return their KPIs, so the event logs are never pickled
+    between processes.
+
+    Args:
+        production_system_data (production_system_data.ProductionSystemData): Production system to simulate.
+        seeds (Union[int, Iterable[int]]): Seeds of the replications. An integer n runs the seeds 0 to n - 1.
+        run_length (float): Length of each simulation run.
+        workers (Optional[int], optional): Number of worker processes. 1 runs the replications in the current
+            process. Defaults to None, which uses the number of CPUs.
+        event_log_directory (Optional[str], optional): If given, the event log of each replication is streamed as
+            Parquet chunks to the subdirectory ``seed_<seed>`` of this directory, which requires pyarrow or
+            fastparquet. Defaults to None, which folds the events into the KPIs while simulating and drops them.
+        confidence_level (float, optional): Confidence level of the confidence intervals. Defaults to 0.95.
+
+    Returns:
+        performance_data.ReplicationPerformance: Summary of the KPIs over all replications.
+    """
+    if isinstance(seeds, int):
+        seeds = range(seeds)
+    seeds = list(seeds)
+    if event_log_directory is None:
+        event_log_directories = None
+    else:
+        logger.check_parquet_engine_available()
+        event_log_directories = [
+            os.path.join(event_log_directory, f"seed_{seed}") for seed in seeds
+        ]
+    replication_args = [
+        (
+            production_system_data,
+            seed,
+            run_length,
+            event_log_directories[index] if event_log_directories else None,
+        )
+        for index, seed in enumerate(seeds)
+    ]
+
+    if workers == 1 or len(seeds) <= 1:
+        kpis_per_replication = [_run_replication(args) for args in replication_args]
+    else:
+        if util.run_from_ipython():
+            from multiprocessing.pool import ThreadPool as Pool
+        else:
+            from multiprocessing.pool import Pool
+        with Pool(workers) as pool:
+            kpis_per_replication = pool.map(_run_replication, replication_args)
+
+    return performance_data.ReplicationPerformance(
+        seeds=seeds,
+        kpis=_summarize_kpis(kpis_per_replication, confidence_level),
+        event_log_directories=event_log_directories,
+    )
+
+
+_SNAPSHOT: Optional[Tuple[Runner, Dict[str, Optional[Callable[[Runner], None]]]]] = None
+"""
+Runner and scenarios of the running :meth:`Runner.fork_scenarios` call. Forked workers inherit it as a copy of the
+simulation state at the time of the fork.
+"""
+
+
+def _run_scenario_from_snapshot(
+    args: Tuple[str, float, bool],
+) -> performance_data.Performance:
+    """
+    Runs one scenario in a worker that was forked from the snapshot of a warmed-up simulation.
+
+    Args:
+        args (Tuple[str, float, bool]): Name of the scenario, run length after the snapshot and whether the event log
+            is returned.
+
+    Returns:
+        performance_data.Performance: The performance of the scenario.
+    """
+    scenario_name, run_length, event_log = args
+    runner_object, scenarios = _SNAPSHOT
+    sim.VERBOSE = 0
+    scenario = scenarios[scenario_name]
+    if scenario is not None:
+        scenario(runner_object)
+    runner_object.post_processor = None
+    start_time = runner_object.env.now
+    runner_object.run(start_time + run_length)
+    # The KPIs only cover the scenario, not the warm-up before the snapshot.
+    runner_object.get_post_processor().store.set_time_range(runner_object.time_range, start_time=start_time)
+    return runner_object.get_performance_data(event_log=event_log)
+
+
 class Runner:
     """
     Class to represent the simulation runner. It allows to run the simulation based on a provided adapter.
@@ -87,6 +276,39 @@ class Runner:
         strict_schedule_timing (bool, optional): When True, scheduled resources wait until
             each matched request's planned start time before dispatch. Defaults to False
             so the simulation may run ahead of the plan while still following schedule order.
+        event_log_backend (Literal["list", "columnar", "streaming", "live"], optional): Storage backend of the event logger. "list" keeps
+            every event as a dictionary, "columnar" stores the events in preallocated typed arrays with interned
+            string values, which needs considerably less memory for long runs. "streaming" additionally spills the
+            events in Parquet chunks to ``event_log_directory`` while simulating. "live" folds the events batch-wise
+            into an AnalyticsStore while simulating and drops the raw events, so KPIs can be queried during the run
+            from ``event_logger.store``. Defaults to "list".
+        event_log_directory (Optional[str], optional): Directory for the chunks of the "streaming" event log
+            backend. Defaults to a new temporary directory.
+        live_analytics_batch_size (int, optional): Maximum number of events per batch of the "live" event log
+            backend. Defaults to 10000.
+        live_analytics_interval (Optional[float], optional): Maximum simulated time span of one batch of the "live"
+            event log backend. Defaults to None.
+        compatibility_cache_directory (Optional[str], optional): Directory of a persistent cache for the
+            compatibility tables and transport routes of the process matcher. Runs of a production system with the
+            same structure reuse the cached tables instead of precomputing them. Defaults to None, which disables
+            the cache.
+        transport_compatibility_mode (Literal["eager", "lazy"], optional): "eager" precomputes the transport
+            compatibility between all pairs of transport locations at initialization. "lazy" resolves it the first
+            time a transport between two locations is requested, which is faster for large layouts where most
+            pairs of locations are never used. Defaults to "eager".
+        route_finder_backend (Literal["dijkstra", "csgraph"], optional): Backend for the routes of link transport
+            processes between static locations. "dijkstra" explores and caches all routes from an origin on first
+            use. "csgraph" computes all-pairs shortest paths per process in one batch with scipy and only stores the
+            predecessor matrix, which needs less memory for large node-link networks. Defaults to "dijkstra".
+        transport_route_mode (Literal["hops", "macro"], optional): How transports along routes with multiple links
+            are simulated. "hops" runs and logs one transport step per link. "macro" runs the whole route as one
+            timed transport step with the summed link times and logs it as one interval, which needs far fewer
+            simulation events on large node-link networks when congestion at the nodes is not of interest.
+            Defaults to "hops".
+        finished_product_retention (Optional[int], optional): How many finished product objects are kept by the
+            product factory. None keeps all finished products. An integer N only keeps the last N finished products
+            and releases their process models, so the memory stays bounded in long runs. 0 only keeps the counts of
+            finished products. The event log and KPIs are not affected. Defaults to None.
 
 
     Attributes:
@@ -114,10 +336,28 @@ class Runner:
         ]] = None,
         *,
         strict_schedule_timing: bool = False,
+        event_log_backend: Literal["list", "columnar", "streaming", "live"] = "list",
+        event_log_directory: Optional[str] = None,
+        live_analytics_batch_size: int = 10_000,
+        live_analytics_interval: Optional[float] = None,
+        compatibility_cache_directory: Optional[str] = None,
+        transport_compatibility_mode: Literal["eager", "lazy"] = "eager",
+        route_finder_backend: Literal["dijkstra", "csgraph"] = "dijkstra",
+        transport_route_mode: Literal["hops", "macro"] = "hops",
+        finished_product_retention: Optional[int] = None,
     ):
         """"""
         self.production_system_data = production_system_data
         self.strict_schedule_timing = strict_schedule_timing
+        self.event_log_backend = event_log_backend
+        self.event_log_directory = event_log_directory
+        self.live_analytics_batch_size = live_analytics_batch_size
+        self.live_analytics_interval = live_analytics_interval
+        self.compatibility_cache_directory = compatibility_cache_directory
+        self.transport_compatibility_mode = transport_compatibility_mode
+        self.route_finder_backend = route_finder_backend
+        self.transport_route_mode = transport_route_mode
+        self.finished_product_retention = finished_product_retention
         self.env = sim.Environment(seed=self.production_system_data.seed)
         self.time_model_factory: time_model_factory.TimeModelFactory = None
         self.state_factory: state_factory.StateFactory = None
@@ -142,19 +382,65 @@ class Runner:
         #: so :meth:`run_until_complete` can terminate the moment the
         #: scheduled workload is done.
         self.completion_tracker: Optional[ScheduleCompletionTracker] = None
+        # Compatibility tables of the process matcher by IDs, reused by reset_simulation.
+        self._compatibility_tables: Optional[Dict[str, Any]] = None
 
     def initialize_simulation(self):
         """
         Initializes the simulation by creating the factories and all simulation objects. Needs to be done before running the simulation.
         """
-        # Clear route cache at start of each simulation run to prevent pollution from previous runs
+        self._compatibility_tables = None
+        self._create_simulation(reuse_static_structures=False)
+
+    def reset_simulation(self):
+        """
+        Resets the simulation to its initial state for another run of the same production system, e.g. a new episode
+        of a control environment. In contrast to :meth:`initialize_simulation`, the production system is not validated
+        again and the static structures of the previous run are reused:
+
+        - the time models, which are only reseeded,
+        - the processes, whose dependencies and links are assigned again,
+        - the cached routes and graphs of the link transport processes between static locations,
+        - the compatibility tables and cached transport routes of the process matcher, which are resolved by ID
+          instead of being precomputed.
+
+        All objects that are bound to the simulation environment (states, queues, resources, nodes, products, sources,
+        sinks, primitives, dependencies, routers and the event logger) are created anew. Falls back to
+        :meth:`initialize_simulation` if the simulation was not initialized before.
+
+        The production system must not be changed between the runs. The benchmark
+        `examples/modelling_and_simulation/reset_benchmark.py` compares the resets per second of both methods.
+        """
+        if self.router_factory is None:
+            self.initialize_simulation()
+            return
+        if self._compatibility_tables is None:
+            self._compatibility_tables = (
+                self.router_factory.process_matcher.dump_compatibility_tables()
+            )
+        for time_model in self.time_model_factory.time_models.values():
+            time_model.set_seed(self.production_system_data.seed)
+        self.post_processor = None
+        self._create_simulation(reuse_static_structures=True)
+
+    def _create_simulation(self, reuse_static_structures: bool):
+        """
+        Creates the factories and all simulation objects.
+
+        Args:
+            reuse_static_structures (bool): Whether the validation is skipped and the time models, processes, cached
+                routes and compatibility tables of the previous run are reused.
+        """
         from prodsys.simulation.route_finder import RouteFinder
-        RouteFinder.clear_cache()
-        
-        self.production_system_data.validate_configuration()
+
+        if not reuse_static_structures:
+            # Clear route cache at start of each simulation run to prevent pollution from previous runs
+            RouteFinder.clear_cache()
+            self.production_system_data.validate_configuration()
         with temp_seed(self.production_system_data.seed):
-            self.time_model_factory = time_model_factory.TimeModelFactory()
-            self.time_model_factory.create_time_models(self.production_system_data)
+            if not reuse_static_structures:
+                self.time_model_factory = time_model_factory.TimeModelFactory()
+                self.time_model_factory.create_time_models(self.production_system_data)
 
             self.env = sim.Environment(seed=self.production_system_data.seed)
 
@@ -163,10 +449,13 @@ class Runner:
             )
             self.state_factory.create_states(self.production_system_data)
 
-            self.process_factory = process_factory.ProcessFactory(
-                time_model_factory=self.time_model_factory
-            )
-            self.process_factory.create_processes(self.production_system_data)
+            if not reuse_static_structures:
+                self.process_factory = process_factory.ProcessFactory(
+                    time_model_factory=self.time_model_factory,
+                    route_finder_backend=self.route_finder_backend,
+                    transport_route_mode=self.transport_route_mode,
+                )
+                self.process_factory.create_processes(self.production_system_data)
 
             self.queue_factory = port_factory.QueueFactory(env=self.env)
             self.queue_factory.create_queues(self.production_system_data)
@@ -188,6 +477,7 @@ class Runner:
                 env=self.env,
                 process_factory=self.process_factory,
                 adapter=self.production_system_data,
+                finished_product_retention=self.finished_product_retention,
             )
             for controller in self.resource_factory.controllers:
                 controller.product_factory = self.product_factory
@@ -200,7 +490,7 @@ class Runner:
             self.product_factory.create_product_mockup(self.production_system_data)
             self.sink_factory.create_sinks(self.production_system_data)
 
-            self.event_logger = logger.EventLogger()
+            self.event_logger = self._create_event_logger()
             self.event_logger.observe_resource_states(self.resource_factory)
 
             self.product_factory.event_logger = self.event_logger
@@ -248,6 +538,14 @@ class Runner:
                 )
             )
             link_transport_process_updater_instance.update_links_with_objects()
+            if reuse_static_structures:
+                RouteFinder.rebind_cache(
+                    [
+                        process_instance
+                        for process_instance in self.process_factory.processes.values()
+                        if isinstance(process_instance, process.LinkTransportProcess)
+                    ]
+                )
 
             self.router_factory = router_factory.RouterFactory(
                 env=self.env,
@@ -258,6 +556,9 @@ class Runner:
                 primitive_factory=self.primitive_factory,
                 dependency_factory=self.dependency_factory,
                 production_system_data=self.production_system_data,
+                compatibility_cache_directory=self.compatibility_cache_directory,
+                transport_compatibility_mode=self.transport_compatibility_mode,
+                compatibility_tables=self._compatibility_tables,
             )
             self.router_factory.create_routers()
             global_router = self.router_factory.global_system_router
@@ -279,6 +580,38 @@ class Runner:
             self.env.process(self.primitive_factory.place_primitives_in_queues())
             self.router_factory.start_routers()
 
+    def _create_event_logger(self) -> logger.EventLogger:
+        """
+        Creates the event logger according to the selected event log backend.
+
+        Returns:
+            logger.EventLogger: The event logger.
+        """
+        if self.event_log_backend == "list":
+            return logger.EventLogger()
+        if self.event_log_backend == "columnar":
+            return logger.ColumnarEventLogger()
+        if self.event_log_backend == "streaming":
+            if self.event_log_directory is None:
+                self.event_log_directory = tempfile.mkdtemp(prefix="prodsys_event_log_")
+            return logger.StreamingEventLogger(self.event_log_directory)
+        if self.event_log_backend == "live":
+            sink_queues, source_queues = get_sink_source_queue_names(
+                self.production_system_data
+            )
+            store = AnalyticsStore(
+                exclude_resources=sink_queues | source_queues,
+                production_system_data=self.production_system_data,
+            )
+            return logger.LiveAnalyticsEventLogger(
+                store,
+                batch_size=self.live_analytics_batch_size,
+                batch_interval=self.live_analytics_interval,
+            )
+        raise ValueError(
+            f"Unknown event log backend {self.event_log_backend}, expected 'list', 'columnar', 'streaming' or 'live'."
+        )
+
     def run(self, time_range: int):
         """
         Runs the simulation for the given time range.
@@ -292,6 +625,64 @@ class Runner:
         self.time_range = self.env.now
         self.time_stamp = time.strftime("%Y%m%d-%H%M%S")
 
+    def fork_scenarios(
+        self,
+        scenarios: Dict[str, Optional[Callable[[Runner], None]]],
+        run_length: float,
+        workers: Optional[int] = None,
+        event_log: bool = False,
+    ) -> Dict[str, performance_data.Performance]:
+        """
+        Forks what-if scenarios from the current, e.g. warmed-up, state of the simulation. Every scenario runs in its
+        own worker process that is forked from this process, so it starts from an exact copy of the clock, queues,
+        WIP products with their process models, resource states, pending requests and random number streams without
+        simulating the warm-up again. The scenario callable is applied to the copied runner before it continues, e.g.
+        to change control policies or to add orders. The state of this runner is not changed.
+
+        The simulation state contains running generators of simpy processes, which cannot be pickled, so the snapshot
+        is the copy-on-write memory of the forked worker and requires the "fork" start method of multiprocessing.
+
+        Args:
+            scenarios (Dict[str, Optional[Callable[[Runner], None]]]): Scenarios by name. A callable receives the
+                copied runner before the run is continued, None continues the run unchanged.
+            run_length (float): Time to simulate after the snapshot.
+            workers (Optional[int], optional): Number of worker processes. Defaults to None, which uses the number of
+                CPUs.
+            event_log (bool, optional): Whether the event logs are returned. Defaults to False, which only returns the
+                KPIs. The KPIs cover the time from the snapshot to the end of the scenario, the event logs cover the
+                whole run including the time before the snapshot.
+
+        Raises:
+            RuntimeError: If the "fork" start method is not available on this platform.
+            ValueError: If the runner streams its event log to a directory, which the scenarios would share.
+
+        Returns:
+            Dict[str, performance_data.Performance]: The performance of each scenario.
+        """
+        global _SNAPSHOT
+        if "fork" not in multiprocessing.get_all_start_methods():
+            raise RuntimeError(
+                "Forking scenarios from a simulation snapshot requires the 'fork' start method of multiprocessing."
+            )
+        if isinstance(self.event_logger, logger.StreamingEventLogger):
+            raise ValueError(
+                "Scenarios cannot be forked from a runner with a streaming event log, because they would write to the same directory."
+            )
+        _SNAPSHOT = (self, dict(scenarios))
+        try:
+            # Every worker only runs one scenario, so that each scenario starts from an unchanged copy of the snapshot.
+            with multiprocessing.get_context("fork").Pool(
+                workers, maxtasksperchild=1
+            ) as pool:
+                results = pool.map(
+                    _run_scenario_from_snapshot,
+                    [(name, run_length, event_log) for name in scenarios],
+                    chunksize=1,
+                )
+        finally:
+            _SNAPSHOT = None
+        return dict(zip(scenarios, results))
+
     def run_until_complete(
         self,
         time_range_max: float,
@@ -389,13 +780,34 @@ class Runner:
             post_processing.PostProcessor: The post processor to process the simulation results.
         """
         if not self.post_processor:
-            self.post_processor = PostProcessor(
-                production_system_data=self.production_system_data,
-                df_raw=self.event_logger.get_data_as_dataframe(),
-                time_range=self.time_range,
-                warm_up_cutoff=self.warm_up_cutoff,
-                cut_off_method=self.cut_off_method,
-            )
+            if isinstance(self.event_logger, logger.LiveAnalyticsEventLogger):
+                # The events were already folded into the store while simulating.
+                self.event_logger.flush()
+                self.post_processor = PostProcessor.from_store(
+                    self.event_logger.store,
+                    production_system_data=self.production_system_data,
+                    time_range=self.time_range,
+                    warm_up_cutoff=self.warm_up_cutoff,
+                    cut_off_method=self.cut_off_method,
+                )
+            elif isinstance(self.event_logger, logger.StreamingEventLogger):
+                # Read the streamed chunks lazily instead of materializing the full event log.
+                self.event_logger.flush()
+                self.post_processor = PostProcessor(
+                    filepath=self.event_logger.directory,
+                    production_system_data=self.production_system_data,
+                    time_range=self.time_range,
+                    warm_up_cutoff=self.warm_up_cutoff,
+                    cut_off_method=self.cut_off_method,
+                )
+            else:
+                self.post_processor = PostProcessor(
+                    production_system_data=self.production_system_data,
+                    df_raw=self.event_logger.get_data_as_dataframe(),
+                    time_range=self.time_range,
+                    warm_up_cutoff=self.warm_up_cutoff,
+                    cut_off_method=self.cut_off_method,
+                )
         return self.post_processor
 
     def print_results(self):
@@ -497,6 +909,9 @@ class Runner:
 
         Returns:
             List[performance_data.Event]: The event data of the simulation.
+
+        Raises:
+            ValueError: If the event log backend does not keep the raw events, i.e. for the "live" backend.
         """
         p = self.get_post_processor()
         df_raw = self.event_logger.get_data_as_dataframe()
@@ -536,14 +951,21 @@ class Runner:
         return events
 
     def get_performance_data(
-        self, dynamic_data: bool = False, event_log: bool = True
+        self, dynamic_data: bool = False, event_log: Optional[bool] = None
     ) -> performance_data.Performance:
         """
         Returns the performance data of the simulation.
 
+        Args:
+            dynamic_data (bool, optional): Whether the KPIs over time are included. Defaults to False.
+            event_log (Optional[bool], optional): Whether the event log is included. Defaults to None, which includes
+                the event log unless the event log backend drops the raw events ("live").
+
         Returns:
             performance_data.Performance: The performance data of the simulation.
         """
+        if event_log is None:
+            event_log = self._keeps_raw_events()
         p = self.get_post_processor()
         kpis = []
         kpis += p.WIP_KPIs
@@ -569,12 +991,18 @@ class Runner:
         Returns:
             dict: The aggregated simulation results.
         """
+        if not self._keeps_raw_events():
+            return self.get_post_processor().get_aggregated_data()
         p = PostProcessor(df_raw=self.event_logger.get_data_as_dataframe())
         return p.get_aggregated_data()
 
+    def _keeps_raw_events(self) -> bool:
+        return not isinstance(self.event_logger, logger.LiveAnalyticsEventLogger)
+
     def save_results_as_csv(self, save_folder="data"):
         """
         Saves the simulation results as .csv-file marked with the time_stamp of simulation and the adapter ID if available.
+        The "live" event log backend does not keep the raw events, so the KPIs of its analytics store are saved instead.
 
         Args:
             save_folder (str, optional): The folder to save the results to. Defaults to "data".
@@ -584,11 +1012,18 @@ class Runner:
         if self.production_system_data.ID:
             save_name = f"{self.production_system_data.ID}_"
         save_name += self.time_stamp
+        if not self._keeps_raw_events():
+            kpis = self.get_performance_data(event_log=False).kpis
+            pd.DataFrame([kpi.model_dump(mode="json") for kpi in kpis]).to_csv(
+                f"{save_folder}/{save_name}.csv"
+            )
+            return
         self.event_logger.log_data_to_csv(filepath=f"{save_folder}/{save_name}.csv")
 
     def save_results_as_json(self, save_folder="data"):
         """
         Saves the simulation results as .json-file marked with the time_stamp of simulation and the adapter ID if available.
+        The "live" event log backend does not keep the raw events, so the KPIs of its analytics store are saved instead.
 
         Args:
             save_folder (str, optional): The folder to save the results to. Defaults to "data".
@@ -598,4 +1033,10 @@ class Runner:
         if self.production_system_data.ID:
             save_name = f"{self.production_system_data.ID}_"
         save_name += self.time_stamp
+        if not self._keeps_raw_events():
+            with open(f"{save_folder}/{save_name}.json", "w") as json_file:
+                json_file.write(
+                    self.get_performance_data(event_log=False).model_dump_json(indent=4)
+                )
+            return
         self.event_logger.log_data_to_json(filepath=f"{save_folder}/{save_name}.json")
@@ -27,6 +27,8 @@ import logging
 from collections import Counter
 from typing import TYPE_CHECKING, Optional
 
+from prodsys.models.schedule_data import ColumnarScheduleEvents
+
 if TYPE_CHECKING:
     from prodsys.models.production_system_data import ProductionSystemData
     from prodsys.simulation.entities.product import Product
@@ -83,11 +85,15 @@ class ScheduleCompletionTracker:
         if ps_data is None or not getattr(ps_data, "schedule", None):
             return
 
-        scheduled_product_ids = {
-            event.product
-            for event in ps_data.schedule
-            if getattr(event, "product", None)
-        }
+        if isinstance(ps_data.schedule, ColumnarScheduleEvents):
+            # Read the product column directly instead of creating an event per row.
+            scheduled_product_ids = ps_data.schedule.columnar_schedule.get_unique_ids("Product")
+        else:
+            scheduled_product_ids = {
+                event.product
+                for event in ps_data.schedule
+                if getattr(event, "product", None)
+            }
         if not scheduled_product_ids:
             return
 
@@ -6,6 +6,7 @@ from collections import defaultdict, deque
 from typing import Deque, Optional
 
 from prodsys.models import performance_data
+from prodsys.models.schedule_data import ColumnarScheduleEvents, get_events_of_data
 from prodsys.simulation import request as request_module
 
 DependencyMoveKey = tuple[str, str, str | None, str | None]
@@ -47,7 +48,21 @@ def build_dependency_move_schedule_index(
     if not schedule:
         return match_indices, route_entries, ordered, routing_by_key
 
-    for index, event in enumerate(schedule):
+    if isinstance(schedule, ColumnarScheduleEvents):
+        # Only create the events of the empty transports, which are few compared to the whole schedule.
+        data = schedule.columnar_schedule.data
+        if "Empty Transport" not in data.columns:
+            return match_indices, route_entries, ordered, routing_by_key
+        mask = (
+            (data["Activity"] == "start state")
+            & (data["State Type"] == "Transport")
+            & data["Empty Transport"].eq(True)
+        )
+        indexed_events = zip(data.index[mask], get_events_of_data(data[mask]))
+    else:
+        indexed_events = enumerate(schedule)
+
+    for index, event in indexed_events:
         if event.activity != "start state":
             continue
         if event.state_type != "Transport":
@@ -70,7 +70,12 @@ class Sink:
         """
         router = self.product_factory.router
 
-        self.product_factory.router.primitive_factory.primitives.append(product)
+        # With a bounded retention, only products that are reused as primitives are kept.
+        if (
+            self.product_factory.finished_product_retention is None
+            or product.data.becomes_consumable
+        ):
+            self.product_factory.router.primitive_factory.primitives.append(product)
         if(product.data.becomes_consumable):    
             if self.product_factory.router:
                 if product.data.type not in router.free_primitives_by_type:
@@ -78,9 +83,7 @@ class Sink:
                 router.free_primitives_by_type[product.data.type].append(product)
                 # Notify all resources that might be waiting for this primitive type
                 # This allows controllers to recheck feasibility of pending requests
-                for resource in router.resources:
-                    if resource.controller and not resource.controller.state_changed.triggered:
-                        resource.controller.state_changed.succeed()
+                router.trigger_resources()
                 if not router.got_primitive_request.triggered:
                     router.got_primitive_request.succeed()
 
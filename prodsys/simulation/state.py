@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Literal, Optional, Union, TYPE_CHECKING, Generator, List
+from typing import Callable, Literal, Optional, Sequence, Union, TYPE_CHECKING, Generator, List
 
 import logging
 
@@ -77,7 +77,34 @@ class StateTypeEnum(str, Enum):
     waiting_for_transport = "WaitingForTransport"
 
 
-class StateInfo:
+class ObservableInfo:
+    """
+    Base class for the event information of states, products and dependencies. After every logged event, the info
+    object calls its observers with itself as argument.
+
+    The observers are no per-object callbacks: a logger assigns one shared list of observers to all info objects it
+    observes, so observing an entity does not allocate anything and logging an event costs a single loop.
+
+    Attributes:
+        observers (Sequence[Callable[[ObservableInfo], None]]): The observers that are called after every logged event.
+    """
+
+    observers: Sequence[Callable[[ObservableInfo], None]] = ()
+
+    def add_observers(self, observers: List[Callable[[ObservableInfo], None]]):
+        """
+        Adds observers to the info object. The list is shared and not copied if the info object has no other observers.
+
+        Args:
+            observers (List[Callable[[ObservableInfo], None]]): The observers to add.
+        """
+        if not self.observers:
+            self.observers = observers
+        elif self.observers is not observers:
+            self.observers = [*self.observers, *observers]
+
+
+class StateInfo(ObservableInfo):
     """
     Class that represents the current event information of a state while simulating.
 
@@ -190,6 +217,8 @@ class StateInfo:
         self._expected_end_time = expected_end_time
         self._activity = StateEnum.start_state
         self._state_type = state_type
+        for observer in self.observers:
+            observer(self)
 
     def log_start_interrupt_state(self, start_time: float, state_type: StateTypeEnum):
         """
@@ -202,6 +231,8 @@ class StateInfo:
         self._event_time = start_time
         self._activity = StateEnum.start_interrupt
         self._state_type = state_type
+        for observer in self.observers:
+            observer(self)
 
     def log_end_interrupt_state(
         self, end_time: float, expected_end_time: float, state_type: StateTypeEnum
@@ -218,6 +249,8 @@ class StateInfo:
         self._expected_end_time = expected_end_time
         self._activity = StateEnum.end_interrupt
         self._state_type = state_type
+        for observer in self.observers:
+            observer(self)
 
     def log_end_state(self, end_time: float, state_type: StateTypeEnum, process_ok: bool = True):
         """
@@ -232,6 +265,8 @@ class StateInfo:
         self._activity = StateEnum.end_state
         self._state_type = state_type
         self._process_ok = process_ok
+        for observer in self.observers:
+            observer(self)
 
 
 class State(ABC):
@@ -257,11 +292,32 @@ class State(ABC):
         self.data = data
         self.time_model = time_model
         self.env = env
+        self.slot_pool: Optional[resources.ProcessStatePool] = None
         self.process: Optional[events.Process] = None
         self.active = events.Event(self.env)
         self.resource = None
         self.reserved = False
 
+    @property
+    def process(self) -> Optional[events.Process]:
+        return self._process
+
+    @process.setter
+    def process(self, value: Optional[events.Process]) -> None:
+        self._process = value
+        if self.slot_pool is not None:
+            self.slot_pool.update(self)
+
+    @property
+    def reserved(self) -> bool:
+        return self._reserved
+
+    @reserved.setter
+    def reserved(self, value: bool) -> None:
+        self._reserved = value
+        if self.slot_pool is not None:
+            self.slot_pool.update(self)
+
     def set_resource(self, resource_model: resources.Resource) -> None:
         """
         Sets the resource of the state.
@@ -468,28 +524,59 @@ class TransportState(State):
 
         return time_model.get_next_time() if time_model else 0
 
-    def process_state(
+    def get_transport_time(
         self,
+        origin: List[float],
         target: List[float],
         empty_transport: bool,
         initial_transport_step: bool,
         last_transport_step: bool,
-    ) -> Generator:
-        self.done_in = self.time_model.get_next_time(
-            origin=self.resource.get_location(), target=target
-        )
+    ) -> float:
+        """
+        Returns the time of a transport step including reaction, loading and unloading times.
+
+        Args:
+            origin (List[float]): The origin location of the transport step.
+            target (List[float]): The target location of the transport step.
+            empty_transport (bool): If the transport is empty.
+            initial_transport_step (bool): If this is the initial transport step.
+            last_transport_step (bool): If this is the last transport step.
+
+        Returns:
+            float: The time of the transport step.
+        """
+        transport_time = self.time_model.get_next_time(origin=origin, target=target)
         if (
             initial_transport_step
             and hasattr(self.time_model, "reaction_time")
             and self.time_model.data.reaction_time
         ):
-            self.done_in += self.time_model.data.reaction_time
+            transport_time += self.time_model.data.reaction_time
         if self.loading_time_model and initial_transport_step and not empty_transport:
             self.loading_time = self.get_handling_time("loading")
-            self.done_in += self.loading_time
+            transport_time += self.loading_time
         if self.unloading_time_model and last_transport_step and not empty_transport:
             self.unloading_time = self.get_handling_time("unloading")
-            self.done_in += self.unloading_time
+            transport_time += self.unloading_time
+        return transport_time
+
+    def process_state(
+        self,
+        target: List[float],
+        empty_transport: bool,
+        initial_transport_step: bool,
+        last_transport_step: bool,
+        time: Optional[float] = None,
+    ) -> Generator:
+        if time is None:
+            time = self.get_transport_time(
+                self.resource.get_location(),
+                target,
+                empty_transport,
+                initial_transport_step,
+                last_transport_step,
+            )
+        self.done_in = time
         self.resource.consider_battery_usage(self.done_in)
 
         while True:
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
 import copy
 import itertools
-from typing import Callable, Iterator, List, Optional, Tuple, Union
+import math
+import zlib
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 from typing_extensions import deprecated
 
 import numpy as np
@@ -13,12 +15,14 @@ from prodsys.models.time_model_data import (
     DistanceTimeModelData,
     TIME_MODEL_DATA,
 )
-from prodsys.util.statistical_functions import FUNCTION_DICT, FunctionTimeModelEnum
+from prodsys.util.statistical_functions import SAMPLE_FUNCTION_DICT, FunctionTimeModelEnum
 
 
 class TimeModel(ABC):
     """
-    Abstract base class for time models.
+    Abstract base class for time models. Every time model owns a random number generator, whose stream only depends
+    on the seed and the ID of the time model. Thereby, time models keep their random streams when other time models
+    are added or removed, which gives common random numbers when comparing configurations.
     """
 
     def __init__(self, data: TIME_MODEL_DATA):
@@ -29,6 +33,49 @@ class TimeModel(ABC):
             time_model_data (TIME_MODEL_DATA): The time model data object.
         """
         self.data = data
+        self.set_seed(0)
+
+    def set_seed(self, seed: int) -> None:
+        """
+        Seeds the random number generator of the time model and discards already sampled values.
+
+        Args:
+            seed (int): The seed of the simulation run.
+        """
+        self.seed_sequence = np.random.SeedSequence(
+            [seed, zlib.crc32(self.data.ID.encode("utf-8"))]
+        )
+        self.rng = np.random.default_rng(self.seed_sequence)
+        self._reset_buffer()
+
+    def _reset_buffer(self) -> None:
+        """
+        Discards the sampled values of the time model. Time models that sample values in blocks override this.
+        """
+        pass
+
+    _shared_attributes: Tuple[str, ...] = ("data",)
+    """
+    Attributes that are read-only after initialization and are shared instead of copied by deepcopy.
+    """
+
+    def __deepcopy__(self, memo: dict) -> "TimeModel":
+        # Copies get an independent child stream, so that e.g. the production states of one resource do not draw
+        # the same values.
+        cls = self.__class__
+        result = cls.__new__(cls)
+        memo[id(self)] = result
+        for k, v in self.__dict__.items():
+            if k in ("seed_sequence", "rng"):
+                continue
+            if k in self._shared_attributes:
+                setattr(result, k, v)
+                continue
+            setattr(result, k, copy.deepcopy(v, memo))
+        result.seed_sequence = self.seed_sequence.spawn(1)[0]
+        result.rng = np.random.default_rng(result.seed_sequence)
+        result._reset_buffer()
+        return result
 
     @abstractmethod
     def get_next_time(
@@ -66,15 +113,38 @@ class TimeModel(ABC):
         """
         pass
 
+    def get_expected_times(
+        self,
+        origins: Sequence[List[float]],
+        targets: Sequence[List[float]],
+    ) -> np.ndarray:
+        """
+        Returns the expected times of the time model for multiple pairs of origins and targets.
+
+        Args:
+            origins (Sequence[List[float]]): The origins of the transports.
+            targets (Sequence[List[float]]): The targets of the transports.
+
+        Returns:
+            np.ndarray: The expected times, one per pair of origin and target.
+        """
+        return np.array(
+            [
+                self.get_expected_time(origin, target)
+                for origin, target in zip(origins, targets)
+            ],
+            dtype=float,
+        )
+
 
 class FunctionTimeModel(TimeModel):
     """
-    Class for time models that are based on a function.
+    Class for time models that are based on a function. Values are sampled in blocks of `batch_size` from the random
+    number generator of the time model and served through a cursor.
 
     Args:
         time_model_data (FunctionTimeModelData): The time model data object.
         statistics_buffer (List[float], optional): A buffer for the statistics. Defaults to [].
-        distribution_function_object (Callable[[FunctionTimeModelData], List[float]], optional): The distribution function object. Defaults to FUNCTION_DICT[FunctionTimeModelEnum.Constant].
     """
 
     def __init__(
@@ -88,8 +158,6 @@ class FunctionTimeModel(TimeModel):
             time_model_data (FunctionTimeModelData): The time model data object.
         """
         super().__init__(time_model_data)
-        self.statistics_buffer = []
-        self._fill_buffer()
 
     def get_next_time(
         self,
@@ -102,27 +170,24 @@ class FunctionTimeModel(TimeModel):
         Returns:
             float: The next time of the time model.
         """
-        try:
-            value = self.statistics_buffer.pop()
-            if value < 0:
-                return 0.1
-            return value
-        except IndexError:
+        if self._buffer_index >= len(self.statistics_buffer):
             self._fill_buffer()
-            return self.get_next_time()
+        value = self.statistics_buffer[self._buffer_index]
+        self._buffer_index += 1
+        if value < 0:
+            return 0.1
+        return value
 
-    def _fill_buffer(self):
-        distribution_function = FUNCTION_DICT[self.data.distribution_function]
-        self.statistics_buffer = distribution_function(self.data)
+    def _reset_buffer(self) -> None:
+        self.statistics_buffer: List[float] = []
+        self._buffer_index = 0
 
-    def __deepcopy__(self, memo: dict) -> "FunctionTimeModel":
-        cls = self.__class__
-        result = cls.__new__(cls)
-        memo[id(self)] = result
-        for k, v in self.__dict__.items():
-            setattr(result, k, copy.deepcopy(v, memo))
-        result._fill_buffer()
-        return result
+    def _fill_buffer(self):
+        sample_function = SAMPLE_FUNCTION_DICT[self.data.distribution_function]
+        self.statistics_buffer = sample_function(
+            self.data, self.rng, self.data.batch_size
+        ).tolist()
+        self._buffer_index = 0
 
     def get_expected_time(
         self,
@@ -146,6 +211,11 @@ class SampleTimeModel(TimeModel):
         time_model_data (SampleTimeModelData): The time model data object.
     """
 
+    buffer_size: int = 100
+    """
+    Number of samples that are drawn at once from the random number generator.
+    """
+
     def __init__(self, time_model_data: SampleTimeModelData):
         """
         Initializes the sample time model with the given time model data.
@@ -166,7 +236,18 @@ class SampleTimeModel(TimeModel):
         Returns:
             float: The next time of the time model.
         """
-        return np.random.choice(self.data.samples, 1)[0]
+        if self._buffer_index >= len(self.sample_buffer):
+            self.sample_buffer = self.rng.choice(
+                self.data.samples, self.buffer_size
+            ).tolist()
+            self._buffer_index = 0
+        value = self.sample_buffer[self._buffer_index]
+        self._buffer_index += 1
+        return value
+
+    def _reset_buffer(self) -> None:
+        self.sample_buffer: List[float] = []
+        self._buffer_index = 0
 
     def get_expected_time(
         self,
@@ -260,10 +341,17 @@ class DistanceTimeModel(TimeModel):
     """
     Class for time models that are based on a distance between two points and time calculation based on reaction time and speed and distance metric.
 
+    The travel times between the static locations of a production system can be precomputed in a matrix with
+    :meth:`precompute_travel_times`, so that a time is looked up instead of calculated. Times between other locations,
+    e.g. of moving products or transport resources, are calculated on every use and not cached, so that the lookup
+    does not grow with the number of visited positions.
+
     Args:
         time_model_data (DistanceTimeModelData): The time model data object.
     """
 
+    _shared_attributes = ("data", "location_indices", "travel_times")
+
     def __init__(self, time_model_data: DistanceTimeModelData):
         """
         Initializes the distance time model with the given time model data.
@@ -272,6 +360,37 @@ class DistanceTimeModel(TimeModel):
             time_model_data (DistanceTimeModelData): The time model data object.
         """
         super().__init__(time_model_data)
+        self.location_indices: Dict[Tuple[float, ...], int] = {}
+        self.travel_times: np.ndarray = np.zeros((0, 0))
+
+    def precompute_travel_times(self, locations: Iterable[List[float]]) -> None:
+        """
+        Precomputes the travel times between all pairs of the given locations in one vectorised calculation.
+
+        Args:
+            locations (Iterable[List[float]]): The locations, e.g. of all resources, sources, sinks and nodes.
+        """
+        unique_locations = list(dict.fromkeys(tuple(location) for location in locations))
+        self.location_indices = {
+            location: index for index, location in enumerate(unique_locations)
+        }
+        if not unique_locations:
+            self.travel_times = np.zeros((0, 0))
+            return
+        points = np.array(unique_locations, dtype=float)
+        self.travel_times = self._calculate_travel_times(
+            points[:, np.newaxis, :], points[np.newaxis, :, :]
+        )
+
+    def _calculate_travel_times(self, origins: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        differences = origins - targets
+        if self.data.metric == "euclidean":
+            distances = np.sqrt(np.sum(differences * differences, axis=-1))
+        elif self.data.metric == "manhattan":
+            distances = np.sum(np.abs(differences), axis=-1)
+        else:
+            raise ValueError(f"Unknown distance metric: {self.data.metric}")
+        return distances / self.data.speed + self.data.reaction_time
 
     def calculate_distance(self, origin: List[float], target: List[float]) -> float:
         """
@@ -285,9 +404,9 @@ class DistanceTimeModel(TimeModel):
             float: The distance between the two points.
         """
         if self.data.metric == "euclidean":
-            return np.linalg.norm(np.array(origin) - np.array(target))
+            return math.dist(origin, target)
         elif self.data.metric == "manhattan":
-            return np.sum(np.abs(np.array(origin) - np.array(target)))
+            return sum(abs(o - t) for o, t in zip(origin, target))
         else:
             raise ValueError(f"Unknown distance metric: {self.data.metric}")
 
@@ -308,6 +427,10 @@ class DistanceTimeModel(TimeModel):
         """
         if origin is None or target is None:
             raise ValueError("Origin and target must be defined for DistanceTimeModel")
+        origin_index = self.location_indices.get(tuple(origin))
+        target_index = self.location_indices.get(tuple(target))
+        if origin_index is not None and target_index is not None:
+            return float(self.travel_times[origin_index, target_index])
         distance = self.calculate_distance(origin, target)
         return distance / self.data.speed + self.data.reaction_time
 
@@ -328,6 +451,31 @@ class DistanceTimeModel(TimeModel):
         """
         return self.get_next_time(origin, target)
 
+    def get_expected_times(
+        self,
+        origins: Sequence[List[float]],
+        targets: Sequence[List[float]],
+    ) -> np.ndarray:
+        """
+        Returns the expected times for multiple pairs of origins and targets in one vectorised lookup.
+
+        Args:
+            origins (Sequence[List[float]]): The origins of the transports.
+            targets (Sequence[List[float]]): The targets of the transports.
+
+        Returns:
+            np.ndarray: The expected times, one per pair of origin and target.
+        """
+        location_indices = self.location_indices
+        origin_indices = [location_indices.get(tuple(origin)) for origin in origins]
+        target_indices = [location_indices.get(tuple(target)) for target in targets]
+        if None not in origin_indices and None not in target_indices:
+            return self.travel_times[origin_indices, target_indices]
+        return np.array(
+            [self.get_next_time(origin, target) for origin, target in zip(origins, targets)],
+            dtype=float,
+        )
+
 
 TIME_MODEL = Union[
     SampleTimeModel,
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass, field
 from functools import cached_property
 
 from prodsys.models.production_system_data import ProductionSystemData
 from prodsys.models.resource_data import SystemResourceData
-from prodsys.simulation import state
+from prodsys.simulation import state, logger as event_logger
 from prodsys.models import performance_indicators
 
 from typing import List, Literal, Optional
@@ -21,6 +22,31 @@ from prodsys.analytics.warm_up import detect_warm_up
 logger = logging.getLogger(__name__)
 
 
+def get_sink_source_queue_names(
+    production_system_data: Optional[ProductionSystemData],
+) -> tuple[set, set]:
+    """
+    Returns the IDs of the sink input queues and source output queues, which are excluded from the resource analytics.
+
+    Args:
+        production_system_data (Optional[ProductionSystemData]): The production system.
+
+    Returns:
+        tuple[set, set]: The sink input queue IDs and the source output queue IDs.
+    """
+    sink_input_queues = set()
+    source_output_queues = set()
+    if production_system_data is None:
+        return sink_input_queues, source_output_queues
+    for sink_data in production_system_data.sink_data:
+        if sink_data.ports:
+            sink_input_queues.update(sink_data.ports)
+    for source_data in production_system_data.source_data:
+        if source_data.ports:
+            source_output_queues.update(source_data.ports)
+    return sink_input_queues, source_output_queues
+
+
 @dataclass
 class PostProcessor:
     """
@@ -38,7 +64,7 @@ class PostProcessor:
         -Target location: Target location of the product at the end of the process
 
     Args:
-        filepath (str): Path to the csv file with the simulation results.
+        filepath (str): Path to the csv file with the simulation results or to the directory of a streamed event log.
         df_raw (pd.DataFrame): Data frame with the simulation results.
     """
 
@@ -54,15 +80,60 @@ class PostProcessor:
     _sink_input_queues: Optional[set] = field(default=None, init=False, repr=False)
     _source_output_queues: Optional[set] = field(default=None, init=False, repr=False)
     _store: Optional[AnalyticsStore] = field(default=None, init=False, repr=False)
+    _event_log_directory: Optional[str] = field(default=None, init=False, repr=False)
+    _store_is_external: bool = field(default=False, init=False, repr=False)
 
     def __post_init__(self):
         if self.filepath:
+            # read_df_from_csv initializes the analytics store itself.
             self.read_df_from_csv()
-        self._initialize_analytics()
+        else:
+            self._initialize_analytics()
+
+    @classmethod
+    def from_store(
+        cls,
+        store: AnalyticsStore,
+        production_system_data: Optional[ProductionSystemData] = None,
+        time_range: Optional[float] = None,
+        warm_up_cutoff: bool = False,
+        cut_off_method: Optional[Literal["mser5", "threshold_stabilization", "static_ratio"]] = None,
+    ) -> PostProcessor:
+        """
+        Creates a post processor for an AnalyticsStore that already ingested the events, e.g. while simulating.
+
+        Args:
+            store (AnalyticsStore): The store with the ingested events.
+            production_system_data (Optional[ProductionSystemData], optional): The simulated production system. Defaults to None.
+            time_range (Optional[float], optional): The simulated time range. Defaults to None.
+            warm_up_cutoff (bool, optional): Whether to use warm-up cutoff. Defaults to False.
+            cut_off_method (Optional[Literal["mser5", "threshold_stabilization", "static_ratio"]], optional): The method to use for warm-up cutoff. Defaults to None.
+
+        Returns:
+            PostProcessor: The post processor using the store.
+        """
+        post_processor = cls(
+            warm_up_cutoff=warm_up_cutoff,
+            cut_off_method=cut_off_method,
+        )
+        post_processor.production_system_data = production_system_data
+        post_processor.time_range = time_range
+        post_processor._store = store
+        post_processor._store_is_external = True
+        if time_range is not None:
+            store.set_time_range(time_range)
+        return post_processor
+
+    def _has_events(self) -> bool:
+        return (
+            self.df_raw is not None
+            or self._event_log_directory is not None
+            or self._store_is_external
+        )
 
     def _initialize_analytics(self):
         """Initialize the v2 AnalyticsStore."""
-        if self.df_raw is not None:
+        if self._has_events():
             exclude = set()
             sink_queues, source_queues = self._get_sink_source_queue_names()
             exclude.update(sink_queues)
@@ -72,7 +143,12 @@ class PostProcessor:
                 exclude_resources=exclude,
                 production_system_data=self.production_system_data,
             )
-            self._store.ingest_events(self.df_raw)
+            if self.df_raw is not None:
+                self._store.ingest_events(self.df_raw)
+            else:
+                self._store.ingest_event_chunks(
+                    event_logger.iter_event_log_chunks(self._event_log_directory)
+                )
         elif self.production_system_data is not None:
             self._store = AnalyticsStore(
                 time_range=self.time_range,
@@ -118,7 +194,7 @@ class PostProcessor:
         # F3: reuse the already-ingested store; only metadata-derived state
         # (model reference + queue excludes) changes. Fall back to a full build
         # if the store has not been created yet.
-        if self._store is not None and self.df_raw is not None:
+        if self._store is not None and self._has_events():
             sink_queues, source_queues = self._get_sink_source_queue_names()
             self._store.update_metadata(
                 production_system_data=production_system_data,
@@ -141,7 +217,7 @@ class PostProcessor:
         self._source_output_queues = source_output_queues
         self._invalidate_cached_properties()
         # F3: queue names only affect the exclude set; reuse the ingested store.
-        if self._store is not None and self.df_raw is not None:
+        if self._store is not None and self._has_events():
             self._store.update_metadata(
                 queue_excludes=set(sink_input_queues) | set(source_output_queues),
             )
@@ -162,21 +238,25 @@ class PostProcessor:
     def _get_sink_source_queue_names(self) -> tuple[set, set]:
         if self._sink_input_queues is not None and self._source_output_queues is not None:
             return self._sink_input_queues, self._source_output_queues
-        sink_input_queues = set()
-        source_output_queues = set()
-        if self.production_system_data is None:
-            return sink_input_queues, source_output_queues
-        for sink_data in self.production_system_data.sink_data:
-            if sink_data.ports:
-                sink_input_queues.update(sink_data.ports)
-        for source_data in self.production_system_data.source_data:
-            if source_data.ports:
-                source_output_queues.update(source_data.ports)
-        return sink_input_queues, source_output_queues
+        return get_sink_source_queue_names(self.production_system_data)
 
     def read_df_from_csv(self, filepath_input: str = None):
+        """
+        Reads the raw simulation results. If the file path is a directory of a streamed event log, the chunks are
+        ingested lazily into the analytics store and ``df_raw`` stays unset, so the log never has to fit into memory.
+
+        Args:
+            filepath_input (str, optional): Path to the csv file or the event log directory. Defaults to the filepath of the post processor.
+        """
         if filepath_input:
             self.filepath = filepath_input
+        if os.path.isdir(self.filepath):
+            self.df_raw = None
+            self._event_log_directory = self.filepath
+            self._invalidate_cached_properties()
+            self._initialize_analytics()
+            return
+        self._event_log_directory = None
         self.df_raw = pd.read_csv(self.filepath)
         self.df_raw.drop(columns=["Unnamed: 0"], inplace=True)
         self._invalidate_cached_properties()
@@ -423,27 +503,57 @@ class PostProcessor:
 
     # ── Primitive WIP ────────────────────────────────────────────────────
 
+    @cached_property
+    def df_primitive_events(self) -> Optional[pd.DataFrame]:
+        """
+        Raw events used for the primitive WIP. Streamed event logs are read chunk-wise and only the events of
+        primitives are kept.
+
+        Raises:
+            ValueError: If the production system has primitives but the raw events were only ingested into an
+                external analytics store, e.g. by the "live" event log backend.
+        """
+        if self.df_raw is not None:
+            return self.df_raw
+        if self._event_log_directory is not None:
+            chunks = [
+                chunk[chunk["Primitive_type"].notna()]
+                for chunk in event_logger.iter_event_log_chunks(self._event_log_directory)
+                if "Primitive_type" in chunk.columns
+            ]
+            return pd.concat(chunks, ignore_index=True) if chunks else None
+        if self._store_is_external and (
+            self.production_system_data is None or self.production_system_data.primitive_data
+        ):
+            raise ValueError(
+                "The primitive WIP requires the raw events, which are not kept by the analytics store. "
+                "Use the 'columnar' or 'streaming' event log backend to analyze primitives."
+            )
+        return None
+
     def get_primitive_types(self) -> List[str]:
-        if self.df_raw is None:
+        df_primitive_events = self.df_primitive_events
+        if df_primitive_events is None:
             return []
-        if "Primitive_type" not in self.df_raw.columns:
+        if "Primitive_type" not in df_primitive_events.columns:
             return []
-        return self.df_raw["Primitive_type"].dropna().unique().tolist()
+        return df_primitive_events["Primitive_type"].dropna().unique().tolist()
 
     @cached_property
     def df_primitive_WIP(self) -> pd.DataFrame:
-        return self._compute_primitive_wip(self.df_raw)
+        return self._compute_primitive_wip(self.df_primitive_events)
 
     @cached_property
     def df_primitive_WIP_per_primitive_type(self) -> pd.DataFrame:
-        if self.df_raw is None:
+        df_primitive_events = self.df_primitive_events
+        if df_primitive_events is None:
             return pd.DataFrame()
         primitive_types = self.get_primitive_types()
         if not primitive_types:
             return pd.DataFrame()
         result_dfs = []
         for pt in primitive_types:
-            df_pt = self.df_raw[self.df_raw.get("Primitive_type") == pt].copy()
+            df_pt = df_primitive_events[df_primitive_events.get("Primitive_type") == pt].copy()
             df_pt = self._compute_primitive_wip(df_pt)
             if len(df_pt) > 0:
                 result_dfs.append(df_pt)
@@ -830,14 +940,16 @@ class PostProcessor:
         """
         from prodsys.simulation.state import StateTypeEnum
 
+        t_start = self.store.simulation_start_time
         t_end = self.store.simulation_end_time
+        resource_time = t_end - t_start
         productive_types = frozenset({
             StateTypeEnum.production.value,
             StateTypeEnum.transport.value,
         })
         rows = []
         for sys_id, sub_ids in system_mapping.items():
-            ri = self.store.resource_intervals(0.0, t_end)
+            ri = self.store.resource_intervals(t_start, t_end)
             sub_ri = ri[
                 (ri["entity_id"].isin(sub_ids))
                 & (ri["state_type"].isin(productive_types))
@@ -846,13 +958,13 @@ class PostProcessor:
             if len(sub_ri) == 0:
                 rows.append({
                     "Resource": sys_id, "Time_type": "SB",
-                    "time_increment": t_end, "resource_time": t_end,
+                    "time_increment": resource_time, "resource_time": resource_time,
                     "percentage": 100.0,
                 })
                 continue
 
             # Merge overlapping productive intervals across subresources
-            intervals = sub_ri[["t_start", "t_end"]].values.tolist()
+            intervals = sub_ri[["t_start", "t_end"]].clip(lower=t_start, upper=t_end).values.tolist()
             intervals.sort(key=lambda x: x[0])
             merged = [[intervals[0][0], intervals[0][1]]]
             for s, e in intervals[1:]:
@@ -861,19 +973,19 @@ class PostProcessor:
                 else:
                     merged.append([s, e])
             pr_time = sum(e - s for s, e in merged)
-            sb_time = max(0.0, t_end - pr_time)
+            sb_time = max(0.0, resource_time - pr_time)
 
             if pr_time > 0:
                 rows.append({
                     "Resource": sys_id, "Time_type": "PR",
-                    "time_increment": pr_time, "resource_time": t_end,
-                    "percentage": pr_time / t_end * 100,
+                    "time_increment": pr_time, "resource_time": resource_time,
+                    "percentage": pr_time / resource_time * 100,
                 })
             if sb_time > 0:
                 rows.append({
                     "Resource": sys_id, "Time_type": "SB",
-                    "time_increment": sb_time, "resource_time": t_end,
-                    "percentage": sb_time / t_end * 100,
+                    "time_increment": sb_time, "resource_time": resource_time,
+                    "percentage": sb_time / resource_time * 100,
                 })
         if not rows:
             return pd.DataFrame(columns=["Resource", "Time_type", "time_increment", "resource_time", "percentage"])
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+from pathfinding.core.graph import GraphNode
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import shortest_path
+
+
+class ShortestPathMatrix:
+    """
+    All-pairs shortest paths of a static, bi-directional graph. The paths are computed in one batch with the
+    Dijkstra implementation of scipy.sparse.csgraph on a CSR adjacency matrix. Only the predecessor matrix is stored
+    as a compact integer array and paths are rebuilt on demand, so the memory does not grow with the path lengths.
+
+    Args:
+        edges (List[Tuple[GraphNode, GraphNode, float]]): List of edges as (from_node, to_node, cost) tuples.
+    """
+
+    def __init__(self, edges: List[Tuple[GraphNode, GraphNode, float]]):
+        self.nodes: List[GraphNode] = []
+        self.node_indices: Dict[str, int] = {}
+        costs: Dict[Tuple[int, int], float] = {}
+        for from_node, to_node, cost in edges:
+            from_index = self._get_node_index(from_node)
+            to_index = self._get_node_index(to_node)
+            # Add both directions (bi-directional graph), keeping the cheapest of parallel edges.
+            for key in ((from_index, to_index), (to_index, from_index)):
+                if key not in costs or cost < costs[key]:
+                    costs[key] = cost
+
+        number_of_nodes = len(self.nodes)
+        rows = np.fromiter((key[0] for key in costs), dtype=np.int32, count=len(costs))
+        columns = np.fromiter((key[1] for key in costs), dtype=np.int32, count=len(costs))
+        weights = np.fromiter(costs.values(), dtype=np.float64, count=len(costs))
+        adjacency = csr_matrix(
+            (weights, (rows, columns)), shape=(number_of_nodes, number_of_nodes)
+        )
+        _, predecessors = shortest_path(
+            adjacency, method="D", directed=True, return_predecessors=True
+        )
+        dtype = np.int16 if number_of_nodes < np.iinfo(np.int16).max else np.int32
+        self.predecessors: np.ndarray = predecessors.astype(dtype)
+
+    def _get_node_index(self, node: GraphNode) -> int:
+        index = self.node_indices.get(node.node_id)
+        if index is None:
+            index = len(self.nodes)
+            self.node_indices[node.node_id] = index
+            self.nodes.append(node)
+        return index
+
+    def get_path(self, origin: GraphNode, target: GraphNode) -> List[GraphNode]:
+        """
+        Rebuilds the shortest path from origin to target from the predecessor matrix.
+
+        Args:
+            origin (GraphNode): Origin node.
+            target (GraphNode): Target node.
+
+        Returns:
+            List[GraphNode]: The shortest path, or an empty list if no path exists.
+        """
+        origin_index = self.node_indices.get(origin.node_id)
+        target_index = self.node_indices.get(target.node_id)
+        if origin_index is None or target_index is None:
+            return []
+        if origin_index == target_index:
+            return [self.nodes[origin_index]]
+        predecessors = self.predecessors[origin_index]
+        if predecessors[target_index] < 0:
+            return []
+        path = []
+        current_index = target_index
+        while current_index != origin_index:
+            path.append(self.nodes[current_index])
+            current_index = int(predecessors[current_index])
+        path.append(self.nodes[origin_index])
+        path.reverse()
+        return path
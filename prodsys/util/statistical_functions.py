@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-from typing import Callable, List, Dict, TYPE_CHECKING
+from typing import Callable, Dict, TYPE_CHECKING
 import numpy as np
-from numpy.random import exponential, normal, lognormal
 from enum import Enum
 
 if TYPE_CHECKING:
@@ -16,58 +15,70 @@ class FunctionTimeModelEnum(str, Enum):
     Lognormal = "lognormal"
 
 
-def get_constant_list(time_model_data: FunctionTimeModelData) -> List[float]:
+def sample_constant(
+    time_model_data: FunctionTimeModelData, rng: np.random.Generator, size: int
+) -> np.ndarray:
     """
-    Returns a list of constant values.
+    Returns an array of constant values.
 
     Args:
         time_model_data (FunctionTimeModelData): The time model data.
+        rng (np.random.Generator): The random number generator. Not used.
+        size (int): The number of values.
 
     Returns:
-        List[float]: A list of constant values.
+        np.ndarray: An array of constant values.
     """
-    return [time_model_data.location] * time_model_data.batch_size
+    return np.full(size, time_model_data.location, dtype=float)
 
 
-def get_exponential_list(time_model_data: FunctionTimeModelData) -> List[float]:
+def sample_exponential(
+    time_model_data: FunctionTimeModelData, rng: np.random.Generator, size: int
+) -> np.ndarray:
     """
-    Returns a list of exponentially distributed values.
+    Returns an array of exponentially distributed values drawn from the given random number generator.
 
     Args:
         time_model_data (FunctionTimeModelData): The time model data.
+        rng (np.random.Generator): The random number generator.
+        size (int): The number of values.
 
     Returns:
-        List[float]: A list of exponentially distributed values.
+        np.ndarray: An array of exponentially distributed values.
     """
-    return list(exponential(time_model_data.location, time_model_data.batch_size))
+    return rng.exponential(time_model_data.location, size)
 
 
-def get_normal_list(time_model_data: FunctionTimeModelData) -> List[float]:
+def sample_normal(
+    time_model_data: FunctionTimeModelData, rng: np.random.Generator, size: int
+) -> np.ndarray:
     """
-    Returns a list of normally distributed values.
+    Returns an array of normally distributed values drawn from the given random number generator.
 
     Args:
         time_model_data (FunctionTimeModelData): The time model data.
+        rng (np.random.Generator): The random number generator.
+        size (int): The number of values.
 
     Returns:
-        List[float]: A list of normally distributed values.
+        np.ndarray: An array of normally distributed values.
     """
-    return list(
-        normal(
-            time_model_data.location, time_model_data.scale, time_model_data.batch_size
-        )
-    )
+    return rng.normal(time_model_data.location, time_model_data.scale, size)
 
 
-def get_lognormal_list(time_model_data: FunctionTimeModelData) -> List[float]:
+def sample_lognormal(
+    time_model_data: FunctionTimeModelData, rng: np.random.Generator, size: int
+) -> np.ndarray:
     """
-    Returns a list of lognormally distributed values.
+    Returns an array of lognormally distributed values drawn from the given random number generator.
 
     Args:
         time_model_data (FunctionTimeModelData): The time model data.
+        rng (np.random.Generator): The random number generator.
+        size (int): The number of values.
 
     Returns:
-        List[float]: A list of lognormally distributed values.
+        np.ndarray: An array of lognormally distributed values.
     """
     mu = np.log(
         time_model_data.location**2
@@ -76,16 +87,18 @@ def get_lognormal_list(time_model_data: FunctionTimeModelData) -> List[float]:
     sigma = np.sqrt(
         np.log(1 + (time_model_data.scale**2 / time_model_data.location**2))
     )
-    exponential_values = lognormal(mu, sigma, time_model_data.batch_size)
-    return list(exponential_values)
+    return rng.lognormal(mu, sigma, size)
 
 
-FUNCTION_DICT: Dict[str, Callable[[float, float, int], List[float]]] = {
-    FunctionTimeModelEnum.Normal: get_normal_list,
-    FunctionTimeModelEnum.Constant: get_constant_list,
-    FunctionTimeModelEnum.Exponential: get_exponential_list,
-    FunctionTimeModelEnum.Lognormal: get_lognormal_list,
+SAMPLE_FUNCTION_DICT: Dict[
+    str, Callable[[FunctionTimeModelData, np.random.Generator, int], np.ndarray]
+] = {
+    FunctionTimeModelEnum.Normal: sample_normal,
+    FunctionTimeModelEnum.Constant: sample_constant,
+    FunctionTimeModelEnum.Exponential: sample_exponential,
+    FunctionTimeModelEnum.Lognormal: sample_lognormal,
 }
 """
-Dictionary that maps the time model function enum to the corresponding function.
+Dictionary that maps the time model function enum to the corresponding function that samples values from a
+random number generator.
 """
@@ -90,7 +90,7 @@ def read_initial_solutions(
     file_paths = [f for f in listdir(folder_path) if isfile(join(folder_path, f))]
     adapter_objects = []
     for counter, file_path in enumerate(file_paths):
-        if ".json" not in file_path or file_path == "optimization_results.json":
+        if not file_path.endswith(".json") or file_path == "optimization_results.json":
             continue
         adapter = prodsys.models.production_system_data.ProductionSystemData()
         adapter.read(join(folder_path, file_path))
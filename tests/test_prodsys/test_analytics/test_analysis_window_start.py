@@ -0,0 +1,56 @@
+"""KPIs without ``t_from`` start at the start time of the analysis window."""
+
+import pandas as pd
+import pytest
+
+from prodsys.analytics import AnalyticsStore
+from prodsys.simulation.state import StateTypeEnum
+
+
+def _event(t: float, resource: str, activity: str, product: str, state_type: str = "") -> dict:
+    return {
+        "Time": t,
+        "Resource": resource,
+        "Activity": activity,
+        "State": f"{resource}_state",
+        "State Type": state_type,
+        "Product": product,
+    }
+
+
+@pytest.fixture
+def store() -> AnalyticsStore:
+    df = pd.DataFrame(
+        [
+            _event(0.0, "source", "created product", "product1_1"),
+            _event(10.0, "source", "created product", "product1_2"),
+            _event(20.0, "M1", "start state", "product1_1", StateTypeEnum.production.value),
+            _event(60.0, "M1", "end state", "product1_1", StateTypeEnum.production.value),
+            _event(70.0, "sink", "finished product", "product1_1"),
+            _event(80.0, "source", "created product", "product1_3"),
+            _event(90.0, "sink", "finished product", "product1_2"),
+        ]
+    )
+    store = AnalyticsStore.from_raw(df, time_range=100.0)
+    store.set_time_range(100.0, start_time=50.0)
+    return store
+
+
+def test_kpis_default_to_the_window_start(store):
+    assert store.simulation_start_time == 50.0
+    pd.testing.assert_frame_equal(store.throughput(), store.throughput(t_from=50.0))
+    pd.testing.assert_frame_equal(store.resource_states(), store.resource_states(t_from=50.0))
+    m1 = store.resource_states().set_index(["Resource", "Time_type"])["time_increment"]
+    assert m1[("M1", "PR")] == pytest.approx(10.0)
+    assert store.resource_states()["resource_time"].iloc[0] == pytest.approx(50.0)
+
+
+def test_wip_in_window_includes_products_created_before(store):
+    wip = store.wip()
+    assert list(wip["Time"]) == [70.0, 80.0, 90.0]
+    # Two products entered before the window, so the WIP does not restart at zero.
+    assert list(wip["WIP"]) == [1.0, 2.0, 1.0]
+    assert store.aggregated_wip()["product1"] == pytest.approx(4.0 / 3.0)
+
+    store.set_time_range(100.0)
+    assert list(store.wip()["Time"]) == [0.0, 10.0, 70.0, 80.0, 90.0]
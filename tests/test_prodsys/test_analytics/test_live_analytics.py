@@ -0,0 +1,124 @@
+"""
+Live analytics: events folded into the AnalyticsStore batch-wise while
+simulating must yield the same KPIs as a single ingest after the run.
+"""
+
+import pandas as pd
+import pytest
+
+import prodsys.express as psx
+from prodsys import runner
+from prodsys.models.production_system_data import ProductionSystemData
+from prodsys.util.post_processing import PostProcessor
+
+
+@pytest.fixture
+def simulation_adapter() -> ProductionSystemData:
+    t1 = psx.FunctionTimeModel("exponential", 0.8, 0, "t1")
+    p1 = psx.ProductionProcess(t1, "p1")
+    t3 = psx.FunctionTimeModel("normal", 0.1, 0.01, ID="t3")
+    tp = psx.TransportProcess(t3, "tp")
+    machine = psx.Resource([p1], [5, 0], 1, ID="machine")
+    transport = psx.Resource([tp], [0, 0], 1, ID="transport")
+    product1 = psx.Product([p1], tp, "product1")
+    sink1 = psx.Sink(product1, [10, 0], "sink1")
+    arrival = psx.FunctionTimeModel("exponential", 1, ID="arrival")
+    source1 = psx.Source(product1, arrival, [0, 0], ID="source_1")
+    system = psx.ProductionSystem([machine, transport], [source1], [sink1])
+    return system.to_model()
+
+
+def _run(adapter: ProductionSystemData, time_range: float = 300, **kwargs) -> runner.Runner:
+    runner_instance = runner.Runner(production_system_data=adapter, **kwargs)
+    runner_instance.initialize_simulation()
+    runner_instance.run(time_range)
+    return runner_instance
+
+
+def _sorted(df: pd.DataFrame, columns: list) -> pd.DataFrame:
+    return df.sort_values(columns).reset_index(drop=True)
+
+
+@pytest.mark.parametrize(
+    "batch_kwargs",
+    [
+        {"live_analytics_batch_size": 200},
+        {"live_analytics_interval": 20.0},
+    ],
+)
+def test_live_kpis_equal_post_run_kpis(simulation_adapter, batch_kwargs):
+    store_batch = _run(simulation_adapter).get_post_processor().store
+    store_live = _run(
+        simulation_adapter, event_log_backend="live", **batch_kwargs
+    ).get_post_processor().store
+
+    pd.testing.assert_frame_equal(
+        store_batch.aggregated_output_and_throughput(),
+        store_live.aggregated_output_and_throughput(),
+    )
+    pd.testing.assert_series_equal(
+        store_batch.aggregated_wip(), store_live.aggregated_wip()
+    )
+    pd.testing.assert_frame_equal(
+        _sorted(store_batch.resource_states(), ["Resource", "Time_type"]),
+        _sorted(store_live.resource_states(), ["Resource", "Time_type"]),
+    )
+    pd.testing.assert_frame_equal(
+        store_batch.oee_production_system(), store_live.oee_production_system()
+    )
+
+
+def test_live_kpis_are_available_mid_run(simulation_adapter):
+    runner_instance = runner.Runner(
+        production_system_data=simulation_adapter,
+        event_log_backend="live",
+        live_analytics_interval=10.0,
+    )
+    runner_instance.initialize_simulation()
+    runner_instance.run(100)
+    store = runner_instance.event_logger.store
+    output_at_100 = store.aggregated_output().sum()
+    assert output_at_100 > 0
+    assert len(runner_instance.event_logger.event_data) < 1000
+
+    runner_instance.run(200)
+    runner_instance.event_logger.flush()
+    assert store.aggregated_output().sum() > output_at_100
+    assert len(runner_instance.event_logger.event_data) == 0
+
+
+def test_live_logger_drops_raw_events(simulation_adapter):
+    runner_instance = _run(simulation_adapter, 50, event_log_backend="live")
+    with pytest.raises(ValueError):
+        runner_instance.event_logger.get_data_as_dataframe()
+
+
+def test_live_logger_results(simulation_adapter, tmp_path):
+    runner_instance = _run(simulation_adapter, 100, event_log_backend="live")
+
+    performance = runner_instance.get_performance_data()
+    assert performance.event_log is None
+    assert performance.kpis
+    with pytest.raises(ValueError):
+        runner_instance.get_performance_data(event_log=True)
+    with pytest.raises(ValueError):
+        runner_instance.get_event_data_of_simulation()
+    assert runner_instance.get_aggregated_data_simulation_results()["Throughput"]
+
+    runner_instance.save_results_as_csv(str(tmp_path))
+    runner_instance.save_results_as_json(str(tmp_path))
+    saved_files = sorted(path.suffix for path in tmp_path.iterdir())
+    assert saved_files == [".csv", ".json"]
+    df_kpis = pd.read_csv(next(tmp_path.glob("*.csv")))
+    assert len(df_kpis) == len(performance.kpis)
+
+
+def test_live_logger_primitive_wip(simulation_adapter):
+    runner_instance = _run(simulation_adapter, 50, event_log_backend="live")
+    post_processor = runner_instance.get_post_processor()
+    assert post_processor.get_primitive_types() == []
+    assert len(post_processor.df_primitive_WIP) == 0
+
+    store_without_system = PostProcessor.from_store(runner_instance.event_logger.store)
+    with pytest.raises(ValueError):
+        store_without_system.get_primitive_types()
@@ -2281,3 +2281,142 @@ class TestDependencySerialization:
         # Should default to empty list or None
         assert model_with_none.dependency_data is None or len(model_with_none.dependency_data) == 0
 
+
+
+@pytest.fixture
+def system() -> ProductionSystemData:
+    import prodsys.express as psx
+
+    t1 = psx.FunctionTimeModel("normal", 1, 0.1, "t1")
+    p1 = psx.ProductionProcess(t1, "p1")
+    p2 = psx.ProductionProcess(t1, "p2")
+    tp = psx.TransportProcess(psx.DistanceTimeModel(speed=180, reaction_time=0.1, ID="t3"), "tp")
+    transport = psx.Resource([tp], [2, 2], 1, ID="transport")
+    machines = [
+        psx.Resource([p1, p2], [5, 5 * i], 1, ID=f"machine_{i}") for i in range(1, 4)
+    ]
+    product1 = psx.Product(process=[p1, p2], transport_process=tp, ID="product1")
+    source1 = psx.Source(
+        product1,
+        psx.FunctionTimeModel("exponential", 2, ID="arrival_model_1"),
+        [0, 0],
+        ID="source_1",
+    )
+    sink1 = psx.Sink(product1, [10, 0], "sink1")
+    return psx.ProductionSystem([*machines, transport], [source1], [sink1]).to_model()
+
+
+class TestSystemHash:
+    """Tests for the hash of production systems."""
+
+    def test_hash_is_stable(self, system):
+        assert system.hash() == system.hash()
+        assert system.hash() == system.model_copy(deep=True).hash()
+
+    def test_hash_computes_every_time_model_hash_once(self, system, monkeypatch):
+        calls = []
+        original_hash = time_model_data.FunctionTimeModelData.hash
+
+        def counting_hash(self):
+            calls.append(self.ID)
+            return original_hash(self)
+
+        monkeypatch.setattr(time_model_data.FunctionTimeModelData, "hash", counting_hash)
+        system.hash()
+        assert sorted(calls) == sorted(
+            time_model.ID
+            for time_model in system.time_model_data
+            if isinstance(time_model, time_model_data.FunctionTimeModelData)
+        )
+
+    def test_hash_changes_after_in_place_mutation(self, system):
+        initial_hash = system.hash()
+        system.resource_data[0].process_ids.remove("p2")
+        assert system.hash() != initial_hash
+
+
+class TestTrustedCopy:
+    """Tests for copies of production systems without validation."""
+
+    def test_trusted_copy(self, system):
+        copy = system.trusted_copy(update={"ID": "copy"})
+
+        assert copy.ID == "copy"
+        assert copy.hash() == system.hash()
+        assert copy.time_model_data is system.time_model_data
+        assert copy.resource_data is system.resource_data
+
+        copy.copy_on_write("resource_data")
+        assert copy.resource_data is not system.resource_data
+        copy.resource_data[0].process_ids.remove("p2")
+        copy.resource_data.pop()
+        assert system.resource_data[0].process_ids == ["p1", "p2"]
+        assert len(system.resource_data) == 4
+
+    def test_trusted_copy_copied_fields(self, system):
+        copy = system.trusted_copy(copied_fields=("product_data",))
+
+        assert copy.product_data is not system.product_data
+        assert copy.resource_data is system.resource_data
+
+    def test_copy_on_write_of_parent(self, system):
+        parent = system.trusted_copy(copied_fields=("resource_data",))
+        copy = parent.trusted_copy()
+
+        parent.copy_on_write("resource_data")
+        parent.resource_data.pop()
+        assert len(copy.resource_data) == 4
+
+    def test_trusted_copy_assignment_is_not_validated(self, system):
+        copy = system.trusted_copy()
+
+        copy.resource_data = []
+        assert copy.resource_data == []
+        assert len(system.resource_data) == 4
+        with pytest.raises(ValidationError):
+            system.ID = 1
+
+    def test_run_check_only_reruns_checks_of_written_fields(self, system):
+        calls = []
+
+        def check(production_system):
+            calls.append(production_system.ID)
+
+        system.run_check(check, ("resource_data",))
+        system.run_check(check, ("resource_data",))
+        assert len(calls) == 2
+
+        copy = system.trusted_copy()
+        copy.run_check(check, ("resource_data",))
+        copy.run_check(check, ("resource_data",))
+        assert len(calls) == 3
+
+        child = copy.trusted_copy()
+        child.copy_on_write("product_data")
+        child.run_check(check, ("resource_data",))
+        assert len(calls) == 3
+
+        child.copy_on_write("resource_data")
+        child.run_check(check, ("resource_data",))
+        assert len(calls) == 4
+
+        copy.resource_data = list(copy.resource_data)
+        copy.run_check(check, ("resource_data",))
+        assert len(calls) == 5
+
+    def test_validate_configuration_of_trusted_copy(self, system):
+        copy = system.trusted_copy()
+        copy.validate_configuration()
+
+        copy.copy_on_write("resource_data")
+        for resource in copy.resource_data:
+            resource.process_ids = []
+        with pytest.raises(ValueError):
+            copy.validate_configuration()
+
+    def test_trusted_copy_does_not_validate_update(self, system):
+        copy = system.trusted_copy(update={"ID": 1})
+
+        assert copy.ID == 1
+        with pytest.raises(ValidationError):
+            ProductionSystemData.model_validate(copy.model_dump())
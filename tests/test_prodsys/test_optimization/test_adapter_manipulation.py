@@ -0,0 +1,81 @@
+import os
+import random
+
+import pytest
+
+from prodsys.models.production_system_data import DATA_FIELDS, ProductionSystemData
+from prodsys.optimization import adapter_manipulation
+from prodsys.optimization.util import clean_out_breakdown_states_of_resources
+
+
+EXAMPLE_FOLDER = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "examples", "optimization", "optimization_example"
+)
+
+
+@pytest.fixture
+def base_configuration() -> ProductionSystemData:
+    base_configuration = ProductionSystemData.read(os.path.join(EXAMPLE_FOLDER, "base_scenario.json"))
+    base_configuration.read_scenario(os.path.join(EXAMPLE_FOLDER, "scenario.json"))
+    clean_out_breakdown_states_of_resources(base_configuration)
+    return base_configuration.trusted_copy(copied_fields=DATA_FIELDS)
+
+
+# The example production system has no primitives, so the primitive operations are not applicable.
+PRIMITIVE_OPERATIONS = [adapter_manipulation.add_primitive, adapter_manipulation.remove_primitive]
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        operation
+        for operation in adapter_manipulation.MUTATED_DATA_FIELDS
+        if operation not in PRIMITIVE_OPERATIONS
+    ],
+    ids=lambda operation: operation.__name__,
+)
+def test_mutation_does_not_change_parent(base_configuration, operation, monkeypatch):
+    monkeypatch.setattr(adapter_manipulation, "get_mutation_operations", lambda adapter_object: [operation])
+    parent = adapter_manipulation.mutation([base_configuration.trusted_copy()])[0][0]
+    parent_data = parent.model_dump()
+
+    for seed in range(5):
+        random.seed(seed)
+        adapter_manipulation.mutation([parent.trusted_copy()])
+
+    assert parent.model_dump() == parent_data
+
+
+@pytest.mark.parametrize("operation", PRIMITIVE_OPERATIONS, ids=lambda operation: operation.__name__)
+def test_primitive_operations_copy_primitives(operation):
+    assert "primitive_data" in adapter_manipulation.get_mutated_data_fields(operation)
+
+
+def test_unknown_operations_copy_all_data_fields():
+    def new_transformation(adapter_object: ProductionSystemData) -> bool:
+        return False
+
+    assert adapter_manipulation.get_mutated_data_fields(new_transformation) == DATA_FIELDS
+
+
+def test_crossover_does_not_change_parents(base_configuration):
+    random.seed(0)
+    parent_1 = adapter_manipulation.random_configuration_with_initial_solution([base_configuration])
+    parent_2 = adapter_manipulation.random_configuration_with_initial_solution([base_configuration])
+    parent_data = [parent_1.model_dump(), parent_2.model_dump()]
+
+    for _ in range(5):
+        adapter_manipulation.crossover([parent_1.trusted_copy()], [parent_2.trusted_copy()])
+
+    assert [parent_1.model_dump(), parent_2.model_dump()] == parent_data
+
+
+def test_random_configuration_does_not_change_baseline(base_configuration):
+    baseline_data = base_configuration.model_dump()
+
+    random.seed(0)
+    for _ in range(5):
+        adapter_manipulation.random_configuration(base_configuration)
+        adapter_manipulation.configuration_capacity_based(base_configuration)
+
+    assert base_configuration.model_dump() == baseline_data
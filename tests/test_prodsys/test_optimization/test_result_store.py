@@ -0,0 +1,137 @@
+import os
+import subprocess
+import sys
+
+from prodsys.optimization.optimization_analysis import read_optimization_results
+from prodsys.optimization.optimization_data import FitnessData
+from prodsys.optimization.result_store import OptimizationResultStore
+
+
+def get_fitness_data(configuration_hash: str, agg_fitness: float) -> FitnessData:
+    return FitnessData(
+        agg_fitness=agg_fitness,
+        fitness=[agg_fitness, 1.0],
+        objective_names=["throughput", "cost"],
+        time_stamp=0.5,
+        hash=configuration_hash,
+        event_log_dict={"Time": {"0": 0.0}},
+    )
+
+
+def test_result_store_appends_results(tmp_path):
+    store = OptimizationResultStore(str(tmp_path / "optimization_results.jsonl"))
+    assert not store.exists()
+
+    store.append("0", "adapter_1", get_fitness_data("hash_1", 1.0))
+    store.append("0", "adapter_2", get_fitness_data("hash_2", 2.0))
+    store.append("1", "adapter_3", get_fitness_data("hash_1", 1.0))
+
+    with open(store.file_path, "r", encoding="utf-8") as jsonl_file:
+        assert len(jsonl_file.readlines()) == 3
+
+    optimization_results = store.read()
+    assert list(optimization_results) == ["0", "1"]
+    assert list(optimization_results["0"]) == ["adapter_1", "adapter_2"]
+    assert optimization_results["0"]["adapter_2"].agg_fitness == 2.0
+    assert optimization_results["1"]["adapter_3"].event_log_dict is None
+
+    hashes = store.get_first_found_hashes()
+    assert hashes["hash_1"].generation == "0"
+    assert hashes["hash_1"].ID == "adapter_1"
+    assert hashes["hash_2"].ID == "adapter_2"
+
+    assert read_optimization_results(store.file_path) == optimization_results
+
+    store.clear()
+    assert not store.exists()
+
+
+def test_result_store_skips_incomplete_lines(tmp_path):
+    store = OptimizationResultStore(str(tmp_path / "optimization_results.jsonl"))
+    store.append("0", "adapter_1", get_fitness_data("hash_1", 1.0))
+    with open(store.file_path, "a", encoding="utf-8") as jsonl_file:
+        jsonl_file.write('{"generation": "0", "ID": "adapter_2", "fitn')
+
+    optimization_results = store.read()
+    assert list(optimization_results["0"]) == ["adapter_1"]
+
+    resumed_store = OptimizationResultStore(store.file_path)
+    resumed_store.append("1", "adapter_3", get_fitness_data("hash_3", 3.0))
+    optimization_results = resumed_store.read()
+    assert list(optimization_results["0"]) == ["adapter_1"]
+    assert list(optimization_results["1"]) == ["adapter_3"]
+
+
+EXAMPLE_FOLDER = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "examples", "optimization", "optimization_example"
+)
+
+OPTIMIZATION_SCRIPT = """
+import sys
+from prodsys.models.production_system_data import ProductionSystemData
+from prodsys.optimization.evolutionary_algorithm import EvolutionaryAlgorithmHyperparameters
+from prodsys.optimization.optimizer import FileSystemSaveOptimizer
+from prodsys.optimization.util import clean_out_breakdown_states_of_resources
+
+example_folder, save_folder, resume = sys.argv[1], sys.argv[2], sys.argv[3] == "resume"
+base_configuration = ProductionSystemData.read(example_folder + "/base_scenario.json")
+base_configuration.read_scenario(example_folder + "/scenario.json")
+base_configuration.scenario_data.info.time_range = 200
+clean_out_breakdown_states_of_resources(base_configuration)
+hyper_parameters = EvolutionaryAlgorithmHyperparameters(
+    seed=0,
+    number_of_generations=1,
+    population_size=4,
+    mutation_rate=0.5,
+    crossover_rate=0.1,
+    number_of_seeds=1,
+    number_of_processes=1,
+)
+FileSystemSaveOptimizer(
+    adapter=base_configuration,
+    hyperparameters=hyper_parameters,
+    save_folder=save_folder,
+    base_validation="loose",
+    resume=resume,
+).optimize()
+"""
+
+
+def run_optimization_in_fresh_process(save_folder: str, resume: bool) -> None:
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            OPTIMIZATION_SCRIPT,
+            EXAMPLE_FOLDER,
+            save_folder,
+            "resume" if resume else "new",
+        ],
+        check=True,
+        capture_output=True,
+    )
+
+
+def test_resume_optimization_in_fresh_process(tmp_path):
+    save_folder = str(tmp_path / "optimization")
+    store = OptimizationResultStore(os.path.join(save_folder, "optimization_results.jsonl"))
+
+    run_optimization_in_fresh_process(save_folder, resume=False)
+    first_results = store.read()
+    run_optimization_in_fresh_process(save_folder, resume=True)
+    resumed_results = store.read()
+
+    for generation, fitness_entry in first_results.items():
+        for adapter_id, fitness_data in fitness_entry.items():
+            assert resumed_results[generation][adapter_id] == fitness_data
+    new_generations = set(resumed_results) - set(first_results)
+    assert new_generations
+    assert min(map(int, new_generations)) > max(map(int, first_results))
+
+    first_ids = {adapter_id for fitness_entry in first_results.values() for adapter_id in fitness_entry}
+    new_ids = {
+        adapter_id
+        for generation in new_generations
+        for adapter_id in resumed_results[generation]
+    }
+    assert not first_ids & new_ids
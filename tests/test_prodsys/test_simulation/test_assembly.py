@@ -148,7 +148,7 @@ def test_run_simulation(simulation_adapter: ProductionSystemData):
 
     for kpi in post_processor.WIP_KPIs:
         if kpi.name == "WIP" and kpi.product_type == "tank":
-            assert kpi.value > 4 and kpi.value < 6
+            assert kpi.value > 19 and kpi.value < 23
 
     tank_output = 0.0 
     pump_output = 0.0 
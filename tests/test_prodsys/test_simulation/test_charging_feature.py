@@ -79,7 +79,7 @@ def test_run_simulation(charging_simulation_adapter: ProductionSystemData):
     post_processor = runner_instance.get_post_processor()
     for kpi in post_processor.throughput_and_output_KPIs:
         if kpi.name == "output" and kpi.product_type == "product1":
-            assert kpi.value > 2100 and kpi.value < 2140
+            assert kpi.value > 2025 and kpi.value < 2070
     for kpi in post_processor.machine_state_KPIS:
         if kpi.name == "productive_time" and kpi.resource == "machine":
             assert kpi.value < 45 and kpi.value > 35
@@ -89,8 +89,8 @@ def test_run_simulation(charging_simulation_adapter: ProductionSystemData):
 
     for kpi in post_processor.WIP_KPIs:
         if kpi.name == "WIP" and kpi.product_type == "product1":
-            assert kpi.value < 7.5 and kpi.value > 6.5
+            assert kpi.value < 6.8 and kpi.value > 5.8
 
     for kpi in post_processor.aggregated_throughput_time_KPIs:
         if kpi.name == "throughput_time" and kpi.product_type == "product1":
-            assert kpi.value < 14.5 and kpi.value > 11.5
+            assert kpi.value < 12.5 and kpi.value > 9.5
@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import prodsys.express as psx
+from prodsys import runner
+from prodsys.models.production_system_data import ProductionSystemData
+from prodsys.simulation.logger import ColumnarEventLog
+
+
+@pytest.fixture
+def simulation_adapter() -> ProductionSystemData:
+    t1 = psx.FunctionTimeModel("exponential", 0.8, 0, "t1")
+    p1 = psx.ProductionProcess(t1, "p1")
+    t3 = psx.FunctionTimeModel("normal", 0.1, 0.01, ID="t3")
+    tp = psx.TransportProcess(t3, "tp")
+    machine = psx.Resource([p1], [5, 0], 1, ID="machine")
+    transport = psx.Resource([tp], [0, 0], 1, ID="transport")
+    product1 = psx.Product([p1], tp, "product1")
+    sink1 = psx.Sink(product1, [10, 0], "sink1")
+    arrival_model_1 = psx.FunctionTimeModel("exponential", 1, ID="arrival_model_1")
+    source1 = psx.Source(product1, arrival_model_1, [0, 0], ID="source_1")
+    system = psx.ProductionSystem([machine, transport], [source1], [sink1])
+    return system.to_model()
+
+
+def _run(adapter: ProductionSystemData, backend: str) -> runner.Runner:
+    runner_instance = runner.Runner(
+        production_system_data=adapter, event_log_backend=backend
+    )
+    runner_instance.initialize_simulation()
+    runner_instance.run(500)
+    return runner_instance
+
+
+def test_columnar_event_log_grows_and_fills_missing_columns():
+    log = ColumnarEventLog(initial_capacity=2)
+    log.append({"Time": 0.0, "Resource": "r1", "State": "s1"})
+    log.append({"Time": 1.0, "Resource": "r1", "Product": "p1"})
+    log.append({"Time": 2.0, "Resource": None, "Expected End Time": None})
+
+    assert len(log) == 3
+    assert log.columns == ["Time", "Resource", "State", "Product", "Expected End Time"]
+    assert log.get_column("Time").tolist() == [0.0, 1.0, 2.0]
+    resources = log.get_column("Resource")
+    assert resources[0] == "r1" and resources[1] == "r1" and resources[2] is None
+    assert pd.isna(log.get_column("State")[1])
+    assert np.isnan(log.get_column("Expected End Time")).all()
+
+
+def test_columnar_backend_matches_list_backend(simulation_adapter: ProductionSystemData):
+    df_list = _run(simulation_adapter, "list").event_logger.get_data_as_dataframe()
+    df_columnar = _run(
+        simulation_adapter, "columnar"
+    ).event_logger.get_data_as_dataframe()
+    pd.testing.assert_frame_equal(df_list, df_columnar)
+
+
+def test_columnar_backend_kpis(simulation_adapter: ProductionSystemData):
+    runner_list = _run(simulation_adapter, "list")
+    runner_columnar = _run(simulation_adapter, "columnar")
+    pd.testing.assert_frame_equal(
+        runner_list.get_post_processor().df_aggregated_output_and_throughput,
+        runner_columnar.get_post_processor().df_aggregated_output_and_throughput,
+    )
+
+
+def test_unknown_event_log_backend(simulation_adapter: ProductionSystemData):
+    runner_instance = runner.Runner(
+        production_system_data=simulation_adapter, event_log_backend="unknown"
+    )
+    with pytest.raises(ValueError):
+        runner_instance.initialize_simulation()
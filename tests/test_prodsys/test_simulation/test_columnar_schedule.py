@@ -0,0 +1,182 @@
+"""
+Tests for columnar schedules of production systems.
+"""
+
+import pandas as pd
+import pytest
+
+import prodsys.express as psx
+from prodsys import runner
+from prodsys.models.performance_data import Event
+from prodsys.models.production_system_data import ProductionSystemData
+from prodsys.models.schedule_data import ColumnarSchedule, ColumnarScheduleEvents
+from prodsys.simulation.router import ScheduleRoutingMaps
+from prodsys.simulation.schedule_completion import ScheduleCompletionTracker
+
+
+@pytest.fixture
+def basic_system() -> ProductionSystemData:
+    t1 = psx.FunctionTimeModel("constant", 5.0, 0, "t1")
+    p1 = psx.ProductionProcess(t1, "P1")
+    tp = psx.TransportProcess(psx.FunctionTimeModel("constant", 0.5, 0, "t_transport"), "TP")
+
+    resource = psx.Resource([p1], [10, 0], 1, ID="R1")
+    transport = psx.Resource([tp], [5, 0], 1, ID="AGV1")
+    product = psx.Product([p1], tp, "Product_A")
+    sink = psx.Sink(product, [20, 0], "Sink")
+    arrival_model = psx.FunctionTimeModel("constant", 10.0, ID="arrival_model")
+    source = psx.Source(product, arrival_model, [0, 0], ID="Source")
+
+    system = psx.ProductionSystem([resource, transport], [source], [sink])
+    return system.to_model()
+
+
+def get_schedule_events(number_of_products: int = 3):
+    events = []
+    for index in range(number_of_products):
+        for activity, time in (("start state", 10.0 * index), ("end state", 10.0 * index + 5.0)):
+            events.append(
+                Event(
+                    time=time,
+                    resource="R1",
+                    state="P1",
+                    state_type="Production",
+                    activity=activity,
+                    product=f"Product_A_{index + 1}",
+                    expected_end_time=10.0 * index + 5.0,
+                    process="P1",
+                )
+            )
+    return events
+
+
+def test_columnar_schedule_round_trip():
+    events = get_schedule_events()
+    schedule = ColumnarSchedule.from_events(events)
+
+    assert len(schedule) == len(events)
+    assert isinstance(schedule.data["Resource"].dtype, pd.CategoricalDtype)
+    assert schedule.get_unique_ids("Product") == {"Product_A_1", "Product_A_2", "Product_A_3"}
+    for original, converted in zip(events, schedule.get_events()):
+        assert converted.time == original.time
+        assert converted.resource == original.resource
+        assert converted.activity == original.activity
+        assert converted.product == original.product
+        assert converted.process == original.process
+    assert [event.time for event in schedule.events] == [event.time for event in events]
+    assert schedule.events[-1].product == "Product_A_3"
+    assert [event.activity for event in schedule.events[:2]] == ["start state", "end state"]
+    with pytest.raises(IndexError):
+        schedule.events[len(events)]
+
+
+def test_columnar_schedule_missing_columns():
+    with pytest.raises(ValueError):
+        ColumnarSchedule(pd.DataFrame({"Time": [0.0], "Resource": ["R1"]}))
+
+
+def test_set_columnar_schedule(basic_system: ProductionSystemData):
+    basic_system.set_columnar_schedule(ColumnarSchedule.from_events(get_schedule_events()))
+
+    assert isinstance(basic_system.schedule, ColumnarScheduleEvents)
+    assert len(basic_system.schedule) == 3
+    assert all(event.activity == "start state" for event in basic_system.schedule)
+
+    schedule = basic_system.schedule
+    basic_system.reconfiguration_cost = 1.0
+    assert basic_system.schedule is schedule
+
+    copied_system = ProductionSystemData.model_validate_json(basic_system.model_dump_json())
+    assert [event.product for event in copied_system.schedule] == [
+        event.product for event in basic_system.schedule
+    ]
+
+
+def test_columnar_schedule_consumers(basic_system: ProductionSystemData):
+    basic_system.set_columnar_schedule(ColumnarSchedule.from_events(get_schedule_events()))
+    runner_instance = runner.Runner(production_system_data=basic_system)
+    runner_instance.initialize_simulation()
+
+    schedule_by_resource = runner_instance.resource_factory.schedule_by_resource
+    assert list(schedule_by_resource) == ["R1"]
+    assert [event.product for event in schedule_by_resource["R1"]] == [
+        "Product_A_1",
+        "Product_A_2",
+        "Product_A_3",
+    ]
+    assert ScheduleCompletionTracker(runner_instance.env, basic_system).expected == 3
+
+    schedule_per_product = runner_instance.source_factory.schedule_per_product
+    assert list(schedule_per_product) == ["Product_A"]
+    assert [event.product for event in schedule_per_product["Product_A"]] == [
+        "Product_A_1",
+        "Product_A_2",
+        "Product_A_3",
+    ]
+    router_factory = runner_instance.router_factory
+    routers = [router_factory.global_system_router, *router_factory.system_routers.values()]
+    assert routers[0].schedule_routing_map[("Product_A_2", "P1")][0] == (10.0, "R1")
+    assert all(
+        router.schedule_routing_maps is routers[0].schedule_routing_maps for router in routers
+    )
+
+
+def test_schedule_routing_maps_of_columnar_schedule():
+    events = get_schedule_events()
+    for index, (empty_transport, target_location) in enumerate(
+        ((False, "R1_default_input_queue"), (True, None), (False, "Sink_default_input_queue"))
+    ):
+        events.append(
+            Event(
+                time=float(index),
+                resource="AGV1",
+                state="TP",
+                state_type="Transport",
+                activity="start state",
+                product="Product_A_1",
+                target_location=target_location,
+                empty_transport=empty_transport,
+                dependency="D1" if empty_transport else None,
+                requesting_item="R1" if empty_transport else None,
+                process="TP",
+            )
+        )
+    maps = ScheduleRoutingMaps(events)
+    columnar_maps = ScheduleRoutingMaps(ColumnarSchedule.from_events(events).events)
+
+    assert columnar_maps.schedule_routing_map == maps.schedule_routing_map
+    assert list(columnar_maps.schedule_routing_map[("Product_A_1", "TP")]) == [
+        (0.0, "AGV1"),
+        (1.0, "AGV1"),
+        (2.0, "AGV1"),
+    ]
+    assert columnar_maps.dependency_move_routing_map == maps.dependency_move_routing_map
+    assert list(columnar_maps.dependency_move_routing_map) == [("Product_A_1", "TP", "D1", "R1")]
+    assert columnar_maps.get_scheduled_transport_targets("Product_A_1") == [
+        "R1_default_input_queue",
+        None,
+        "Sink_default_input_queue",
+    ]
+    assert maps.get_scheduled_transport_targets("Product_A_1") == (
+        columnar_maps.get_scheduled_transport_targets("Product_A_1")
+    )
+
+
+def test_set_columnar_schedule_invalid_resource(basic_system: ProductionSystemData):
+    data = ColumnarSchedule.from_events(get_schedule_events()).data.astype(object)
+    data["Resource"] = "R2"
+    with pytest.raises(ValueError):
+        basic_system.set_columnar_schedule(ColumnarSchedule(data))
+
+
+def test_read_schedule_from_csv(basic_system: ProductionSystemData, tmp_path):
+    filepath = str(tmp_path / "schedule.csv")
+    ColumnarSchedule.from_events(get_schedule_events()).data.to_csv(filepath, index=False)
+
+    basic_system.read_schedule(filepath)
+    assert len(basic_system.schedule) == 3
+
+    runner_instance = runner.Runner(production_system_data=basic_system)
+    runner_instance.initialize_simulation()
+    runner_instance.run(100)
+    assert runner_instance.get_post_processor().df_raw is not None
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from prodsys.models.time_model_data import DistanceTimeModelData
+from prodsys.simulation.time_model import DistanceTimeModel
+
+
+@pytest.mark.parametrize("metric", ["manhattan", "euclidean"])
+def test_precomputed_travel_times_match_calculation(metric):
+    time_model = DistanceTimeModel(
+        DistanceTimeModelData(
+            ID="tm", description="", speed=2.0, reaction_time=0.5, metric=metric
+        )
+    )
+    locations = [[0.0, 0.0], [3.0, 4.0], [10.0, 2.0], [3.0, 4.0]]
+    expected = {
+        (i, j): time_model.calculate_distance(origin, target) / 2.0 + 0.5
+        for i, origin in enumerate(locations)
+        for j, target in enumerate(locations)
+    }
+
+    time_model.precompute_travel_times(locations)
+
+    assert time_model.travel_times.shape == (3, 3)
+    for (i, j), travel_time in expected.items():
+        assert time_model.get_next_time(locations[i], locations[j]) == pytest.approx(
+            travel_time
+        )
+    # Locations that were not precomputed are calculated on demand.
+    assert time_model.get_next_time([1.0, 1.0], [0.0, 0.0]) == pytest.approx(
+        time_model.calculate_distance([1.0, 1.0], [0.0, 0.0]) / 2.0 + 0.5
+    )
+    # ... without storing them, so the lookup does not grow with visited positions.
+    assert len(time_model.location_indices) == 3
+
+
+def test_expected_times_are_batched():
+    time_model = DistanceTimeModel(
+        DistanceTimeModelData(ID="tm", description="", speed=1.0, reaction_time=0.0)
+    )
+    time_model.precompute_travel_times([[0.0, 0.0], [1.0, 1.0], [5.0, 0.0]])
+
+    origins = [[0.0, 0.0], [5.0, 0.0], [1.0, 1.0]]
+    targets = [[1.0, 1.0], [0.0, 0.0], [1.0, 1.0]]
+    np.testing.assert_allclose(
+        time_model.get_expected_times(origins, targets), [2.0, 5.0, 0.0]
+    )
+
+    origins.append([2.0, 2.0])
+    targets.append([0.0, 0.0])
+    np.testing.assert_allclose(
+        time_model.get_expected_times(origins, targets), [2.0, 5.0, 0.0, 4.0]
+    )
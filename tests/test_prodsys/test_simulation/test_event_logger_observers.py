@@ -0,0 +1,48 @@
+from types import SimpleNamespace
+
+from prodsys.simulation.logger import EventLogger, post_monitor_resource_states
+from prodsys.simulation.state import StateInfo, StateTypeEnum
+
+
+def test_observed_state_infos_share_one_observer_list():
+    event_logger = EventLogger()
+    state_infos = [StateInfo(ID=f"state_{i}", resource_ID="resource") for i in range(3)]
+    for state_info in state_infos:
+        event_logger.register_observer(
+            event_logger.event_data, state_info, post=post_monitor_resource_states
+        )
+
+    assert all(info.observers is state_infos[0].observers for info in state_infos)
+    assert len(state_infos[0].observers) == 1
+    # Logging methods are not wrapped per instance.
+    assert "log_start_state" not in vars(state_infos[0])
+
+    state_infos[0].log_start_state(1.0, 2.0, StateTypeEnum.production)
+    state_infos[1].log_end_state(3.0, StateTypeEnum.production)
+    state_infos[2].log_primitive(SimpleNamespace(data=SimpleNamespace(ID="primitive")), StateTypeEnum.transport)
+
+    assert [(e["Time"], e["State"], e["Activity"]) for e in event_logger.event_data] == [
+        (1.0, "state_0", "start state"),
+        (3.0, "state_1", "end state"),
+    ]
+
+
+def test_unobserved_state_info_logs_nothing():
+    state_info = StateInfo(ID="state", resource_ID="resource")
+    state_info.log_start_state(1.0, 2.0, StateTypeEnum.production)
+    assert state_info.observers == ()
+
+
+def test_multiple_loggers_observe_same_state_info():
+    first_logger = EventLogger()
+    second_logger = EventLogger()
+    state_info = StateInfo(ID="state", resource_ID="resource")
+    for event_logger in (first_logger, second_logger):
+        event_logger.register_observer(
+            event_logger.event_data, state_info, post=post_monitor_resource_states
+        )
+
+    state_info.log_start_state(1.0, 2.0, StateTypeEnum.production)
+
+    assert len(first_logger.event_data) == 1
+    assert len(second_logger.event_data) == 1
@@ -0,0 +1,93 @@
+import gc
+import weakref
+from typing import Optional
+
+import prodsys.express as psx
+from prodsys import runner
+
+
+def create_runner(finished_product_retention: Optional[int]) -> runner.Runner:
+    t1 = psx.FunctionTimeModel("constant", 0.8, 0, "t1")
+    p1 = psx.ProductionProcess(t1, "p1")
+    tp = psx.TransportProcess(psx.FunctionTimeModel("constant", 0.1, 0, "t2"), "tp")
+
+    machine = psx.Resource([p1], [5, 0], 1, ID="machine")
+    transport = psx.Resource([tp], [0, 0], 1, ID="transport")
+
+    product1 = psx.Product([p1], tp, "product1")
+    sink1 = psx.Sink(product1, [10, 0], "sink1")
+    arrival_model_1 = psx.FunctionTimeModel("constant", 1, ID="arrival_model_1")
+    source1 = psx.Source(product1, arrival_model_1, [0, 0], ID="source_1")
+
+    system = psx.ProductionSystem([machine, transport], [source1], [sink1])
+    runner_instance = runner.Runner(
+        production_system_data=system.to_model(),
+        finished_product_retention=finished_product_retention,
+    )
+    runner_instance.initialize_simulation()
+    return runner_instance
+
+
+def run_system(finished_product_retention: Optional[int]) -> runner.Runner:
+    runner_instance = create_runner(finished_product_retention)
+    runner_instance.run(100)
+    return runner_instance
+
+
+def get_output(runner_instance: runner.Runner) -> float:
+    return next(
+        kpi.value
+        for kpi in runner_instance.get_post_processor().throughput_and_output_KPIs
+        if kpi.name == "output"
+    )
+
+
+def test_finished_product_retention():
+    keep_all = run_system(None)
+    finished_count = keep_all.product_factory.finished_product_count
+    assert finished_count > 90
+    assert len(keep_all.product_factory.finished_products) == finished_count
+    assert keep_all.product_factory.finished_product_counts == {"product1": finished_count}
+
+    keep_last = run_system(10)
+    assert keep_last.product_factory.finished_product_count == finished_count
+    assert len(keep_last.product_factory.finished_products) == 10
+    assert all(
+        product.process_model is None
+        for product in keep_last.product_factory.finished_products
+    )
+    assert keep_last.product_factory.finished_products[-1].data.ID == (
+        keep_all.product_factory.finished_products[-1].data.ID
+    )
+
+    counters_only = run_system(0)
+    assert counters_only.product_factory.finished_product_count == finished_count
+    assert len(counters_only.product_factory.finished_products) == 0
+    assert len(counters_only.primitive_factory.primitives) == len(
+        keep_all.primitive_factory.primitives
+    ) - finished_count
+
+    assert get_output(keep_all) == get_output(keep_last) == get_output(counters_only)
+
+
+def test_finished_products_are_released():
+    runner_instance = create_runner(0)
+    product_factory = runner_instance.product_factory
+    finished_product_refs = []
+    register_finished_product = product_factory.register_finished_product
+
+    def register_and_track(product):
+        finished_product_refs.append(weakref.ref(product))
+        register_finished_product(product)
+
+    product_factory.register_finished_product = register_and_track
+    runner_instance.run(100)
+    gc.collect()
+
+    assert len(finished_product_refs) > 90
+    assert [ref() for ref in finished_product_refs if ref() is not None] == []
+    request_handler = runner_instance.router_factory.global_system_router.request_handler
+    assert all(
+        request_info.request_state != "completed"
+        for request_info in request_handler.request_infos.values()
+    )
@@ -0,0 +1,61 @@
+import multiprocessing
+
+import pytest
+
+import prodsys.express as psx
+from prodsys import runner
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="Forking scenarios requires the fork start method.",
+)
+def test_fork_scenarios_from_warmed_up_state():
+    t1 = psx.FunctionTimeModel("constant", 0.8, 0, "t1")
+    p1 = psx.ProductionProcess(t1, "p1")
+    tp = psx.TransportProcess(psx.FunctionTimeModel("normal", 0.1, 0.01, ID="t3"), "tp")
+
+    machine = psx.Resource([p1], [5, 0], 1, ID="machine")
+    transport = psx.Resource([tp], [0, 0], 1, ID="transport")
+
+    product1 = psx.Product([p1], tp, "product1")
+    sink1 = psx.Sink(product1, [10, 0], "sink1")
+    arrival_model_1 = psx.FunctionTimeModel("exponential", 1, ID="arrival_model_1")
+    source1 = psx.Source(product1, arrival_model_1, [0, 0], ID="source_1")
+
+    system = psx.ProductionSystem([machine, transport], [source1], [sink1])
+    runner_instance = runner.Runner(production_system_data=system.to_model())
+    runner_instance.initialize_simulation()
+    runner_instance.run(200)
+
+    applied = []
+    results = runner_instance.fork_scenarios(
+        {"base": None, "copy": lambda r: applied.append(r.env.now)},
+        run_length=300,
+        workers=2,
+    )
+    assert list(results) == ["base", "copy"]
+    # Scenarios run on copies, so the snapshot itself is not changed.
+    assert runner_instance.env.now == 200
+    assert applied == []
+
+    runner_instance.run(500)
+    full_run_kpis = {
+        (kpi.name, kpi.resource, kpi.product_type): kpi.value
+        for kpi in runner_instance.get_performance_data(event_log=False).kpis
+    }
+    # The scenario KPIs only cover the time after the snapshot.
+    runner_instance.post_processor = None
+    runner_instance.get_post_processor().store.set_time_range(500, start_time=200)
+    expected_kpis = {
+        (kpi.name, kpi.resource, kpi.product_type): kpi.value
+        for kpi in runner_instance.get_performance_data(event_log=False).kpis
+    }
+    assert expected_kpis != full_run_kpis
+    for performance in results.values():
+        assert performance.event_log is None
+        kpis = {
+            (kpi.name, kpi.resource, kpi.product_type): kpi.value
+            for kpi in performance.kpis
+        }
+        assert kpis == expected_kpis
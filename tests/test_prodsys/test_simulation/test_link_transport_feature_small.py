@@ -2,6 +2,7 @@ import pytest
 from prodsys.models.production_system_data import ProductionSystemData
 import prodsys.express as psx
 from prodsys import runner
+from prodsys.simulation.process import LinkTransportProcess
 
 
 # Define the path to your test configuration file. This should be similar to example_simulation.py.
@@ -180,3 +181,64 @@ def test_run_simulation(simulation_adapter: ProductionSystemData):
             assert kpi.value > 0.01 and kpi.value < 500
 
     assert counter == 2 + 1 - 1
+
+
+def test_run_simulation_with_csgraph_route_finder(simulation_adapter: ProductionSystemData):
+    runner_instance = runner.Runner(
+        production_system_data=simulation_adapter, route_finder_backend="csgraph"
+    )
+    runner_instance.initialize_simulation()
+    runner_instance.run(480)
+    assert runner_instance.env.now == 480
+    post_processor = runner_instance.get_post_processor()
+    for kpi in post_processor.throughput_and_output_KPIs:
+        if kpi.name == "output":
+            assert kpi.value > 1
+
+
+def test_run_simulation_with_macro_transport_route_mode(
+    simulation_adapter: ProductionSystemData,
+):
+    transport_events = {}
+    for route_mode in ["hops", "macro"]:
+        runner_instance = runner.Runner(
+            production_system_data=simulation_adapter, transport_route_mode=route_mode
+        )
+        runner_instance.initialize_simulation()
+        runner_instance.run(480)
+        assert runner_instance.env.now == 480
+        df = runner_instance.event_logger.get_data_as_dataframe()
+        transport_events[route_mode] = (df["State Type"] == "Transport").sum()
+        post_processor = runner_instance.get_post_processor()
+        for kpi in post_processor.throughput_and_output_KPIs:
+            if kpi.name == "output":
+                assert kpi.value > 1
+
+    assert transport_events["macro"] < transport_events["hops"]
+
+
+def test_route_options_per_runner(simulation_adapter: ProductionSystemData):
+    csgraph_macro_runner = runner.Runner(
+        production_system_data=simulation_adapter,
+        route_finder_backend="csgraph",
+        transport_route_mode="macro",
+    )
+    csgraph_macro_runner.initialize_simulation()
+    default_runner = runner.Runner(production_system_data=simulation_adapter)
+    default_runner.initialize_simulation()
+
+    for runner_instance, backend, route_mode in (
+        (csgraph_macro_runner, "csgraph", "macro"),
+        (default_runner, "dijkstra", "hops"),
+    ):
+        link_transport_processes = [
+            process_instance
+            for process_instance in runner_instance.process_factory.processes.values()
+            if isinstance(process_instance, LinkTransportProcess)
+        ]
+        assert link_transport_processes
+        assert all(
+            process_instance.route_finder_backend == backend
+            and process_instance.route_mode == route_mode
+            for process_instance in link_transport_processes
+        )
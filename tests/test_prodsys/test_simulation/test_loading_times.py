@@ -69,7 +69,7 @@ def test_run_simulation(loading_times_simulation_adapter: ProductionSystemData):
             assert kpi.value < 83 and kpi.value > 75
 
         if kpi.name == "productive_time" and kpi.resource == "transport":
-            assert kpi.value > 65 and kpi.value < 75
+            assert kpi.value > 72 and kpi.value < 82
 
     for kpi in post_processor.WIP_KPIs:
         if kpi.name == "WIP" and kpi.product_type == "product1":
@@ -0,0 +1,29 @@
+from prodsys.simulation.request_handler import PendingRequestIndex
+
+
+def test_entries_are_indexed_in_insertion_order():
+    pending = PendingRequestIndex()
+    first = pending.add("product_1:resource_1:process_1", ["R1", "R2"])
+    second = pending.add("product_2:resource_1:process_1", ["R2"])
+    third = pending.add("product_3:resource_1:process_1", ["R1", "R1"])
+
+    assert len(pending) == 3
+    assert list(pending.get_entries("R1")) == [first, third]
+    assert list(pending.get_entries("R2")) == [first, second]
+    assert list(pending.get_entries("R3")) == []
+
+
+def test_remove_updates_index():
+    pending = PendingRequestIndex()
+    key = "product_1:resource_1:process_1"
+    first = pending.add(key, ["R1", "R2"])
+    second = pending.add(key, ["R2"])
+
+    assert pending.remove(first) == key
+    assert "R1" not in pending.index
+    assert list(pending.get_entries("R2")) == [second]
+    assert list(pending) == [key]
+
+    pending.remove(second)
+    assert not pending
+    assert pending.index == {}
@@ -108,7 +108,7 @@ def test_run_simulation(simulation_adapter: ProductionSystemData):
             assert kpi.value > 740 and kpi.value < 770
     for kpi in post_processor.machine_state_KPIS:
         if kpi.name == "productive_time" and kpi.resource == "machine":
-            assert kpi.value < 94 and kpi.value > 91
+            assert kpi.value < 88 and kpi.value > 85
 
         if kpi.name == "productive_time" and kpi.resource == "transport":
             assert kpi.value > 48 and kpi.value < 55
@@ -119,9 +119,9 @@ def test_run_simulation(simulation_adapter: ProductionSystemData):
 
     for kpi in post_processor.WIP_KPIs:
         if kpi.name == "WIP" and kpi.product_type == "product1":
-            assert kpi.value < 5.5 and kpi.value > 4.0
+            assert kpi.value < 3.7 and kpi.value > 2.2
         if kpi.name == "WIP" and kpi.product_type == "product2":
-            assert kpi.value < 10 and kpi.value > 8
+            assert kpi.value < 7 and kpi.value > 5
 
     for kpi in post_processor.primitive_WIP_KPIs:
         if kpi.name == "primitive_WIP" and kpi.product_type == "primitive1":
@@ -131,6 +131,6 @@ def test_run_simulation(simulation_adapter: ProductionSystemData):
 
     for kpi in post_processor.aggregated_throughput_time_KPIs:
         if kpi.name == "throughput_time" and kpi.product_type == "product1":
-            assert kpi.value < 12.5 and kpi.value > 10.5
+            assert kpi.value < 8.5 and kpi.value > 6.5
         if kpi.name == "throughput_time" and kpi.product_type == "product2":
-            assert kpi.value < 12.5 and kpi.value > 10.5
+            assert kpi.value < 8.5 and kpi.value > 6.5
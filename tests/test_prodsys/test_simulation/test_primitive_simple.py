@@ -96,7 +96,7 @@ def test_run_simulation(simulation_adapter: ProductionSystemData):
             assert kpi.value > 1100 and kpi.value < 1120
     for kpi in post_processor.machine_state_KPIS:
         if kpi.name == "productive_time" and kpi.resource == "machine":
-            assert kpi.value < 90 and kpi.value > 86
+            assert kpi.value < 85 and kpi.value > 81
 
         # if kpi.name == "productive_time" and kpi.resource == "transport":
         #     assert kpi.value > 53 and kpi.value < 55
@@ -113,4 +113,4 @@ def test_run_simulation(simulation_adapter: ProductionSystemData):
 
     for kpi in post_processor.aggregated_throughput_time_KPIs:
         if kpi.name == "throughput_time" and kpi.product_type == "product1":
-            assert kpi.value < 8 and kpi.value > 6
+            assert kpi.value < 6 and kpi.value > 4
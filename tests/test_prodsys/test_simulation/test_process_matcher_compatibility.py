@@ -186,6 +186,72 @@ class TestProcessMatcherCompatibility:
         )
         return productionsystem.to_model()
 
+    @pytest.fixture
+    def routable_link_transport_with_capabilities_system(self) -> ProductionSystemData:
+        """Create a link transport system with capabilities whose links connect source, machine and sink."""
+        time_model_agv = psx.DistanceTimeModel(
+            speed=90, reaction_time=0.2, ID="time_model_x"
+        )
+        time_model_machine1 = psx.FunctionTimeModel(
+            distribution_function="constant", location=3, ID="time_model_ap23"
+        )
+
+        node1 = psx.Node(location=[0, 20], ID="node1")
+        node2 = psx.Node(location=[-10, 50], ID="node2")
+
+        rcp01 = psx.RequiredCapabilityProcess(
+            time_model=time_model_agv, capability="euro_palette_transport", ID="rtp01"
+        )
+        productionprocess01 = psx.ProductionProcess(
+            time_model=time_model_machine1, ID="pp01"
+        )
+
+        machine01 = psx.Resource(
+            ID="resource01",
+            processes=[productionprocess01],
+            location=[0, 0],
+        )
+
+        product01 = psx.Product(
+            process=[productionprocess01],
+            transport_process=rcp01,
+            ID="product01",
+        )
+
+        source01 = psx.Source(
+            product=product01,
+            ID="source01",
+            time_model=psx.FunctionTimeModel("constant", 6, ID="tm_source01"),
+            location=[-10, 0],
+        )
+        sink01 = psx.Sink(product=product01, ID="sink01", location=[-10, 100])
+
+        ltp01 = psx.LinkTransportProcess(
+            time_model=time_model_agv,
+            capability="euro_palette_transport",
+            ID="ltp01",
+            links=[
+                [source01, machine01],
+                [machine01, node1],
+                [node1, node2],
+                [node2, sink01],
+            ],
+        )
+
+        agv01 = psx.Resource(
+            location=[0, 20],
+            ID="agv01",
+            processes=[ltp01],
+        )
+
+        productionsystem = psx.ProductionSystem(
+            resources=[agv01, machine01],
+            sources=[source01],
+            sinks=[sink01],
+            ID="productionsystem01",
+        )
+        return productionsystem.to_model()
+
     @pytest.fixture
     def link_transport_without_capabilities_system(self) -> ProductionSystemData:
         """Create a link transport system without capabilities for testing."""
@@ -933,3 +999,105 @@ class TestProcessMatcherCompatibility:
         assert len(process_matcher.reachability_cache) == 0
         assert len(process_matcher.rework_compatibility) == 0
         assert len(process_matcher.route_cache) == 0
+
+    @pytest.mark.parametrize(
+        "system_fixture",
+        ["primitive_complex_system", "link_transport_with_capabilities_system"],
+    )
+    def test_compatibility_cache(self, system_fixture, request, tmp_path):
+        """Test that cached compatibility tables equal the precomputed tables."""
+        from prodsys import runner
+
+        production_system_data = request.getfixturevalue(system_fixture)
+
+        def get_process_matcher(cache_directory):
+            runner_instance = runner.Runner(
+                production_system_data=production_system_data,
+                compatibility_cache_directory=cache_directory,
+            )
+            runner_instance.initialize_simulation()
+            return (
+                runner_instance.product_factory.router.request_handler.process_matcher
+            )
+
+        precomputed = get_process_matcher(None)
+        stored = get_process_matcher(str(tmp_path))
+        assert len(list(tmp_path.glob("compatibility_*.json"))) == 1
+
+        with patch.object(
+            ProcessMatcher, "precompute_compatibility_tables"
+        ) as precompute:
+            loaded = get_process_matcher(str(tmp_path))
+        precompute.assert_not_called()
+
+        assert (
+            loaded.dump_compatibility_tables()
+            == stored.dump_compatibility_tables()
+            == precomputed.dump_compatibility_tables()
+        )
+        # Loaded tables reference the simulation objects of the new run.
+        for entries in loaded.transport_compatibility.values():
+            for resource, _ in entries:
+                assert resource is loaded.resource_factory.all_resources[resource.data.ID]
+
+    def test_compatibility_cache_key_changes_with_structure(self, most_trivial_system):
+        """Test that the cache key only depends on the structure of the production system."""
+        from prodsys.simulation.process_matcher import get_compatibility_cache_key
+
+        key = get_compatibility_cache_key(most_trivial_system)
+        assert key == get_compatibility_cache_key(
+            most_trivial_system.model_copy(update={"seed": 42})
+        )
+        changed_system = most_trivial_system.model_copy(deep=True)
+        changed_system.resource_data[0].location = [7, 0]
+        assert key != get_compatibility_cache_key(changed_system)
+
+    @pytest.mark.parametrize(
+        "system_fixture",
+        ["most_trivial_system", "routable_link_transport_with_capabilities_system"],
+    )
+    def test_lazy_transport_compatibility(self, system_fixture, request):
+        """Test that the lazy transport compatibility mode simulates like the eager mode."""
+        from prodsys import runner
+
+        production_system_data = request.getfixturevalue(system_fixture)
+
+        def run(transport_compatibility_mode):
+            runner_instance = runner.Runner(
+                production_system_data=production_system_data,
+                transport_compatibility_mode=transport_compatibility_mode,
+            )
+            runner_instance.initialize_simulation()
+            process_matcher = (
+                runner_instance.product_factory.router.request_handler.process_matcher
+            )
+            if transport_compatibility_mode == "lazy":
+                assert not process_matcher.transport_compatibility
+            runner_instance.run(200)
+            return runner_instance, process_matcher
+
+        eager_runner, eager_matcher = run("eager")
+        lazy_runner, lazy_matcher = run("lazy")
+
+        assert eager_runner.product_factory.finished_product_count > 0
+        assert (
+            lazy_runner.product_factory.finished_product_count
+            == eager_runner.product_factory.finished_product_count
+        )
+
+        assert lazy_matcher.resolved_transport_keys
+        for key in lazy_matcher.resolved_transport_keys:
+            assert [
+                (resource.data.ID, offered_process.data.ID)
+                for resource, offered_process in lazy_matcher.transport_compatibility[key]
+            ] == [
+                (resource.data.ID, offered_process.data.ID)
+                for resource, offered_process in eager_matcher.transport_compatibility[key]
+            ]
+        assert len(lazy_matcher.transport_compatibility) < len(
+            eager_matcher.transport_compatibility
+        )
+        assert (
+            eager_runner.event_logger.get_data_as_dataframe().shape
+            == lazy_runner.event_logger.get_data_as_dataframe().shape
+        )
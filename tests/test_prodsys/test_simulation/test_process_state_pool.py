@@ -0,0 +1,60 @@
+import prodsys.express as psx
+from prodsys import runner
+
+
+def get_runner(capacity: int) -> runner.Runner:
+    t1 = psx.FunctionTimeModel("constant", 2.5, 0, "t1")
+    p1 = psx.ProductionProcess(t1, "p1")
+    tp = psx.TransportProcess(psx.FunctionTimeModel("constant", 0.1, 0, "t2"), "tp")
+
+    machine = psx.Resource([p1], [5, 0], capacity, ID="machine")
+    transport = psx.Resource([tp], [0, 0], 3, ID="transport")
+
+    product1 = psx.Product([p1], tp, "product1")
+    sink1 = psx.Sink(product1, [10, 0], "sink1")
+    arrival_model_1 = psx.FunctionTimeModel("constant", 1, ID="arrival_model_1")
+    source1 = psx.Source(product1, arrival_model_1, [0, 0], ID="source_1")
+
+    system = psx.ProductionSystem([machine, transport], [source1], [sink1])
+    runner_instance = runner.Runner(production_system_data=system.to_model())
+    runner_instance.initialize_simulation()
+    return runner_instance
+
+
+def test_free_production_states_are_pooled_per_process():
+    runner_instance = get_runner(capacity=3)
+    machine = runner_instance.resource_factory.get_resource("machine")
+    process = machine.processes[0]
+    states = machine.get_processes(process)
+
+    assert len(states) == 3
+    assert machine.capacity_current_setup == 3
+    assert machine.get_free_process(process) is states[0]
+
+    states[0].reserved = True
+    states[1].reserved = True
+    assert machine.get_free_process(process) is states[2]
+
+    states[2].reserved = True
+    assert machine.get_free_process(process) is None
+    assert machine.production_state_pools[process.data.ID].busy_count == 3
+
+    states[1].reserved = False
+    assert machine.get_free_process(process) is states[1]
+    states[0].reserved = False
+    assert machine.get_free_process(process) is states[0]
+
+
+def test_simulation_with_pooled_production_states():
+    runner_instance = get_runner(capacity=3)
+    runner_instance.run(100)
+
+    machine = runner_instance.resource_factory.get_resource("machine")
+    pool = machine.production_state_pools[machine.processes[0].data.ID]
+    assert pool.busy_count <= 3
+    output = next(
+        kpi
+        for kpi in runner_instance.get_post_processor().throughput_and_output_KPIs
+        if kpi.name == "output"
+    )
+    assert output.value > 90
@@ -0,0 +1,43 @@
+import prodsys.express as psx
+from prodsys import runner
+
+
+def test_products_are_stamped_from_templates():
+    t1 = psx.FunctionTimeModel("constant", 0.8, 0, "t1")
+    p1 = psx.ProductionProcess(t1, "p1")
+    p2 = psx.ProductionProcess(t1, "p2")
+    tp = psx.TransportProcess(psx.FunctionTimeModel("constant", 0.1, 0, "t2"), "tp")
+
+    machine = psx.Resource([p1, p2], [5, 0], 1, ID="machine")
+    transport = psx.Resource([tp], [0, 0], 1, ID="transport")
+
+    product1 = psx.Product([p1, p2], tp, "product1")
+    sink1 = psx.Sink(product1, [10, 0], "sink1")
+    arrival_model_1 = psx.FunctionTimeModel("constant", 2, ID="arrival_model_1")
+    source1 = psx.Source(product1, arrival_model_1, [0, 0], ID="source_1")
+
+    system = psx.ProductionSystem([machine, transport], [source1], [sink1])
+    runner_instance = runner.Runner(production_system_data=system.to_model())
+    runner_instance.initialize_simulation()
+    number_of_processes = len(runner_instance.process_factory.processes)
+    runner_instance.run(100)
+
+    product_factory = runner_instance.product_factory
+    assert len(runner_instance.process_factory.processes) == number_of_processes
+    assert list(product_factory.product_templates) == ["product1"]
+
+    template = product_factory.product_templates["product1"]
+    products = list(product_factory.products.values()) + product_factory.finished_products
+    assert len(products) > 40
+    for product in products:
+        assert product.process_model.data.ID == product.data.ID
+        assert product.process_model.contained_processes is template.process_model.contained_processes
+        assert product.process_model.precedence_graph is not template.process_model.precedence_graph
+        assert product.transport_process is template.transport_process
+
+    output = next(
+        kpi
+        for kpi in runner_instance.get_post_processor().throughput_and_output_KPIs
+        if kpi.name == "output"
+    )
+    assert output.value > 40
@@ -0,0 +1,107 @@
+import os
+
+import pytest
+
+import prodsys.express as psx
+from prodsys import runner
+from prodsys.models.production_system_data import ProductionSystemData
+from prodsys.simulation import logger
+
+
+@pytest.fixture
+def simulation_adapter() -> ProductionSystemData:
+    t1 = psx.FunctionTimeModel("constant", 0.8, 0, "t1")
+    p1 = psx.ProductionProcess(t1, "p1")
+    tp = psx.TransportProcess(psx.FunctionTimeModel("normal", 0.1, 0.01, ID="t3"), "tp")
+
+    machine = psx.Resource([p1], [5, 0], 1, ID="machine")
+    transport = psx.Resource([tp], [0, 0], 1, ID="transport")
+
+    product1 = psx.Product([p1], tp, "product1")
+    sink1 = psx.Sink(product1, [10, 0], "sink1")
+    arrival_model_1 = psx.FunctionTimeModel("exponential", 1, ID="arrival_model_1")
+    source1 = psx.Source(product1, arrival_model_1, [0, 0], ID="source_1")
+
+    system = psx.ProductionSystem([machine, transport], [source1], [sink1])
+    return system.to_model()
+
+
+def test_run_replications(simulation_adapter: ProductionSystemData):
+    result = runner.run_replications(simulation_adapter, 3, 500, workers=1)
+
+    assert result.seeds == [0, 1, 2]
+    assert result.event_log_directories is None
+    output = next(kpi for kpi in result.kpis if kpi.name == "output")
+    assert len(output.values) == 3
+    assert len(set(output.values)) > 1
+    lower, upper = output.confidence_interval
+    assert lower < output.mean < upper
+    assert 450 < output.mean < 550
+
+
+def test_run_replications_matches_single_run(simulation_adapter: ProductionSystemData):
+    result = runner.run_replications(simulation_adapter, [3], 500, workers=1)
+
+    single_runner = runner.Runner(
+        production_system_data=simulation_adapter.model_copy(update={"seed": 3})
+    )
+    single_runner.initialize_simulation()
+    single_runner.run(500)
+    expected = {
+        (kpi.name, kpi.resource, kpi.product_type): kpi.value
+        for kpi in single_runner.get_performance_data(event_log=False).kpis
+    }
+    assert {
+        (kpi.name, kpi.resource, kpi.product_type): kpi.values[0] for kpi in result.kpis
+    } == pytest.approx(expected)
+
+
+def test_run_replications_in_worker_processes(simulation_adapter: ProductionSystemData):
+    result = runner.run_replications(simulation_adapter, 2, 500, workers=2)
+
+    assert result.seeds == [0, 1]
+    output = next(kpi for kpi in result.kpis if kpi.name == "output")
+    assert len(output.values) == 2
+    assert len(set(output.values)) > 1
+
+    in_process_result = runner.run_replications(simulation_adapter, 2, 500, workers=1)
+    in_process_output = next(
+        kpi for kpi in in_process_result.kpis if kpi.name == "output"
+    )
+    assert output.values == in_process_output.values
+
+
+def test_run_replications_spills_event_logs(
+    simulation_adapter: ProductionSystemData, tmp_path
+):
+    if not logger.is_parquet_engine_available():
+        pytest.skip("requires pyarrow or fastparquet")
+    result = runner.run_replications(
+        simulation_adapter, [7], 100, workers=1, event_log_directory=str(tmp_path)
+    )
+
+    assert result.event_log_directories == [str(tmp_path / "seed_7")]
+    assert os.listdir(result.event_log_directories[0])
+    output = next(kpi for kpi in result.kpis if kpi.name == "output")
+    assert output.confidence_interval == (output.mean, output.mean)
+
+
+def test_streaming_event_log_requires_parquet_engine(
+    simulation_adapter: ProductionSystemData, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(logger, "PARQUET_ENGINES", ("not_a_parquet_engine",))
+
+    with pytest.raises(ImportError, match="prodsys\\[parquet\\]"):
+        logger.StreamingEventLogger(str(tmp_path))
+    streaming_runner = runner.Runner(
+        production_system_data=simulation_adapter,
+        event_log_backend="streaming",
+        event_log_directory=str(tmp_path),
+    )
+    with pytest.raises(ImportError, match="prodsys\\[parquet\\]"):
+        streaming_runner.initialize_simulation()
+    with pytest.raises(ImportError, match="prodsys\\[parquet\\]"):
+        runner.run_replications(
+            simulation_adapter, [7], 100, workers=1, event_log_directory=str(tmp_path)
+        )
+    assert not os.listdir(tmp_path)
@@ -0,0 +1,80 @@
+import prodsys.express as psx
+from prodsys import runner
+from prodsys.simulation.route_finder import RouteFinder
+
+
+def get_kpis(runner_instance: runner.Runner) -> dict:
+    return {
+        (kpi.name, kpi.resource, kpi.product_type): kpi.value
+        for kpi in runner_instance.get_performance_data(event_log=False).kpis
+    }
+
+
+def test_reset_simulation_matches_initialize_simulation():
+    t1 = psx.FunctionTimeModel("normal", 0.8, 0.1, "t1")
+    p1 = psx.ProductionProcess(t1, "p1")
+    tp = psx.TransportProcess(psx.DistanceTimeModel(speed=180, reaction_time=0.1, ID="t3"), "tp")
+
+    machine = psx.Resource([p1], [5, 0], 1, ID="machine")
+    transport = psx.Resource([tp], [0, 0], 1, ID="transport")
+
+    product1 = psx.Product([p1], tp, "product1")
+    sink1 = psx.Sink(product1, [10, 0], "sink1")
+    arrival_model_1 = psx.FunctionTimeModel("exponential", 1, ID="arrival_model_1")
+    source1 = psx.Source(product1, arrival_model_1, [0, 0], ID="source_1")
+
+    system = psx.ProductionSystem([machine, transport], [source1], [sink1])
+    runner_instance = runner.Runner(production_system_data=system.to_model())
+    runner_instance.initialize_simulation()
+    runner_instance.run(100)
+    expected_kpis = get_kpis(runner_instance)
+    time_model_factory = runner_instance.time_model_factory
+    process_matcher = runner_instance.router_factory.process_matcher
+
+    for _ in range(2):
+        runner_instance.reset_simulation()
+        assert runner_instance.env.now == 0
+        assert runner_instance.time_model_factory is time_model_factory
+        assert runner_instance.router_factory.process_matcher is not process_matcher
+        runner_instance.run(100)
+        assert get_kpis(runner_instance) == expected_kpis
+
+
+def test_reset_simulation_reuses_processes_and_routes():
+    t1 = psx.FunctionTimeModel("constant", 3, ID="t1")
+    t2 = psx.FunctionTimeModel("constant", 4, ID="t2")
+    p1 = psx.ProductionProcess(t1, "p1")
+    p2 = psx.ProductionProcess(t2, "p2")
+    ltp = psx.LinkTransportProcess(psx.DistanceTimeModel(speed=360, reaction_time=0, ID="t3"), "ltp")
+
+    node1 = psx.Node(location=[10, 0], ID="node1")
+    machine1 = psx.Resource([p1], [10, 10], ID="machine1")
+    machine2 = psx.Resource([p2], [20, 10], ID="machine2")
+    agv = psx.Resource([ltp], [0, 0], ID="agv")
+
+    product1 = psx.Product([p1, p2], ltp, "product1")
+    arrival_model_1 = psx.FunctionTimeModel("constant", 6, ID="arrival_model_1")
+    source1 = psx.Source(product1, arrival_model_1, [0, 0], ID="source_1")
+    sink1 = psx.Sink(product1, [20, 20], "sink1")
+    ltp.set_links(
+        [[source1, node1], [node1, machine1], [machine1, machine2], [machine2, sink1]]
+    )
+
+    system = psx.ProductionSystem([agv, machine1, machine2], [source1], [sink1])
+    runner_instance = runner.Runner(production_system_data=system.to_model())
+    runner_instance.initialize_simulation()
+    runner_instance.run(100)
+    expected_kpis = get_kpis(runner_instance)
+    processes = runner_instance.process_factory.processes
+
+    runner_instance.reset_simulation()
+    assert runner_instance.process_factory.processes is processes
+    link_transport_process = processes["ltp"]
+    locatables = {
+        id(locatable) for link in link_transport_process.links for locatable in link
+    }
+    assert RouteFinder._route_cache
+    for route in RouteFinder._route_cache.values():
+        assert all(id(locatable) in locatables for locatable in route)
+    runner_instance.run(100)
+    assert get_kpis(runner_instance) == expected_kpis
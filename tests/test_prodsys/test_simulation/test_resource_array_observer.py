@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+import prodsys.express as psx
+from prodsys import runner
+from prodsys.simulation import observer
+
+
+def test_array_observer_matches_observation_objects():
+    t1 = psx.FunctionTimeModel("constant", 1.2, 0, "t1")
+    t2 = psx.FunctionTimeModel("constant", 0.9, 0, "t2")
+    p1 = psx.ProductionProcess(t1, "p1")
+    p2 = psx.ProductionProcess(t2, "p2")
+    tp = psx.TransportProcess(psx.FunctionTimeModel("constant", 0.1, 0, "t3"), "tp")
+
+    machine = psx.Resource([p1, p2], [5, 0], 2, ID="machine", internal_queue_size=10)
+    transport = psx.Resource([tp], [0, 0], 1, ID="transport")
+
+    product1 = psx.Product([p1], tp, "product1")
+    product2 = psx.Product([p2, p1], tp, "product2")
+    sink1 = psx.Sink(product1, [10, 0], "sink1")
+    sink2 = psx.Sink(product2, [10, 0], "sink2")
+    arrival_model = psx.FunctionTimeModel("exponential", 1, ID="arrival_model")
+    source1 = psx.Source(product1, arrival_model, [0, 0], ID="source_1")
+    source2 = psx.Source(product2, arrival_model, [0, 0], ID="source_2")
+
+    system = psx.ProductionSystem([machine, transport], [source1, source2], [sink1, sink2])
+    runner_instance = runner.Runner(production_system_data=system.to_model())
+    runner_instance.initialize_simulation()
+    resource = runner_instance.resource_factory.get_resource("machine")
+    resource_observer = observer.ResourceObserver(
+        resource_factory=runner_instance.resource_factory,
+        product_factory=runner_instance.product_factory,
+        resource=resource,
+    )
+    with pytest.raises(ValueError):
+        observer.ResourceArrayObserver(resource, runner_instance.product_factory)
+    array_observer = observer.ResourceArrayObserver(
+        resource, runner_instance.product_factory, max_queue_length=10
+    )
+    assert array_observer.process_ids == ["p1", "p2"]
+    observed_next_processes = set()
+
+    observation = array_observer.observe()
+    for time in np.arange(1, 60, 0.7):
+        runner_instance.run(time)
+        assert array_observer.observe() is observation
+
+        process_observations = resource_observer.observe_processes()
+        assert array_observer.process_one_hot.sum() == len(process_observations)
+        assert list(array_observer.process_one_hot.sum(axis=0)) == [
+            sum(o.process == process_id for o in process_observations)
+            for process_id in array_observer.process_ids
+        ]
+
+        queue_observations = resource_observer.observe_input_queue()
+        assert array_observer.queue_lengths.sum() == len(queue_observations)
+        number_of_queued = min(len(queue_observations), array_observer.max_queue_length)
+        for slot, queue_observation in enumerate(queue_observations[:number_of_queued]):
+            expected = np.zeros(len(array_observer.process_ids))
+            if queue_observation.process in array_observer.process_indices:
+                expected[array_observer.process_indices[queue_observation.process]] = 1
+            assert list(array_observer.queue_one_hot[slot]) == list(expected)
+            observed_next_processes.add((queue_observation.product.rsplit("_", 1)[0], queue_observation.process))
+        assert not array_observer.queue_one_hot[number_of_queued:].any()
+        assert (array_observer.waiting_times[:number_of_queued] >= 0).all()
+        assert not array_observer.waiting_times[number_of_queued:].any()
+        assert array_observer.available[0] == resource.active.triggered
+
+    # product2 waits for p2 first and for p1 after p2, so the marking of the executing handler has to advance.
+    assert ("product2", "p1") in observed_next_processes
+    assert ("product2", "p2") in observed_next_processes
@@ -0,0 +1,106 @@
+from types import SimpleNamespace
+
+import simpy
+
+import prodsys.express as psx
+from prodsys import runner
+from prodsys.simulation.control import Controller
+
+
+def get_controller(**resource_attributes) -> Controller:
+    env = simpy.Environment()
+    resource = SimpleNamespace(
+        bound=False,
+        in_setup=False,
+        charging_states=[],
+        active=simpy.Event(env).succeed(),
+    )
+    vars(resource).update(resource_attributes)
+    controller = Controller(control_policy=None, env=env, lot_handler=None)
+    controller.resource = resource
+    return controller
+
+
+def test_controller_idle():
+    assert get_controller().idle
+
+    controller = get_controller()
+    controller.requests.append(object())
+    assert not controller.idle
+
+    controller = get_controller()
+    controller.num_running_processes = 1
+    assert not controller.idle
+
+    assert not get_controller(bound=True).idle
+    assert not get_controller(in_setup=True).idle
+    assert not get_controller(active=simpy.Event(simpy.Environment())).idle
+
+
+def test_idle_resources_are_not_woken_up():
+    t1 = psx.FunctionTimeModel("constant", 0.8, 0, "t1")
+    p1 = psx.ProductionProcess(t1, "p1")
+    p2 = psx.ProductionProcess(t1, "p2")
+    tp = psx.TransportProcess(psx.FunctionTimeModel("constant", 0.1, 0, "t2"), "tp")
+
+    machine = psx.Resource([p1], [5, 0], 1, ID="machine")
+    unused_machines = [
+        psx.Resource([p2], [5, 5 * i], 1, ID=f"unused_machine_{i}")
+        for i in range(1, 4)
+    ]
+    transport = psx.Resource([tp], [0, 0], 1, ID="transport")
+
+    product1 = psx.Product([p1], tp, "product1")
+    sink1 = psx.Sink(product1, [10, 0], "sink1")
+    arrival_model_1 = psx.FunctionTimeModel("constant", 1, ID="arrival_model_1")
+    source1 = psx.Source(product1, arrival_model_1, [0, 0], ID="source_1")
+
+    system = psx.ProductionSystem(
+        [machine, transport, *unused_machines], [source1], [sink1]
+    )
+    runner_instance = runner.Runner(production_system_data=system.to_model())
+    runner_instance.initialize_simulation()
+    runner_instance.run(100)
+
+    router = runner_instance.router_factory.global_system_router
+    assert router.skipped_resource_wakeups > 0
+    router.update_free_resources()
+    assert not any(
+        resource.data.ID.startswith("unused_machine")
+        for resource in router.busy_resources.values()
+    )
+    post_processor = runner_instance.get_post_processor()
+    output = next(
+        kpi for kpi in post_processor.throughput_and_output_KPIs if kpi.name == "output"
+    )
+    assert output.value > 90
+
+
+def test_router_tracks_busy_resources():
+    t1 = psx.FunctionTimeModel("constant", 0.8, 0, "t1")
+    p1 = psx.ProductionProcess(t1, "p1")
+    tp = psx.TransportProcess(psx.FunctionTimeModel("constant", 0.1, 0, "t2"), "tp")
+    machine = psx.Resource([p1], [5, 0], 1, ID="machine")
+    transport = psx.Resource([tp], [0, 0], 1, ID="transport")
+    product1 = psx.Product([p1], tp, "product1")
+    sink1 = psx.Sink(product1, [10, 0], "sink1")
+    arrival_model_1 = psx.FunctionTimeModel("constant", 1, ID="arrival_model_1")
+    source1 = psx.Source(product1, arrival_model_1, [0, 0], ID="source_1")
+    system = psx.ProductionSystem([machine, transport], [source1], [sink1])
+    runner_instance = runner.Runner(production_system_data=system.to_model())
+    runner_instance.initialize_simulation()
+
+    router = runner_instance.router_factory.global_system_router
+    machine_resource = router.free_resources["machine"]
+    assert router in machine_resource.controller.routers
+    router.update_free_resources()
+    assert not router.busy_resources
+
+    machine_resource.controller.num_running_processes = 1
+    router.mark_resource_not_free(machine_resource)
+    router.update_free_resources()
+    assert list(router.busy_resources.values()) == [machine_resource]
+
+    machine_resource.controller.num_running_processes = 0
+    router.update_free_resources()
+    assert not router.busy_resources
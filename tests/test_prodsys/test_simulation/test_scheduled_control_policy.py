@@ -826,3 +826,25 @@ def test_maybe_create_setup_request_adopts_ahead_of_product_setup():
     assert parent._setup_injected is True
     assert early.parent_production_request is parent
     assert early.required_dependencies == [dep]
+
+
+def test_schedule_cursor_advances_past_started_indices():
+    key = ("p1", "proc")
+    matches = {key: [0, 5, 10]}
+    cursor = control.ScheduleCursor()
+    controller = SimpleNamespace(completed_schedule_indices=set())
+    request_instance = _make_request("p1", "proc")
+    request_instance.resource = SimpleNamespace(controller=controller)
+
+    control.scheduled_control_policy(
+        matches, {}, [], lambda r: None, [request_instance], schedule_cursor=cursor
+    )
+    assert request_instance.scheduled_control_index == 0
+    assert cursor.positions[key] == 0
+
+    controller.completed_schedule_indices.update({0, 5})
+    control.scheduled_control_policy(
+        matches, {}, [], lambda r: None, [request_instance], schedule_cursor=cursor
+    )
+    assert request_instance.scheduled_control_index == 10
+    assert cursor.positions[key] == 2
@@ -0,0 +1,113 @@
+import json
+
+import pandas as pd
+import pytest
+
+import prodsys.express as psx
+from prodsys import runner
+from prodsys.analytics.store import AnalyticsStore
+from prodsys.models.production_system_data import ProductionSystemData
+from prodsys.simulation import logger
+from prodsys.util.post_processing import PostProcessor
+
+if not logger.is_parquet_engine_available():
+    pytest.skip("requires pyarrow or fastparquet", allow_module_level=True)
+
+
+@pytest.fixture
+def simulation_adapter() -> ProductionSystemData:
+    t1 = psx.FunctionTimeModel("exponential", 0.8, 0, "t1")
+    p1 = psx.ProductionProcess(t1, "p1")
+    t3 = psx.FunctionTimeModel("normal", 0.1, 0.01, ID="t3")
+    tp = psx.TransportProcess(t3, "tp")
+    machine = psx.Resource([p1], [5, 0], 1, ID="machine")
+    transport = psx.Resource([tp], [0, 0], 1, ID="transport")
+    product1 = psx.Product([p1], tp, "product1")
+    sink1 = psx.Sink(product1, [10, 0], "sink1")
+    arrival_model_1 = psx.FunctionTimeModel("exponential", 1, ID="arrival_model_1")
+    source1 = psx.Source(product1, arrival_model_1, [0, 0], ID="source_1")
+    system = psx.ProductionSystem([machine, transport], [source1], [sink1])
+    return system.to_model()
+
+
+def _run(adapter: ProductionSystemData, **kwargs) -> runner.Runner:
+    runner_instance = runner.Runner(production_system_data=adapter, **kwargs)
+    runner_instance.initialize_simulation()
+    runner_instance.run(300)
+    return runner_instance
+
+
+def _run_streaming(adapter: ProductionSystemData, directory) -> runner.Runner:
+    runner_instance = runner.Runner(
+        production_system_data=adapter,
+        event_log_backend="streaming",
+        event_log_directory=str(directory),
+    )
+    runner_instance.initialize_simulation()
+    runner_instance.event_logger.event_data.chunk_size = 500
+    runner_instance.run(300)
+    return runner_instance
+
+
+def test_streaming_log_keeps_bounded_window(simulation_adapter, tmp_path):
+    runner_instance = _run_streaming(simulation_adapter, tmp_path)
+    event_log = runner_instance.event_logger.event_data
+
+    assert len(event_log.chunk_files) > 1
+    assert event_log.chunk_files == logger.get_event_log_chunk_files(str(tmp_path))
+    assert len(event_log) < 2 * event_log.chunk_size
+
+    chunks = list(logger.iter_event_log_chunks(str(tmp_path)))
+    for previous, following in zip(chunks[:-1], chunks[1:]):
+        assert previous["Time"].max() < following["Time"].min()
+
+
+def test_streaming_backend_matches_list_backend(simulation_adapter, tmp_path):
+    df_list = _run(simulation_adapter).event_logger.get_data_as_dataframe()
+    df_streaming = _run_streaming(
+        simulation_adapter, tmp_path
+    ).event_logger.get_data_as_dataframe()
+
+    assert list(df_streaming.columns) == list(df_list.columns)
+    assert len(df_streaming) == len(df_list)
+    pd.testing.assert_series_equal(df_list["Time"], df_streaming["Time"])
+    assert df_list["Resource"].tolist() == df_streaming["Resource"].tolist()
+    assert df_list["Activity"].tolist() == df_streaming["Activity"].tolist()
+
+
+def test_streaming_backend_kpis(simulation_adapter, tmp_path):
+    runner_list = _run(simulation_adapter)
+    runner_streaming = _run_streaming(simulation_adapter, tmp_path)
+
+    post_processor = runner_streaming.get_post_processor()
+    assert post_processor.df_raw is None
+    pd.testing.assert_frame_equal(
+        runner_list.get_post_processor().df_aggregated_output_and_throughput,
+        post_processor.df_aggregated_output_and_throughput,
+    )
+
+    store = AnalyticsStore(time_range=runner_streaming.time_range)
+    store.ingest_event_chunks(logger.iter_event_log_chunks(str(tmp_path)))
+    pd.testing.assert_frame_equal(
+        store.throughput().reset_index(drop=True),
+        post_processor.store.throughput().reset_index(drop=True),
+    )
+
+    reread = PostProcessor(filepath=str(tmp_path), time_range=runner_streaming.time_range)
+    assert len(reread.store.throughput()) == len(post_processor.store.throughput())
+
+
+def test_streaming_backend_saves_results(simulation_adapter, tmp_path):
+    runner_instance = _run_streaming(simulation_adapter, tmp_path / "chunks")
+    df = runner_instance.event_logger.get_data_as_dataframe()
+
+    csv_file = tmp_path / "events.csv"
+    runner_instance.event_logger.log_data_to_csv(str(csv_file))
+    df_csv = pd.read_csv(csv_file)
+    assert len(df_csv) == len(df)
+    assert df_csv["Unnamed: 0"].tolist() == list(range(len(df)))
+
+    json_file = tmp_path / "events.json"
+    runner_instance.event_logger.log_data_to_json(str(json_file))
+    with open(json_file) as f:
+        assert len(json.load(f)) == len(df)
@@ -0,0 +1,55 @@
+import copy
+
+from prodsys.models.time_model_data import FunctionTimeModelData, SampleTimeModelData
+from prodsys.simulation.time_model import FunctionTimeModel, SampleTimeModel
+
+
+def get_function_time_model(ID: str, seed: int) -> FunctionTimeModel:
+    time_model = FunctionTimeModel(
+        FunctionTimeModelData(
+            ID=ID,
+            description="",
+            distribution_function="normal",
+            location=10.0,
+            scale=1.0,
+        )
+    )
+    time_model.set_seed(seed)
+    return time_model
+
+
+def draw(time_model, n: int = 250):
+    return [time_model.get_next_time() for _ in range(n)]
+
+
+def test_streams_depend_on_seed_and_ID():
+    values = draw(get_function_time_model("t1", 1))
+
+    assert values == draw(get_function_time_model("t1", 1))
+    assert values != draw(get_function_time_model("t1", 2))
+    assert values != draw(get_function_time_model("t2", 1))
+
+
+def test_set_seed_restarts_stream():
+    time_model = get_function_time_model("t1", 1)
+    values = draw(time_model)
+    time_model.set_seed(1)
+    assert draw(time_model) == values
+
+
+def test_copies_draw_independent_streams():
+    time_model = get_function_time_model("t1", 1)
+    first_copy = copy.deepcopy(time_model)
+    second_copy = copy.deepcopy(time_model)
+
+    assert draw(first_copy) != draw(second_copy)
+
+
+def test_sample_time_model_draws_from_samples():
+    samples = [1.0, 2.0, 3.0]
+    time_model = SampleTimeModel(
+        SampleTimeModelData(ID="s1", description="", samples=samples)
+    )
+    values = draw(time_model)
+
+    assert set(values) == set(samples)
@@ -0,0 +1,52 @@
+import math
+import random
+
+from pathfinding.core.graph import GraphNode
+
+from prodsys.util.dijkstra_all import DijkstraAllPaths
+from prodsys.util.shortest_path_matrix import ShortestPathMatrix
+
+
+def get_path_cost(path, edges) -> float:
+    costs = {}
+    for from_node, to_node, cost in edges:
+        for key in ((from_node.node_id, to_node.node_id), (to_node.node_id, from_node.node_id)):
+            costs[key] = min(costs.get(key, math.inf), cost)
+    return sum(
+        costs[(path[i].node_id, path[i + 1].node_id)] for i in range(len(path) - 1)
+    )
+
+
+def test_shortest_path_matrix_matches_dijkstra():
+    random.seed(0)
+    nodes = [GraphNode(node_id=f"node_{i}") for i in range(40)]
+    edges = [
+        (random.choice(nodes), random.choice(nodes), random.uniform(0, 10))
+        for _ in range(80)
+    ]
+    edges.append((nodes[0], nodes[1], 0.0))
+
+    shortest_path_matrix = ShortestPathMatrix(edges)
+    dijkstra = DijkstraAllPaths()
+    for origin in nodes:
+        if origin.node_id not in shortest_path_matrix.node_indices:
+            continue
+        dijkstra_paths = dijkstra.get_all_paths_from_origin(origin, edges, "process")
+        for target in nodes:
+            path = shortest_path_matrix.get_path(origin, target)
+            dijkstra_path = dijkstra_paths.get(target.node_id, [])
+            assert bool(path) == bool(dijkstra_path)
+            if path:
+                assert path[0] is origin and path[-1] is target
+                assert math.isclose(
+                    get_path_cost(path, edges), get_path_cost(dijkstra_path, edges)
+                )
+
+
+def test_shortest_path_matrix_unreachable_target():
+    a, b, c, d = (GraphNode(node_id=node_id) for node_id in "abcd")
+    shortest_path_matrix = ShortestPathMatrix([(a, b, 1.0), (c, d, 1.0)])
+    assert shortest_path_matrix.get_path(a, b) == [a, b]
+    assert shortest_path_matrix.get_path(b, a) == [b, a]
+    assert shortest_path_matrix.get_path(a, d) == []
+    assert shortest_path_matrix.get_path(a, a) == [a]